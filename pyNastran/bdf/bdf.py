@@ -14,6 +14,7 @@ Main BDF class.  Defines:
 from __future__ import annotations
 import os
 import sys
+import warnings
 from copy import deepcopy
 from io import StringIO, IOBase
 from pathlib import PurePath
@@ -34,6 +35,12 @@ from .bdf_interface.utils import (
     fill_dmigs, _get_card_name, _parse_dynamic_syntax,
 )
 from pyNastran.bdf.bdf_interface.add_card import CARD_MAP
+from pyNastran.bdf.bdf_interface.coord_engine import CoordTransformEngine, get_coord_engine
+from pyNastran.bdf.bdf_interface.topology_index import TopologyIndex, get_topology_index
+from .bdf_interface.fast_parse import parse_fast_cards, FAST_CARD_NAMES
+from .bdf_interface.parallel_parse import parse_cards_parallel, is_parallel_card
+from .bdf_interface.bdf_cache import BDFCache
+from .bdf_interface.refresh import refresh_model, group_cards_by_file, get_file_stamps
 from .bdf_interface.replication import (
     to_fields_replication, get_nrepeats, int_replication, float_replication,
     _field, repeat_cards)
@@ -102,7 +109,6 @@ from .cards.constraints import (SPC, SPCADD, SPCAX, SPC1, SPCOFF, SPCOFF1,
                                 GMSPC)
 from .cards.coordinate_systems import (CORD1R, CORD1C, CORD1S,
                                        CORD2R, CORD2C, CORD2S, #CORD3G,
-                                       transform_coords_vectorized,
                                        CORDx)
 #from .cards.coordinate_systems.msgmesh import CGEN, GMCORD, GMLOAD
 from .cards.deqatn import DEQATN
@@ -564,6 +570,18 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
         # flag that allows for OpenMDAO-style optimization syntax to be used
         self._is_dynamic_syntax = False
 
+        # use the vectorized parser for the GRID/CQUAD4/CTRIA3/CTETRA/CHEXA cards
+        self._fast_parse = True
+
+        # the number of processes used to parse the cards (see read_bdf)
+        self._nworkers = 1
+
+        # the read_bdf arguments and the cards/(size, mtime) of each
+        # file that was read (see refresh)
+        self._read_options = {}  # type: Dict[str, Any]
+        self._file_cards = {}  # type: Dict[int, List[Any]]
+        self._file_stamps = {}  # type: Dict[int, Any]
+
         # lines that were rejected b/c they were for a card that isnt supported
         self.reject_lines = []  # type: List[List[str]]
 
@@ -903,6 +921,8 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
         self.cards_to_read = set_cards_to_read
 
         self._xref = False
+        self._coord_engine = None
+        self._topology_index = None
 
         #case_control_cards = {'FREQ', 'GUST', 'MPC', 'SPC', 'NLPARM', 'NSM',
                               #'TEMP', 'TSTEPNL', 'INCLUDE'}
@@ -1253,11 +1273,14 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
 
     def read_bdf(self, bdf_filename: Optional[str]=None,
                  validate: bool=True,
-                 xref: bool=True,
+                 xref: Union[bool, str]=True,
                  punch: bool=False,
                  read_includes: bool=True,
                  save_file_structure: bool=False,
-                 encoding: Optional[str]=None) -> None:
+                 encoding: Optional[str]=None,
+                 nworkers: int=1,
+                 cache_dir: Optional[str]=None,
+                 track_includes: bool=False) -> None:
         """
         Read method for the bdf files
 
@@ -1267,8 +1290,9 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
             the input bdf (default=None; popup a dialog)
         validate : bool; default=True
             runs various checks on the BDF
-        xref :  bool; default=True
+        xref :  bool / str; default=True
             should the bdf be cross referenced
+            'arrays' : use ``cross_reference_arrays`` (integer index arrays)
         punch : bool; default=False
             indicates whether the file is a punch file
         read_includes : bool; default=True
@@ -1277,6 +1301,17 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
             enables the ``write_bdfs`` method
         encoding : str; default=None -> system default
             the unicode encoding
+        nworkers : int; default=1
+            the number of workers used to read the INCLUDE files (threads)
+            and create the card objects (processes); the cards are added
+            to the model in the same order as a serial read
+        cache_dir : str; default=None
+            a directory to store binary snapshots of the parsed BDF in;
+            an unchanged BDF (including the INCLUDE files) is restored
+            from the snapshot instead of being parsed
+        track_includes : bool; default=False
+            keeps the cards and (size, mtime) of each file that was read,
+            which enables ``refresh``
 
         .. code-block:: python
 
@@ -1296,16 +1331,34 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
 
         """
         self.save_file_structure = save_file_structure
+        self._nworkers = nworkers
+        self._read_options = {
+            'validate': validate, 'xref': xref, 'punch': punch,
+            'read_includes': read_includes, 'save_file_structure': save_file_structure,
+            'encoding': encoding, 'nworkers': nworkers, 'cache_dir': cache_dir,
+            'track_includes': track_includes,
+        }
         if bdf_filename and not isinstance(bdf_filename, (StringIO, list)):
             check_path(bdf_filename, 'bdf_filename')
         self._read_bdf_helper(bdf_filename, encoding, punch, read_includes)
         self.log.debug(f'---starting BDF.read_bdf of {self.bdf_filename}---')
         self._parse_primary_file_header(bdf_filename)
 
+        cache = self._get_bdf_cache(cache_dir, save_file_structure, track_includes)
+        if cache is not None and cache.load(self):
+            if track_includes:
+                # the snapshot is only loaded if the files are unchanged
+                self._file_stamps = get_file_stamps(self.active_filenames)
+            self.case_control_deck = CaseControlDeck(self.case_control_lines, self.log)
+            self.case_control_deck.solmap_to_value = self._solmap_to_value
+            self.case_control_deck.rsolmap_to_str = self.rsolmap_to_str
+            self._finish_read_bdf(validate, xref)
+            return
+
         obj = BDFInputPy(self.read_includes, self.dumplines, self._encoding,
                          nastran_format=self.nastran_format,
                          consider_superelements=self.is_superelements,
-                         log=self.log, debug=self.debug)
+                         log=self.log, debug=self.debug, nworkers=nworkers)
         out = obj.get_lines(bdf_filename, punch=self.punch, make_ilines=True)
         (system_lines,
          executive_control_lines,
@@ -1313,6 +1366,8 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
          bulk_data_lines, bulk_data_ilines,
          superelement_lines, superelement_ilines) = out
         self._set_pybdf_attributes(obj, save_file_structure)
+        if track_includes:
+            self._file_stamps = get_file_stamps(self.active_filenames)
 
         #assert system_lines == [], system_lines
         #assert executive_control_lines == [], executive_control_lines
@@ -1339,7 +1394,8 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
             self.is_superelements = True
             self.read_bdf(bdf_filename=bdf_filename, validate=validate, xref=xref, punch=punch,
                           read_includes=read_includes, save_file_structure=save_file_structure,
-                          encoding=encoding)
+                          encoding=encoding, nworkers=nworkers, cache_dir=cache_dir,
+                          track_includes=track_includes)
             return
 
         if superelement_lines:
@@ -1347,7 +1403,57 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
 
         self.pop_parse_errors()
         fill_dmigs(self)
+        if cache is not None:
+            cache.write(self)
+        self._finish_read_bdf(validate, xref)
+
+    def refresh(self) -> List[str]:
+        """
+        Re-reads the INCLUDE files that changed since the model was read
+        (requires ``read_bdf(..., track_includes=True)``)
+
+        The cards from the changed files are removed and re-parsed and,
+        if the model was cross-referenced, the new cards and the cards
+        that referenced the removed cards are cross-referenced.  The
+        model is fully re-read if the main BDF changed or the changed
+        cards can't be replaced one by one (e.g., DMIG, GRDSET, AERO).
+
+        Returns
+        -------
+        filenames : List[str]
+            the files that changed
 
+        .. code-block:: python
+
+           >>> model = read_bdf(bdf_filename, track_includes=True)
+           >>> # edit properties.inc
+           >>> model.refresh()
+           ['properties.inc']
+
+        """
+        return refresh_model(self)
+
+    def _get_bdf_cache(self, cache_dir: Optional[str],
+                       save_file_structure: bool,
+                       track_includes: bool) -> Optional[BDFCache]:
+        """gets the binary model cache for ``read_bdf``"""
+        if cache_dir is None or save_file_structure or self._is_dynamic_syntax:
+            return None
+        if not isinstance(self.bdf_filename, (str, PurePath)):
+            return None
+        options = {
+            'punch' : self.punch,
+            'encoding' : self._encoding,
+            'read_includes' : self.read_includes,
+            'mode' : self._nastran_format,
+            'is_superelements' : self.is_superelements,
+            'cards_to_read' : sorted(self.cards_to_read),
+            'track_includes' : track_includes,
+        }
+        return BDFCache(cache_dir, str(self.bdf_filename), options, self.log)
+
+    def _finish_read_bdf(self, validate: bool, xref: Union[bool, str]) -> None:
+        """validates and cross-references the model for ``read_bdf``"""
         if validate:
             self.validate()
 
@@ -1357,6 +1463,9 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
             if union_cards:
                 raise DisabledCardError(f'the following cards have been removed: {list(union_cards)}')
 
+        if xref == 'arrays':
+            self.cross_reference_arrays()
+            xref = False
         self.cross_reference(xref=xref)
         self._xref = xref
 
@@ -1386,6 +1495,8 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
         else:
             cards_list, cards_dict, card_count = self.get_bdf_cards(
                 bulk_data_lines, bulk_data_ilines)
+            if self._read_options.get('track_includes'):
+                self._file_cards = group_cards_by_file(cards_list)
             #for card in cards_list:
                 #card_name = card[0]
                 #if card_name == 'CBAR':
@@ -3040,6 +3151,26 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
         self._add_card_helper_ifile(ifile, card_obj, card_name, card_name, comment)
         return card_obj
 
+    def _add_parsed_card(self, card_name: str, card_obj: Any, card_lines: List[str]) -> None:
+        """
+        adds a card object that was created by ``parse_fast_cards``
+        or ``parse_cards_parallel``
+        """
+        self.increase_card_count(card_name)
+        if card_name in self._card_parser:
+            add_card_function = self._card_parser[card_name][1]
+        else:
+            # CTETRA/CHEXA
+            add_card_function = self._add_methods._add_element_object
+        try:
+            add_card_function(card_obj)
+        except (SyntaxError, AssertionError, KeyError, ValueError) as exception:
+            self._iparse_errors += 1
+            var = traceback.format_exception_only(type(exception), exception)
+            self._stored_parse_errors.append((card_lines, var))
+            if self._iparse_errors > self._nparse_errors:
+                self.pop_parse_errors()
+
     def add_card(self, card_lines: List[str], card_name: str,
                  comment: str='', ifile=None, is_list: bool=True, has_none: bool=True) -> Any:
         """
@@ -3230,6 +3361,38 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
             raise ValueError(msg)
         return npoints, nids, all_nodes
 
+    def get_coord_engine(self) -> CoordTransformEngine:
+        """
+        Gets the vectorized coordinate transform engine
+
+        The CORD1x/CORD2x chains are resolved once and the engine is
+        cached until a coordinate system changes.
+
+        Examples
+        --------
+        >>> engine = model.get_coord_engine()
+        >>> xyz_cid0 = engine.transform_points(xyz_cp, cps, cid_to=0)
+        >>> disp_cid0 = engine.transform_vectors(disp_cd, cds, cid_to=0, xyz_cid0=xyz_cid0)
+
+        """
+        return get_coord_engine(self)
+
+    def get_topology_index(self) -> TopologyIndex:
+        """
+        Gets the vectorized edge/face/node topology index of the elements
+
+        The index is cached until an element is added, removed or replaced.
+
+        Examples
+        --------
+        >>> index = model.get_topology_index()
+        >>> edges = index.free_edges()
+        >>> eid_set, face_map = index.get_solid_skin_faces()
+        >>> eids = index.get_element_ids_by_node(nid)
+
+        """
+        return get_topology_index(self)
+
     def get_xyz_in_coord(self, cid=0, fdtype='float64', sort_ids=True):
         """
         Gets the xyz points (including SPOINTS) in the desired coordinate frame
@@ -3252,16 +3415,13 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
         #return self.get_displacement_index_xyz_cp_cd(cid=cid, fdtype=dtype)[2]
         npoints, nids, all_nodes = self._get_npoints_nids_allnids()
         xyz_cid0 = np.zeros((npoints, 3), dtype=fdtype)
-        if cid == 0:
-            for i, nid in enumerate(nids):
-                node = self.nodes[nid]
-                xyz = node.get_position()
-                xyz_cid0[i, :] = xyz
-        else:
-            for i, nid in enumerate(nids):
-                node = self.nodes[nid]
-                xyz = node.get_position_wrt(self, cid)
-                xyz_cid0[i, :] = xyz
+        nnodes = len(nids)
+        if nnodes:
+            nodes = [self.nodes[nid] for nid in nids]
+            cps = np.array([node.Cp() for node in nodes], dtype='int64')
+            xyz_cp = np.array([node.xyz for node in nodes], dtype='float64')
+            engine = self.get_coord_engine()
+            xyz_cid0[:nnodes, :] = engine.transform_points(xyz_cp, cps, cid_to=cid)
         if sort_ids:
             isort = np.argsort(all_nodes)
             xyz_cid0 = xyz_cid0[isort, :]
@@ -3622,7 +3782,7 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
             fdtype=fdtype, idtype=idtype, sort_ids=True)
         nids = nid_cp_cd[:, 0]
         xyz_cid = self.transform_xyzcp_to_xyz_cid(xyz_cp, nids, icp_transform,
-                                                  cid=cid, in_place=False, atol=1e-6)
+                                                  cid=cid, in_place=False)
         return nid_cp_cd, xyz_cid, xyz_cp, icd_transform, icp_transform
 
     def transform_xyzcp_to_xyz_cid(self, xyz_cp: np.ndarray,
@@ -3630,7 +3790,7 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
                                    icp_transform: Dict[int, np.ndarray],
                                    cid: int=0,
                                    in_place: bool=False,
-                                   atol: float=1e-6) -> np.ndarray:
+                                   atol: Optional[float]=None) -> np.ndarray:
         """
         Vectorized method for calculating node locations in an arbitrary
         coordinate system.
@@ -3650,6 +3810,8 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
         in_place : bool, default=False
             If true the original xyz_cp is modified, otherwise a
             new one is created.
+        atol : float; default=None
+            deprecated and unused; the transform is no longer checked
 
         Returns
         -------
@@ -3674,256 +3836,21 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
                 cid=1)
 
         """
-        #F:\work\pyNastran\examples\femap_examples\Support\nast\tpl\heli112em7.dat
-        if self.is_bdf_vectorized:
-            # this is used when xref=False (only for vectorized=True)
-            # we now require nids, where the other approach
-            # (the one with xref=True) does not
-            in_place = False
-            cps_to_check = list(self.coords.keys())
-        else:
-            # this requires xref
-            #cps_to_check = list(icp_transform.keys())
-            # xref allows in_place=True
-
-            # this is more general and slightly slower
-            # requires in_place=False???
-            cps_to_check = list(self.coords.keys())
-        cps_to_check.sort()
-        assert 0 in cps_to_check, cps_to_check
-
-        nodes = self.nodes
-        coord2 = self.coords[cid]
-        #assert in_place is False, 'in_place=%s' % in_place
-        if in_place:
-            xyz_cid0 = xyz_cp
-        else:
-            xyz_cid0 = np.copy(xyz_cp)
-
-        do_checks = False
-        xyz_cid0_correct = None
-        if do_checks:
-            # transform the grids to the global coordinate system
-            xyz_cid0_correct = self.get_xyz_in_coord(fdtype=xyz_cid0.dtype, cid=0)
-
-        #cps_to_check = list(icp_transform.keys())
-        #ncoords_to_setup = len(icp_transform)
-        ncoords_to_setup = len(cps_to_check)
-        nids_checked = []
-        while ncoords_to_setup > 0:
-            #print('--------------------------------------------------------------------------')
-            #print('ncoords_to_setup = ', ncoords_to_setup)
-            ncoords_to_setup = 0
-            nids_checkedi, cps_checked, cps_to_check = self._transform(
-                cps_to_check, icp_transform,
-                nids, xyz_cp, xyz_cid0, xyz_cid0_correct,
-                in_place, do_checks)
-
-            if cps_to_check:
-                nids_checked.append(nids_checkedi)
-                #print("nids_checkedi =", nids_checkedi)
-                out = _get_coords_to_update(
-                    self.coords, cps_to_check, cps_checked, nids_checked)
-                unused_ncoords_to_setup, cord1s_to_update, cord2s_to_update, nids_checked = out
-                #print('CPs not handled=%s\n  cord1s_to_update=%s\n  cord2s_to_update=%s' % (
-                    #cps_to_check, cord1s_to_update, cord2s_to_update))
-
-                for cp in cord2s_to_update:
-                    coord = self.coords[cp]
-                    coord.rid_ref = self.coords[coord.rid]
-                    coord.setup_no_xref(self)
-
-                for cp in cord1s_to_update:
-                    coord = self.coords[cp]
-                    nid1, nid2, nid3 = coord.node_ids
-                    if self.is_bdf_vectorized or 1:
-                        i1, i2, i3 = np.searchsorted(nids, coord.node_ids)
-                        assert nids[i1] == nid1
-                        assert nids[i2] == nid2
-                        assert nids[i3] == nid3
-                        coord.e1 = xyz_cid0[i1, :] #: the origin in the local frame
-                        coord.e2 = xyz_cid0[i2, :] #: a point on the z-axis
-                        coord.e3 = xyz_cid0[i3, :] #: a point on the xz-plane
-                    else:
-                        g1_ref = nodes[nid1]
-                        g2_ref = nodes[nid2]
-                        g3_ref = nodes[nid3]
-                        coord.e1 = g1_ref.get_position() #: the origin in the local frame
-                        coord.e2 = g2_ref.get_position() #: a point on the z-axis
-                        coord.e3 = g3_ref.get_position() #: a point on the xz-plane
-                    coord.setup_no_xref(self)
-                    #coord.rid_ref = self.coords[coord.rid]
-                    #coord.setup_no_xref(self)
-
-                ncoords_to_setup = len(cord1s_to_update) + len(cord2s_to_update)
-            #print('ncoords_next = ', ncoords_to_setup)
-        #print('--------------------------------------------------------------------------')
-        #print('ncoords_to_setup = ', ncoords_to_setup)
-
-        #if ncoords == 0:
-        if cps_to_check:
-            msg = 'CPs not handled=%s cord1s_to_update=%s cord2s_to_update=%s\n' % (
-                cps_to_check, cord1s_to_update, cord2s_to_update)
-            for cp in cps_to_check:
-                coord = self.coords[cp]
-                msg += coord.rstrip() + '\n'
-                if coord.type in ['CORD2R', 'CORD2C', 'CORD2S']:
-                    rid_ref = self.coords[coord.rid]
-                    msg += rid_ref.rstrip() + '\n'
-                    msg += f'  rid={coord.rid!r} origin={rid_ref.origin}\n\n'
-                else:
-                    nid1, nid2, nid3 = coord.node_ids
-                    #coord.e1 = xyz_cid0[i1, :] #: the origin in the local frame
-                    #coord.e2 = xyz_cid0[i2, :] #: a point on the z-axis
-                    #coord.e3 = xyz_cid0[i3, :] #: a point on the xz-plane
-                    if self.is_bdf_vectorized:
-                        i1, i2, i3 = np.searchsorted(nids, coord.node_ids)
-                        cp1 = nodes.cp[i1]
-                        cp2 = nodes.cp[i2]
-                        cp3 = nodes.cp[i3]
-                    else:
-                        cp1 = nodes[nid1].cp
-                        cp2 = nodes[nid2].cp
-                        cp3 = nodes[nid3].cp
-                    msg += f'  g1={nid1} xyz={coord.e1} cp={cp1}\n'
-                    msg += f'  g2={nid2} xyz={coord.e2} cp={cp2}\n'
-                    msg += f'  g3={nid3} xyz={coord.e3} cp={cp3}\n'
-                    #break
-            raise RuntimeError(msg)
-
-        if do_checks and not np.allclose(xyz_cid0, xyz_cid0_correct, atol=atol):
-            #np.array_equal(xyz_cid, xyz_cid_alt):
-            out = self.get_displacement_index_xyz_cp_cd(fdtype=xyz_cid0.dtype, sort_ids=True)
-            unused_icd_transform, icp_transform, xyz_cp, nid_cp_cd = out
-            msg = ('xyz_cid0:\n%s\n'
-                   'xyz_cid0_correct:\n%s\n'
-                   'nid_cp_cd:\n%s\n'
-                   'xyz_cp:\n%s'% (xyz_cid0, xyz_cid0_correct, nid_cp_cd, xyz_cp))
-            raise ValueError(msg)
-
-        if cid == 0:
-            return xyz_cid0
-
-        # transform the grids to the local coordinate system
-        #is_beta = np.diagonal(beta2).min() != 1.
-        #is_origin = np.abs(coord2.origin).max() != 0.
-        #if is_beta and is_origin:
-        xyz_cid = coord2.transform_node_to_local_array(xyz_cid0)
-        #xyz_cid = coord2.xyz_to_coord_array(np.dot(xyz_cid0 - coord2.origin, beta2.T))
-        #elif is_beta:
-            #xyz_cid = coord2.xyz_to_coord_array(xyz_cid0 @ beta2.T)
-        #else:
-            #xyz_cid = coord2.xyz_to_coord_array(xyz_cid0 - coord2.origin)
-
         if atol is not None:
-            xyz_cid_correct = self.get_xyz_in_coord(cid=cid)
-            if not np.allclose(xyz_cid, xyz_cid_correct, atol=atol):
-                #np.array_equal(xyz_cid, xyz_cid_correct):
-                msg = ('xyz_cid:\n%s\n'
-                       'xyz_cid_correct:\n%s'% (xyz_cid, xyz_cid_correct))
-                raise ValueError(msg)
+            warnings.warn('transform_xyzcp_to_xyz_cid(..., atol) is unused and is deprecated',
+                          DeprecationWarning, stacklevel=2)
+        cps = np.zeros(len(nids), dtype='int64')
+        for cp, inode in icp_transform.items():
+            cps[inode] = cp
+
+        engine = self.get_coord_engine()
+        engine.update_coords(self.coords)
+        xyz_cid = engine.transform_points(xyz_cp, cps, cid_to=cid)
+        if in_place:
+            xyz_cp[:, :] = xyz_cid
+            return xyz_cp
         return xyz_cid
 
-    def _transform(self, cps_to_check0, icp_transform,
-                   nids, xyz_cp, xyz_cid0, xyz_cid0_correct,
-                   unused_in_place, do_checks):
-        """
-        Transforms coordinates in a vectorized way
-        Helper method for ``transform_xyzcp_to_xyz_cid``
-
-        Parameters
-        ----------
-        cps_to_check0 : List[int]
-            the Cps to check
-        icp_transform : dict{int cp : (n,) int ndarray}
-            Dictionary from coordinate id to index of the nodes in
-            ``self.point_ids`` that their input (`CP`) in that
-            coordinate system.
-        nids : (n, ) int ndarray
-            the GRID/SPOINT/EPOINT ids corresponding to xyz_cp
-        xyz_cp : (n, 3) float ndarray
-            points in the CP coordinate system
-        xyz_cid : (n, 3) float ndarray
-            points in the CID coordinate system
-        xyz_cid_correct : (n, 3) float ndarray
-            points in the CID coordinate system
-        unused_in_place : bool, default=False
-            If true the original xyz_cp is modified, otherwise a
-            new one is created.
-        do_checks : bool; default=False
-            internal value for testing
-            True : makes use of xyz_cid_correct
-            False : xyz_cid_correct is unused
-
-        Returns
-        -------
-        nids_checked : (nnodes_checked,) int ndarray
-           the node ids that were checked
-        cps_checked : List[int]
-            the Cps that were checked
-        cps_to_check : List[int]
-            the Cps that are unreferenceable given the current information
-
-        """
-        nids_checked, cps_checked, cps_to_check = transform_coords_vectorized(
-            cps_to_check0, icp_transform,
-            nids, xyz_cp, xyz_cid0, xyz_cid0_correct,
-            self.coords, do_checks)
-        return nids_checked, cps_checked, cps_to_check
-
-    def _get_coords_to_update(self, cps_to_check, cps_checked, nids_checked):
-        """helper method for ``transform_xyzcp_to_xyz_cid``"""
-        cord1s_to_update_temp = []
-        cord2s_to_update = []
-        for cp in sorted(cps_to_check):
-            coord = self.coords[cp]
-            if coord.type in ['CORD2R', 'CORD2C', 'CORD2S']:
-                if coord.rid in cps_checked:
-                    cord2s_to_update.append(cp)
-            elif coord.type in ['CORD1R', 'CORD1C', 'CORD1S']:
-                cord1s_to_update_temp.append(cp)
-            else:
-                raise NotImplementedError(coord.rstrip())
-
-        cord1s_to_update = set()
-        if cord1s_to_update_temp:
-            if len(nids_checked) == 0:
-                raise RuntimeError('len(nids_checked)=0...this shouldnt happen.')
-            elif len(nids_checked) == 1:
-                pass
-            else:
-                nids_checked = [np.hstack(nids_checked)]
-
-            nids_checkedi = nids_checked[0]
-            if len(nids_checkedi) == 0:
-                #print("no cord1s to check...")
-                cord1s_to_update = []
-            else:
-                #print('nids_checked = ', nids_checkedi)
-                for cp in cord1s_to_update_temp:
-                    coord = self.coords[cp]
-                    nids = coord.node_ids
-                    #print('cp=%s nids=%s' % (cp, nids))
-                    for nid in nids:
-                        if nid not in nids_checkedi:
-                            #print('  nid=%s break...' % nid)
-                            break
-                    else:
-                        #print('  passed')
-                        # all nids passed
-                        cord1s_to_update.add(cp)
-                cord1s_to_update = list(cord1s_to_update)
-                cord1s_to_update.sort()
-
-        ncoords = len(cord1s_to_update) + len(cord2s_to_update)
-        #if ncoords == 0:
-            #msg = 'CPs not handled=%s cord1s_to_update=%s cord2s_to_update=%s\n' % (
-                #cps_to_check, cord1s_to_update, cord2s_to_update)
-            #for cp in (cord1s_to_update + cord2s_to_update):
-                #msg += str(cp)
-            #raise RuntimeError(msg)
-        return ncoords, cord1s_to_update, cord2s_to_update, nids_checked
-
     @property
     def is_bdf_vectorized(self):
         """Returns False for the ``BDF`` class"""
@@ -4259,9 +4186,32 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
                                         is_list=False, has_none=False)
 
         else:
+            fast_cards = {}
+            parallel_cards = {}
+            card_names = set(card[0] for card in cards_list)
+            is_vectorizable = 'ECHOON' not in card_names and not self._is_dynamic_syntax
+            if self._fast_parse and is_vectorizable and not any(
+                    self.is_reject(card_name) for card_name in FAST_CARD_NAMES & card_names):
+                fast_cards = parse_fast_cards(cards_list)
+
+            if self._nworkers > 1 and is_vectorizable:
+                parallel_names = {card_name for card_name in card_names
+                                  if is_parallel_card(card_name, self._card_parser) and
+                                  not self.is_reject(card_name)}
+                icards = [icard for icard, card in enumerate(cards_list)
+                          if card[0] in parallel_names and icard not in fast_cards]
+                parallel_cards = parse_cards_parallel(
+                    cards_list, self._card_parser, icards, self._nworkers)
+
             for icard, card in enumerate(cards_list):
                 card_name, comment, card_lines, (ifile, unused_iline) = card
                 #print(unused_iline, card_lines[0])
+                if icard in fast_cards:
+                    self._add_parsed_card(*fast_cards[icard], card_lines)
+                    continue
+                if icard in parallel_cards:
+                    self._add_parsed_card(card_name, parallel_cards[icard], card_lines)
+                    continue
                 if card_name is None:
                     msg = f'card_name = {card_name!r}\n'
                     msg += f'card_lines = {card_lines}'
@@ -4782,13 +4732,15 @@ def _echo_card(card, card_obj):
         else:
             print(print_card_16(card_obj).rstrip())
 
-def read_bdf(bdf_filename: Optional[str]=None, validate: bool=True, xref: bool=True, punch: bool=False,
+def read_bdf(bdf_filename: Optional[str]=None, validate: bool=True, xref: Union[bool, str]=True,
+             punch: bool=False,
              save_file_structure: bool=False,
              skip_cards: Optional[List[str]]=None,
              read_cards: Optional[List[str]]=None,
              encoding: Optional[str]=None,
              log: Optional[SimpleLogger]=None,
-             debug: bool=True, mode: str='msc') -> BDF:
+             debug: bool=True, mode: str='msc', nworkers: int=1,
+             cache_dir: Optional[str]=None, track_includes: bool=False) -> BDF:
     """
     Creates the BDF object
 
@@ -4806,8 +4758,9 @@ def read_bdf(bdf_filename: Optional[str]=None, validate: bool=True, xref: bool=T
         settings the logging object has
     validate : bool; default=True
         runs various checks on the BDF
-    xref :  bool; default=True
+    xref :  bool / str; default=True
         should the bdf be cross referenced
+        'arrays' : use ``cross_reference_arrays`` (integer index arrays)
     punch : bool; default=False
         indicates whether the file is a punch file
     save_file_structure : bool; default=False
@@ -4823,6 +4776,13 @@ def read_bdf(bdf_filename: Optional[str]=None, validate: bool=True, xref: bool=T
     mode : str; default='msc'
         the type of Nastran
         valid_modes = {'msc', 'nx'}
+    nworkers : int; default=1
+        the number of workers used to read the INCLUDE files and
+        create the card objects
+    cache_dir : str; default=None
+        a directory to store binary snapshots of the parsed BDF in
+    track_includes : bool; default=False
+        keeps the cards of each file that was read (see ``BDF.refresh``)
 
     Returns
     -------
@@ -4864,7 +4824,8 @@ def read_bdf(bdf_filename: Optional[str]=None, validate: bool=True, xref: bool=T
     model.read_bdf(bdf_filename=bdf_filename, validate=validate,
                    xref=xref, punch=punch, read_includes=True,
                    save_file_structure=save_file_structure,
-                   encoding=encoding)
+                   encoding=encoding, nworkers=nworkers, cache_dir=cache_dir,
+                   track_includes=track_includes)
 
     #if 0:
         ### TODO: remove all the extra methods
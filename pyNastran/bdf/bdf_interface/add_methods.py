@@ -441,6 +441,7 @@ class AddMethods:
         else:
             model.elements[key] = elem
             model._type_to_id_map[elem.type].append(key)
+            model._topology_index = None
 
     def _add_ao_object(self, elem_flag: CBARAO, allow_overwrites: bool=False) -> None:
         """adds a CBARAO"""
@@ -0,0 +1,291 @@
+"""
+Defines the array-backed cross-reference:
+  - ArrayCrossReference(model)
+  - ElementArrays
+
+Rather than linking the cards with object references (``nodes_ref``,
+``pid_ref``, ...), the connectivity is stored as integer index arrays:
+
+ - element -> node index into the sorted node ids (``nids``)
+ - element -> property index into the sorted property ids (``pids``)
+ - property -> material index into the sorted material ids (``mids``)
+
+A missing node/property/material has an index of -1.  The geometry
+queries (``area``, ``centroid``, ``volume``, ``mass``) are vectorized
+over an element type and don't require the model to be cross-referenced.
+
+.. code-block:: python
+
+   >>> model = read_bdf(bdf_filename, xref=False)
+   >>> xref = model.cross_reference_arrays()
+   >>> elements = xref.elements['CQUAD4']
+   >>> elements.eids
+   [1, 2, 3]
+   >>> xref.area('CQUAD4')
+   [0.5, 1.0, 1.0]
+
+"""
+from __future__ import annotations
+from typing import List, Dict, Tuple, Optional, Any, TYPE_CHECKING
+
+import numpy as np
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+
+#: the number of corner nodes for the element types with vectorized geometry
+CORNER_NODES = {
+    'CTRIA3' : 3,
+    'CQUAD4' : 4,
+    'CTETRA' : 4,
+    'CHEXA' : 8,
+}
+SHELL_TYPES = {'CTRIA3', 'CQUAD4'}
+SOLID_TYPES = {'CTETRA', 'CHEXA'}
+
+#: properties with more than one material (e.g., one per ply)
+MULTI_MATERIAL_PROPERTIES = {'PCOMP', 'PCOMPG', 'PCOMPS', 'PCOMPLS'}
+
+
+class ElementArrays:
+    """the connectivity of one element type"""
+    def __init__(self, element_type: str, eids: np.ndarray, pids: np.ndarray,
+                 node_ids: np.ndarray, node_index: np.ndarray,
+                 property_index: np.ndarray,
+                 tflag: Optional[np.ndarray]=None,
+                 tscales: Optional[np.ndarray]=None):
+        """
+        Parameters
+        ----------
+        element_type : str
+            the element type (e.g., CQUAD4, CTETRA)
+        eids : (nelements, ) int ndarray
+            the sorted element ids
+        pids : (nelements, ) int ndarray
+            the property ids; 0 for elements without a property
+        node_ids : (nelements, nnodes) int ndarray
+            the node ids; 0 for a blank (e.g., midside) node
+        node_index : (nelements, nnodes) int ndarray
+            the index into ``ArrayCrossReference.nids``; -1 if missing
+        property_index : (nelements, ) int ndarray
+            the index into ``ArrayCrossReference.pids``; -1 if missing
+        tflag : (nelements, ) int ndarray; default=None
+            the shell thickness flag
+        tscales : (nelements, ncorner_nodes) float ndarray; default=None
+            the shell thicknesses (T1, T2, ...); nan if blank
+
+        """
+        self.element_type = element_type
+        self.eids = eids
+        self.pids = pids
+        self.node_ids = node_ids
+        self.node_index = node_index
+        self.property_index = property_index
+        self.tflag = tflag
+        self.tscales = tscales
+
+    def __len__(self) -> int:
+        return len(self.eids)
+
+    def __repr__(self) -> str:
+        return f'ElementArrays(element_type={self.element_type!r}, nelements={len(self)})'
+
+
+class ArrayCrossReference:
+    """
+    Integer index arrays that link the elements to their nodes/properties
+    and the properties to their materials
+    """
+    def __init__(self, model: BDF):
+        """
+        Builds the index arrays
+
+        Parameters
+        ----------
+        model : BDF
+            the model; it does not need to be cross-referenced
+
+        """
+        nid_cp_cd, xyz_cid0 = model.get_xyz_in_coord_array(
+            cid=0, fdtype='float64', idtype='int64')[:2]
+        #: the sorted GRID/SPOINT/EPOINT ids
+        self.nids = nid_cp_cd[:, 0]
+        #: the node locations in the global frame
+        self.xyz_cid0 = xyz_cid0
+
+        #: the sorted material ids
+        self.mids = np.array(sorted(model.materials), dtype='int64')
+        #: the density of each material; nan if it doesn't have one
+        self.rho = np.array([_get_float(model.materials[mid], 'rho')
+                             for mid in self.mids], dtype='float64')
+
+        #: the sorted property ids
+        self.pids = np.array(sorted(model.properties), dtype='int64')
+        properties = [model.properties[pid] for pid in self.pids]
+        #: the property types
+        self.property_types = np.array([prop.type for prop in properties], dtype='U8')
+        mids = np.array([_get_property_mid(prop) for prop in properties], dtype='int64')
+        #: the index into ``mids`` for each property; -1 if missing
+        self.property_material_index = _get_index(self.mids, mids)
+        #: the PSHELL thickness/nsm; nan for the other properties
+        self.property_thickness = np.array(
+            [_get_float(prop, 't') if prop.type == 'PSHELL' else np.nan for prop in properties],
+            dtype='float64')
+        self.property_nsm = np.array(
+            [_get_float(prop, 'nsm') if prop.type == 'PSHELL' else np.nan for prop in properties],
+            dtype='float64')
+
+        elements_by_type = {}  # type: Dict[str, List[Any]]
+        for eid in sorted(model.elements):
+            element = model.elements[eid]
+            elements_by_type.setdefault(element.type, []).append(element)
+
+        #: the connectivity of each element type
+        self.elements = {}  # type: Dict[str, ElementArrays]
+        for element_type, elements in sorted(elements_by_type.items()):
+            self.elements[element_type] = self._build_element_arrays(element_type, elements)
+
+    def _build_element_arrays(self, element_type: str, elements: List[Any]) -> ElementArrays:
+        """creates the index arrays for one element type"""
+        eids = np.array([element.eid for element in elements], dtype='int64')
+        if hasattr(elements[0], 'Pid'):
+            pids = np.array([element.Pid() or 0 for element in elements], dtype='int64')
+        else:
+            pids = np.zeros(len(elements), dtype='int64')
+        node_ids = _get_node_ids(elements)
+
+        tflag = None
+        tscales = None
+        if element_type in SHELL_TYPES:
+            tflag = np.array([element.tflag for element in elements], dtype='int32')
+            tscales = np.array([element.get_thickness_scale() for element in elements],
+                               dtype='float64')
+        return ElementArrays(
+            element_type, eids, pids, node_ids,
+            _get_index(self.nids, node_ids), _get_index(self.pids, pids),
+            tflag=tflag, tscales=tscales)
+
+    def _get_corner_xyz(self, element_type: str) -> List[np.ndarray]:
+        """gets the (nelements, 3) locations of each corner node"""
+        if element_type not in CORNER_NODES:
+            raise NotImplementedError(f'element_type={element_type!r} is not supported; '
+                                      f'allowed={list(CORNER_NODES)}')
+        elements = self.elements[element_type]
+        node_index = elements.node_index[:, :CORNER_NODES[element_type]]
+        is_missing = (node_index == -1).any(axis=1)
+        if is_missing.any():
+            missing_eids = elements.eids[is_missing]
+            raise KeyError(f'{element_type} eids={missing_eids.tolist()} reference nodes '
+                           'that do not exist')
+        return [self.xyz_cid0[inode, :] for inode in node_index.T]
+
+    def area(self, element_type: str) -> np.ndarray:
+        """gets the area of the CTRIA3/CQUAD4 elements"""
+        if element_type not in SHELL_TYPES:
+            raise NotImplementedError(f'area does not support element_type={element_type!r}')
+        xyz = self._get_corner_xyz(element_type)
+        if element_type == 'CTRIA3':
+            n1, n2, n3 = xyz
+            normal = np.cross(n1 - n2, n1 - n3)
+        else:
+            n1, n2, n3, n4 = xyz
+            normal = np.cross(n1 - n3, n2 - n4)
+        return 0.5 * np.linalg.norm(normal, axis=1)
+
+    def centroid(self, element_type: str) -> np.ndarray:
+        """gets the (nelements, 3) centroid"""
+        xyz = self._get_corner_xyz(element_type)
+        return sum(xyz) / len(xyz)
+
+    def volume(self, element_type: str) -> np.ndarray:
+        """gets the volume of the CTETRA/CHEXA elements"""
+        if element_type not in SOLID_TYPES:
+            raise NotImplementedError(f'volume does not support element_type={element_type!r}')
+        xyz = self._get_corner_xyz(element_type)
+        if element_type == 'CTETRA':
+            n1, n2, n3, n4 = xyz
+            return -np.einsum('ij,ij->i', n1 - n4, np.cross(n2 - n4, n3 - n4)) / 6.
+
+        n1, n2, n3, n4, n5, n6, n7, n8 = xyz
+        area1 = 0.5 * np.linalg.norm(np.cross(n3 - n1, n4 - n2), axis=1)
+        area2 = 0.5 * np.linalg.norm(np.cross(n7 - n5, n8 - n6), axis=1)
+        centroid1 = (n1 + n2 + n3 + n4) / 4.
+        centroid2 = (n5 + n6 + n7 + n8) / 4.
+        return np.abs((area1 + area2) / 2. * np.linalg.norm(centroid1 - centroid2, axis=1))
+
+    def mass(self, element_type: str) -> np.ndarray:
+        """
+        Gets the mass of the CTRIA3/CQUAD4 (PSHELL) and CTETRA/CHEXA (PSOLID)
+        elements; nan for the other properties and missing properties/materials
+        """
+        elements = self.elements[element_type]
+        rho = self._get_rho(elements.property_index)
+        if element_type in SOLID_TYPES:
+            return rho * self.volume(element_type)
+        if element_type not in SHELL_TYPES:
+            raise NotImplementedError(f'mass does not support element_type={element_type!r}')
+
+        iprop = elements.property_index
+        t0 = np.where(iprop == -1, np.nan, self.property_thickness[iprop])[:, np.newaxis]
+        nsm = np.where(iprop == -1, np.nan, self.property_nsm[iprop])
+        tscales = elements.tscales
+        is_blank = np.isnan(tscales)
+        thickness_absolute = np.where(is_blank, t0, tscales).mean(axis=1)
+        thickness_relative = np.where(is_blank, t0, tscales * t0).mean(axis=1)
+        thickness = np.where(elements.tflag == 0, thickness_absolute,
+                             np.where(elements.tflag == 1, thickness_relative, np.nan))
+        mass_per_area = nsm + rho * thickness
+        return mass_per_area * self.area(element_type)
+
+    def _get_rho(self, property_index: np.ndarray) -> np.ndarray:
+        """gets the density of the material of each property"""
+        imat = np.where(property_index == -1, -1,
+                        self.property_material_index[property_index])
+        return np.where(imat == -1, np.nan, self.rho[imat])
+
+    def __repr__(self) -> str:
+        msg = (f'ArrayCrossReference(nnodes={len(self.nids)}, '
+               f'nproperties={len(self.pids)}, nmaterials={len(self.mids)})\n')
+        for elements in self.elements.values():
+            msg += f'  {elements}\n'
+        return msg
+
+
+def _get_node_ids(elements: List[Any]) -> np.ndarray:
+    """gets the (nelements, nnodes) node ids; blank nodes are 0"""
+    # node_ids without the checks
+    nids_list = [element.nodes if element.nodes_ref is None else element.node_ids
+                 for element in elements]
+    try:
+        return np.array(nids_list, dtype='int64').reshape(len(elements), -1)
+    except (TypeError, ValueError):
+        # blank midside nodes or a variable number of nodes (e.g., CTETRA4/CTETRA10)
+        nnodes = max(len(nids) for nids in nids_list)
+        node_ids = np.zeros((len(elements), nnodes), dtype='int64')
+        for i, nids in enumerate(nids_list):
+            node_ids[i, :len(nids)] = [nid if nid is not None else 0 for nid in nids]
+        return node_ids
+
+
+def _get_index(sorted_ids: np.ndarray, ids: np.ndarray) -> np.ndarray:
+    """gets the index of ids in sorted_ids; -1 if missing"""
+    if len(sorted_ids) == 0:
+        return np.full(ids.shape, -1, dtype='int32')
+    index = np.searchsorted(sorted_ids, ids).clip(max=len(sorted_ids) - 1)
+    return np.where(sorted_ids[index] == ids, index, -1).astype('int32')
+
+
+def _get_property_mid(prop: Any) -> int:
+    """gets the material used for mass; 0 if there isn't one"""
+    if prop.type in MULTI_MATERIAL_PROPERTIES or not hasattr(prop, 'Mid'):
+        return 0
+    try:
+        mid = prop.Mid()
+    except (AttributeError, TypeError):
+        return 0
+    return mid if isinstance(mid, int) else 0
+
+
+def _get_float(card: Any, name: str) -> float:
+    """gets a float attribute; nan if it's blank or doesn't exist"""
+    value = getattr(card, name, None)
+    return np.nan if value is None else value
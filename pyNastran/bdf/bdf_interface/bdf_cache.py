@@ -0,0 +1,408 @@
+"""
+Defines the binary model cache used by ``read_bdf(..., cache_dir=...)``:
+  - BDFCache(cache_dir, bdf_filename, options, log)
+    - load(model)
+    - write(model)
+    - evict()
+
+The cache is keyed on the main BDF (path, size, mtime), the pyNastran
+version and the read options (e.g., punch, encoding, mode, track_includes).  Each
+snapshot also stores the (path, size, mtime) of every file that was
+read (the main file and the INCLUDE files), so changing an INCLUDE file
+invalidates the snapshot.
+
+The snapshot is taken after the cards are parsed, but before the model
+is validated/cross-referenced.  The card objects are stored in columns
+(one numpy array per attribute and card class), so restoring a card is
+just creating an empty object and filling in its ``__dict__``.
+Attributes that don't fit in a column (e.g., a variable length list)
+and the rest of the model state are pickled.
+
+The snapshots are loaded with ``pickle``, so only use a cache directory
+that you trust.  The least recently used snapshots are removed when
+the cache is larger than ``max_nbytes``.
+
+"""
+from __future__ import annotations
+import os
+import hashlib
+import pickle
+from collections import defaultdict
+from typing import List, Dict, Tuple, Optional, Any, TYPE_CHECKING
+
+import numpy as np
+
+import pyNastran
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+
+CACHE_VERSION = 1
+CACHE_EXT = '.bdfcache'
+
+#: the default maximum size of the cache directory (10 GB)
+MAX_CACHE_NBYTES = 10 * 1024 ** 3
+
+#: model attributes that are tied to the current BDF object or are
+#: user settings, which aren't stored in the snapshot
+SKIP_ATTRS = {
+    'log', '_add_methods', 'zona', 'case_control_deck',
+    '_card_parser', '_card_parser_b', '_card_parser_prepare',
+    '_fast_parse', '_nworkers', 'debug', 'dumplines', '_xref',
+    '_nparse_errors', '_nxref_errors', '_stop_on_parsing_error',
+    '_stop_on_xref_error', '_stop_on_duplicate_error',
+    'cards_to_read', '_remove_disabled_cards', 'values_to_skip', '_read_options',
+    '_file_stamps',
+    '_split_include_hashes', 'array_xref', '_coord_engine',
+    '_topology_index',
+}
+
+
+def _get_stamp(filename: str) -> Tuple[str, int, int]:
+    """gets the (path, size, mtime_ns) of a file, which is used to invalidate the cache"""
+    stat = os.stat(filename)
+    return os.path.abspath(filename), stat.st_size, stat.st_mtime_ns
+
+
+class BDFCache:
+    """
+    Stores a snapshot of a parsed BDF
+
+    Parameters
+    ----------
+    cache_dir : str
+        the directory to store the snapshots in
+    bdf_filename : str
+        the main BDF
+    options : Dict[str, Any]
+        the read options that change the parsed model (e.g., punch)
+    log : logger
+        the logger
+    max_nbytes : int; default=MAX_CACHE_NBYTES
+        the maximum size of the cache directory
+
+    """
+    def __init__(self, cache_dir: str, bdf_filename: str,
+                 options: Dict[str, Any], log: Any,
+                 max_nbytes: int=MAX_CACHE_NBYTES) -> None:
+        self.cache_dir = cache_dir
+        self.log = log
+        self.max_nbytes = max_nbytes
+        self.stamp = _get_stamp(bdf_filename)
+
+        key = repr((CACHE_VERSION, pyNastran.__version__, self.stamp,
+                    sorted(options.items())))
+        digest = hashlib.sha1(key.encode('utf8')).hexdigest()
+        self.cache_filename = os.path.join(cache_dir, digest + CACHE_EXT)
+
+    def load(self, model: BDF) -> bool:
+        """
+        Restores the model from the snapshot
+
+        Returns
+        -------
+        is_loaded : bool
+            False if the snapshot doesn't exist or is out of date
+
+        """
+        if not os.path.exists(self.cache_filename):
+            return False
+        try:
+            with np.load(self.cache_filename, allow_pickle=False) as data:
+                meta = pickle.loads(data['meta'].tobytes())
+                if not self._is_valid(meta):
+                    return False
+                arrays = {key: data[key] for key in data.files if key != 'meta'}
+        except (OSError, ValueError, KeyError, EOFError, pickle.UnpicklingError):
+            self.log.warning(f'cannot read {self.cache_filename!r}; rebuilding the cache')
+            return False
+
+        state = meta['state']
+        for name, table in meta['tables'].items():
+            state[name] = _decode_dict(table, arrays)
+        model.__dict__.update(state)
+
+        # mark the snapshot as recently used
+        os.utime(self.cache_filename)
+        self.log.debug(f'loaded {self.cache_filename!r}')
+        return True
+
+    def _is_valid(self, meta: Dict[str, Any]) -> bool:
+        """is the snapshot up to date"""
+        if meta.get('version') != CACHE_VERSION:
+            return False
+        for filename, size, mtime_ns in meta['stamps']:
+            try:
+                if _get_stamp(filename) != (filename, size, mtime_ns):
+                    self.log.info(f'{filename!r} changed; rebuilding the cache')
+                    return False
+            except OSError:
+                return False
+        return True
+
+    def write(self, model: BDF) -> None:
+        """writes a snapshot of the (not cross-referenced) model"""
+        if model.superelement_models or model._nastran_format == 'zona':
+            self.log.debug('superelements/zona models are not cached')
+            return
+
+        stamps = [self.stamp]
+        for filename in model.active_filenames:
+            stamp = _get_stamp(filename)
+            if stamp not in stamps:
+                stamps.append(stamp)
+
+        state = {}
+        tables = {}
+        arrays = {}  # type: Dict[str, np.ndarray]
+        for name, value in model.__getstate__().items():
+            if name in SKIP_ATTRS or callable(value):
+                continue
+            table = _encode_dict(value, arrays) if is_card_dict(value) else None
+            if table is None:
+                state[name] = value
+            else:
+                tables[name] = table
+
+        meta = {
+            'version' : CACHE_VERSION,
+            'stamps' : stamps,
+            'state' : state,
+            'tables' : tables,
+        }
+        try:
+            meta_bytes = pickle.dumps(meta, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError) as error:
+            self.log.warning(f'cannot cache {self.stamp[0]!r}: {error}')
+            return
+        arrays['meta'] = np.frombuffer(meta_bytes, dtype='uint8')
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_filename = self.cache_filename + '.tmp'
+        try:
+            with open(tmp_filename, 'wb') as cache_file:
+                np.savez(cache_file, **arrays)
+            os.replace(tmp_filename, self.cache_filename)
+        except OSError:
+            self.log.warning(f'cannot write {self.cache_filename!r}')
+            return
+        self.log.debug(f'wrote {self.cache_filename!r}')
+        self.evict()
+
+    def evict(self) -> None:
+        """removes the least recently used snapshots if the cache is too large"""
+        snapshots = []
+        for filename in os.listdir(self.cache_dir):
+            if not filename.endswith(CACHE_EXT):
+                continue
+            cache_filename = os.path.join(self.cache_dir, filename)
+            stat = os.stat(cache_filename)
+            snapshots.append((stat.st_mtime_ns, stat.st_size, cache_filename))
+
+        nbytes = sum(snapshot[1] for snapshot in snapshots)
+        for unused_mtime_ns, size, cache_filename in sorted(snapshots):
+            if nbytes <= self.max_nbytes:
+                break
+            if cache_filename == self.cache_filename:
+                continue
+            os.remove(cache_filename)
+            nbytes -= size
+            self.log.debug(f'removed {cache_filename!r}')
+
+
+def is_card_dict(value: Any) -> bool:
+    """is this a dictionary of cards or a dictionary of lists of cards"""
+    if not isinstance(value, dict) or not value:
+        return False
+    obj = next(iter(value.values()))
+    if isinstance(obj, list):
+        if not obj:
+            return False
+        obj = obj[0]
+    return hasattr(obj, 'type') and hasattr(obj, '__dict__') and not isinstance(obj, type)
+
+
+def _encode_dict(cards: Dict[Any, Any],
+                 arrays: Dict[str, np.ndarray]) -> Optional[Dict[str, Any]]:
+    """
+    Splits a dictionary of cards into tables of the same class/attributes
+
+    Returns
+    -------
+    table : Dict[str, Any] / None
+        None if the values aren't all objects
+        keys : column
+            the dictionary keys
+        nkeys : int
+            the number of keys
+        nvalues : int ndarray / None
+            the number of cards for each key (for a dictionary of lists)
+        groups : List[(card_class, attrs, ncards, columns)]
+            the cards grouped by their class and attribute names
+        igroup : int ndarray
+            the group of each card
+
+    """
+    if type(cards) is not dict:
+        # e.g., a defaultdict
+        return None
+    values = list(cards.values())
+    nvalues = None
+    if isinstance(values[0], list):
+        if not all(type(value) is list for value in values):
+            return None
+        nvalues = [len(value) for value in values]
+        objs = [obj for value in values for obj in value]
+    else:
+        objs = values
+    if not all(hasattr(obj, '__dict__') for obj in objs):
+        return None
+
+    group_ids = {}  # type: Dict[Tuple[Any, Tuple[str, ...]], int]
+    group_objs = defaultdict(list)  # type: Dict[int, List[Any]]
+    igroup = []
+    for obj in objs:
+        group_key = (obj.__class__, tuple(obj.__dict__))
+        try:
+            igroupi = group_ids[group_key]
+        except KeyError:
+            igroupi = group_ids[group_key] = len(group_ids)
+        igroup.append(igroupi)
+        group_objs[igroupi].append(obj)
+
+    groups = []
+    for (card_class, attrs), igroupi in group_ids.items():
+        objsi = group_objs[igroupi]
+        columns = [_encode_column([obj.__dict__[attr] for obj in objsi], arrays)
+                   for attr in attrs]
+        groups.append((card_class, attrs, len(objsi), columns))
+
+    table = {
+        'nkeys' : len(cards),
+        'keys' : _encode_column(list(cards.keys()), arrays),
+        'nvalues' : _add_array(arrays, np.array(nvalues, dtype='int64')) if nvalues is not None else None,
+        'groups' : groups,
+        'igroup' : _add_array(arrays, np.array(igroup, dtype='int32')),
+    }
+    return table
+
+
+def _decode_dict(table: Dict[str, Any], arrays: Dict[str, np.ndarray]) -> Dict[Any, Any]:
+    """creates the dictionary of cards from the tables"""
+    group_objs = []
+    for card_class, attrs, ncards, columns in table['groups']:
+        values = [_decode_column(column, ncards, arrays) for column in columns]
+        new = card_class.__new__
+        objs = []
+        for row in zip(*values) if values else [()] * ncards:
+            obj = new(card_class)
+            obj.__dict__.update(zip(attrs, row))
+            objs.append(obj)
+        group_objs.append(iter(objs))
+
+    objs = [next(group_objs[igroup]) for igroup in arrays[table['igroup']].tolist()]
+    nkeys = table['nkeys']
+    keys = _decode_column(table['keys'], nkeys, arrays)
+    if table['nvalues'] is None:
+        return dict(zip(keys, objs))
+
+    cards = {}
+    i0 = 0
+    for key, nvalues in zip(keys, arrays[table['nvalues']].tolist()):
+        cards[key] = objs[i0:i0 + nvalues]
+        i0 += nvalues
+    return cards
+
+
+def _add_array(arrays: Dict[str, np.ndarray], array: np.ndarray) -> str:
+    """stores an array and returns its name in the snapshot"""
+    name = f'a{len(arrays)}'
+    arrays[name] = array
+    return name
+
+
+def _encode_column(values: List[Any], arrays: Dict[str, np.ndarray]) -> Tuple[Any, ...]:
+    """
+    Encodes the values of an attribute:
+     - ('const', value) : the values are all None/True/False
+     - ('int', name) / ('float', name) : an int64/float64 array
+     - ('str', joined_str, name) : the strings are joined; name is the lengths
+     - ('array', name) : the arrays are stacked
+     - ('int_list', name, mask_name) : lists of the same length of ints/None
+     - ('float_list', name) : lists of the same length of floats
+     - ('pickle', values) : anything else
+    """
+    value0 = values[0]
+    types = set(type(value) for value in values)
+    if len(types) == 1:
+        type0 = type(value0)
+        if value0 is None or type0 is bool:
+            if all(value is value0 for value in values):
+                return ('const', value0)
+        elif type0 is int:
+            try:
+                return ('int', _add_array(arrays, np.array(values, dtype='int64')))
+            except OverflowError:
+                pass
+        elif type0 is float:
+            return ('float', _add_array(arrays, np.array(values, dtype='float64')))
+        elif type0 is str:
+            lengths = np.array([len(value) for value in values], dtype='int64')
+            return ('str', ''.join(values), _add_array(arrays, lengths))
+        elif type0 is np.ndarray:
+            if (not value0.dtype.hasobject and
+                    all(value.shape == value0.shape and value.dtype == value0.dtype
+                        for value in values)):
+                return ('array', _add_array(arrays, np.array(values)))
+        elif type0 is list:
+            column = _encode_list_column(values, arrays)
+            if column is not None:
+                return column
+    return ('pickle', values)
+
+
+def _encode_list_column(values: List[List[Any]],
+                        arrays: Dict[str, np.ndarray]) -> Tuple[Any, ...]:
+    """encodes lists of the same length of ints (or None) or floats"""
+    nvalues = len(values[0])
+    if nvalues == 0 or any(len(value) != nvalues for value in values):
+        return None
+    types = set(type(valuei) for value in values for valuei in value)
+    if types <= {int, type(None)} and int in types:
+        is_none = np.array([[valuei is None for valuei in value] for value in values])
+        ints = [[0 if valuei is None else valuei for valuei in value] for value in values]
+        try:
+            array = np.array(ints, dtype='int64')
+        except OverflowError:
+            return None
+        mask_name = _add_array(arrays, is_none) if is_none.any() else None
+        return ('int_list', _add_array(arrays, array), mask_name)
+    if types == {float}:
+        return ('float_list', _add_array(arrays, np.array(values, dtype='float64')))
+    return None
+
+
+def _decode_column(column: Tuple[Any, ...], nvalues: int,
+                   arrays: Dict[str, np.ndarray]) -> List[Any]:
+    """decodes the values of an attribute (see ``_encode_column``)"""
+    kind = column[0]
+    if kind == 'const':
+        return [column[1]] * nvalues
+    elif kind in {'int', 'float', 'float_list'}:
+        return arrays[column[1]].tolist()
+    elif kind == 'str':
+        joined = column[1]
+        i1s = np.cumsum(arrays[column[2]]).tolist()
+        i0s = [0] + i1s[:-1]
+        return [joined[i0:i1] for i0, i1 in zip(i0s, i1s)]
+    elif kind == 'array':
+        return list(arrays[column[1]])
+    elif kind == 'int_list':
+        values = arrays[column[1]].tolist()
+        if column[2] is not None:
+            is_none = arrays[column[2]]
+            for i, j in zip(*np.where(is_none)):
+                values[i][j] = None
+        return values
+    assert kind == 'pickle', kind
+    return column[1]
+
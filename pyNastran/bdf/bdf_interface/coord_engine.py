@@ -0,0 +1,408 @@
+"""
+Defines the vectorized coordinate system transform engine:
+  - CoordTransformEngine(coords, nodes=None)
+  - get_coord_engine(model)
+
+The CORD1x/CORD2x chains are resolved once into stacked origin/beta
+arrays, so any (n, 3) point array or (n, 3)/(n, 6) vector array can be
+transformed between any two coordinate systems (including cylindrical
+and spherical ones) in one batched call.
+
+``get_coord_engine`` caches the engine on the model and rebuilds it
+when a coordinate card changes.
+
+.. code-block:: python
+
+   >>> engine = model.get_coord_engine()
+   >>> xyz_cid0 = engine.transform_points(xyz_cp, cps, cid_to=0)
+   >>> rtz_cid2 = engine.transform_points(xyz_cid0, 0, cid_to=2)
+
+"""
+from __future__ import annotations
+from typing import List, Dict, Tuple, Union, Optional, Any, TYPE_CHECKING
+
+import numpy as np
+
+from pyNastran.femutils.coord_transforms import (
+    xyz_to_rtz_array, xyz_to_rtp_array, rtz_to_xyz_array, rtp_to_xyz_array)
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+
+RECTANGULAR, CYLINDRICAL, SPHERICAL = 0, 1, 2
+COORD_TYPES = {
+    'CORD2R' : RECTANGULAR, 'CORD2C' : CYLINDRICAL, 'CORD2S' : SPHERICAL,
+    'CORD1R' : RECTANGULAR, 'CORD1C' : CYLINDRICAL, 'CORD1S' : SPHERICAL,
+}
+CORD2_TYPES = {'CORD2R', 'CORD2C', 'CORD2S'}
+
+
+class CoordTransformEngine:
+    """
+    Stacked origin/beta arrays for the CORD1x/CORD2x coordinate systems
+    """
+    def __init__(self, coords: Dict[int, Any], nodes: Optional[Dict[int, Any]]=None):
+        """
+        Resolves the coordinate systems
+
+        Parameters
+        ----------
+        coords : dict[cid] = Coord
+            the coordinate systems
+        nodes : dict[nid] = GRID; default=None
+            the nodes used by the CORD1x coordinate systems;
+            None : use the (already resolved) CORD1x axes
+
+        """
+        #: the coordinate systems that were skipped (e.g., CORD3G)
+        self.unsupported_cids = sorted(cid for cid, coord in coords.items()
+                                       if coord.type not in COORD_TYPES and cid != 0)
+        resolved, unresolved = _resolve_coords(coords, nodes)
+        #: the coordinate systems with circular/missing references
+        self.unresolved_cids = unresolved
+
+        #: the sorted coordinate ids
+        self.cids = np.array(sorted(resolved), dtype='int64')
+        ncoords = len(self.cids)
+        #: the origin of each coordinate system in the global frame
+        self.origin = np.zeros((ncoords, 3), dtype='float64')
+        #: the (i, j, k) axes of each coordinate system in the global frame
+        self.beta = np.zeros((ncoords, 3, 3), dtype='float64')
+        #: RECTANGULAR, CYLINDRICAL or SPHERICAL
+        self.coord_type = np.zeros(ncoords, dtype='int8')
+        for i, cid in enumerate(self.cids):
+            origin, beta, coord_type = resolved[cid]
+            self.origin[i, :] = origin
+            self.beta[i, :, :] = beta
+            self.coord_type[i] = coord_type
+
+    def get_index(self, cids: Union[int, np.ndarray]) -> Union[int, np.ndarray]:
+        """gets the index of the coordinate systems"""
+        icoord = np.searchsorted(self.cids, cids).clip(max=len(self.cids) - 1)
+        is_missing = self.cids[icoord] != cids
+        if np.any(is_missing):
+            missing = np.unique(np.asarray(cids)[is_missing] if np.ndim(cids) else cids)
+            unsupported = np.intersect1d(missing, self.unsupported_cids)
+            if len(unsupported):
+                raise NotImplementedError(f'cids={unsupported.tolist()} are not supported; '
+                                          'only CORD1x/CORD2x coordinate systems are')
+            unresolved = np.intersect1d(missing, self.unresolved_cids)
+            if len(unresolved):
+                raise RuntimeError(f'cids={unresolved.tolist()} could not be resolved '
+                                   '(circular or missing references)')
+            raise KeyError(f'cids={missing.tolist()} are not defined')
+        return icoord
+
+    def transform_points(self, xyz: np.ndarray, cid_from: Union[int, np.ndarray]=0,
+                         cid_to: int=0) -> np.ndarray:
+        """
+        Transforms points from one coordinate system to another
+
+        Parameters
+        ----------
+        xyz : (n, 3) float ndarray
+            the points in the local frame of cid_from
+            (e.g., R-theta-z for a cylindrical system; theta in degrees)
+        cid_from : int / (n, ) int ndarray; default=0
+            the coordinate system of each point (e.g., the CP of each GRID)
+        cid_to : int; default=0
+            the coordinate system the points are transformed to
+
+        Returns
+        -------
+        xyz_to : (n, 3) float ndarray
+            the points in the local frame of cid_to
+
+        """
+        xyz = np.asarray(xyz)
+        xyz_to = self._points_to_global(xyz, self.get_index(cid_from))
+        if cid_to != 0:
+            icoord = self.get_index(cid_to)
+            xyz_coord = (xyz_to - self.origin[icoord]) @ self.beta[icoord].T
+            xyz_to = _xyz_to_coord(xyz_coord, self.coord_type[icoord])
+        return xyz_to.astype(xyz.dtype, copy=False)
+
+    def _points_to_global(self, xyz: np.ndarray, icoord: Union[int, np.ndarray]) -> np.ndarray:
+        """transforms points in the local frames to the global frame"""
+        if np.ndim(icoord) == 0:
+            xyz_coord = _coord_to_xyz(xyz, self.coord_type[icoord])
+            return xyz_coord @ self.beta[icoord] + self.origin[icoord]
+
+        xyz_coord = xyz.astype('float64', copy=True)
+        coord_types = self.coord_type[icoord]
+        for coord_type in (CYLINDRICAL, SPHERICAL):
+            i = np.where(coord_types == coord_type)[0]
+            if len(i):
+                xyz_coord[i, :] = _coord_to_xyz(xyz[i, :], coord_type)
+        return np.einsum('ni,nij->nj', xyz_coord, self.beta[icoord]) + self.origin[icoord]
+
+    def get_basis(self, cids: Union[int, np.ndarray],
+                  xyz_cid0: Optional[np.ndarray]=None) -> np.ndarray:
+        """
+        Gets the local basis vectors (in the global frame) at each point
+
+        Parameters
+        ----------
+        cids : int / (n, ) int ndarray
+            the coordinate system of each point (e.g., the CD of each GRID)
+        xyz_cid0 : (n, 3) float ndarray; default=None
+            the points in the global frame; required for cylindrical and
+            spherical coordinate systems
+
+        Returns
+        -------
+        basis : (n, 3, 3) float ndarray
+            the basis of each point, so v_global = v_local @ basis[i]
+
+        """
+        icoord = self.get_index(cids)
+        if np.ndim(icoord) == 0:
+            if xyz_cid0 is None:
+                icoord = np.array([icoord])
+            else:
+                icoord = np.full(len(xyz_cid0), icoord)
+        basis = self.beta[icoord].copy()
+        coord_types = self.coord_type[icoord]
+        is_curvilinear = coord_types != RECTANGULAR
+        if not is_curvilinear.any():
+            return basis
+        if xyz_cid0 is None:
+            raise RuntimeError('xyz_cid0 is required for cylindrical/spherical '
+                               'coordinate transforms')
+
+        i = np.where(is_curvilinear)[0]
+        ic = icoord[i]
+        xyz_coord = np.einsum('nj,nij->ni', xyz_cid0[i, :] - self.origin[ic], self.beta[ic])
+        x = xyz_coord[:, 0]
+        y = xyz_coord[:, 1]
+        z = xyz_coord[:, 2]
+        azimuth = np.arctan2(y, x)
+        cos_azimuth = np.cos(azimuth)
+        sin_azimuth = np.sin(azimuth)
+        zero = np.zeros(len(i))
+        one = np.ones(len(i))
+
+        # cylindrical: (e_r, e_theta, e_z)
+        rotation = np.array([
+            [cos_azimuth, sin_azimuth, zero],
+            [-sin_azimuth, cos_azimuth, zero],
+            [zero, zero, one],
+        ]).transpose(2, 0, 1)
+
+        is_spherical = coord_types[i] == SPHERICAL
+        if is_spherical.any():
+            # spherical: (e_rho, e_theta, e_phi); theta is measured from z
+            rho = np.sqrt(x * x + y * y + z * z)
+            polar = np.zeros(len(i))
+            irho = rho != 0.
+            polar[irho] = np.arccos(z[irho] / rho[irho])
+            cos_polar = np.cos(polar)
+            sin_polar = np.sin(polar)
+            spherical = np.array([
+                [sin_polar * cos_azimuth, sin_polar * sin_azimuth, cos_polar],
+                [cos_polar * cos_azimuth, cos_polar * sin_azimuth, -sin_polar],
+                [-sin_azimuth, cos_azimuth, zero],
+            ]).transpose(2, 0, 1)
+            rotation[is_spherical] = spherical[is_spherical]
+        basis[i] = rotation @ self.beta[ic]
+        return basis
+
+    def transform_vectors(self, vectors: np.ndarray, cid_from: Union[int, np.ndarray]=0,
+                          cid_to: Union[int, np.ndarray]=0,
+                          xyz_cid0: Optional[np.ndarray]=None) -> np.ndarray:
+        """
+        Transforms vectors (e.g., displacements, forces) from one
+        coordinate system to another
+
+        Parameters
+        ----------
+        vectors : (..., n, 3) or (..., n, 6) float ndarray
+            the vectors in the local frame of cid_from; for a (..., n, 6)
+            array the translations and rotations are transformed
+        cid_from : int / (n, ) int ndarray; default=0
+            the coordinate system of each vector (e.g., the CD of each GRID)
+        cid_to : int / (n, ) int ndarray; default=0
+            the coordinate system the vectors are transformed to
+        xyz_cid0 : (n, 3) float ndarray; default=None
+            the location of the vectors in the global frame; required for
+            cylindrical and spherical coordinate systems
+
+        Returns
+        -------
+        vectors_to : (..., n, 3) or (..., n, 6) float ndarray
+            the vectors in the local frame of cid_to
+
+        """
+        vectors = np.asarray(vectors)
+        basis_from = self.get_basis(cid_from, xyz_cid0)
+        basis_to = self.get_basis(cid_to, xyz_cid0)
+        # v_to = v_from @ basis_from @ basis_to.T
+        transform = basis_from @ basis_to.transpose(0, 2, 1)
+
+        vectors_to = np.empty(vectors.shape, dtype=vectors.dtype)
+        for j in range(0, vectors.shape[-1], 3):
+            if len(transform) == 1:
+                vectors_to[..., j:j+3] = vectors[..., j:j+3] @ transform[0]
+            else:
+                vectors_to[..., j:j+3] = np.einsum('...ni,nij->...nj',
+                                                   vectors[..., j:j+3], transform)
+        return vectors_to
+
+    def update_coords(self, coords: Dict[int, Any]) -> None:
+        """
+        Sets the origin/ijk axes of the Coord objects that haven't been set up
+        (e.g., a CORD2x with a non-zero rid in a model that isn't cross-referenced)
+        """
+        for icoord, cid in enumerate(self.cids):
+            coord = coords[cid]
+            if cid == 0 or coord.i is not None:
+                continue
+            coord.origin = self.origin[icoord].copy()
+            coord.i, coord.j, coord.k = self.beta[icoord].copy()
+
+    def __repr__(self) -> str:
+        return f'CoordTransformEngine(cids={self.cids.tolist()})'
+
+
+def get_coord_engine(model: BDF) -> CoordTransformEngine:
+    """
+    Gets the coordinate transform engine for the model
+
+    The engine is cached on the model and is rebuilt when a coordinate
+    system (or a node used by a CORD1x) changes.
+
+    """
+    key = _get_coords_key(model.coords, model.nodes)
+    cached = model._coord_engine
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    engine = CoordTransformEngine(model.coords, model.nodes)
+    model._coord_engine = (key, engine)
+    return engine
+
+
+def _get_coords_key(coords: Dict[int, Any], nodes: Dict[int, Any]) -> Tuple[Any, ...]:
+    """gets the values that define the coordinate systems"""
+    key = []
+    for cid, coord in sorted(coords.items()):
+        if cid == 0:
+            continue
+        if coord.type in CORD2_TYPES:
+            key.append((cid, coord.type, coord.Rid(), np.asarray(coord.e1).tobytes(),
+                        np.asarray(coord.e2).tobytes(), np.asarray(coord.e3).tobytes()))
+        elif coord.type in COORD_TYPES:
+            keyi = [cid, coord.type]
+            for nid in coord.node_ids:
+                node = nodes.get(nid)
+                if node is not None:
+                    keyi.extend([nid, node.Cp(), node.xyz.tobytes()])
+            key.append(tuple(keyi))
+        else:
+            key.append((cid, coord.type))
+    return tuple(key)
+
+
+def _resolve_coords(coords: Dict[int, Any],
+                    nodes: Optional[Dict[int, Any]]) -> Tuple[Dict[int, Tuple[np.ndarray, np.ndarray, int]],
+                                                              List[int]]:
+    """
+    Resolves the coordinate chains
+
+    Returns
+    -------
+    resolved : dict[cid] = (origin, beta, coord_type)
+        the resolved coordinate systems
+    unresolved : List[int]
+        the coordinate systems with circular/missing references
+
+    """
+    resolved = {0: (np.zeros(3), np.eye(3), RECTANGULAR)}
+    cids_to_resolve = [cid for cid, coord in sorted(coords.items())
+                       if cid != 0 and coord.type in COORD_TYPES]
+    while cids_to_resolve:
+        cids_unresolved = []
+        for cid in cids_to_resolve:
+            coord = coords[cid]
+            if coord.type in CORD2_TYPES:
+                e123 = _get_cord2_e123(coord, resolved)
+            else:
+                e123 = _get_cord1_e123(coord, nodes, resolved)
+            if e123 is None:
+                cids_unresolved.append(cid)
+                continue
+            origin, beta = _get_axes(cid, e123)
+            resolved[cid] = (origin, beta, COORD_TYPES[coord.type])
+
+        if len(cids_unresolved) == len(cids_to_resolve):
+            break
+        cids_to_resolve = cids_unresolved
+    return resolved, cids_to_resolve
+
+
+def _get_cord2_e123(coord: Any, resolved: Dict[int, Any]) -> Optional[np.ndarray]:
+    """gets the e1, e2, e3 points of a CORD2x in the global frame"""
+    rid = coord.Rid()
+    if rid not in resolved:  # not resolved yet or missing
+        return None
+    origin, beta, coord_type = resolved[rid]
+    e123 = np.array([coord.e1, coord.e2, coord.e3], dtype='float64')
+    return _coord_to_xyz(e123, coord_type) @ beta + origin
+
+
+def _get_cord1_e123(coord: Any, nodes: Optional[Dict[int, Any]],
+                    resolved: Dict[int, Any]) -> Optional[np.ndarray]:
+    """gets the g1, g2, g3 locations of a CORD1x in the global frame"""
+    node_ids = coord.node_ids
+    if nodes is None or any(nid not in nodes for nid in node_ids):
+        if coord.i is None:
+            # the nodes are required to resolve it
+            return None
+        # use the axes that were already set up
+        return np.array([coord.origin, coord.origin + coord.k,
+                         coord.origin + coord.i])
+
+    e123 = np.zeros((3, 3), dtype='float64')
+    for i, nid in enumerate(node_ids):
+        node = nodes[nid]
+        cp = node.Cp()
+        if cp not in resolved:
+            return None
+        origin, beta, coord_type = resolved[cp]
+        e123[i, :] = _coord_to_xyz(node.xyz[np.newaxis, :], coord_type) @ beta + origin
+    return e123
+
+
+def _get_axes(cid: int, e123: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """see ``Coord.setup``"""
+    e1, e2, e3 = e123
+    e12 = e2 - e1
+    e13 = e3 - e1
+    k = _normalize(cid, e12)
+    j = _normalize(cid, np.cross(k, e13))
+    i = np.cross(j, k)
+    return e1, np.array([i, j, k])
+
+
+def _normalize(cid: int, vector: np.ndarray) -> np.ndarray:
+    """normalizes a vector"""
+    norm = np.linalg.norm(vector)
+    if norm == 0.:
+        raise RuntimeError(f'cid={cid} has an invalid unit vector; {vector}')
+    return vector / norm
+
+
+def _coord_to_xyz(xyz: np.ndarray, coord_type: int) -> np.ndarray:
+    """converts R-theta-z / rho-theta-phi points to local xyz points"""
+    if coord_type == RECTANGULAR:
+        return xyz
+    if coord_type == CYLINDRICAL:
+        return rtz_to_xyz_array(xyz)
+    return rtp_to_xyz_array(xyz)
+
+
+def _xyz_to_coord(xyz: np.ndarray, coord_type: int) -> np.ndarray:
+    """converts local xyz points to R-theta-z / rho-theta-phi points"""
+    if coord_type == RECTANGULAR:
+        return xyz
+    if coord_type == CYLINDRICAL:
+        return xyz_to_rtz_array(xyz)
+    return xyz_to_rtp_array(xyz)
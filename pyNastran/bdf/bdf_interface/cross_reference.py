@@ -74,6 +74,7 @@ from typing import List, Dict, Any
 
 from numpy import zeros, argsort, arange, array_equal, array
 from pyNastran.bdf.bdf_interface.attributes import BDFAttributes
+from pyNastran.bdf.bdf_interface.array_xref import ArrayCrossReference
 
 class XrefMesh(BDFAttributes):
     """Links up the various cards in the BDF."""
@@ -82,6 +83,7 @@ class XrefMesh(BDFAttributes):
         BDFAttributes.__init__(self)
         self._nxref_errors = 100
         self._stop_on_xref_error = True
+        self.array_xref = None
 
     # def geom_check(self):
         # """
@@ -189,6 +191,30 @@ class XrefMesh(BDFAttributes):
                 xref_sets=xref_sets, xref_optimization=xref_optimization,
                 word=' (Superelement %i)' % super_id)
 
+    def cross_reference_arrays(self) -> ArrayCrossReference:
+        """
+        Links the elements to their nodes/properties and the properties to
+        their materials with integer index arrays instead of object references
+
+        This is much faster and uses much less memory than
+        ``cross_reference`` on large models.  The cards are not modified.
+
+        Returns
+        -------
+        array_xref : ArrayCrossReference
+            the index arrays; also stored as ``model.array_xref``
+
+        .. code-block:: python
+
+           model = BDF()
+           model.read_bdf(bdf_filename, xref='arrays')
+           area = model.array_xref.area('CQUAD4')
+
+        """
+        self.log.debug('Cross Referencing (arrays)...')
+        self.array_xref = ArrayCrossReference(self)
+        return self.array_xref
+
     def _cross_reference_constraints(self) -> None:
         """
         Links the SPCADD, SPC, SPCAX, SPCD, MPCADD, MPC, SUPORT,
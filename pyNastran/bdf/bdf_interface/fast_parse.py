@@ -0,0 +1,352 @@
+"""
+Defines the vectorized bulk data parser for the high-volume cards:
+ - parse_fast_cards(cards_list)
+ - FAST_CARD_NAMES
+
+``BDF._parse_cards_list`` normally creates a ``BDFCard`` for each card,
+converts each field with ``integer``/``double`` and then creates the
+card object.  For GRID, CQUAD4, CTRIA3, CTETRA and CHEXA cards, the
+fields (small field, large field or CSV) are instead stacked into a
+(ncards, nfields) string array per card type and converted to integers
+and floats a column at a time.
+
+Cards that use an uncommon form (e.g., GRID with a PS, CQUAD4 with
+theta/zoffset/thickness, Nastran exponent floats like 1.-5, or a bad
+field) are not handled here and go through the standard parser, so the
+error messages are unchanged.
+
+"""
+from typing import List, Dict, Tuple, Optional, Any
+
+import numpy as np
+
+from pyNastran.bdf.bdf_interface.utils import to_fields
+from pyNastran.bdf.cards.nodes import GRID
+from pyNastran.bdf.cards.elements.shell import CQUAD4, CTRIA3
+from pyNastran.bdf.cards.elements.solid import CTETRA4, CTETRA10, CHEXA8, CHEXA20
+
+FAST_CARD_NAMES = {'GRID', 'CQUAD4', 'CTRIA3', 'CTETRA', 'CHEXA'}
+
+#: a card that fails is left for the standard parser, which stores the error
+CARD_ERRORS = (SyntaxError, AssertionError, KeyError, ValueError)
+
+#: the number of fields on the parsed lines (name + 8 per line)
+NFIELDS_MAX = {
+    'GRID' : 9,
+    'CQUAD4' : 9,
+    'CTRIA3' : 9,
+    'CTETRA' : 17,
+    'CHEXA' : 25,
+}
+
+
+def parse_fast_cards(cards_list: List[Any]) -> Dict[int, Tuple[str, Any]]:
+    """
+    Creates the card objects for the GRID, CQUAD4, CTRIA3, CTETRA and
+    CHEXA cards
+
+    Parameters
+    ----------
+    cards_list : List[card]
+        card = [card_name, comment, card_lines, (ifile, iline)]
+
+    Returns
+    -------
+    objs : Dict[icard] = (card_name, obj)
+        icard : int
+            the index of the card in cards_list
+        obj : GRID, CQUAD4, ...
+            the card object; cards that can't be vectorized aren't included
+
+    """
+    card_groups = {}  # type: Dict[str, CardGroup]
+    for icard, (card_name, comment, card_lines, unused_ifile_iline) in enumerate(cards_list):
+        if card_name not in FAST_CARD_NAMES:
+            continue
+        try:
+            group = card_groups[card_name]
+        except KeyError:
+            group = card_groups[card_name] = CardGroup(NFIELDS_MAX[card_name])
+        group.add(icard, comment, card_lines, card_name)
+
+    objs = {}  # type: Dict[int, Tuple[str, Any]]
+    for card_name, group in card_groups.items():
+        icards, fields, comments = group.get_fields()
+        if not icards:
+            continue
+        func = FAST_CARD_FUNCS[card_name]
+        for icard, obj in zip(icards, func(Fields(fields), comments)):
+            if obj is not None:
+                objs[icard] = (card_name, obj)
+    return objs
+
+
+class CardGroup:
+    """
+    Stores the cards of a single type.  Small field cards without tabs
+    or commas are stored as a padded string (8 characters per field),
+    so they can be split into fields with a view.
+    """
+    def __init__(self, nfields: int) -> None:
+        self.nfields = nfields
+        self.nchars = 8 * nfields
+        self.icards_fixed = []  # type: List[int]
+        self.lines_fixed = []  # type: List[str]
+        self.comments_fixed = []  # type: List[str]
+        self.icards = []  # type: List[int]
+        self.fields = []  # type: List[List[str]]
+        self.comments = []  # type: List[str]
+
+    def add(self, icard: int, comment: str, card_lines: List[str], card_name: str) -> None:
+        """adds a card"""
+        nchars = self.nchars
+        line = ''.join(card_lines)
+        if '=' in line:
+            return
+        if not ('*' in line or ',' in line or '\t' in line):
+            line = card_lines[0][:72].ljust(72) + ''.join(
+                linei[8:72].ljust(64) for linei in card_lines[1:])
+            if len(line) > nchars:
+                if line[nchars:].strip():
+                    return
+                line = line[:nchars]
+            self.icards_fixed.append(icard)
+            self.lines_fixed.append(line.ljust(nchars))
+            self.comments_fixed.append(comment)
+            return
+
+        nfields = self.nfields
+        fields = to_fields(card_lines, card_name)
+        if len(fields) > nfields:
+            if any(field.strip() for field in fields[nfields:]):
+                return
+            fields = fields[:nfields]
+        elif len(fields) < nfields:
+            fields += [''] * (nfields - len(fields))
+        self.icards.append(icard)
+        self.fields.append(fields)
+        self.comments.append(comment)
+
+    def get_fields(self) -> Tuple[List[int], np.ndarray, List[str]]:
+        """gets the (ncards, nfields) string array"""
+        nfields = self.nfields
+        fields = np.array(self.lines_fixed, dtype=f'U{self.nchars}').view('U8').reshape(
+            len(self.lines_fixed), nfields)
+        if self.fields:
+            fields = np.vstack([fields, np.array(self.fields, dtype='U')])
+        icards = self.icards_fixed + self.icards
+        comments = self.comments_fixed + self.comments
+        return icards, fields, comments
+
+
+class Fields:
+    """
+    A (ncards, nfields) string array and the blank/decimal point flags,
+    which are found from the character codes
+    """
+    def __init__(self, fields: np.ndarray) -> None:
+        ncards, nfields = fields.shape
+        nchars = fields.dtype.itemsize // 4
+        codes = np.ascontiguousarray(fields).view('uint32').reshape(ncards, nfields, nchars)
+        self.fields = fields
+        self.is_blank = ((codes == 32) | (codes == 0)).all(axis=2)
+        self.is_float = (codes == 46).any(axis=2)  # .
+        self.nfields = nfields - np.argmax(~self.is_blank[:, ::-1], axis=1)
+
+    def __len__(self) -> int:
+        return self.fields.shape[0]
+
+    def to_int(self, ifield: int, default: Optional[int]=None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Converts a field to integers
+
+        Parameters
+        ----------
+        ifield : int
+            the field index
+        default : int; default=None
+            the value for a blank field; None -> blank isn't valid
+
+        Returns
+        -------
+        ints : (ncards, ) int ndarray
+            the values
+        is_valid : (ncards, ) bool ndarray
+            can the field be vectorized
+
+        """
+        values = self.fields[:, ifield]
+        is_blank = self.is_blank[:, ifield]
+        ints = np.zeros(len(values), dtype='int64')
+        is_valid = np.ones(len(values), dtype='bool')
+        if default is None:
+            is_valid[is_blank] = False
+        else:
+            ints[is_blank] = default
+
+        inonblank = np.where(~is_blank)[0]
+        try:
+            ints[inonblank] = values[inonblank].astype('int64')
+        except ValueError:
+            for i in inonblank:
+                try:
+                    ints[i] = int(values[i])
+                except ValueError:
+                    is_valid[i] = False
+        return ints, is_valid
+
+    def to_float(self, ifield: int, default: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Converts a field to floats; see ``to_int``.
+
+        Only fields with a decimal point (e.g., 1., 1.5, 1.e-5) are handled.
+        Fields like 1.-5 or 1.D+5 are left for the standard parser.
+        """
+        values = self.fields[:, ifield]
+        is_blank = self.is_blank[:, ifield]
+        floats = np.full(len(values), default, dtype='float64')
+        is_valid = is_blank | self.is_float[:, ifield]
+
+        ifloat = np.where(is_valid & ~is_blank)[0]
+        try:
+            floats[ifloat] = values[ifloat].astype('float64')
+        except ValueError:
+            for i in ifloat:
+                try:
+                    floats[i] = float(values[i])
+                except ValueError:
+                    is_valid[i] = False
+        is_valid &= np.isfinite(floats)
+        return floats, is_valid
+
+
+def _get_grids(fields: Fields, comments: List[str]) -> List[Optional[GRID]]:
+    """
+    +------+-----+----+----+----+----+----+----+------+
+    |   1  |  2  | 3  | 4  | 5  | 6  |  7 | 8  |  9   |
+    +======+=====+====+====+====+====+====+====+======+
+    | GRID | NID | CP | X1 | X2 | X3 | CD | PS | SEID |
+    +------+-----+----+----+----+----+----+----+------+
+    """
+    nid, is_valid = fields.to_int(1)
+    cp, is_validi = fields.to_int(2, 0)
+    is_valid &= is_validi
+    xyz = np.zeros((len(nid), 3), dtype='float64')
+    for i in range(3):
+        xyz[:, i], is_validi = fields.to_float(3 + i, 0.)
+        is_valid &= is_validi
+    cd, is_validi = fields.to_int(6, 0)
+    is_valid &= is_validi
+    seid, is_validi = fields.to_int(8, 0)
+    is_valid &= is_validi
+
+    # the PS field is a component string, which is validated by the standard parser
+    is_valid &= fields.is_blank[:, 7]
+
+    objs = [None] * len(nid)  # type: List[Optional[GRID]]
+    for i, nidi, cpi, xyzi, cdi, seidi, comment in zip(
+            np.where(is_valid)[0], nid[is_valid].tolist(), cp[is_valid].tolist(),
+            xyz[is_valid], cd[is_valid].tolist(), seid[is_valid].tolist(),
+            _get_valid(comments, is_valid)):
+        try:
+            objs[i] = GRID(nidi, xyzi, cp=cpi, cd=cdi, ps='', seid=seidi, comment=comment)
+        except CARD_ERRORS:
+            pass
+    return objs
+
+
+def _get_shells(card_class: Any, nnodes: int,
+                fields: Fields, comments: List[str]) -> List[Optional[Any]]:
+    """
+    Gets the CQUAD4/CTRIA3 cards without theta/mcid, zoffset or thickness
+
+    +--------+-------+-------+----+----+----+----+
+    |   1    |   2   |   3   |  4 |  5 |  6 | 7  |
+    +========+=======+=======+=====+===+====+====+
+    | CQUAD4 |  EID  |  PID  | N1 | N2 | N3 | N4 |
+    +--------+-------+-------+----+----+----+----+
+    """
+    eid, is_valid = fields.to_int(1)
+    pid, is_validi = fields.to_int(2, 0)
+    is_valid &= is_validi
+
+    # pid defaults to the eid
+    is_blank = fields.is_blank[:, 2]
+    pid[is_blank] = eid[is_blank]
+
+    nids = np.zeros((len(eid), nnodes), dtype='int64')
+    for i in range(nnodes):
+        nids[:, i], is_validi = fields.to_int(3 + i)
+        is_valid &= is_validi
+    is_valid &= fields.nfields <= 3 + nnodes
+
+    objs = [None] * len(eid)  # type: List[Optional[Any]]
+    for i, eidi, pidi, nidsi, comment in zip(
+            np.where(is_valid)[0], eid[is_valid].tolist(), pid[is_valid].tolist(),
+            nids[is_valid].tolist(), _get_valid(comments, is_valid)):
+        try:
+            objs[i] = card_class(eidi, pidi, nidsi, comment=comment)
+        except CARD_ERRORS:
+            pass
+    return objs
+
+
+def _get_solids(card_class1: Any, card_class2: Any, nnodes1: int, nnodes2: int,
+                fields: Fields, comments: List[str]) -> List[Optional[Any]]:
+    """
+    Gets the CTETRA4/CTETRA10 or CHEXA8/CHEXA20 cards.  The mid-side nodes
+    of the CTETRA10/CHEXA20 are optional.
+
+    +-------+-----+-----+----+----+----+----+-----+-----+
+    |   1   |  2  |  3  |  4 |  5 |  6 |  7 |  8  |  9  |
+    +=======+=====+=====+====+====+====+====+=====+=====+
+    | CHEXA | EID | PID | G1 | G2 | G3 | G4 | G5  | G6  |
+    +-------+-----+-----+----+----+----+----+-----+-----+
+    |       | G7  | G8  |    |    |    |    |     |     |
+    +-------+-----+-----+----+----+----+----+-----+-----+
+    """
+    eid, is_valid = fields.to_int(1)
+    pid, is_validi = fields.to_int(2)
+    is_valid &= is_validi
+
+    nfields = fields.nfields
+    is_card1 = nfields == 3 + nnodes1
+    is_valid &= nfields <= 3 + nnodes2
+
+    nids = np.zeros((len(eid), nnodes2), dtype='int64')
+    for i in range(nnodes2):
+        nids[:, i], is_validi = fields.to_int(3 + i, 0)
+        is_valid &= is_validi
+    is_blank = fields.is_blank[:, 3:3 + nnodes2]
+
+    # the corner nodes are required
+    is_valid &= ~is_blank[:, :nnodes1].any(axis=1)
+
+    objs = [None] * len(eid)  # type: List[Optional[Any]]
+    for i in np.where(is_valid)[0]:
+        comment = comments[i]
+        try:
+            if is_card1[i]:
+                objs[i] = card_class1(int(eid[i]), int(pid[i]), nids[i, :nnodes1].tolist(),
+                                      comment=comment)
+            else:
+                nidsi = [None if is_blanki else nid
+                         for nid, is_blanki in zip(nids[i, :].tolist(), is_blank[i, :])]
+                objs[i] = card_class2(int(eid[i]), int(pid[i]), nidsi, comment=comment)
+        except CARD_ERRORS:
+            pass
+    return objs
+
+
+def _get_valid(values: List[Any], is_valid: np.ndarray) -> List[Any]:
+    """filters a list"""
+    return [value for value, is_validi in zip(values, is_valid) if is_validi]
+
+
+FAST_CARD_FUNCS = {
+    'GRID' : _get_grids,
+    'CQUAD4' : lambda fields, comments: _get_shells(CQUAD4, 4, fields, comments),
+    'CTRIA3' : lambda fields, comments: _get_shells(CTRIA3, 3, fields, comments),
+    'CTETRA' : lambda fields, comments: _get_solids(CTETRA4, CTETRA10, 4, 10, fields, comments),
+    'CHEXA' : lambda fields, comments: _get_solids(CHEXA8, CHEXA20, 8, 20, fields, comments),
+}
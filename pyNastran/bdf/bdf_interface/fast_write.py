@@ -0,0 +1,506 @@
+"""
+Defines the vectorized bulk data writer for the high-volume cards:
+ - write_cards_8(bdf_file, cards, is_double)
+ - print_floats_8(values)
+
+``BDF.write_bdf`` normally calls ``card.write_card(size, is_double)``
+for each card.  For GRID, CQUAD4, CTRIA3, CTETRA, CHEXA, CBAR, CONM2 and
+RBE2 cards in small field format, the fields are instead collected per
+card type and formatted a column at a time into a (ncards, nchars)
+character array, which is written in large blocks.  The output is
+identical to ``write_card``.
+
+Floats use the same rules as ``print_float_8``.  The fixed point forms
+(e.g., 0.001 <= value < 1.e6) are built from integers, while the rest
+(scientific notation, large values, exact rounding ties) are passed to
+``print_float_8``.  Cards that use an uncommon form (e.g., a GRID with a
+CD/PS/SEID or an element with a missing node) are written with
+``write_card``, so the error messages are unchanged.
+
+"""
+from typing import List, Tuple, Any
+
+import numpy as np
+
+from pyNastran.femutils.utils import concatenate_ranges
+from pyNastran.bdf.field_writer_8 import print_float_8, print_field_8
+from pyNastran.bdf.cards.nodes import GRID
+from pyNastran.bdf.cards.elements.shell import CQUAD4, CTRIA3
+from pyNastran.bdf.cards.elements.solid import CTETRA4, CTETRA10, CHEXA8, CHEXA20
+from pyNastran.bdf.cards.elements.bars import CBAR
+from pyNastran.bdf.cards.elements.mass import CONM2
+from pyNastran.bdf.cards.elements.rigid import RBE2
+
+#: shorter lists of cards are written with ``write_card``
+MIN_CARDS = 100
+
+#: the number of cards that are formatted at once
+CHUNK_SIZE = 50000
+
+SPACE, PLUS, MINUS, DOT, ZERO, NEWLINE = (ord(char) for char in ' +-.0\n')
+POW10 = 10 ** np.arange(19, dtype='int64')
+
+#: (chars, lengths, is_valid); segment j of card i is chars[i, j, :lengths[i, j]]
+Rows = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+def write_cards_8(bdf_file: Any, cards: List[Any], is_double: bool=False) -> None:
+    """
+    Writes a list of cards in small field format
+
+    Parameters
+    ----------
+    bdf_file : file
+        the file object
+    cards : List[card]
+        the cards to write in order (e.g., sorted by id)
+    is_double : bool; default=False
+        passed to ``write_card`` for the cards that aren't vectorized
+
+    """
+    if len(cards) < MIN_CARDS:
+        for card in cards:
+            bdf_file.write(card.write_card(8, is_double))
+        return
+
+    for i0 in range(0, len(cards), CHUNK_SIZE):
+        bdf_file.write(_write_chunk_8(cards[i0:i0 + CHUNK_SIZE], is_double))
+
+
+def _write_chunk_8(cards: List[Any], is_double: bool) -> str:
+    """gets the small field string for a list of cards"""
+    ncards = len(cards)
+    icards_by_class = {}
+    for icard, card in enumerate(cards):
+        card_class = card.__class__
+        if card_class in ROW_FUNCS:
+            icards_by_class.setdefault(card_class, []).append(icard)
+
+    groups = []
+    nsegments = 1
+    for card_class, icards in icards_by_class.items():
+        chars, lengths, is_valid = ROW_FUNCS[card_class]([cards[icard] for icard in icards])
+        groups.append((np.array(icards), chars, lengths, is_valid))
+        nsegments = max(nsegments, chars.shape[1])
+
+    # segment 0 is the comment; segments 1+ are the card
+    starts = np.zeros((ncards, nsegments + 1), dtype='int64')
+    lengths_all = np.zeros((ncards, nsegments + 1), dtype='int64')
+    is_written = np.zeros(ncards, dtype='bool')
+    buffers = []
+    nbytes = 0
+    for icards, chars, lengths, is_valid in groups:
+        nrows, nsegments_group, width = chars.shape
+        offsets = np.arange(nrows * nsegments_group).reshape(nrows, nsegments_group) * width
+        starts[icards, 1:nsegments_group + 1] = nbytes + offsets
+        lengths_all[icards, 1:nsegments_group + 1] = np.where(is_valid[:, np.newaxis], lengths, 0)
+        is_written[icards[is_valid]] = True
+        buffers.append(chars.ravel())
+        nbytes += chars.size
+
+    # the comments and the cards that aren't vectorized
+    extra_slots = []
+    extra_strings = []
+    for icard, card in enumerate(cards):
+        if is_written[icard]:
+            if card.comment:
+                extra_slots.append((icard, 0))
+                extra_strings.append(card.comment)
+        else:
+            extra_slots.append((icard, 1))
+            extra_strings.append(card.write_card(8, is_double))
+
+    if extra_strings:
+        extra_bytes = [string.encode('utf8') for string in extra_strings]
+        extra_lengths = np.array([len(string) for string in extra_bytes], dtype='int64')
+        icards, islots = np.array(extra_slots, dtype='int64').T
+        starts[icards, islots] = nbytes + np.cumsum(extra_lengths) - extra_lengths
+        lengths_all[icards, islots] = extra_lengths
+        buffers.append(np.frombuffer(b''.join(extra_bytes), dtype='uint8'))
+
+    buffer = np.concatenate(buffers)
+    data = buffer[concatenate_ranges(starts.ravel(), lengths_all.ravel())]
+    return data.tobytes().decode('utf8')
+
+
+def print_floats_8(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized version of ``print_float_8``
+
+    Parameters
+    ----------
+    values : (n, ) float ndarray
+        the values to print
+
+    Returns
+    -------
+    chars : (n, 8) uint8 ndarray
+        the 8-character fields as characters
+    is_valid : (n, ) bool ndarray
+        False if the field isn't 8 characters long
+
+    """
+    values = np.asarray(values, dtype='float64')
+    nvalues = len(values)
+    chars = np.full((nvalues, 8), SPACE, dtype='uint8')
+    is_valid = np.ones(nvalues, dtype='bool')
+
+    with np.errstate(invalid='ignore'):
+        abs_values = np.abs(values)
+        is_negative = values < 0.
+        is_zero = values == 0.
+        # the same bounds as print_float_8 (e.g., "%8.7f" for 0.001 <= value < 1.)
+        is_fixed = np.where(is_negative,
+                            (abs_values >= 0.01) & (abs_values < 100000.),
+                            (abs_values >= 0.001) & (abs_values < 1000000.))
+    chars[is_zero, 6] = ZERO
+    chars[is_zero, 7] = DOT
+
+    ifixed = np.where(is_fixed)[0]
+    abs_fixed = abs_values[ifixed]
+    is_negative = is_negative[ifixed]
+    ndecimals = np.where(is_negative, 6, 7)
+    for power in range(6):
+        ndecimals -= abs_fixed >= 10. ** power
+
+    # round to the integer with ndecimals implied decimal places; the
+    # rounding error of the multiply is ~1e-9, so values that are close
+    # to a tie are left for the string formatting
+    scaled = abs_fixed * 10. ** ndecimals
+    floor = np.floor(scaled)
+    remainder = scaled - floor
+    is_tie = np.abs(remainder - 0.5) < 1e-6
+    ivalues = floor.astype('int64') + (remainder > 0.5)
+
+    integer_part, decimal_part = np.divmod(ivalues, POW10[ndecimals])
+    ntrailing_zeros = np.zeros(len(ifixed), dtype='int64')
+    for ndigits in range(1, 8):
+        ntrailing_zeros += (decimal_part % POW10[ndigits] == 0) & (ndigits <= ndecimals)
+    ndecimals -= ntrailing_zeros
+    decimal_part //= POW10[ntrailing_zeros]
+    ninteger = np.zeros(len(ifixed), dtype='int64')
+    for ndigits in range(8):
+        ninteger += integer_part >= POW10[ndigits]
+    is_tie |= (is_negative + ninteger + ndecimals + 1) > 8
+
+    # fill the characters from right to left; e.g., '-12.5' or '.001'
+    fixed_chars = np.full((len(ifixed), 8), SPACE, dtype='uint8')
+    for i in range(8):
+        char = np.where(is_negative & (i == ndecimals + ninteger + 1), MINUS, SPACE)
+        iinteger = i - ndecimals - 1
+        is_integer = (iinteger >= 0) & (iinteger < ninteger)
+        integer_digit = integer_part // POW10[np.clip(iinteger, 0, 18)] % 10
+        char = np.where(is_integer, ZERO + integer_digit, char)
+        char = np.where(i == ndecimals, DOT, char)
+        decimal_digit = decimal_part // POW10[min(i, 18)] % 10
+        char = np.where(i < ndecimals, ZERO + decimal_digit, char)
+        fixed_chars[:, 7 - i] = char
+    chars[ifixed] = fixed_chars
+
+    is_scalar = ~(is_fixed | is_zero)
+    is_scalar[ifixed[is_tie]] = True
+    for i in np.where(is_scalar)[0]:
+        try:
+            field = print_float_8(values[i])
+        except ValueError:  # inf
+            field = ''
+        if len(field) == 8:
+            chars[i] = np.frombuffer(field.encode('ascii'), dtype='uint8')
+        else:
+            is_valid[i] = False
+    return chars, is_valid
+
+
+def _print_ints_8(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """vectorized version of ``'%8i' % value``"""
+    nvalues = len(values)
+    is_negative = values < 0
+    is_valid = (values > -10000000) & (values < 100000000)
+    abs_values = np.where(is_valid, np.abs(values), 0)
+    ndigits = np.ones(nvalues, dtype='int64')
+    for power in range(1, 8):
+        ndigits += abs_values >= POW10[power]
+
+    chars = np.empty((nvalues, 8), dtype='uint8')
+    for i in range(8):
+        char = np.where(is_negative & (i == ndigits), MINUS, SPACE)
+        chars[:, 7 - i] = np.where(i < ndigits, ZERO + abs_values // POW10[i] % 10, char)
+    return chars, is_valid
+
+
+def _print_fields_8(values: List[Any], field_type: str='field') -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Prints a column of fields
+
+    Parameters
+    ----------
+    values : List[int/float/str/None]
+        the values to print
+    field_type : str; default='field'
+        'field' : ``print_field_8(value)``
+        'int' : ``'%8i' % value``
+        'int_blank' : ``'%8i' % value`` or a blank field for None
+
+    Returns
+    -------
+    chars : (n, 8) uint8 ndarray
+        the 8-character fields as characters
+    is_valid : (n, ) bool ndarray
+        False if the value must be written by the card
+
+    """
+    if isinstance(values, np.ndarray):
+        return _print_ints_8(values)
+    types = list(map(type, values))
+    type_set = set(types)
+    if type_set == {int}:
+        try:
+            return _print_ints_8(np.array(values, dtype='int64'))
+        except OverflowError:
+            pass
+
+    nvalues = len(values)
+    chars = np.full((nvalues, 8), SPACE, dtype='uint8')
+    is_valid = np.ones(nvalues, dtype='bool')
+    if type_set <= {int, float, type(None)}:
+        # the common case (e.g., optional fields that are blank or a float)
+        for value_type, func in ((int, _print_ints_8), (float, print_floats_8)):
+            if value_type not in type_set:
+                continue
+            ivalues = [i for i, type_i in enumerate(types) if type_i is value_type]
+            if value_type is float and field_type != 'field':
+                is_valid[ivalues] = False
+                continue
+            try:
+                chars_values, is_valid_values = func(np.array([values[i] for i in ivalues]))
+            except OverflowError:
+                is_valid[ivalues] = False
+                continue
+            chars[ivalues] = chars_values
+            is_valid[ivalues] &= is_valid_values
+        if field_type == 'int' and type(None) in type_set:
+            is_valid[[i for i, type_i in enumerate(types) if type_i is type(None)]] = False
+        return chars, is_valid
+
+    iints = []
+    ints = []
+    ifloats = []
+    floats = []
+    for i, value in enumerate(values):
+        if isinstance(value, int) and abs(value) < 100000000:
+            iints.append(i)
+            ints.append(value)
+        elif value is None:
+            is_valid[i] = field_type != 'int'
+        elif field_type != 'field':
+            is_valid[i] = False
+        elif isinstance(value, (float, np.float32, np.float64)):
+            ifloats.append(i)
+            floats.append(value)
+        else:
+            try:
+                field = print_field_8(value)
+                chars[i] = np.frombuffer(field.encode('ascii'), dtype='uint8')
+            except (RuntimeError, ValueError, UnicodeEncodeError):
+                is_valid[i] = False
+
+    for ivalues, func, ivalues_list in ((iints, _print_ints_8, ints),
+                                       (ifloats, print_floats_8, floats)):
+        if ivalues:
+            chars_values, is_valid_values = func(np.array(ivalues_list))
+            chars[ivalues] = chars_values
+            is_valid[ivalues] &= is_valid_values
+    return chars, is_valid
+
+
+def _template_rows(parts: List[Any], is_valid: np.ndarray, rstrip: bool=False) -> Rows:
+    """
+    Stacks the fields of a fixed format card (e.g., 'GRID    %8i%8s...')
+
+    Parameters
+    ----------
+    parts : List[str/(n, 8) uint8 ndarray]
+        the strings and columns of the card without the trailing newline
+    is_valid : (n, ) bool ndarray
+        can the row be vectorized
+    rstrip : bool; default=False
+        strip the trailing whitespace (e.g., blank optional fields)
+
+    """
+    nrows = len(is_valid)
+    arrays = []
+    for part in parts:
+        if isinstance(part, str):
+            part = np.broadcast_to(np.frombuffer(part.encode('ascii'), dtype='uint8'),
+                                   (nrows, len(part)))
+        arrays.append(part)
+    arrays.append(np.full((nrows, 1), NEWLINE, dtype='uint8'))
+    chars = np.hstack(arrays)
+    width = chars.shape[1]
+    if rstrip:
+        is_blank = (chars[:, :-1] == SPACE) | (chars[:, :-1] == NEWLINE)
+        lengths = width - np.argmin(is_blank[:, ::-1], axis=1)
+        chars[np.arange(nrows), lengths - 1] = NEWLINE
+    else:
+        lengths = np.full(nrows, width, dtype='int64')
+    return chars[:, np.newaxis, :], lengths[:, np.newaxis], is_valid
+
+
+def _grid_rows(nodes: List[GRID]) -> Rows:
+    """see ``GRID.write_card_8``"""
+    nids, nids_valid = _print_fields_8([node.nid for node in nodes], 'int')
+    cps = [node.Cp() for node in nodes]
+    cps, cps_valid = _print_fields_8([None if cp == 0 else cp for cp in cps], 'int_blank')
+    is_default = np.array([[node.Cd(), node.ps, node.seid] == [0, '', 0] for node in nodes])
+
+    xyz = np.array([node.xyz for node in nodes], dtype='float64')
+    parts = ['GRID    ', nids, cps]
+    is_valid = nids_valid & cps_valid & is_default
+    for i in range(3):
+        chars, floats_valid = print_floats_8(xyz[:, i])
+        parts.append(chars)
+        is_valid &= floats_valid
+    return _template_rows(parts, is_valid)
+
+
+def _get_element_columns(elements: List[Any], nnodes: int) -> Tuple[List[Any], np.ndarray]:
+    """gets the (eid, pid, nid1, nid2, ...) columns"""
+    eids = [element.eid for element in elements]
+    pids = [element.Pid() for element in elements]
+    # node_ids without the checks; a 0 is an error or a blank field
+    nids_list = [element.nodes if element.nodes_ref is None else element.node_ids
+                 for element in elements]
+    try:
+        nids = np.array(nids_list, dtype='int64')
+        assert nids.shape == (len(elements), nnodes)
+    except (TypeError, ValueError, OverflowError, AssertionError):
+        # missing midside nodes
+        is_valid = np.ones(len(elements), dtype='bool')
+        for i, nids_i in enumerate(nids_list):
+            if len(nids_i) != nnodes or 0 in nids_i:
+                nids_list[i] = [None] * nnodes
+                is_valid[i] = False
+        return [eids, pids] + list(zip(*nids_list)), is_valid
+
+    is_valid = (nids != 0).all(axis=1)
+    return [eids, pids] + list(nids.T), is_valid
+
+
+def _blank_if_default(values: List[Any], default: Any) -> List[Any]:
+    """vectorized version of ``set_blank_if_default`` for int/float/str/None values"""
+    return [None if value == default or value != value else value
+            for value in values]
+
+
+def _print_columns_8(columns: List[Any], field_type: str,
+                     is_valid: np.ndarray) -> List[np.ndarray]:
+    """prints a series of columns"""
+    chars = []
+    for column in columns:
+        chars_column, is_valid_column = _print_fields_8(column, field_type)
+        chars.append(chars_column)
+        is_valid &= is_valid_column
+    return chars
+
+
+def _shell_rows(elements: List[Any], card_name: str, nnodes: int) -> Rows:
+    """see ``CTRIA3.write_card`` and ``CQUAD4.write_card``"""
+    columns, is_valid = _get_element_columns(elements, nnodes)
+    ints = _print_columns_8(columns, 'int', is_valid)
+
+    thicknesses = [[element.T1 for element in elements],
+                   [element.T2 for element in elements],
+                   [element.T3 for element in elements]]
+    if nnodes == 4:
+        thicknesses.append([element.T4 for element in elements])
+    theta_mcids = [element.theta_mcid for element in elements]
+    zoffsets = [element.zoffset for element in elements]
+    tflags = [element.tflag for element in elements]
+
+    # the optional fields are blank if they're all the default
+    is_default = np.ones(len(elements), dtype='bool')
+    for values, default in zip([theta_mcids, zoffsets, tflags] + thicknesses,
+                               [0.0, 0.0, 0] + [1.0] * nnodes):
+        is_default &= np.array([value == default for value in values], dtype='bool')
+
+    # _get_theta_mcid_repr
+    theta_mcids = [element.Theta_mcid() for element in elements]
+    theta_mcids = [None if isinstance(theta_mcid, float) and (
+                       theta_mcid == 0.0 or theta_mcid != theta_mcid) else theta_mcid
+                   for theta_mcid in theta_mcids]
+    optional_columns = [theta_mcids, _blank_if_default(zoffsets, 0.0),
+                        _blank_if_default(tflags, 0)]
+    optional_columns += [_blank_if_default(values, 1.0) for values in thicknesses]
+    fields = _print_columns_8(optional_columns, 'field', is_valid)
+    for field in fields:
+        field[is_default] = SPACE
+
+    parts = ['%-8s' % card_name] + ints + fields[:2] + ['\n' + ' ' * 16] + fields[2:]
+    return _template_rows(parts, is_valid, rstrip=True)
+
+
+def _solid_rows(elements: List[Any], nnodes: int, nlinear: int) -> Rows:
+    """
+    see ``CTETRA4.write_card``, ``CTETRA10.write_card``,
+    ``CHEXA8.write_card`` and ``CHEXA20.write_card``
+    """
+    columns, is_valid = _get_element_columns(elements, nnodes)
+    fields = (_print_columns_8(columns[:nlinear + 2], 'int', is_valid) +
+              _print_columns_8(columns[nlinear + 2:], 'int_blank', is_valid))
+    card_name = 'CTETRA  ' if nlinear == 4 else 'CHEXA   '
+    parts = [card_name]
+    for i, field in enumerate(fields):
+        if i and i % 8 == 0:
+            parts.append('\n        ')
+        parts.append(field)
+    return _template_rows(parts, is_valid, rstrip=nnodes > nlinear)
+
+
+def _print_card_rows(cards: List[Any]) -> Rows:
+    """see ``print_card_8(card.repr_fields())``"""
+    rows = [card.repr_fields() for card in cards]
+    card_name = '%-8s' % rows[0][0]
+    is_valid = np.array([row[0] == rows[0][0] for row in rows]) & (len(card_name) == 8)
+    nfields = max(len(row) for row in rows) - 1
+    nlines = max(1, (nfields + 7) // 8)
+    columns = [[row[i] if i < len(row) else None for row in rows]
+               for i in range(1, nlines * 8 + 1)]
+    fields = _print_columns_8(columns, 'field', is_valid)
+
+    # (nrows, nlines, 80 + newline); the first field is the card name or blank
+    nrows = len(rows)
+    chars = np.full((nrows, nlines, 73), SPACE, dtype='uint8')
+    chars[:, 0, :8] = np.frombuffer(card_name.encode('ascii'), dtype='uint8')
+    chars[:, :, 8:72] = np.hstack(fields).reshape(nrows, nlines, 64)
+
+    # each line is rstripped, a blank continuation line is written as '+'
+    # and the blank lines at the end are removed
+    is_blank = chars[:, :, :72] == SPACE
+    lengths = 72 - np.argmin(is_blank[:, :, ::-1], axis=2)
+    is_blank_line = is_blank.all(axis=2)
+    ilast = nlines - 1 - np.argmin(is_blank_line[:, ::-1], axis=1)
+    irows, ilines = np.where(is_blank_line)
+    chars[irows, ilines, 0] = PLUS
+    lengths[irows, ilines] = 1
+    irow = np.arange(nrows)
+    is_valid &= chars[irow, ilast, lengths[irow, ilast] - 1] != PLUS
+
+    irows, ilines = np.indices(lengths.shape)
+    chars[irows, ilines, lengths] = NEWLINE
+    lengths += 1
+    lengths[ilines > ilast[:, np.newaxis]] = 0
+    return chars, lengths, is_valid
+
+
+ROW_FUNCS = {
+    GRID : _grid_rows,
+    CTRIA3 : lambda elements: _shell_rows(elements, 'CTRIA3', 3),
+    CQUAD4 : lambda elements: _shell_rows(elements, 'CQUAD4', 4),
+    CTETRA4 : lambda elements: _solid_rows(elements, 4, 4),
+    CTETRA10 : lambda elements: _solid_rows(elements, 10, 4),
+    CHEXA8 : lambda elements: _solid_rows(elements, 8, 8),
+    CHEXA20 : lambda elements: _solid_rows(elements, 20, 8),
+    CBAR : _print_card_rows,
+    CONM2 : _print_card_rows,
+    RBE2 : _print_card_rows,
+}
@@ -0,0 +1,110 @@
+"""
+Defines the parallel card parsing used by ``read_bdf(..., nworkers=N)``:
+  - parse_cards_parallel(cards_list, card_parser, icards, nworkers)
+  - is_parallel_card(card_name, card_parser)
+
+The cards are split into contiguous chunks and each worker creates the
+card objects (e.g., ``CBAR.add_card``) for its chunk.  The objects are
+added to the model by the main process in the original card order, so
+the duplicate ID checks, card_count and dictionary order are the same as
+for a serial read.  A card that fails in a worker is left for the serial
+parser, which stores/raises the same error as it normally would.
+
+The objects are pickled back to the main process, which costs about as
+much as creating them, so the speedup is limited to the cards with a
+heavy ``add_card``.  Small decks are parsed serially.
+
+"""
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Tuple, Any
+
+from pyNastran.bdf.bdf_interface.utils import to_fields
+from pyNastran.bdf.bdf_interface.bdf_card import BDFCard
+from pyNastran.bdf.cards.utils import wipe_empty_fields
+
+#: cards that are stored as lines and not fields (see ``BDF.create_card_object``)
+LINE_CARD_NAMES = {'DEQATN', 'PBRSECT', 'PBMSECT', 'GMCURV', 'GMSURF', 'OUTPUT', 'ADAPT',
+                   'MONDSP1'}
+
+#: the minimum number of cards given to each worker
+MIN_CARDS_PER_WORKER = 2000
+
+
+def parse_cards_parallel(cards_list: List[Any],
+                         card_parser: Dict[str, Tuple[Any, Any]],
+                         icards: List[int],
+                         nworkers: int) -> Dict[int, Any]:
+    """
+    Creates the card objects for a subset of the cards in parallel
+
+    Parameters
+    ----------
+    cards_list : List[card]
+        card = [card_name, comment, card_lines, (ifile, iline)]
+    card_parser : Dict[card_name] = (card_class, add_card_function)
+        the model's ``_card_parser``
+    icards : List[int]
+        the indices of the cards to parse; these must be in ``card_parser``
+    nworkers : int
+        the number of processes
+
+    Returns
+    -------
+    objs : Dict[icard] = obj
+        the card objects; cards that failed aren't included and
+        an empty dictionary is returned if there are too few cards
+
+    """
+    ncards = len(icards)
+    nchunks = min(nworkers, ncards // MIN_CARDS_PER_WORKER)
+    if nchunks < 2:
+        return {}
+
+    card_classes = {}  # type: Dict[str, Any]
+    for icard in icards:
+        card_name = cards_list[icard][0]
+        if card_name not in card_classes:
+            card_classes[card_name] = card_parser[card_name][0]
+
+    chunks = []
+    for ichunk in range(nchunks):
+        i0 = ichunk * ncards // nchunks
+        i1 = (ichunk + 1) * ncards // nchunks
+        chunks.append([
+            (icard, cards_list[icard][0], cards_list[icard][1], cards_list[icard][2])
+            for icard in icards[i0:i1]])
+
+    objs = {}  # type: Dict[int, Any]
+    with ProcessPoolExecutor(max_workers=nchunks) as executor:
+        futures = [executor.submit(_parse_cards, card_classes, chunk) for chunk in chunks]
+        for future in futures:
+            objs.update(future.result())
+    return objs
+
+
+def is_parallel_card(card_name: str, card_parser: Dict[str, Tuple[Any, Any]]) -> bool:
+    """can the card be created by ``parse_cards_parallel``"""
+    try:
+        card_class = card_parser[card_name][0]
+    except KeyError:
+        return False
+    # local classes (e.g., the Crash class) can't be pickled
+    return card_name not in LINE_CARD_NAMES and '<locals>' not in card_class.__qualname__
+
+
+def _parse_cards(card_classes: Dict[str, Any],
+                 cards: List[Tuple[int, str, str, List[str]]]) -> List[Tuple[int, Any]]:
+    """creates the card objects in a worker"""
+    objs = []
+    for icard, card_name, comment, card_lines in cards:
+        try:
+            fields = to_fields(card_lines, card_name)
+            card_obj = BDFCard(wipe_empty_fields(fields), has_none=False)
+            obj = card_classes[card_name].add_card(card_obj, comment=comment)
+        except Exception:
+            # the serial parser reports the error
+            continue
+        objs.append((icard, obj))
+    return objs
+
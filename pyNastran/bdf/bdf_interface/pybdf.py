@@ -23,8 +23,9 @@ BEGIN TRMC=102
 import os
 import shlex
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from itertools import count
-from typing import List, Tuple, Optional, Union, Any, cast
+from typing import List, Dict, Tuple, Optional, Union, Any, cast
 from io import StringIO
 
 import numpy as np
@@ -146,7 +147,7 @@ class BDFInputPy:
     def __init__(self, read_includes: bool, dumplines: bool,
                  encoding: str, nastran_format: str='msc',
                  consider_superelements: bool=True,
-                 log: Any=None, debug: bool=False):
+                 log: Any=None, debug: bool=False, nworkers: int=1):
         """
         BDF reader class that only handles lines and not building cards or parsing cards
 
@@ -167,6 +168,8 @@ class BDFInputPy:
             a logger for printing INCLUDE files that are loadaed
         debug : bool; default=False
             used when testing; for the logger
+        nworkers : int; default=1
+            the number of threads used to read the INCLUDE files
 
         """
         self.dumplines = dumplines
@@ -183,6 +186,10 @@ class BDFInputPy:
         self.debug = debug
         self.log = get_logger2(log, debug)
 
+        self.nworkers = nworkers
+        #: the INCLUDE files that were read ahead of time by ``_prefetch_includes``
+        self._include_cache = {}  # type: Dict[str, List[str]]
+
     def get_lines(self, bdf_filename: Union[str, StringIO],
                   punch: Optional[bool]=False,
                   make_ilines: bool=True) -> List[str]:
@@ -347,6 +354,8 @@ class BDFInputPy:
         """
         nlines = len(lines)
         #bdf_filenames = [self.bdf_filename]
+        if self.read_includes and self.nworkers > 1:
+            self._prefetch_includes(lines)
 
         ilines = None
         if make_ilines:
@@ -414,6 +423,14 @@ class BDFInputPy:
             #raise IOError(msg)
 
         read_again = False
+        bdf_filename_inc = os.path.join(self.include_dir, bdf_filename2)
+        if bdf_filename_inc in self._include_cache:
+            self.log.debug('opening %r' % bdf_filename_inc)
+            self.active_filenames.append(bdf_filename_inc)
+            lines2 = self._include_cache.pop(bdf_filename_inc)
+            return self._insert_include_lines(lines, nlines, ilines, lines2,
+                                              bdf_filename2, i, j, ifile, make_ilines)
+
         with self._open_file(bdf_filename2, basename=False) as bdf_file:
             #print('bdf_file.name = %s' % bdf_file.name)
             try:
@@ -454,6 +471,13 @@ class BDFInputPy:
                         ' (or other encoding) to the top of the main/INCLUDE file\n' % encoding2)
                     raise RuntimeError(msg)
 
+        return self._insert_include_lines(lines, nlines, ilines, lines2,
+                                          bdf_filename2, i, j, ifile, make_ilines)
+
+    def _insert_include_lines(self, lines: List[str], nlines: int, ilines,
+                              lines2: List[str], bdf_filename2: str,
+                              i: int, j: int, ifile: int, make_ilines: bool):
+        """replaces the INCLUDE lines (lines[i:j]) with the lines of the include file"""
         #print('lines2 = %s' % lines2)
 
         #line2 = lines[j].split('$')
@@ -520,6 +544,56 @@ class BDFInputPy:
             #print("  *%s" % line.rstrip())
         return lines, nlines, ilines
 
+    def _prefetch_includes(self, lines: List[str]) -> None:
+        """
+        Reads the INCLUDE files (including nested INCLUDE files) using
+        ``nworkers`` threads, so ``_update_include`` doesn't wait on each
+        file in turn.  Files that can't be read (e.g., they don't exist or
+        have a different encoding) are left for ``_update_include``, which
+        handles the error.
+        """
+        futures = {}  # type: Dict[str, Any]
+        with ThreadPoolExecutor(max_workers=self.nworkers) as executor:
+            def submit(lines: List[str]) -> None:
+                for bdf_filename_inc in self._find_include_filenames(lines):
+                    if bdf_filename_inc not in futures:
+                        futures[bdf_filename_inc] = executor.submit(
+                            _read_include_lines, bdf_filename_inc, self.encoding)
+
+            submit(lines)
+            pending = set(futures.values())
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                nfutures = len(futures)
+                for future in done:
+                    lines2 = future.result()
+                    if lines2 is not None:
+                        submit(lines2)
+                pending.update(list(futures.values())[nfutures:])
+
+        self._include_cache = {bdf_filename_inc: future.result()
+                               for bdf_filename_inc, future in futures.items()
+                               if future.result() is not None}
+        self.log.debug('read %i INCLUDE files with %i threads' % (
+            len(self._include_cache), self.nworkers))
+
+    def _find_include_filenames(self, lines: List[str]) -> List[str]:
+        """gets the full path to the INCLUDE files that are referenced in a set of lines"""
+        bdf_filenames = []
+        nlines = len(lines)
+        for i, line in enumerate(lines):
+            line = line.rstrip('\r\n\t')
+            if not line.upper().startswith('INCLUDE'):
+                continue
+            try:
+                unused_j, include_lines = self._get_include_lines(lines, line, i, nlines)
+                bdf_filename2 = get_include_filename(include_lines, include_dir=self.include_dir)
+            except Exception:
+                # the serial reader reports the error
+                continue
+            bdf_filenames.append(os.path.join(self.include_dir, bdf_filename2))
+        return bdf_filenames
+
     def _get_include_lines(self, lines: List[str], line: str,
                            i: int, nlines: int) -> Tuple[int, List[str]]:
         """
@@ -721,6 +795,15 @@ class BDFInputPy:
                 raise IOError('Not a file: bdf_filename=%r' % bdf_filename)
 
 
+def _read_include_lines(bdf_filename_inc: str, encoding: str) -> Optional[List[str]]:
+    """reads an INCLUDE file for ``_prefetch_includes``; returns None if it can't be read"""
+    try:
+        with open(_filename(bdf_filename_inc), 'r', encoding=encoding) as bdf_file:
+            return bdf_file.readlines()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
 def _is_bulk_data_line(text: str) -> bool:
     """
     Returns True if there is a Bulk Data Deck
@@ -0,0 +1,394 @@
+"""
+Defines the incremental re-read used by ``BDF.refresh()``:
+  - refresh_model(model)
+  - group_cards_by_file(cards_list)
+  - get_file_stamps(filenames)
+
+When a model is read with ``track_includes=True``, the cards are stored by the file (main BDF or
+INCLUDE file) they came from, along with the (size, mtime) of each file.
+``refresh_model`` checks the files, and for each INCLUDE file that
+changed:
+  - the old cards are parsed into a scratch model to find out which
+    keys they were stored under and are removed from the model
+  - the new cards are parsed into the model
+  - if the model was cross-referenced, the new cards and the cards that
+    referenced a removed card are cross-referenced
+
+A file with the same cards (e.g., it was touched or only a comment
+changed) is skipped.  The
+model is fully re-read if the main BDF changed, an INCLUDE file was
+added/removed, or the changed cards can't be replaced one by one
+(e.g., DMIG, GRDSET, BAROR, AERO, replication).
+
+"""
+from __future__ import annotations
+import os
+import hashlib
+from typing import List, Dict, Tuple, Set, Optional, Any, TYPE_CHECKING
+
+from pyNastran.bdf.bdf_interface.pybdf import BDFInputPy
+from pyNastran.bdf.bdf_interface.bdf_cache import is_card_dict
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+
+#: cards that aren't stored by ID, depend on other cards while they are
+#: parsed or are merged after parsing, so they can't be replaced one by one
+REREAD_CARD_NAMES = {
+    'BAROR', 'BEAMOR', 'GRDSET', 'SNORM', 'AERO', 'AEROS', 'DOPTPRM', 'DTABLE',
+    'MDLPRM', 'ECHOON', 'ECHOOFF', 'ENDDATA', 'DEQATN', '/',
+    'DMIG', 'DMIJ', 'DMIJI', 'DMIK', 'DMI', 'DMIAX', 'DMIGROT', 'DTI',
+}
+
+
+def get_file_stamps(filenames: List[str]) -> Dict[int, Tuple[int, int]]:
+    """gets the (size, mtime_ns) of each file"""
+    stamps = {}
+    for ifile, filename in enumerate(filenames):
+        stamps[ifile] = _get_stamp(filename)
+    return stamps
+
+
+def group_cards_by_file(cards_list: List[Any]) -> Dict[int, List[Tuple[str, str, List[str]]]]:
+    """
+    Splits the cards by the file they came from
+
+    Parameters
+    ----------
+    cards_list : List[card]
+        card = [card_name, comment, card_lines, (ifile, iline)]
+
+    Returns
+    -------
+    file_cards : Dict[ifile] = List[(card_name, comment, card_lines)]
+        the cards in each file
+
+    """
+    file_cards = {}  # type: Dict[int, List[Tuple[str, str, List[str]]]]
+    for card_name, comment, card_lines, ifile_iline in cards_list:
+        ifile = int(ifile_iline[0])
+        try:
+            file_cards[ifile].append((card_name, comment, card_lines))
+        except KeyError:
+            file_cards[ifile] = [(card_name, comment, card_lines)]
+    return file_cards
+
+
+def refresh_model(model: BDF) -> List[str]:
+    """
+    Re-reads the files of a model that changed since it was read
+
+    Returns
+    -------
+    filenames : List[str]
+        the files that changed
+
+    """
+    options = model._read_options
+    if not options:
+        raise RuntimeError('refresh requires a model that was read from a file')
+    if not options['track_includes']:
+        raise RuntimeError('refresh requires a model that was read with track_includes=True')
+
+    filenames = model.active_filenames
+    changed_ifiles = [
+        ifile for ifile, filename in enumerate(filenames)
+        if _get_stamp(filename) != model._file_stamps.get(ifile)]
+    if not changed_ifiles:
+        return []
+
+    if not _is_incremental(model, changed_ifiles):
+        changed_filenames = [filenames[ifile] for ifile in changed_ifiles]
+        _reread_model(model, changed_filenames)
+        return changed_filenames
+
+    new_file_cards = {}
+    for ifile in changed_ifiles:
+        filename = filenames[ifile]
+        stamp = _get_stamp(filename)
+        cards = _read_file_cards(model, filename)
+        if cards is None:
+            changed_filenames = [filenames[ifile] for ifile in changed_ifiles]
+            _reread_model(model, changed_filenames)
+            return changed_filenames
+
+        if _hash_cards(cards) == _hash_cards(model._file_cards[ifile]):
+            # touched, but the cards are the same
+            model._file_stamps[ifile] = stamp
+            continue
+        new_file_cards[ifile] = (cards, stamp)
+
+    if not new_file_cards:
+        return []
+
+    changed_filenames = [filenames[ifile] for ifile in new_file_cards]
+    card_names = set()  # type: Set[str]
+    for ifile, (cards, unused_stamp) in new_file_cards.items():
+        card_names.update(card[0] for card in cards)
+        card_names.update(card[0] for card in model._file_cards[ifile])
+    if card_names & REREAD_CARD_NAMES or any('=' in card_name for card_name in card_names):
+        _reread_model(model, changed_filenames)
+        return changed_filenames
+
+    model.log.debug(f'refreshing {changed_filenames}')
+    old_cards = []
+    new_cards = []
+    for ifile, (cards, unused_stamp) in new_file_cards.items():
+        old_cards.extend(model._file_cards[ifile])
+        new_cards.extend((card_name, comment, card_lines, (ifile, 0))
+                         for card_name, comment, card_lines in cards)
+
+    removed_objs = _remove_cards(model, old_cards)
+    if removed_objs is None:
+        _reread_model(model, changed_filenames)
+        return changed_filenames
+
+    old_obj_ids = {id(obj) for obj in _iter_card_objects(model)}
+    model._parse_cards_list(new_cards)
+    model.pop_parse_errors()
+
+    for ifile, (cards, stamp) in new_file_cards.items():
+        model._file_cards[ifile] = cards
+        model._file_stamps[ifile] = stamp
+
+    if options['validate']:
+        model.validate()
+    if model._xref:
+        is_coords = any(card_name.startswith('CORD') for card_name in card_names)
+        _cross_reference_cards(model, removed_objs, old_obj_ids, is_coords)
+    return changed_filenames
+
+
+def _is_incremental(model: BDF, changed_ifiles: List[int]) -> bool:
+    """can the changed files be re-read on their own"""
+    options = model._read_options
+    return (
+        0 not in changed_ifiles and
+        not options['save_file_structure'] and
+        not model._is_cards_dict and
+        not model.superelement_models and
+        all(ifile in model._file_cards for ifile in changed_ifiles)
+    )
+
+
+def _reread_model(model: BDF, changed_filenames: List[str]) -> None:
+    """re-reads the full model"""
+    model.log.debug(f're-reading {model.bdf_filename} because {changed_filenames} changed')
+    options = model._read_options
+    bdf_filename = model.bdf_filename
+    model.clear_attributes()
+    model.card_count = {}
+    model.reject_count = {}
+    model.reject_lines = []
+    model.reject_cards = []
+    model.read_bdf(bdf_filename, **options)
+
+
+def _read_file_cards(model: BDF,
+                     filename: str) -> Optional[List[Tuple[str, str, List[str]]]]:
+    """
+    Reads the cards in an INCLUDE file
+
+    Returns
+    -------
+    cards : List[(card_name, comment, card_lines)] / None
+        None if the file has an INCLUDE or cards that are stored by name
+
+    """
+    obj = BDFInputPy(False, model.dumplines, model._encoding,
+                     nastran_format=model.nastran_format,
+                     consider_superelements=model.is_superelements,
+                     log=model.log, debug=model.debug)
+    out = obj.get_lines(filename, punch=True, make_ilines=True)
+    bulk_data_lines = [line.rstrip() for line in out[3]]
+    bulk_data_ilines = out[4]
+    if obj.include_lines:
+        return None
+
+    echo = model.echo
+    cards_list, cards_dict, unused_card_count = model.get_bdf_cards(
+        bulk_data_lines, bulk_data_ilines)
+    model.echo = echo
+    if cards_dict:
+        return None
+    return [(card_name, comment, card_lines)
+            for card_name, comment, card_lines, unused_ifile_iline in cards_list]
+
+
+def _remove_cards(model: BDF, cards: List[Tuple[str, str, List[str]]]) -> Optional[List[Any]]:
+    """
+    Removes the cards that were created from a set of card lines
+
+    Returns
+    -------
+    removed_objs : List[card] / None
+        the removed card objects; None if the cards can't be found
+    """
+    from pyNastran.bdf.bdf import BDF
+    scratch = BDF(debug=None, mode=model._nastran_format)
+    scratch.cards_to_read = model.cards_to_read
+    scratch._fast_parse = model._fast_parse
+    scratch._parse_cards_list([(card_name, comment, card_lines, (0, 0))
+                               for card_name, comment, card_lines in cards])
+    scratch.pop_parse_errors()
+    if scratch.reject_lines or scratch.reject_cards:
+        return None
+
+    # cards that aren't stored in a card dictionary (e.g., SUPORT) can't be removed
+    empty = BDF(debug=None, mode=model._nastran_format).__dict__
+    removed = []  # type: List[Tuple[Dict[Any, Any], Any, Any]]
+    for name, scratch_cards in scratch.__dict__.items():
+        if not is_card_dict(scratch_cards):
+            if name not in {'card_count', '_type_to_id_map'} and _is_set(
+                    scratch_cards, empty.get(name)):
+                return None
+            continue
+        cards_dict = getattr(model, name)
+        empty_cards = empty.get(name, {})
+        for key, scratch_obj in scratch_cards.items():
+            if key in empty_cards:
+                # e.g., the default CORD2R 0
+                continue
+            if key not in cards_dict:
+                return None
+            if not isinstance(scratch_obj, list):
+                removed.append((cards_dict, key, None))
+                continue
+
+            objs = cards_dict[key]
+            used = set()  # type: Set[int]
+            for scratch_obj_i in scratch_obj:
+                msg = scratch_obj_i.write_card()
+                for i, obj in enumerate(objs):
+                    if i not in used and obj.write_card() == msg:
+                        used.add(i)
+                        break
+                else:
+                    return None
+            removed.append((cards_dict, key, used))
+
+    # nothing has been changed until now
+    removed_objs = []
+    type_to_id_map = model._type_to_id_map
+    for cards_dict, key, used in removed:
+        if used is None:
+            obj = cards_dict.pop(key)
+            removed_objs.append(obj)
+            _remove_type_id(type_to_id_map, obj.type, key)
+            continue
+
+        objs = cards_dict[key]
+        removed_objs.extend(objs[i] for i in sorted(used))
+        objs2 = [obj for i, obj in enumerate(objs) if i not in used]
+        if objs2:
+            cards_dict[key] = objs2
+        else:
+            del cards_dict[key]
+            for obj in objs:
+                _remove_type_id(type_to_id_map, obj.type, key)
+
+    card_count = model.card_count
+    for card_name, ncards in scratch.card_count.items():
+        ncards2 = card_count.get(card_name, 0) - ncards
+        if ncards2 > 0:
+            card_count[card_name] = ncards2
+        else:
+            card_count.pop(card_name, None)
+    return removed_objs
+
+
+def _is_set(value: Any, empty_value: Any) -> bool:
+    """was a model attribute set while parsing"""
+    if isinstance(value, (list, dict, set)):
+        return len(value) != len(empty_value)
+    return empty_value is None and value is not None
+
+
+def _remove_type_id(type_to_id_map: Dict[str, List[Any]], card_type: str, key: Any) -> None:
+    """removes an id from ``model._type_to_id_map``"""
+    ids = type_to_id_map.get(card_type)
+    if ids is not None and key in ids:
+        ids.remove(key)
+        if not ids:
+            del type_to_id_map[card_type]
+
+
+def _cross_reference_cards(model: BDF, removed_objs: List[Any],
+                           old_obj_ids: Set[int], is_coords: bool) -> None:
+    """
+    Cross-references the new cards and the cards that referenced a
+    removed card
+    """
+    if is_coords:
+        # the nodes/elements are in the global frame, so redo everything
+        model.uncross_reference()
+        model.cross_reference()
+        return
+
+    removed_ids = {id(obj) for obj in removed_objs}
+    objs = []
+    for obj in _iter_card_objects(model):
+        if id(obj) not in old_obj_ids:
+            objs.append(obj)
+        elif _references(obj, removed_ids):
+            obj.uncross_reference()
+            objs.append(obj)
+
+    try:
+        for obj in objs:
+            obj.cross_reference(model)
+    except Exception:
+        model.log.warning('refresh failed to cross-reference the changed cards; '
+                          'cross-referencing the full model')
+        model.uncross_reference()
+        model.cross_reference()
+
+
+def _references(obj: Any, removed_ids: Set[int]) -> bool:
+    """does a card reference one of the removed cards"""
+    for name, value in obj.__dict__.items():
+        if name.endswith('_ref') and _contains(value, removed_ids):
+            return True
+    return False
+
+
+def _contains(value: Any, removed_ids: Set[int]) -> bool:
+    """is one of the removed cards in a (nested) reference"""
+    if id(value) in removed_ids:
+        return True
+    if isinstance(value, (list, tuple)):
+        return any(_contains(valuei, removed_ids) for valuei in value)
+    if isinstance(value, dict):
+        return any(_contains(valuei, removed_ids) for valuei in value.values())
+    return False
+
+
+def _iter_card_objects(model: BDF):
+    """loops over the card objects stored in the card dictionaries"""
+    for value in list(model.__dict__.values()):
+        if not is_card_dict(value):
+            continue
+        for obj in value.values():
+            if isinstance(obj, list):
+                yield from obj
+            else:
+                yield obj
+
+
+def _hash_cards(cards: List[Tuple[str, str, List[str]]]) -> str:
+    """hashes the cards in a file; the comments are skipped"""
+    sha1 = hashlib.sha1()
+    for card_name, unused_comment, card_lines in cards:
+        sha1.update(card_name.encode('utf8', 'replace'))
+        for line in card_lines:
+            sha1.update(line.encode('utf8', 'replace'))
+        sha1.update(b'\0')
+    return sha1.hexdigest()
+
+
+def _get_stamp(filename: str) -> Optional[Tuple[int, int]]:
+    """gets the (size, mtime_ns) of a file; None if it was removed"""
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
@@ -0,0 +1,80 @@
+import os
+import unittest
+import numpy as np
+from cpylog import SimpleLogger
+
+import pyNastran
+from pyNastran.bdf.bdf import BDF, read_bdf
+
+PKG_PATH = pyNastran.__path__[0]
+MODEL_PATH = os.path.join(PKG_PATH, '../', 'models')
+
+
+class TestArrayXref(unittest.TestCase):
+    """tests BDF.cross_reference_arrays"""
+
+    def test_array_xref_geometry(self):
+        """compares the vectorized geometry to the cross-referenced cards"""
+        log = SimpleLogger(level='error')
+        bdf_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'static_solid_shell_bar.bdf')
+        model = read_bdf(bdf_filename, xref=True, log=log)
+        array_xref = model.cross_reference_arrays()
+        assert array_xref is model.array_xref
+        assert np.array_equal(array_xref.nids, sorted(model.nodes))
+
+        for element_type in ['CTRIA3', 'CQUAD4', 'CTETRA', 'CHEXA']:
+            elements = array_xref.elements[element_type]
+            cards = [model.elements[eid] for eid in elements.eids]
+            assert np.array_equal(array_xref.pids[elements.property_index],
+                                  [card.Pid() for card in cards])
+            centroid = np.array([card.Centroid() for card in cards])
+            assert np.allclose(array_xref.centroid(element_type), centroid)
+            if element_type in ['CTRIA3', 'CQUAD4']:
+                expected = [card.Area() for card in cards]
+                assert np.allclose(array_xref.area(element_type), expected)
+            else:
+                expected = [card.Volume() for card in cards]
+                assert np.allclose(array_xref.volume(element_type), expected)
+
+            # the PCOMP elements are nan
+            mass = array_xref.mass(element_type)
+            is_pcomp = array_xref.property_types[elements.property_index] == 'PCOMP'
+            expected = [card.Mass() for card in cards]
+            assert np.allclose(mass[~is_pcomp], np.array(expected)[~is_pcomp])
+            assert np.isnan(mass[is_pcomp]).all()
+
+        with self.assertRaises(NotImplementedError):
+            array_xref.area('CTETRA')
+
+    def test_array_xref_no_xref(self):
+        """the index arrays don't need object cross-referencing"""
+        model = BDF(debug=None)
+        model.add_grid(1, [0., 0., 0.])
+        model.add_grid(2, [2., 0., 0.])
+        model.add_grid(3, [2., 1., 0.])
+        model.add_grid(4, [0., 1., 0.])
+        model.add_cquad4(10, 100, [1, 2, 3, 4], tflag=1, T1=2., T2=2., T3=2., T4=2.)
+        model.add_ctria3(11, 100, [1, 2, 5])  # missing node
+        model.add_ctria3(12, 101, [1, 2, 3])  # missing property
+        model.add_pshell(100, mid1=1000, t=0.1, nsm=0.5)
+        model.add_mat1(1000, 3.0e7, None, 0.3, rho=10.)
+        model.cross_reference_arrays()
+        array_xref = model.array_xref
+        assert model.elements[10].nodes_ref is None
+
+        quads = array_xref.elements['CQUAD4']
+        assert np.array_equal(quads.node_index, [[0, 1, 2, 3]])
+        assert np.allclose(array_xref.area('CQUAD4'), [2.])
+        assert np.allclose(array_xref.centroid('CQUAD4'), [[1., 0.5, 0.]])
+        # (nsm + rho * t * T) * area
+        assert np.allclose(array_xref.mass('CQUAD4'), [(0.5 + 10. * 0.2) * 2.])
+
+        trias = array_xref.elements['CTRIA3']
+        assert np.array_equal(trias.node_index, [[0, 1, -1], [0, 1, 2]])
+        assert np.array_equal(trias.property_index, [0, -1])
+        with self.assertRaises(KeyError):
+            array_xref.area('CTRIA3')
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
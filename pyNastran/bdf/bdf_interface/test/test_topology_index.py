@@ -0,0 +1,82 @@
+import unittest
+import numpy as np
+
+from pyNastran.bdf.bdf import BDF
+from pyNastran.bdf.bdf_interface.topology_index import TopologyIndex
+
+
+class TestTopologyIndex(unittest.TestCase):
+    """tests BDF.get_topology_index"""
+
+    def test_topology_shells(self):
+        """
+        4-----3---5
+        |   / |
+        |  /  |
+        | /   |
+        1-----2
+        """
+        model = BDF(debug=None)
+        model.add_grid(1, [0., 0., 0.])
+        model.add_grid(2, [1., 0., 0.])
+        model.add_grid(3, [1., 1., 0.])
+        model.add_grid(4, [0., 1., 0.])
+        model.add_grid(5, [1., 1., 1.])
+        model.add_ctria3(1, 1, [1, 2, 3])
+        model.add_ctria3(2, 1, [1, 3, 4])
+        model.add_conrod(10, 100, [4, 5])
+
+        index = model.get_topology_index()
+        assert index is model.get_topology_index()
+        assert index.free_edges().tolist() == [[1, 2], [2, 3], [3, 4], [1, 4]]
+        assert index.non_paired_edges().tolist() == [[1, 2], [2, 3], [3, 4], [1, 4]]
+        assert index.get_edge_to_eids_map()[(1, 3)] == {1, 2}
+        assert np.array_equal(index.get_element_ids_by_node(4), [2, 10])
+        assert np.array_equal(index.get_element_ids_by_node([2, 5, 42]), [1, 10])
+        assert np.array_equal(index.get_neighbor_element_ids(1), [2])
+        assert np.array_equal(index.get_neighbor_element_ids(10), [])
+
+        # adding an element rebuilds the index
+        model.add_ctria3(3, 1, [1, 3, 5])
+        index2 = model.get_topology_index()
+        assert index2 is not index
+        assert index2.non_paired_edges().tolist() == [
+            [1, 2], [2, 3], [1, 3], [3, 4], [1, 4], [3, 5], [1, 5]]
+        assert np.array_equal(index2.get_neighbor_element_ids(1), [2, 3])
+
+        # removing an element also rebuilds the index
+        del model.elements[3]
+        assert model.get_topology_index().non_paired_edges().tolist() == [
+            [1, 2], [2, 3], [3, 4], [1, 4]]
+
+        # a subset of the elements
+        subset = TopologyIndex(model, element_ids=[2])
+        assert subset.free_edges().tolist() == [[1, 3], [3, 4], [1, 4]]
+
+    def test_topology_solids(self):
+        """two CHEXA8s that share a face"""
+        model = BDF(debug=None)
+        nid = 1
+        for x in [0., 1., 2.]:
+            for y, z in [(0., 0.), (1., 0.), (1., 1.), (0., 1.)]:
+                model.add_grid(nid, [x, y, z])
+                nid += 1
+        model.add_chexa(1, 100, [1, 2, 3, 4, 5, 6, 7, 8])
+        model.add_chexa(2, 100, [5, 6, 7, 8, 9, 10, 11, 12])
+
+        index = model.get_topology_index()
+        assert len(index.face_counts) == 11
+        assert len(index.skin_faces()) == 10
+
+        eid_set, face_map = index.get_solid_skin_faces()
+        assert len(eid_set) == 10
+        assert (5, 6, 7, 8) not in eid_set
+        assert eid_set[(1, 2, 3, 4)] == [1]
+        assert face_map[(1, 2, 3, 4)] == [1, 2, 3, 4]
+        assert eid_set[(9, 10, 11, 12)] == [2]
+        assert np.array_equal(index.get_neighbor_element_ids(1), [2])
+        assert np.array_equal(index.get_element_ids_by_node(8), [1, 2])
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
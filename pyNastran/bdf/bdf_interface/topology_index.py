@@ -0,0 +1,423 @@
+"""
+Defines the vectorized element topology index:
+  - TopologyIndex(model, element_ids=None)
+  - get_topology_index(model)
+
+The element connectivity is gathered once into integer arrays:
+
+ - the shell edges are encoded as int64 keys (``inid1 * nnodes + inid2``)
+ - the solid faces are the sorted (zero padded) face node ids
+ - ``np.unique`` gives the number of elements that use each edge/face
+ - the edge/face -> element, node -> element and element -> element
+   (shared edge/face) maps are stored in CSR form (offsets, values)
+
+The free edges, non-paired edges, skin faces, element neighbors and
+node-to-element maps are then array lookups.
+
+``get_topology_index`` caches the index on the model and rebuilds it
+when an element is added, removed or replaced.
+
+.. code-block:: python
+
+   >>> index = model.get_topology_index()
+   >>> index.free_edges()
+   [[1, 2], [2, 3], [1, 3]]
+   >>> index.get_element_ids_by_node(3)
+   [1, 2]
+
+"""
+from __future__ import annotations
+from typing import List, Dict, Tuple, Union, Optional, Any, TYPE_CHECKING
+
+import numpy as np
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+
+TRI_EDGES = [(0, 1), (1, 2), (2, 0)]
+QUAD_EDGES = [(0, 1), (1, 2), (2, 3), (3, 0)]
+
+#: the local node indices of the edges of the shell elements
+SHELL_EDGES = {
+    'CTRIA3' : TRI_EDGES,
+    'CTRIA6' : TRI_EDGES,
+    'CTRIAX' : TRI_EDGES,
+    'CTRIAX6' : [(0, 2), (2, 4), (4, 0)],
+    'CQUAD4' : QUAD_EDGES,
+    'CQUAD' : QUAD_EDGES,
+    'CQUAD8' : QUAD_EDGES,
+    'CQUADR' : QUAD_EDGES,
+    'CQUADX' : QUAD_EDGES,
+    'CQUADX8' : QUAD_EDGES,
+    'CSHEAR' : QUAD_EDGES,
+}
+
+#: the local node indices of the faces of the solid elements;
+#: consistent with ``element.faces``
+SOLID_FACES = {
+    ('CTETRA', 4) : [[0, 1, 3], [0, 3, 2], [1, 2, 3], [0, 2, 1]],
+    ('CTETRA', 10) : [[0, 1, 2, 4, 5, 6], [0, 1, 3, 4, 8, 7],
+                      [1, 2, 3, 5, 9, 8], [2, 0, 3, 6, 7, 9]],
+    ('CPENTA', 6) : [[0, 1, 2], [3, 4, 5], [0, 1, 4, 3], [1, 2, 5, 4], [2, 0, 3, 5]],
+    ('CPENTA', 15) : [[0, 1, 2, 6, 7, 8], [3, 4, 5, 9, 10, 11],
+                      [0, 1, 4, 3, 6, 13, 9, 12], [1, 2, 5, 4, 7, 14, 10, 13],
+                      [2, 0, 3, 5, 8, 12, 11, 14]],
+    ('CPYRAM', 5) : [[0, 1, 2, 3], [0, 1, 4], [1, 2, 4], [2, 3, 4], [3, 0, 4]],
+    ('CPYRAM', 13) : [[0, 1, 2, 3, 5, 6, 7, 8], [0, 1, 4, 5, 10, 9],
+                      [1, 2, 4, 6, 11, 10], [2, 3, 4, 7, 12, 11], [3, 0, 4, 8, 9, 12]],
+    ('CHEXA', 8) : [[0, 1, 2, 3], [0, 1, 5, 4], [1, 2, 6, 5],
+                    [2, 3, 7, 6], [3, 0, 4, 7], [4, 5, 6, 7]],
+    ('CHEXA', 20) : [[0, 1, 2, 3, 8, 9, 10, 11], [0, 1, 5, 4, 8, 17, 12, 16],
+                     [1, 2, 6, 5, 9, 18, 13, 17], [2, 3, 7, 6, 10, 9, 14, 18],
+                     [3, 0, 4, 7, 11, 16, 15, 19], [4, 5, 6, 7, 12, 13, 14, 15]],
+}
+MAX_FACE_NODES = 8
+
+
+class TopologyIndex:
+    """
+    Edge/face/node connectivity of the elements stored as arrays
+
+    Element references (e.g., ``edge_elements``) are indices into ``eids``.
+    """
+    def __init__(self, model: BDF, element_ids: Optional[List[int]]=None):
+        """
+        Builds the index
+
+        Parameters
+        ----------
+        model : BDF
+            the model; it does not need to be cross-referenced
+        element_ids : List[int]; default=None -> all elements
+            the elements to consider
+
+        """
+        if element_ids is None:
+            element_ids = list(model.elements.keys())
+        elif isinstance(element_ids, int):
+            element_ids = [element_ids]
+
+        #: the element ids in the order of ``model.elements``/element_ids
+        self.eids = np.array(element_ids, dtype='int64')
+        elements = [model.elements[eid] for eid in self.eids.tolist()]
+        node_ids_list = [_get_element_node_ids(elem) for elem in elements]
+        self._build_node_elements(node_ids_list)
+
+        shells = {}  # type: Dict[str, List[int]]
+        solids = {}  # type: Dict[Tuple[str, int], List[int]]
+        for ielem, (elem, node_ids) in enumerate(zip(elements, node_ids_list)):
+            if elem.type in SHELL_EDGES:
+                shells.setdefault(elem.type, []).append(ielem)
+            elif (elem.type, len(node_ids)) in SOLID_FACES:
+                solids.setdefault((elem.type, len(node_ids)), []).append(ielem)
+        self._build_edges(shells, node_ids_list)
+        self._build_faces(solids, node_ids_list)
+        self._element_neighbors = None
+
+    @property
+    def nelements(self) -> int:
+        """the number of elements"""
+        return len(self.eids)
+
+    def _build_node_elements(self, node_ids_list: List[List[int]]) -> None:
+        """builds the node -> element map"""
+        nnodes_per_element = np.array([len(node_ids) for node_ids in node_ids_list],
+                                      dtype='int64')
+        if nnodes_per_element.sum():
+            all_nids = np.hstack(node_ids_list).astype('int64')
+        else:
+            all_nids = np.zeros(0, dtype='int64')
+        ielements = np.repeat(np.arange(self.nelements, dtype='int64'), nnodes_per_element)
+
+        #: the sorted node ids that are used by the elements
+        self.nids = np.unique(all_nids)
+        inids = np.searchsorted(self.nids, all_nids)
+
+        # remove the duplicate nodes within an element
+        keys = np.unique(inids * max(self.nelements, 1) + ielements)
+        inids, ielements = np.divmod(keys, max(self.nelements, 1))
+
+        #: node -> element CSR map; the elements of nids[i] are
+        #: node_elements[node_element_offsets[i]:node_element_offsets[i+1]]
+        self.node_element_offsets = _get_offsets(inids, len(self.nids))
+        self.node_elements = ielements
+
+    def _build_edges(self, shells: Dict[str, List[int]],
+                     node_ids_list: List[List[int]]) -> None:
+        """builds the shell edge -> element map"""
+        nnids = max(len(self.nids), 1)
+        keys = []
+        ielements = []
+        positions = []
+        for etype, ielems in shells.items():
+            ielems = np.array(ielems, dtype='int64')
+            local_edges = SHELL_EDGES[etype]
+            nnodes = max(local_edges[-1]) + 1
+            node_ids = np.array([node_ids_list[ielem][:nnodes] for ielem in ielems],
+                                dtype='int64').reshape(len(ielems), nnodes)
+            inids = np.searchsorted(self.nids, node_ids)
+            for iedge, (i1, i2) in enumerate(local_edges):
+                inid1 = np.minimum(inids[:, i1], inids[:, i2])
+                inid2 = np.maximum(inids[:, i1], inids[:, i2])
+                keys.append(inid1 * nnids + inid2)
+                ielements.append(ielems)
+                positions.append(ielems * 4 + iedge)
+
+        if keys:
+            keys = np.hstack(keys)
+            ielements = np.hstack(ielements)
+            positions = np.hstack(positions)
+        else:
+            keys = ielements = positions = np.zeros(0, dtype='int64')
+
+        ukeys, offsets, ientries = _group_by_first_position(keys, positions)
+        #: the (nedges, 2) shell edges (sorted node ids) in the order that
+        #: they are first used
+        self.edges = self.nids[np.column_stack(np.divmod(ukeys, nnids))].reshape(len(ukeys), 2)
+        #: the edge keys (inid1 * nnodes + inid2; inid1 < inid2)
+        self.edge_keys = ukeys
+        #: the number of elements that use each edge
+        self.edge_counts = np.diff(offsets)
+        #: edge -> element CSR map
+        self.edge_offsets = offsets
+        self.edge_elements = ielements[ientries]
+
+    def _build_faces(self, solids: Dict[Tuple[str, int], List[int]],
+                     node_ids_list: List[List[int]]) -> None:
+        """builds the solid face -> element map"""
+        self._blank_face_msg = None
+        raw_faces = []
+        ielements = []
+        positions = []
+        for (etype, nnodes), ielems in solids.items():
+            ielems = np.array(ielems, dtype='int64')
+            node_ids = np.array([node_ids_list[ielem] for ielem in ielems],
+                                dtype='int64').reshape(len(ielems), nnodes)
+            for iface, local_face in enumerate(SOLID_FACES[(etype, nnodes)]):
+                face = np.zeros((len(ielems), MAX_FACE_NODES), dtype='int64')
+                face[:, :len(local_face)] = node_ids[:, local_face]
+                is_blank = (face[:, :len(local_face)] == 0).any(axis=1)
+                if is_blank.any() and self._blank_face_msg is None:
+                    eid = self.eids[ielems[is_blank][0]]
+                    self._blank_face_msg = (
+                        'There is a None in the face.\n'
+                        'etype=%s eid=%s face_id=%s face=%s\n' % (
+                            etype, eid, iface + 1, face[is_blank][0].tolist()))
+                raw_faces.append(face)
+                ielements.append(ielems)
+                positions.append(ielems * 6 + iface)
+
+        if raw_faces:
+            raw_faces = np.vstack(raw_faces)
+            ielements = np.hstack(ielements)
+            positions = np.hstack(positions)
+        else:
+            raw_faces = np.zeros((0, MAX_FACE_NODES), dtype='int64')
+            ielements = positions = np.zeros(0, dtype='int64')
+
+        # the zero padding sorts to the front
+        sorted_faces = np.sort(raw_faces, axis=1)
+        unused_ufaces, keys = np.unique(sorted_faces, axis=0, return_inverse=True)
+        ufaces, offsets, ientries = _group_by_first_position(keys.ravel(), positions)
+
+        #: the (nfaces, 8) sorted face node ids (zero padded at the front)
+        #: in the order that they are first used
+        self.faces = sorted_faces[ientries[offsets[:-1]], :] if len(ufaces) else sorted_faces
+        #: the (nfaces, 8) face node ids of the last element that uses the face
+        #: (zero padded at the end)
+        self.raw_faces = raw_faces[ientries[offsets[1:] - 1], :] if len(ufaces) else raw_faces
+        #: the number of elements that use each face
+        self.face_counts = np.diff(offsets)
+        #: face -> element CSR map
+        self.face_offsets = offsets
+        self.face_elements = ielements[ientries]
+
+    def free_edges(self) -> np.ndarray:
+        """gets the (n, 2) shell edges that are used by only 1 element"""
+        return self.edges[self.edge_counts == 1, :]
+
+    def non_paired_edges(self) -> np.ndarray:
+        """gets the (n, 2) shell edges that aren't used by exactly 2 elements"""
+        return self.edges[self.edge_counts != 2, :]
+
+    def get_edge_to_eids_map(self) -> Dict[Tuple[int, int], set]:
+        """gets the edge -> element ids map (e.g., for ``_get_maps``)"""
+        edges = [tuple(edge) for edge in self.edges.tolist()]
+        eids = self.eids[self.edge_elements].tolist()
+        offsets = self.edge_offsets.tolist()
+        return {edge: set(eids[i1:i2])
+                for edge, i1, i2 in zip(edges, offsets[:-1], offsets[1:])}
+
+    def skin_faces(self) -> np.ndarray:
+        """gets the index of the solid faces that aren't shared by exactly 2 elements"""
+        if self._blank_face_msg is not None:
+            raise RuntimeError(self._blank_face_msg)
+        return np.where(self.face_counts != 2)[0]
+
+    def get_solid_skin_faces(self) -> Tuple[Dict[Tuple[int, ...], List[int]],
+                                            Dict[Tuple[int, ...], List[int]]]:
+        """
+        Gets the elements and faces that are skinned from solid elements.
+        This doesn't include internal faces.
+
+        Returns
+        -------
+        eid_set : Dict[tuple(int, int, ...)] = List[int]
+           key : sorted face
+           value : list of element ids with that face
+        face_map : Dict[tuple(int, int, ...)] = List[int]
+           key : sorted face
+           value : unsorted face
+
+        """
+        eid_set = {}
+        face_map = {}
+        offsets = self.face_offsets
+        for iface in self.skin_faces():
+            face = self.faces[iface, :]
+            raw_face = self.raw_faces[iface, :]
+            tface = tuple(face[face > 0].tolist())
+            ielements = self.face_elements[offsets[iface]:offsets[iface + 1]]
+            eid_set[tface] = self.eids[ielements].tolist()
+            face_map[tface] = raw_face[raw_face > 0].tolist()
+        return eid_set, face_map
+
+    def get_element_ids_by_node(self, nids: Union[int, List[int]]) -> np.ndarray:
+        """gets the sorted element ids that use the node(s)"""
+        inids = np.searchsorted(self.nids, np.atleast_1d(nids))
+        inids = inids[inids < len(self.nids)]
+        inids = inids[np.isin(self.nids[inids], nids)]
+        ielements = _get_csr_values(self.node_element_offsets, self.node_elements, inids)
+        return np.unique(self.eids[ielements])
+
+    def get_element_neighbors(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Gets the elements that share a shell edge or a solid face
+
+        Returns
+        -------
+        offsets : (nelements + 1, ) int ndarray
+            the neighbors of eids[i] are neighbors[offsets[i]:offsets[i+1]]
+        neighbors : (n, ) int ndarray
+            the index into eids
+
+        """
+        if self._element_neighbors is None:
+            rows = []
+            cols = []
+            for offsets, ielements in [(self.edge_offsets, self.edge_elements),
+                                       (self.face_offsets, self.face_elements)]:
+                rowsi, colsi = _get_pairs(offsets, ielements)
+                rows.append(rowsi)
+                cols.append(colsi)
+            rows = np.hstack(rows)
+            cols = np.hstack(cols)
+            nelements = max(self.nelements, 1)
+            keys = np.unique(rows * nelements + cols)
+            rows, cols = np.divmod(keys, nelements)
+            self._element_neighbors = (_get_offsets(rows, self.nelements), cols)
+        return self._element_neighbors
+
+    def get_neighbor_element_ids(self, eid: int) -> np.ndarray:
+        """gets the sorted element ids that share an edge/face with the element"""
+        offsets, neighbors = self.get_element_neighbors()
+        ielement = np.where(self.eids == eid)[0]
+        if len(ielement) == 0:
+            raise KeyError('eid=%s is not in the topology index' % eid)
+        ielement = ielement[0]
+        return np.sort(self.eids[neighbors[offsets[ielement]:offsets[ielement + 1]]])
+
+    def __repr__(self) -> str:
+        return (f'TopologyIndex(nelements={self.nelements}, nnodes={len(self.nids)}, '
+                f'nedges={len(self.edges)}, nfaces={len(self.face_counts)})')
+
+
+def get_topology_index(model: BDF) -> TopologyIndex:
+    """
+    Gets the topology index for all the elements in the model
+
+    The index is cached on the model and is rebuilt when an element
+    is added, removed or replaced.  Changing the nodes of an existing
+    element object isn't detected; set ``model._topology_index = None``.
+
+    """
+    key = _get_elements_key(model.elements)
+    cached = model._topology_index
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    index = TopologyIndex(model)
+    model._topology_index = (key, index)
+    return index
+
+
+def _get_elements_key(elements: Dict[int, Any]) -> Tuple[int, int, int]:
+    """gets a cheap fingerprint of the element dictionary"""
+    return (len(elements), sum(elements), sum(map(id, elements.values())))
+
+
+def _get_element_node_ids(elem: Any) -> List[int]:
+    """gets the node ids; blank (None) nodes are 0"""
+    try:
+        node_ids = elem.node_ids
+    except (AttributeError, TypeError):
+        return []
+    return [nid if nid is not None else 0 for nid in node_ids]
+
+
+def _group_by_first_position(keys: np.ndarray, positions: np.ndarray,
+                             ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Groups the entries by key
+
+    Returns
+    -------
+    ukeys : (nkeys, ) int ndarray
+        the unique keys in the order of their first position
+    offsets : (nkeys + 1, ) int ndarray
+        the CSR offsets into ientries
+    ientries : (n, ) int ndarray
+        the entries sorted by (key order, position)
+
+    """
+    if len(keys) == 0:
+        return keys, np.zeros(1, dtype='int64'), np.zeros(0, dtype='int64')
+    isort = np.lexsort((positions, keys))
+    sorted_keys = keys[isort]
+    is_first = np.ones(len(keys), dtype='bool')
+    is_first[1:] = sorted_keys[1:] != sorted_keys[:-1]
+    ifirst = np.where(is_first)[0]
+    counts = np.diff(np.append(ifirst, len(keys)))
+
+    # reorder the groups by their first position; the entries within a
+    # group are already sorted by position
+    igroup = np.argsort(positions[isort[ifirst]], kind='stable')
+    group_rank = np.empty(len(igroup), dtype='int64')
+    group_rank[igroup] = np.arange(len(igroup))
+    igroup_sorted = np.cumsum(is_first) - 1
+    ientries = isort[np.argsort(group_rank[igroup_sorted], kind='stable')]
+    offsets = np.zeros(len(ifirst) + 1, dtype='int64')
+    offsets[1:] = np.cumsum(counts[igroup])
+    return sorted_keys[ifirst[igroup]], offsets, ientries
+
+
+def _get_offsets(rows: np.ndarray, nrows: int) -> np.ndarray:
+    """gets the CSR offsets for sorted row indices"""
+    return np.searchsorted(rows, np.arange(nrows + 1)).astype('int64')
+
+
+def _get_csr_values(offsets: np.ndarray, values: np.ndarray, irows: np.ndarray) -> np.ndarray:
+    """gets the values of several CSR rows"""
+    counts = offsets[irows + 1] - offsets[irows]
+    starts = np.repeat(offsets[irows], counts)
+    within = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    return values[starts + within]
+
+
+def _get_pairs(offsets: np.ndarray, ielements: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """gets the (row, col) element pairs that share a CSR group"""
+    counts = np.diff(offsets)
+    group = np.repeat(np.arange(len(counts)), counts)
+    npairs = counts[group]
+    rows = np.repeat(ielements, npairs)
+    cols = _get_csr_values(offsets, ielements, group)
+    is_different = rows != cols
+    return rows[is_different], cols[is_different]
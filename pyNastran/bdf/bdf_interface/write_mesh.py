@@ -14,7 +14,8 @@ from pyNastran.bdf.field_writer_8 import print_card_8
 from pyNastran.bdf.field_writer_16 import print_card_16
 from pyNastran.bdf.bdf_interface.attributes import BDFAttributes
 from pyNastran.bdf.bdf_interface.write_mesh_utils import (
-    find_aero_location, write_dict, get_properties_by_element_type)
+    find_aero_location, write_dict, write_dict_8, get_properties_by_element_type)
+from pyNastran.bdf.bdf_interface.write_split import write_split_includes
 from pyNastran.bdf.cards.nodes import write_xpoints
 if TYPE_CHECKING:  # pragma: no cover
     from io import StringIO
@@ -36,6 +37,10 @@ class WriteMesh(BDFAttributes):
         self._auto_reject = True
         self.cards_to_read = set()
 
+        # the (sha1, mtime_ns) of the include files that were written
+        # by write_bdf(..., split_includes=True)
+        self._split_include_hashes = {}  # type: Dict[str, Tuple[str, int]]
+
     def get_encoding(self, encoding: Optional[str]=None) -> str:
         """gets the file encoding"""
         if encoding is not None:
@@ -113,7 +118,8 @@ class WriteMesh(BDFAttributes):
                   encoding: Optional[str]=None,
                   size: int=8, is_double: bool=False,
                   interspersed: bool=False, enddata: Optional[bool]=None,
-                  write_header: bool=True, close: bool=True) -> None:
+                  write_header: bool=True, close: bool=True,
+                  split_includes: bool=False, nworkers: int=1) -> None:
         """
         Writes the BDF.
 
@@ -145,6 +151,15 @@ class WriteMesh(BDFAttributes):
             flag for writing the pyNastran header
         close : bool; default=True
             should the output file be closed
+        split_includes : bool; default=False
+            write the nodes, elements, properties, materials, loads and
+            constraints to include files next to out_filename (e.g.,
+            model_nodes.inc), which are INCLUDEd by out_filename.
+            An include file that didn't change isn't rewritten.
+            Models with superelements are written to a single file.
+        nworkers : int; default=1
+            the number of processes used to write the include files
+            (split_includes=True)
 
         """
         if self.is_bdf_vectorized:
@@ -156,6 +171,19 @@ class WriteMesh(BDFAttributes):
                                            interspersed, size, is_double)
         encoding = self.get_encoding(encoding)
         #assert encoding.lower() in ['ascii', 'latin1', 'utf8'], encoding
+        if split_includes and self.superelement_models:
+            self.log.warning('split_includes=True does not support superelements; '
+                             f'writing {out_filename} as a single file')
+            split_includes = False
+        if split_includes:
+            if not isinstance(out_filename, (str, PurePath)):
+                raise TypeError('split_includes=True requires a filename; '
+                                f'out_filename={out_filename!r}')
+            self.log.debug(f'---starting BDF.write_bdf of {out_filename}---')
+            write_split_includes(self, out_filename, encoding, size, is_double, is_long_ids,
+                                 enddata=enddata, write_header=write_header,
+                                 nworkers=nworkers)
+            return
 
         has_read_write = hasattr(out_filename, 'read') and hasattr(out_filename, 'write')
         if has_read_write:
@@ -256,6 +284,8 @@ class WriteMesh(BDFAttributes):
             if is_long_ids:
                 for (eid, element) in sorted(self.elements.items()):
                     bdf_file.write(element.write_card_16(is_double))
+            elif size == 8:
+                write_dict_8(bdf_file, self.elements, is_double, 'element')
             else:
                 for (eid, element) in sorted(self.elements.items()):
                     try:
@@ -431,7 +461,8 @@ class WriteMesh(BDFAttributes):
                 bdf_file.write(gust.write_card(size, is_double))
 
     def _write_common(self, bdf_file: Any, size: int=8, is_double: bool=False,
-                      is_long_ids: Optional[bool]=None) -> None:
+                      is_long_ids: Optional[bool]=None,
+                      write_split_sections: bool=True) -> None:
         """
         Write the common outputs so none get missed...
 
@@ -443,10 +474,14 @@ class WriteMesh(BDFAttributes):
             the field width
         is_double : bool (default=False)
             is this double precision
+        write_split_sections : bool (default=True)
+            write the loads, thermal materials and constraints, which
+            are in include files for write_bdf(..., split_includes=True)
 
         """
         self._write_dmigs(bdf_file, size, is_double, is_long_ids=is_long_ids)
-        self._write_loads(bdf_file, size, is_double, is_long_ids=is_long_ids)
+        if write_split_sections:
+            self._write_loads(bdf_file, size, is_double, is_long_ids=is_long_ids)
         self._write_dynamic(bdf_file, size, is_double, is_long_ids=is_long_ids)
         self._write_aero_control(bdf_file, size, is_double, is_long_ids=is_long_ids)
         self._write_static_aero(bdf_file, size, is_double, is_long_ids=is_long_ids)
@@ -457,8 +492,9 @@ class WriteMesh(BDFAttributes):
         self._write_gust(bdf_file, size, is_double, write_aero_in_gust, is_long_ids=is_long_ids)
 
         self._write_thermal(bdf_file, size, is_double, is_long_ids=is_long_ids)
-        self._write_thermal_materials(bdf_file, size, is_double, is_long_ids=is_long_ids)
-        self._write_constraints(bdf_file, size, is_double, is_long_ids=is_long_ids)
+        if write_split_sections:
+            self._write_thermal_materials(bdf_file, size, is_double, is_long_ids=is_long_ids)
+            self._write_constraints(bdf_file, size, is_double, is_long_ids=is_long_ids)
         self._write_optimization(bdf_file, size, is_double, is_long_ids=is_long_ids)
         self._write_tables(bdf_file, size, is_double, is_long_ids=is_long_ids)
         self._write_sets(bdf_file, size, is_double, is_long_ids=is_long_ids)
@@ -719,12 +755,15 @@ class WriteMesh(BDFAttributes):
 
         if self.masses:
             bdf_file.write('$MASSES\n')
-            for (eid, mass) in sorted(self.masses.items()):
-                try:
-                    bdf_file.write(mass.write_card(size, is_double))
-                except Exception:
-                    print(f'failed printing masses...type={mass.type} eid={eid}')
-                    raise
+            if size == 8:
+                write_dict_8(bdf_file, self.masses, is_double, 'masses')
+            else:
+                for (eid, mass) in sorted(self.masses.items()):
+                    try:
+                        bdf_file.write(mass.write_card(size, is_double))
+                    except Exception:
+                        print(f'failed printing masses...type={mass.type} eid={eid}')
+                        raise
 
     def _write_materials(self, bdf_file: Any, size: int=8, is_double: bool=False,
                          is_long_ids: Optional[bool]=None) -> None:
@@ -1066,6 +1105,8 @@ class WriteMesh(BDFAttributes):
                     except Exception:
                         print(f'failed printing element...type={element.type} eid={eid}')
                         raise
+            elif size == 8:
+                write_dict_8(bdf_file, self.rigid_elements, is_double, 'element')
             else:
                 for (eid, element) in sorted(self.rigid_elements.items()):
                     try:
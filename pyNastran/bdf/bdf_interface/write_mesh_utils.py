@@ -2,6 +2,7 @@
 """
 This file defines:
   - write_dict(bdf_file, my_dict, size, is_double, is_long_ids)
+  - write_dict_8(bdf_file, my_dict, is_double, word)
   - write_aero_in_flutter, write_aero_in_gust = find_aero_location(model)
   - ptype_to_pid, property_type_to_property_class, ...
         properties_by_class = get_properties_by_element_type(model)
@@ -11,6 +12,8 @@ from __future__ import annotations
 from collections import defaultdict
 from typing import List, Dict, Tuple, Any, TYPE_CHECKING
 
+from pyNastran.bdf.bdf_interface.fast_write import write_cards_8
+
 if TYPE_CHECKING:  # pragma: no cover
     from pyNastran.bdf.bdf import BDF
 
@@ -21,11 +24,32 @@ def write_dict(bdf_file, my_dict: Dict[int, Any], size: int,
     if is_long_ids:
         for (unused_nid, node) in sorted(my_dict.items()):
             bdf_file.write(node.write_card_16(is_double))
+    elif size == 8:
+        write_cards_8(bdf_file, [node for (unused_nid, node) in sorted(my_dict.items())],
+                      is_double)
     else:
         for (unused_nid, node) in sorted(my_dict.items()):
             bdf_file.write(node.write_card(size, is_double))
 
 
+def write_dict_8(bdf_file, my_dict: Dict[int, Any], is_double: bool, word: str) -> None:
+    """
+    Writes a dictionary of elements with ``write_cards_8`` and prints
+    the element that can't be written if it fails
+    """
+    cards = [card for (unused_eid, card) in sorted(my_dict.items())]
+    try:
+        write_cards_8(bdf_file, cards, is_double)
+    except Exception:
+        for (eid, card) in sorted(my_dict.items()):
+            try:
+                card.write_card(8, is_double)
+            except Exception:
+                print(f'failed printing {word}...type={card.type} eid={eid}')
+                raise
+        raise
+
+
 def find_aero_location(model: BDF) -> Tuple[bool, bool]:
     """Determines where the AERO card should be written"""
     write_aero_in_flutter = False
@@ -0,0 +1,207 @@
+"""
+Defines the ``write_bdf(..., split_includes=True)`` writer:
+  - write_split_includes(model, out_filename, ...)
+  - SPLIT_SECTIONS
+
+The nodes, elements, properties, materials, loads and constraints are
+written to separate include files (e.g., ``model_nodes.inc``) next to
+the master deck, which has the executive/case control decks, the
+remaining bulk data and the INCLUDE statements.
+
+The sections are written by ``nworkers`` processes, which get a copy of
+the model by forking, so the model isn't pickled.  A section that has
+the same content as the file that is on disk isn't rewritten, so its
+modification time is unchanged.  The comments that reading an include
+file adds to the cards (e.g., ``$ INCLUDE processed: ...``, ``$NODES``)
+aren't written, so a read/write loop doesn't change the include files.
+
+"""
+from __future__ import annotations
+import os
+import hashlib
+import multiprocessing
+from io import StringIO
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Set, Tuple, Optional, Any, TYPE_CHECKING
+
+from pyNastran.bdf.write_path import write_include
+from pyNastran.bdf.bdf_interface.pybdf import IGNORE_COMMENTS
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+
+#: the WriteMesh methods used to write each include file
+SPLIT_SECTIONS = {
+    'nodes' : ('_write_nodes', ),
+    'elements' : ('_write_elements', '_write_masses', '_write_rigid_elements'),
+    'properties' : ('_write_properties', ),
+    'materials' : ('_write_materials', '_write_thermal_materials'),
+    'loads' : ('_write_loads', ),
+    'constraints' : ('_write_constraints', ),
+}
+
+#: the model that is written by the forked processes
+_MODEL = None  # type: Optional[BDF]
+
+
+def write_split_includes(model: BDF, out_filename: str, encoding: str,
+                         size: int, is_double: bool, is_long_ids: bool,
+                         enddata: Optional[bool]=None, write_header: bool=True,
+                         nworkers: int=1) -> List[str]:
+    """
+    Writes the master deck and the section include files
+
+    Parameters
+    ----------
+    model : BDF
+        the model to write
+    out_filename : str
+        the master deck; the include files are ``{base}_{section}.inc``
+    encoding : str
+        the unicode encoding
+    size : int; {8, 16}
+        the field size
+    is_double : bool
+        is this double precision
+    is_long_ids : bool
+        are there ids greater than 100,000,000
+    enddata : bool; default=None
+        bool - enable/disable writing ENDDATA
+        None - depends on input BDF
+    write_header : bool; default=True
+        flag for writing the pyNastran header
+    nworkers : int; default=1
+        the number of processes used to write the include files
+
+    Returns
+    -------
+    written_filenames : List[str]
+        the include files that were changed
+
+    """
+    out_filename = str(out_filename)
+    base = os.path.splitext(out_filename)[0]
+    filenames = {section: f'{base}_{section}.inc' for section in SPLIT_SECTIONS}
+    args = [(section, filenames[section], encoding, size, is_double, is_long_ids)
+            for section in SPLIT_SECTIONS]
+
+    global _MODEL
+    nworkers = min(nworkers, len(args))
+    if nworkers > 1 and 'fork' in multiprocessing.get_all_start_methods():
+        _MODEL = model
+        try:
+            context = multiprocessing.get_context('fork')
+            with ProcessPoolExecutor(max_workers=nworkers, mp_context=context) as executor:
+                results = list(executor.map(_write_section_worker, args))
+        finally:
+            _MODEL = None
+    else:
+        results = [_write_section(model, *arg) for arg in args]
+
+    written_filenames = []
+    include_filenames = []
+    for section, stamp, is_written in results:
+        filename = filenames[section]
+        if stamp is None:
+            # the section is empty, so the file isn't INCLUDEd
+            model._split_include_hashes.pop(filename, None)
+            continue
+        include_filenames.append(filename)
+        model._split_include_hashes[filename] = stamp
+        if is_written:
+            written_filenames.append(filename)
+        else:
+            model.log.debug(f'skipping unchanged {filename}')
+
+    dirname = os.path.dirname(os.path.abspath(out_filename))
+    with open(out_filename, 'w', encoding=encoding) as bdf_file:
+        model._write_header(bdf_file, encoding, write_header=write_header)
+        model._write_params(bdf_file, size, is_double, is_long_ids=is_long_ids)
+        for filename in include_filenames:
+            rel_filename = os.path.relpath(os.path.abspath(filename), dirname)
+            bdf_file.write(write_include(rel_filename))
+        model._write_aero(bdf_file, size, is_double, is_long_ids=is_long_ids)
+        model._write_common(bdf_file, size, is_double, is_long_ids=is_long_ids,
+                            write_split_sections=False)
+        if (enddata is None and 'ENDDATA' in model.card_count) or enddata:
+            bdf_file.write('ENDDATA\n')
+    return written_filenames
+
+
+def _write_section_worker(args: Tuple[Any, ...]) -> Tuple[str, Optional[Tuple[str, int]], bool]:
+    """writes a section with the forked model"""
+    return _write_section(_MODEL, *args)
+
+
+def _write_section(model: BDF, section: str, filename: str, encoding: str,
+                   size: int, is_double: bool,
+                   is_long_ids: bool) -> Tuple[str, Optional[Tuple[str, int]], bool]:
+    """
+    Writes an include file if it changed
+
+    Returns
+    -------
+    section : str
+        the section name
+    stamp : (sha1, mtime_ns) or None
+        the hash of the content and the modification time of the file;
+        None for an empty section
+    is_written : bool
+        was the file written
+
+    """
+    bdf_file = StringIO()
+    for method_name in SPLIT_SECTIONS[section]:
+        getattr(model, method_name)(bdf_file, size, is_double, is_long_ids=is_long_ids)
+    msg = _strip_include_comments(bdf_file.getvalue())
+    if not msg:
+        return section, None, False
+
+    sha1 = hashlib.sha1(msg.encode(encoding, errors='replace')).hexdigest()
+    if _is_unchanged(model._split_include_hashes.get(filename), filename, sha1,
+                     msg, encoding):
+        return section, (sha1, os.stat(filename).st_mtime_ns), False
+
+    with open(filename, 'w', encoding=encoding) as include_file:
+        include_file.write(msg)
+    return section, (sha1, os.stat(filename).st_mtime_ns), True
+
+
+def _strip_include_comments(msg: str) -> str:
+    """
+    Removes the comments that reading an include file adds to the cards
+    (``$ INCLUDE processed: ...``, blank lines and the section headers of
+    the previous write, e.g., ``$NODES``), so they don't pile up
+    """
+    lines = []  # type: List[str]
+    headers = set()  # type: Set[str]
+    for line in msg.splitlines(True):
+        if not line.startswith('$'):
+            headers = set()
+            lines.append(line)
+            continue
+        if line.startswith('$ INCLUDE processed:') or line.rstrip() == '$':
+            continue
+        header = line.rstrip()[1:]
+        if header in IGNORE_COMMENTS:
+            # a section header in the same comment block
+            if header in headers:
+                continue
+            headers.add(header)
+        lines.append(line)
+    return ''.join(lines)
+
+
+def _is_unchanged(stamp: Optional[Tuple[str, int]], filename: str, sha1: str,
+                  msg: str, encoding: str) -> bool:
+    """is the file on disk the same as the new content"""
+    if not os.path.exists(filename):
+        return False
+    if stamp is not None and stamp[1] == os.stat(filename).st_mtime_ns:
+        # written by the last write_bdf and not modified since
+        return stamp[0] == sha1
+
+    try:
+        with open(filename, 'r', encoding=encoding) as include_file:
+            return include_file.read() == msg
+    except UnicodeDecodeError:
+        return False
@@ -2801,7 +2801,7 @@ def get_nodes_along_axis_in_coords(model, nids, xyz_cp, icp_transform, cids):
         #origin = model.coords[cid].origin
 
         xyz_cid = model.transform_xyzcp_to_xyz_cid(xyz_cp, nids, icp_transform,
-                                                   cid=cid, in_place=False, atol=1e-6)
+                                                   cid=cid, in_place=False)
         xvalues_raw = xyz_cid[:, 0]
         inids = np.where(xvalues_raw <= 0.)[0]
         cid_to_inids[cid] = inids
@@ -371,6 +371,9 @@ class TestCoords(unittest.TestCase):
             xyz_cp, nid_cp_cd[:, 0], icp_transform, cid=11)
         unused_xyz_cid_12 = model.transform_xyzcp_to_xyz_cid(
             xyz_cp, nid_cp_cd[:, 0], icp_transform, cid=12)
+        with self.assertWarns(DeprecationWarning):
+            model.transform_xyzcp_to_xyz_cid(
+                xyz_cp, nid_cp_cd[:, 0], icp_transform, cid=12, atol=1e-6)
 
     def test_cord2_rcs_02(self):
         """
@@ -533,7 +536,7 @@ class TestCoords(unittest.TestCase):
         #---------------------------------------------
         xyz_cid0 = model.transform_xyzcp_to_xyz_cid(
             xyz_cp, nids, icp_transform,
-            cid=0, atol=None)
+            cid=0)
         array_equal(xyz_cid0_actual, xyz_cid0)
 
         model.write_bdf(bdf_file, close=False)
@@ -836,6 +839,54 @@ class TestCoords(unittest.TestCase):
         for unused_cid, coord in sorted(model.coords.items()):
             assert coord.i is not None, coord
 
+    def test_coord_engine(self):
+        """tests the vectorized coordinate transform engine"""
+        model = BDF(debug=False)
+        model.add_cord2c(300, [253.345, 171.174, 197.495], [242.924, 270.323, 205.299],
+                         [254.161, 163.413, 297.19])
+        model.add_cord2r(301, [0., 0., 0.], [100., 90.4, 0.], [100., -179.5, 0.], rid=300)
+        model.add_cord2s(302, [1., 2., 3.], [1., 2., 4.], [2., 2., 3.], rid=301)
+        model.add_cord1r(932, 23315, 23310, 22155)
+        model.add_grid(22155, [5., 30., 60.], cp=302, cd=932)
+        model.add_grid(23310, [256.9914, 187.4238, 218.859], cd=300)
+        model.add_grid(23315, [0., 0., 0.], cp=301, cd=932)
+        model.add_grid(1, [10., 20., 30.], cp=932, cd=302)
+
+        # the model doesn't need to be cross-referenced
+        xyz_cid0 = model.get_xyz_in_coord(cid=0)
+        engine = model.get_coord_engine()
+        assert model.get_coord_engine() is engine
+        assert array_equal(engine.cids, [0, 300, 301, 302, 932])
+
+        model.cross_reference()
+        nids = sorted(model.nodes)
+        nodes = [model.nodes[nid] for nid in nids]
+        assert allclose(xyz_cid0, [node.get_position() for node in nodes])
+        for cid in [300, 302, 932]:
+            xyz_cid = model.get_xyz_in_coord(cid=cid)
+            assert allclose(xyz_cid, [node.get_position_wrt(model, cid) for node in nodes])
+
+        # a displacement in the CD frames to the global frame and back
+        cds = np.array([node.Cd() for node in nodes])
+        disp_cd = np.arange(len(nids) * 6, dtype='float64').reshape(len(nids), 6)
+        disp_cid0 = engine.transform_vectors(disp_cd, cds, 0, xyz_cid0=xyz_cid0)
+        assert allclose(np.linalg.norm(disp_cid0[:, :3], axis=1),
+                        np.linalg.norm(disp_cd[:, :3], axis=1))
+        assert allclose(engine.transform_vectors(disp_cid0, 0, cds, xyz_cid0=xyz_cid0), disp_cd)
+
+        # the radial direction of the cylindrical system
+        coord = model.coords[300]
+        rtz = engine.transform_points(xyz_cid0, 0, cid_to=300)
+        radial = engine.transform_vectors([[1., 0., 0.]] * len(nids), 300, 0, xyz_cid0=xyz_cid0)
+        xyz_axis = coord.origin + np.outer(rtz[:, 2], coord.k)
+        assert allclose(xyz_cid0, xyz_axis + rtz[:, [0]] * radial)
+
+        # the engine is rebuilt when a coord changes
+        model.coords[300].e1 = np.array([250., 171.174, 197.495])
+        model.coords[300].setup()
+        assert model.get_coord_engine() is not engine
+        assert allclose(model.nodes[23310].get_position(), model.get_xyz_in_coord(cid=0)[2])
+
     def test_define_coords_from_axes(self):
         """define_coord_e123"""
         model = BDF(debug=False)
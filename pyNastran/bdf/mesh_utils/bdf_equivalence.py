@@ -8,17 +8,22 @@ defines:
                                   avoid_collapsed_elements=False,
                                   crash_on_collapse=False, log=None, debug=True)
 
+    nids_keep = get_equivalent_node_ids(nodes_xyz, nids, tol, node_set=None,
+                                        chunk_size=100_000, out_of_core=False)
+
 """
 from __future__ import annotations
 #import warnings
 from itertools import combinations
-from typing import Tuple, List, Set, Union, Optional, Any, TYPE_CHECKING
+from typing import Tuple, List, Dict, Set, Union, Optional, Any, TYPE_CHECKING
 import numpy as np
 from numpy import (array, unique, arange, searchsorted,
                    setdiff1d, intersect1d, asarray)
 from numpy.linalg import norm  # type: ignore
 import scipy
 import scipy.spatial
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
 
 from pyNastran.nptyping import NDArrayNint, NDArrayN3float
 from pyNastran.utils.numpy_utils import integer_types
@@ -28,6 +33,9 @@ if TYPE_CHECKING:  # pragma: no cover
     from cpylog import SimpleLogger
     from pyNastran.bdf.bdf import GRID
 
+#: the cKDTree n_jobs argument is called workers in scipy>=1.6
+IS_SCIPY_WORKERS = np.lib.NumpyVersion(scipy.__version__) >= '1.6.0'
+
 
 def bdf_equivalence_nodes(bdf_filename: str, bdf_filename_out: str, tol: float,
                           renumber_nodes: bool=False, neq_max: int=4, xref: bool=True,
@@ -37,7 +45,9 @@ def bdf_equivalence_nodes(bdf_filename: str, bdf_filename_out: str, tol: float,
                           avoid_collapsed_elements: bool=False,
                           crash_on_collapse: bool=False,
                           log: Optional[SimpleLogger]=None,
-                          debug: bool=True, method: str='new') -> BDF:
+                          debug: bool=True, method: str='new',
+                          chunk_size: int=100_000, out_of_core: bool=False,
+                          workers: int=-1) -> BDF:
     """
     Equivalences nodes; keeps the lower node id; creates two nodes with the same
 
@@ -83,8 +93,21 @@ def bdf_equivalence_nodes(bdf_filename: str, bdf_filename_out: str, tol: float,
     method: str; default='new'
         'new': doesn't require neq_max; new in v1.3
         'old': use neq_max; used in v1.2
+        'chunked': queries the nodes in blocks and merges the clusters
+                   with array-based connected components; doesn't require
+                   neq_max; intended for large models
     log : logger(); default=None
         bdf logging
+    chunk_size : int; default=100_000
+        the number of nodes per query block (method='chunked')
+    out_of_core : bool; default=False
+        method='chunked' only
+        False : build one kdtree for all the nodes
+        True  : sweep the nodes in slabs, so only the kdtree of the
+                current block (and its neighbors within tol) is in memory
+    workers : int; default=-1
+        the number of threads used for the kdtree queries (method='chunked');
+        -1 uses all the cores
 
     Returns
     -------
@@ -111,6 +134,7 @@ def bdf_equivalence_nodes(bdf_filename: str, bdf_filename_out: str, tol: float,
         renumber_nodes=renumber_nodes, neq_max=neq_max,
         xref=xref, node_set=node_set, log=log, debug=debug,
         method=method,
+        chunk_size=chunk_size, out_of_core=out_of_core, workers=workers,
         idtype='int32', fdtype='float64')
     model.log.debug(f'equivalence {len(nid_pairs):d} nodes')
 
@@ -187,9 +211,17 @@ def _bdf_equivalence_nodes(bdf_filename: str, tol: float,
                            node_set: Optional[List[NDArrayNint]]=None,
                            log: Optional[SimpleLogger]=None,
                            debug: bool=True, method: str='new',
+                           chunk_size: int=100_000, out_of_core: bool=False,
+                           workers: int=-1,
                            idtype: str='int32', fdtype: str='float64') -> Tuple[BDF,
                                                                                 List[Tuple[int, int]]]:
     """helper for bdf_equivalence_nodes"""
+    if method == 'chunked':
+        return _bdf_equivalence_nodes_chunked(
+            bdf_filename, tol, xref=xref, node_set=node_set, log=log, debug=debug,
+            chunk_size=chunk_size, out_of_core=out_of_core, workers=workers,
+            idtype=idtype, fdtype=fdtype)
+
     all_node_set = get_all_node_set(node_set)
     nodes_xyz, model, nids, inew = _eq_nodes_setup(
         bdf_filename, renumber_nodes=renumber_nodes,
@@ -204,6 +236,8 @@ def _bdf_equivalence_nodes(bdf_filename: str, tol: float,
         tol, log, inew,
         node_set=node_set, neq_max=neq_max, method=method, debug=debug)
     _eq_nodes_final(nid_pairs, model, tol, all_node_set, debug=debug)
+    # the cross-referenced elements now have different node ids
+    model._topology_index = None
     return model, nid_pairs
 
 def _eq_nodes_setup(bdf_filename,
@@ -690,3 +724,238 @@ def _get_tree(nodes_xyz: NDArrayN3float, msg: str='') -> scipy.spatial.cKDTree:
         print(nodes_xyz)
         raise RuntimeError(nodes_xyz)
     return kdt
+
+
+def _bdf_equivalence_nodes_chunked(bdf_filename: str, tol: float, xref: bool=True,
+                                   node_set: Optional[List[NDArrayNint]]=None,
+                                   log: Optional[SimpleLogger]=None,
+                                   debug: bool=True,
+                                   chunk_size: int=100_000, out_of_core: bool=False,
+                                   workers: int=-1,
+                                   idtype: str='int32',
+                                   fdtype: str='float64') -> Tuple[BDF, List[Tuple[int, int]]]:
+    """helper for bdf_equivalence_nodes for method='chunked'"""
+    all_node_set = get_all_node_set(node_set)
+    model = get_bdf_model(bdf_filename, xref=xref, log=log, debug=debug)
+    log = model.log
+    log.debug(f'bdf_equivalence_nodes; tol={tol} chunk_size={chunk_size} '
+              f'out_of_core={out_of_core}')
+    if node_set is not None:
+        assert len(node_set) > 0, node_set
+        nids = _eq_nodes_setup_node_set(model, node_set, all_node_set, idtype=idtype)[0]
+    else:
+        nids = _eq_nodes_setup_node(model, idtype=idtype)[0]
+    if tol < 0.0 or len(nids) == 0:
+        return model, []
+
+    nodes_xyz = _get_xyz_cid0_array(model, nids, fdtype=fdtype)
+    node_groups = _get_grid_groups(model, nids)
+    nids_keep = get_equivalent_node_ids(
+        nodes_xyz, nids, tol, node_set=node_set, node_groups=node_groups,
+        chunk_size=chunk_size, out_of_core=out_of_core, workers=workers)
+    nid_pairs = _eq_nodes_final_array(model, nids, nids_keep)
+    model._topology_index = None
+    return model, nid_pairs
+
+def _get_xyz_cid0_array(model: BDF, nids: NDArrayNint, fdtype: str='float64') -> NDArrayN3float:
+    """gets xyz_cid0 for the GRIDs in nids using the vectorized transform"""
+    nid_cp_cd, xyz_cid0 = model.get_xyz_in_coord_array(cid=0, fdtype=fdtype)[:2]
+    inid = np.searchsorted(nid_cp_cd[:, 0], nids)
+    return xyz_cid0[inid, :]
+
+def _get_grid_groups(model: BDF, nids: NDArrayNint) -> Optional[NDArrayNint]:
+    """
+    Groups the GRIDs by (cd, ps, seid), which must match for two nodes
+    to be merged.  Returns None if all the GRIDs are in the same group.
+    """
+    nodes = model.nodes
+    group_ids = {}
+    node_groups = np.array([
+        group_ids.setdefault((node.cd, node.ps, node.seid), len(group_ids))
+        for node in (nodes[nid] for nid in nids.tolist())], dtype='int32')
+    if len(group_ids) <= 1:
+        return None
+    return node_groups
+
+def get_equivalent_node_ids(nodes_xyz: NDArrayN3float,
+                            nids: NDArrayNint,
+                            tol: float,
+                            node_set: Optional[List[NDArrayNint]]=None,
+                            node_groups: Optional[NDArrayNint]=None,
+                            chunk_size: int=100_000,
+                            out_of_core: bool=False,
+                            workers: int=-1,
+                            neq_max: int=4) -> NDArrayNint:
+    """
+    Finds the node each node is equivalenced to
+
+    Nodes within tol of each other are grouped into clusters (chains of
+    close nodes are merged) and every node in a cluster maps to the
+    lowest node id of the cluster.
+
+    Parameters
+    ----------
+    nodes_xyz : (nnodes, 3) float ndarray
+        the xyzs to equivalence; may be a np.memmap when out_of_core=True
+    nids : (nnodes,) int ndarray
+        the sorted node ids
+    tol : float
+        the spherical equivalence tolerance
+    node_set : List[(n, ) int ndarray]; default=None
+        nodes may only be merged with other nodes in the same set
+    node_groups : (nnodes,) int ndarray; default=None
+        nodes may only be merged with other nodes in the same group
+        (e.g., GRIDs with the same CD/PS/SEID)
+    chunk_size : int; default=100_000
+        the number of nodes per query block
+    out_of_core : bool; default=False
+        False : build one kdtree for all the nodes
+        True  : sweep the nodes in slabs along the longest axis and only
+                build the kdtree of the current block and its neighbors
+    workers : int; default=-1
+        the number of threads used for the kdtree queries
+    neq_max : int; default=4
+        the number of close nodes found by the fast query; blocks with
+        more close nodes fall back to a ball query, so it's not a limit
+
+    Returns
+    -------
+    nids_keep : (nnodes,) int ndarray
+        the node id to use for each node
+
+    """
+    nnodes = len(nids)
+    assert nodes_xyz.shape == (nnodes, 3), f'nodes_xyz.shape={nodes_xyz.shape} nnodes={nnodes}'
+    assert chunk_size > 0, chunk_size
+    if out_of_core:
+        irows, icols = _get_close_node_pairs_out_of_core(
+            nodes_xyz, tol, chunk_size, workers, neq_max)
+    else:
+        irows, icols = _get_close_node_pairs_in_core(
+            nodes_xyz, tol, chunk_size, workers, neq_max)
+
+    if node_set is not None:
+        # nodes may only be merged within an explicit set
+        nid1 = nids[irows]
+        nid2 = nids[icols]
+        is_valid = np.zeros(len(irows), dtype='bool')
+        for seti in node_set:
+            is_valid |= np.isin(nid1, seti) & np.isin(nid2, seti)
+        irows = irows[is_valid]
+        icols = icols[is_valid]
+    if node_groups is not None:
+        is_valid = node_groups[irows] == node_groups[icols]
+        irows = irows[is_valid]
+        icols = icols[is_valid]
+
+    # union-find on the pairs; each node goes to the lowest index
+    # (i.e., the lowest node id) of its cluster
+    graph = coo_matrix((np.ones(len(irows), dtype='int8'), (irows, icols)),
+                       shape=(nnodes, nnodes))
+    unused_nclusters, labels = connected_components(graph, directed=False)
+    inode = np.arange(nnodes)
+    iroot = np.full(labels.max() + 1, nnodes)
+    np.minimum.at(iroot, labels, inode)
+    return nids[iroot[labels]]
+
+def _get_close_node_pairs_in_core(nodes_xyz: NDArrayN3float, tol: float,
+                                  chunk_size: int, workers: int,
+                                  neq_max: int) -> Tuple[NDArrayNint, NDArrayNint]:
+    """queries a single kdtree in blocks of chunk_size nodes"""
+    kdt = _get_tree(nodes_xyz)
+    nnodes = len(nodes_xyz)
+    irows_list = []
+    icols_list = []
+    for i0 in range(0, nnodes, chunk_size):
+        i1 = min(i0 + chunk_size, nnodes)
+        irow, icol = _query_close_nodes(kdt, nodes_xyz[i0:i1, :], tol, workers, neq_max)
+        irows_list.append(irow + i0)
+        icols_list.append(icol)
+    return _stack_pairs(irows_list, icols_list)
+
+def _get_close_node_pairs_out_of_core(nodes_xyz: NDArrayN3float, tol: float,
+                                      chunk_size: int, workers: int,
+                                      neq_max: int) -> Tuple[NDArrayNint, NDArrayNint]:
+    """
+    Sorts the nodes along the longest axis and sweeps through them in
+    blocks of chunk_size nodes.  Each block is queried against a kdtree
+    of the nodes within tol of the block, so the full kdtree is never
+    built.
+    """
+    nnodes = len(nodes_xyz)
+    xyz_min = nodes_xyz.min(axis=0)
+    xyz_max = nodes_xyz.max(axis=0)
+    iaxis = np.argmax(xyz_max - xyz_min)
+    isort = np.argsort(nodes_xyz[:, iaxis], kind='stable')
+    x = nodes_xyz[isort, iaxis]
+
+    irows_list = []
+    icols_list = []
+    for i0 in range(0, nnodes, chunk_size):
+        i1 = min(i0 + chunk_size, nnodes)
+        j0 = np.searchsorted(x, x[i0] - tol, side='left')
+        j1 = np.searchsorted(x, x[i1 - 1] + tol, side='right')
+        iblock = np.sort(isort[i0:i1])
+        iwindow = np.sort(isort[j0:j1])
+        kdt = _get_tree(np.asarray(nodes_xyz[iwindow, :]))
+        irow, icol = _query_close_nodes(kdt, np.asarray(nodes_xyz[iblock, :]),
+                                        tol, workers, neq_max)
+        irows_list.append(iblock[irow])
+        icols_list.append(iwindow[icol])
+    return _stack_pairs(irows_list, icols_list)
+
+def _query_close_nodes(kdt: scipy.spatial.cKDTree,
+                       xyz: NDArrayN3float,
+                       tol: float, workers: int,
+                       neq_max: int) -> Tuple[NDArrayNint, NDArrayNint]:
+    """
+    Gets the (irow, icol) pairs, where xyz[irow] is within tol of
+    the kdtree point icol.  The fixed-size query is vectorized; rows
+    that fill all neq_max slots are requeried with a ball query.
+    """
+    ntree = kdt.n
+    neq = max(neq_max, 2)
+    workers_kwargs = _get_workers_kwargs(workers)
+    unused_deq, ieq = kdt.query(xyz, k=neq, distance_upper_bound=tol, **workers_kwargs)
+    is_close = ieq < ntree
+    is_full = is_close[:, -1].copy()
+    is_close[is_full, :] = False
+    irow, icol = np.where(is_close)
+    icol = ieq[irow, icol]
+    if not is_full.any():
+        return irow, icol
+
+    # there are more than neq_max close nodes
+    ifull = np.where(is_full)[0]
+    balls = kdt.query_ball_point(xyz[ifull, :], tol, **workers_kwargs)
+    nballs = np.array([len(ball) for ball in balls])
+    irow_full = np.repeat(ifull, nballs)
+    icol_full = np.hstack(balls).astype(icol.dtype)
+    return np.hstack([irow, irow_full]), np.hstack([icol, icol_full])
+
+def _get_workers_kwargs(workers: int) -> Dict[str, int]:
+    """gets the cKDTree keyword argument for the number of threads"""
+    if IS_SCIPY_WORKERS:
+        return {'workers': workers}
+    return {'n_jobs': workers}
+
+def _stack_pairs(irows_list: List[NDArrayNint],
+                 icols_list: List[NDArrayNint]) -> Tuple[NDArrayNint, NDArrayNint]:
+    """combines the pairs from each block and drops the self pairs"""
+    irows = np.hstack(irows_list)
+    icols = np.hstack(icols_list)
+    is_pair = irows != icols
+    return irows[is_pair], icols[is_pair]
+
+def _eq_nodes_final_array(model: BDF, nids: NDArrayNint,
+                          nids_keep: NDArrayNint) -> List[Tuple[int, int]]:
+    """
+    Applies nodal equivalencing to the model.  Only the merged GRIDs are
+    updated; the cross-referenced elements pick up the new ids.
+    """
+    is_merged = nids_keep != nids
+    nid_pairs = list(zip(nids_keep[is_merged].tolist(), nids[is_merged].tolist()))
+    nodes = model.nodes
+    for nid1, nid2 in nid_pairs:
+        _update_grid(nodes[nid1], nodes[nid2])
+    return nid_pairs
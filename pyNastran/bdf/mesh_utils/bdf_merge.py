@@ -2,12 +2,15 @@
 defines:
  - bdf_merge(bdf_filenames, bdf_filename_out=None, renumber=True, encoding=None, size=8,
              is_double=False, cards_to_skip=None, log=None, skip_case_control_deck=False)
+ - bdf_merge_streaming(bdf_filenames, bdf_filename_out, renumber=True, encoding=None,
+                       size=8, is_double=False, cards_to_skip=None, log=None,
+                       skip_case_control_deck=False)
 
 """
 from __future__ import annotations
 from io import StringIO
 from pathlib import PurePath
-from typing import Tuple, List, Optional, Any, TYPE_CHECKING
+from typing import Tuple, List, Dict, Optional, Any, TYPE_CHECKING
 
 from pyNastran.bdf.bdf import BDF, read_bdf
 from pyNastran.bdf.case_control_deck import CaseControlDeck
@@ -209,6 +212,145 @@ def bdf_merge(bdf_filenames: List[str],
                                      mapper_renumber=mapper_renumber)
     return model, mappers_final
 
+def bdf_merge_streaming(bdf_filenames: List[str],
+                        bdf_filename_out: str,
+                        renumber: bool=True, encoding: Optional[str]=None,
+                        size: int=8, is_double: bool=False,
+                        cards_to_skip: Optional[List[str]]=None,
+                        skip_case_control_deck: bool=False,
+                        log: Optional[SimpleLogger]=None) -> List[MAPPER]:
+    """
+    Merges multiple BDFs into one file without holding all the models
+    in memory
+
+    Only one model is loaded at a time.  Each model is renumbered to
+    start after the maximum ids of the models that were already
+    written, written to bdf_filename_out and then released.  The
+    same families of cards as ``bdf_merge`` are merged from the
+    secondary models.
+
+    Parameters
+    ----------
+    bdf_filenames : List[str]
+        list of bdf filenames
+    bdf_filename_out : str
+        the output bdf filename
+    renumber : bool
+        True : the ids of the merged deck start from 1
+        False : the ids of the first model are unchanged
+    encoding : str
+        the unicode encoding (default=None; system default)
+    size : int; {8, 16}; default=8
+        the bdf write precision
+    is_double : bool; default=False
+        the field precision to write
+    cards_to_skip : List[str]; (default=None -> don't skip any cards)
+        There are edge cases (e.g. FLUTTER analysis) where things can break due to
+        uncross-referenced cards.  You need to disable entire classes of cards in
+        that case (e.g. all aero cards).
+    skip_case_control_deck : bool, optional, default : False
+        If true, don't consider the case control deck while merging.
+
+    Returns
+    -------
+    mappers_all : List[mapper]
+        mapper : Dict[bdf_attribute] : old_id_to_new_id_dict
+            the map of the original ids of each model to the merged ids
+            (see ``bdf_merge``)
+
+    """
+    if not isinstance(bdf_filenames, (list, tuple)):
+        raise TypeError('bdf_filenames is not a list/tuple...%s' % str(bdf_filenames))
+    if not len(bdf_filenames) > 1:
+        raise RuntimeError("You can't merge one BDF...bdf_filenames=%s" % str(bdf_filenames))
+    for bdf_filename in bdf_filenames:
+        if not isinstance(bdf_filename, (str, StringIO, PurePath)):
+            raise TypeError('bdf_filenames is not a string...%s' % bdf_filename)
+
+    data_members = [
+        'coords', 'nodes', 'elements', 'masses', 'properties', 'properties_mass',
+        'materials', 'sets', 'rigid_elements', 'mpcs', 'caeros', 'splines',
+    ]
+    bdf_filename0 = bdf_filenames[0]
+    model = get_bdf_model(
+        bdf_filename0, xref=True,
+        cards_to_skip=cards_to_skip, validate=False,
+        log=log, debug=False)
+    log = model.log
+    if skip_case_control_deck:
+        model.case_control_deck = CaseControlDeck([], log=None)
+    log.info('primary=%s' % bdf_filename0)
+
+    if renumber:
+        starting_id_dict = {
+            'cid' : 1,
+            'nid' : 1,
+            'eid' : 1,
+            'pid' : 1,
+            'mid' : 1,
+        }
+        _, mapper = bdf_renumber(model, None, starting_id_dict=starting_id_dict,
+                                 size=size, is_double=is_double, cards_to_skip=cards_to_skip)
+    else:
+        mapper = _get_mapper_0(model)
+    mappers = [mapper]
+
+    encoding = model.get_encoding(encoding)
+    with open(bdf_filename_out, 'w', encoding=encoding) as bdf_file:
+        model.write_bdf(bdf_file, encoding=encoding, size=size, is_double=is_double,
+                        interspersed=False, enddata=False, close=False)
+        starting_id_dict = get_renumber_starting_ids_from_model(model, mapper)
+        params_written = set(model.params)
+        has_aero = model.aero is not None
+        has_aeros = model.aeros is not None
+        del model
+
+        for bdf_filename in bdf_filenames[1:]:
+            log.debug('secondary=%s' % bdf_filename)
+            model2 = get_bdf_model(
+                bdf_filename, xref=True,
+                cards_to_skip=cards_to_skip, validate=True,
+                log=log, debug=False)
+            _, mapperi = bdf_renumber(model2, None, starting_id_dict=starting_id_dict.copy(),
+                                      size=size, is_double=is_double,
+                                      cards_to_skip=cards_to_skip)
+            mappers.append(mapperi)
+
+            bdf_file.write('$' + '-' * 79 + '\n')
+            bdf_file.write(f'$ merged from {bdf_filename}\n')
+            for key, param in sorted(model2.params.items()):
+                if key not in params_written:
+                    bdf_file.write(param.write_card(size, is_double))
+                    params_written.add(key)
+            if not has_aero and model2.aero is not None:
+                bdf_file.write(model2.aero.write_card(size, is_double))
+                has_aero = True
+            if not has_aeros and model2.aeros is not None:
+                bdf_file.write(model2.aeros.write_card(size, is_double))
+                has_aeros = True
+            for mkaero in model2.mkaeros:
+                bdf_file.write(mkaero.write_card(size, is_double))
+            _write_data_members(bdf_file, model2, data_members, size, is_double)
+
+            starting_id_dict2 = get_renumber_starting_ids_from_model(model2, mapperi)
+            for key, value in starting_id_dict2.items():
+                starting_id_dict[key] = max(starting_id_dict[key], value)
+            del model2
+        bdf_file.write('ENDDATA\n')
+    return mappers
+
+def _write_data_members(bdf_file: Any, model: BDF, data_members: List[str],
+                        size: int, is_double: bool) -> None:
+    """writes the merged cards of a secondary model"""
+    for data_member in data_members:
+        data = getattr(model, data_member)
+        for key, value in sorted(data.items()):
+            if data_member == 'coords' and key == 0:
+                continue
+            cards = value if isinstance(value, list) else [value]
+            for card in cards:
+                bdf_file.write(card.write_card(size, is_double))
+
 def _apply_scalar_cards(model: BDF, model2_renumber: BDF) -> None:
     """apply cards from model2 to model if they don't exist in model"""
     if model.aero is None and model2_renumber.aero:
@@ -2,7 +2,8 @@
 defines:
     bdf_renumber(bdf_filename, bdf_filename_out, size=8, is_double=False,
                  starting_id_dict=None, round_ids=False, cards_to_skip=None,
-                 log=None, debug=False)
+                 log=None, debug=False, node_ordering='id')
+    nids = get_rcm_node_order(model)
     superelement_renumber(bdf_filename, bdf_filename_out=None, size=8, is_double=False,
                           starting_id_dict=None, cards_to_skip=None,
                           log=None, debug=False)
@@ -10,9 +11,11 @@ defines:
 """
 from itertools import chain
 from io import StringIO, IOBase
-from typing import List, Dict, Optional, Union
+from typing import List, Dict, Tuple, Optional, Union, Any
 
 import numpy as np
+import scipy.sparse
+from scipy.sparse.csgraph import reverse_cuthill_mckee
 
 from pyNastran.bdf.bdf import BDF
 from pyNastran.utils.numpy_utils import integer_types
@@ -24,7 +27,7 @@ def bdf_renumber(bdf_filename: Union[str, BDF, StringIO],
                  size=8, is_double=False,
                  starting_id_dict=None, round_ids: bool=False,
                  cards_to_skip: Optional[List[str]]=None,
-                 log=None, debug=False) -> BDF:
+                 log=None, debug=False, node_ordering: str='id') -> BDF:
     """
     Renumbers a BDF
 
@@ -58,6 +61,12 @@ def bdf_renumber(bdf_filename: Union[str, BDF, StringIO],
         There are edge cases (e.g. FLUTTER analysis) where things can
         break due to uncross-referenced cards.  You need to disable
         entire classes of cards in that case (e.g. all aero cards).
+    node_ordering : str; default='id'
+        the order the new node ids are assigned in
+        'id' : keep the order of the original node ids
+        'rcm' : reverse Cuthill-McKee ordering of the element and rigid element
+                connectivity, which reduces the bandwidth of the
+                stiffness matrix
 
     Returns
     -------
@@ -161,6 +170,10 @@ def bdf_renumber(bdf_filename: Union[str, BDF, StringIO],
     >>> bdf_renumber(bdf_filename, bdf_filename_out, size=8, is_double=False,
                      starting_ids_dict=starting_ids_dict, round_ids=False)
 
+    **Renumber the Nodes to Reduce the Bandwidth**
+
+    >>> bdf_renumber(bdf_filename, bdf_filename_out, node_ordering='rcm')
+
     **Only Renumber Material IDs**
 
     >>> starting_id_dict = {
@@ -194,6 +207,7 @@ def bdf_renumber(bdf_filename: Union[str, BDF, StringIO],
     """
     assert size in [8, 16], size
     assert isinstance(is_double, bool), is_double
+    assert node_ordering in ['id', 'rcm'], f'node_ordering={node_ordering!r}'
     starting_id_dict_default = {
         'cid' : 1,
         'nid' : 1,
@@ -361,7 +375,8 @@ def bdf_renumber(bdf_filename: Union[str, BDF, StringIO],
 
     model = _get_bdf_model(bdf_filename, cards_to_skip=cards_to_skip, log=log, debug=debug)
 
-    nid_map, unused_reverse_nid_map = _create_nid_maps(model, starting_id_dict, nid)
+    nid_map, unused_reverse_nid_map = _create_nid_maps(model, starting_id_dict, nid,
+                                                       node_ordering=node_ordering)
     mid_map, all_materials = _create_mid_map(model, mid)
 
     _update_nodes(
@@ -543,40 +558,15 @@ def bdf_renumber(bdf_filename: Union[str, BDF, StringIO],
         table_id += 1
 
     # dloads
-    for dload_idi, dloads in sorted(model.dloads.items()):
-        for dload in dloads:
-            assert hasattr(dload, 'sid')
-            dload.sid = dload_id
-        dload_map[dload_idi] = dload_id
-        dload_id += 1
-    for dload_idi, dloads in sorted(model.dload_entries.items()):
-        for dload in dloads:
-            assert hasattr(dload, 'sid')
-            dload.sid = dload_id
-        dload_map[dload_idi] = dload_id
-        dload_id += 1
+    dload_id = _create_dict_mapper(model.dloads, dload_map, 'sid', dload_id)
+    dload_id = _create_dict_mapper(model.dload_entries, dload_map, 'sid', dload_id)
 
     # loads
-    for load_idi, load_combinations in sorted(model.load_combinations.items()):
-        for load_combination in load_combinations:
-            assert hasattr(load_combination, 'sid')
-            load_combination.sid = load_id
-        load_map[load_idi] = load_id
-        load_id += 1
-    for load_idi, loads in sorted(model.loads.items()):
-        for load in loads:
-            assert hasattr(load, 'sid')
-            load.sid = load_id
-        load_map[load_idi] = load_id
-        load_id += 1
+    load_id = _create_dict_mapper(model.load_combinations, load_map, 'sid', load_id)
+    load_id = _create_dict_mapper(model.loads, load_map, 'sid', load_id)
 
     # transfer_functions
-    for tf_idi, transfer_functions in sorted(model.transfer_functions.items()):
-        for transfer_function in transfer_functions:
-            assert hasattr(transfer_function, 'sid')
-            transfer_function.sid = tf_id
-        tranfer_function_map[tf_idi] = tf_id
-        load_id += 1
+    tf_id = _create_dict_mapper(model.transfer_functions, tranfer_function_map, 'sid', tf_id)
 
     lseq_map = load_map # wrong???
     temp_map = load_map # wrong???
@@ -647,7 +637,9 @@ def _write_bdf(model, bdf_filename_out, size=8, is_double=False):
                         interspersed=False, close=close)
 
 
-def get_renumber_starting_ids_from_model(model: BDF) -> Dict[str, int]:
+def get_renumber_starting_ids_from_model(model: BDF,
+                                         mapper: Optional[Dict[str, Dict[int, int]]]=None,
+                                         ) -> Dict[str, int]:
     """
     Get the starting ids dictionary used for renumbering with ids greater
     than those in model.
@@ -656,36 +648,58 @@ def get_renumber_starting_ids_from_model(model: BDF) -> Dict[str, int]:
     ----------
     model : BDF
         BDF object to get maximum ids from.
+    mapper : dict[str] = dict[int] = int; default=None
+        The mapper from bdf_renumber.  A model that was renumbered in place
+        still has the original ids as its dictionary keys, so the new ids
+        are taken from the mapper instead.
 
     Returns
     -------
     starting_id_dict : dict {str : int, ...}
         Dictionary from id type to starting id.
     """
-    eid_max = max([
-        max(model.elements),
-        max(model.masses) if model.masses else 0,
-        max(model.rigid_elements) if model.rigid_elements else 0,
-    ])
-    pid_max = max([
-        max(model.properties) if model.properties else 0,
-        max(model.properties_mass) if model.properties_mass else 0,
-    ])
-    mids = model.material_ids
+    if mapper is None:
+        def _max_id(*names):
+            ids = [max(getattr(model, name)) for name in names
+                   if getattr(model, name)]
+            return max(ids) if ids else 0
+        nids = list(model.point_ids)
+        mids = model.material_ids
+        mid_max = max(mids) if mids else 0
+    else:
+        def _max_id(*names):
+            ids = [max(mapper[name].values()) for name in names
+                   if mapper.get(name)]
+            return max(ids) if ids else 0
+        nids = [max(mapper['nodes'].values())] if mapper.get('nodes') else []
+        nids += list(model.spoints) + list(model.epoints)
+        mid_max = _max_id('materials')
+
+    caero_id_max = max(_get_max_box_id(caero) for caero in model.caeros.values()) \
+        if model.caeros else 0
     starting_id_dict = {
-        'cid' : max(model.coords) + 1,
-        'nid' : max(model.point_ids) + 1,
-        'eid' : eid_max + 1,
-        'pid' : pid_max + 1,
-        'mid' : max(mids) + 1 if mids else 1,
-        'set_id' : max(model.sets) + 1 if model.sets else 1,
-        'spline_id' : max(model.splines) + 1 if model.splines else 1,
-        'caero_id' : max(caero.box_ids[-1, -1]
-                         for caero in model.caeros.values()) + 1 if model.caeros else 1,
+        'cid' : _max_id('coords') + 1,
+        'nid' : max(nids) + 1 if nids else 1,
+        'eid' : _max_id('elements', 'masses', 'rigid_elements') + 1,
+        'pid' : _max_id('properties', 'properties_mass') + 1,
+        'mid' : mid_max + 1,
+        'set_id' : _max_id('sets') + 1,
+        'spline_id' : _max_id('splines') + 1,
+        'caero_id' : caero_id_max + 1,
     }
     return starting_id_dict
 
 
+def _get_max_box_id(caero) -> int:
+    """gets the last box id of a CAEROx"""
+    if caero.type in ('CAERO2', 'CAERO5'):
+        nboxes = caero.nboxes
+    else:
+        nchord, nspan = caero.shape
+        nboxes = nchord * nspan
+    return caero.eid + nboxes - 1
+
+
 def get_starting_ids_dict_from_mapper(model, mapper):
     starting_id_dict2 = {}
     missed_keys = []
@@ -820,55 +834,83 @@ def superelement_renumber(bdf_filename, bdf_filename_out=None, size=8, is_double
     return model #, mapper
 
 
-def _create_nid_maps(model, starting_id_dict, nid):
+def _create_nid_maps(model, starting_id_dict, nid, node_ordering='id'):
     """builds the nid_maps"""
-    nid_map = {}
-    reverse_nid_map = {}
-
-    spoints = list(model.spoints.keys())
-    epoints = list(model.epoints.keys())
-    nids = model.nodes.keys()
+    spoints = np.array(list(model.spoints.keys()), dtype='int64')
+    epoints = np.array(list(model.epoints.keys()), dtype='int64')
+    nids = np.array(sorted(model.nodes.keys()), dtype='int64')
 
-    nids_spoints_epoints = sorted(chain(nids, spoints, epoints))
-
-    #spoints_nids.sort()
-    i = 1
-    #nnodes = len(spoints_nids)
-
-    i = 1
-    #j = 1
-    #print(spoints_nids)
-    #k = 0
-    #model.log.debug(starting_id_dict)
     if 'nid' in starting_id_dict and nid is not None:
-        i = nid
-        #banned_nodes = spoints
-        for nidi in nids_spoints_epoints:
-            if nidi in spoints or nidi in epoints:
-                pass
-                #print('sid=%s -> %s' % (nid, i))
-                #i += 1
-            else:
-                while i in spoints or i in epoints:
-                    #print('*bump')
-                    i += 1
-                #print('nid=%s -> %s' % (nid, i))
-                nid_map[nidi] = i
-                reverse_nid_map[i] = nidi
-                i += 1
-        #for nid in sorted(nids):
-            #nid_map[nid] = i
-            #reverse_nid_map[i] = nid
-            #i += 1
-        #print(nid_map)
-        #print(reverse_nid_map)
+        if node_ordering == 'rcm':
+            nids = get_rcm_node_order(model)
+
+        # the SPOINTs/EPOINTs aren't renumbered, so skip over their ids
+        banned_ids = np.union1d(spoints, epoints)
+        nids_new = np.arange(nid, nid + len(nids) + len(banned_ids), dtype='int64')
+        nids_new = nids_new[~np.isin(nids_new, banned_ids)][:len(nids)]
+
+        nids_list = nids.tolist()
+        nids_new_list = nids_new.tolist()
+        nid_map = dict(zip(nids_list, nids_new_list))
+        reverse_nid_map = dict(zip(nids_new_list, nids_list))
     else:
-        for nid in nids_spoints_epoints:
-            nid_map[nid] = nid
+        nid_map = {nid: nid for nid in sorted(chain(nids.tolist(), spoints.tolist(),
+                                                    epoints.tolist()))}
         reverse_nid_map = nid_map
     return nid_map, reverse_nid_map
 
 
+def get_rcm_node_order(model: BDF) -> np.ndarray:
+    """
+    Gets the GRID ids in reverse Cuthill-McKee order, which reduces the
+    bandwidth of the node adjacency (and stiffness) matrix.  Two nodes
+    are adjacent if they're used by the same element or rigid element
+    (e.g., RBE2, RBE3, RBAR).  Nodes that aren't used by either are put
+    at the end.
+
+    Parameters
+    ----------
+    model : BDF
+        the model
+
+    Returns
+    -------
+    nids : (nnodes, ) int ndarray
+        the GRID ids in their new order
+
+    """
+    nids = np.array(sorted(model.nodes.keys()), dtype='int64')
+    index = model.get_topology_index()
+
+    # node-element incidence matrix; the rigid elements are extra columns
+    nelements = index.nelements
+    inode_index = np.repeat(np.arange(len(index.nids)), np.diff(index.node_element_offsets))
+    rows_list = [index.nids[inode_index]]
+    cols_list = [index.node_elements]
+    for irigid, elem in enumerate(model.rigid_elements.values()):
+        rigid_nids = [nid for nid in chain(elem.independent_nodes, elem.dependent_nodes)
+                      if nid is not None]
+        rows_list.append(np.array(rigid_nids, dtype='int64'))
+        cols_list.append(np.full(len(rigid_nids), nelements + irigid, dtype='int64'))
+    node_ids = np.hstack(rows_list)
+    cols = np.hstack(cols_list)
+    is_grid = np.isin(node_ids, nids)
+    rows = np.searchsorted(nids, node_ids[is_grid])
+    cols = cols[is_grid]
+
+    nnodes = len(nids)
+    ncols = max(nelements + len(model.rigid_elements), 1)
+    incidence = scipy.sparse.coo_matrix(
+        (np.ones(len(rows), dtype='int32'), (rows, cols)), shape=(nnodes, ncols)).tocsr()
+    is_used = np.diff(incidence.indptr) > 0
+    incidence = incidence[is_used, :]
+
+    # node adjacency matrix
+    adjacency = (incidence @ incidence.T).tocsr()
+    ircm = reverse_cuthill_mckee(adjacency, symmetric_mode=True)
+    return np.hstack([nids[is_used][ircm], nids[~is_used]])
+
+
 def _create_mid_map(model, mid):
     """builds the mid_map"""
     mid_map = {}
@@ -892,16 +934,8 @@ def _create_mid_map(model, mid):
     )
 
     if mid is not None:
-        mids = []
-        for materials in all_materials:
-            mids += materials.keys()
-        mids = np.unique(mids)
-        mids.sort()
-        nmaterials = len(mids)
-
-        for i in range(nmaterials):
-            midi = mids[i]
-            mid_map[midi] = mid + i
+        mids = chain.from_iterable(materials.keys() for materials in all_materials)
+        mid_map = _get_id_map(mids, mid)
     return mid_map, all_materials
 
 
@@ -922,38 +956,21 @@ def _update_nodes(model, starting_id_dict, nid, nid_map):
         #spoints2 = arange(1, len(spoints) + 1)
         #nid = _create_dict_mapper(model.nodes, nid_map, 'nid', nid)
 
-        for nid, node in sorted(model.nodes.items()):
-            nid_new = nid_map[nid]
-            #print('nid=%s -> %s' % (nid, nid_new))
-            node.nid = nid_new
+        for nid, node in model.nodes.items():
+            node.nid = nid_map[nid]
+        # the cross-referenced elements now have different node ids
+        model._topology_index = None
 
 
 def _update_properties(model, starting_id_dict, pid,
                        properties_map, properties_mass_map):
     """updates the properties"""
     if 'pid' in starting_id_dict and pid is not None:
-        # properties
-        #pid = _create_dict_mapper(model.properties, properties_map, 'pid', pid)
-        #pid = _create_dict_mapper(model.properties_mass, properties_mass_map, 'pid', pid)
-        #pid = _update(model.convection_properties, properties_mass_map, pid)
-
-        for pidi, prop in sorted(model.properties.items()):
-            prop.pid = pid
-            properties_map[pidi] = pid
-            pid += 1
-        for pidi, prop in sorted(model.properties_mass.items()):
-            # PMASS
-            prop.pid = pid
-            properties_mass_map[pidi] = pid
-            pid += 1
-        for pidi, prop in sorted(model.convection_properties.items()):
-            # PCONV
-            prop.pid = pid
-            pid += 1
-        for pidi, prop in sorted(model.phbdys.items()):
-            # PHBDY
-            prop.pid = pid
-            pid += 1
+        # properties, PMASS, PCONV, PHBDY
+        pid = _create_dict_mapper(model.properties, properties_map, 'pid', pid)
+        pid = _create_dict_mapper(model.properties_mass, properties_mass_map, 'pid', pid)
+        pid = _create_dict_mapper(model.convection_properties, {}, 'pid', pid)
+        pid = _create_dict_mapper(model.phbdys, {}, 'pid', pid)
 
 
 def _update_elements(model, starting_id_dict, eid,
@@ -961,24 +978,15 @@ def _update_elements(model, starting_id_dict, eid,
     """updates the elements"""
     if 'eid' in starting_id_dict and eid is not None:
         # elements
-        #eid = _create_dict_mapper(model.elements, eid_map, 'eid', eid)
-
-        for eidi, element in sorted(model.elements.items()):
-            element.eid = eid
-            eid_map[eidi] = eid
-            eid += 1
-        for eidi, element in sorted(model.masses.items()):
-            # CONM1, CONM2, CMASSx
-            element.eid = eid
-            eid_map[eidi] = eid
-            mass_id_map[eidi] = eid
-            eid += 1
-        for eidi, elem in sorted(model.rigid_elements.items()):
-            # RBAR/RBAR1/RBE1/RBE2/RBE3/RSPLINE/RSSCON
-            elem.eid = eid
-            eid_map[eidi] = eid
-            rigid_elements_map[eidi] = eid
-            eid += 1
+        eid = _create_dict_mapper(model.elements, eid_map, 'eid', eid)
+
+        # CONM1, CONM2, CMASSx
+        eid = _create_dict_mapper(model.masses, mass_id_map, 'eid', eid)
+        eid_map.update(mass_id_map)
+
+        # RBAR/RBAR1/RBE1/RBE2/RBE3/RSPLINE/RSSCON
+        eid = _create_dict_mapper(model.rigid_elements, rigid_elements_map, 'eid', eid)
+        eid_map.update(rigid_elements_map)
         #for eidi, elem in model.caeros.items():
             #pass
 
@@ -986,12 +994,10 @@ def _update_elements(model, starting_id_dict, eid,
 def _update_materials(unused_model, starting_id_dict, mid,
                       mid_map, all_materials):
     if 'mid' in starting_id_dict and mid is not None:
-        #mid = 1
         for materials in all_materials:
             for midi, material in materials.items():
-                mid = mid_map[midi]
                 assert hasattr(material, 'mid')
-                material.mid = mid
+                material.mid = mid_map[midi]
 
 
 def _update_spcs(model, starting_id_dict, spc_id,
@@ -999,19 +1005,8 @@ def _update_spcs(model, starting_id_dict, spc_id,
     """updates the spcs"""
     if 'spc_id' in starting_id_dict and spc_id is not None:
         # spc
-        for spc_idi, spc_group in sorted(model.spcadds.items()):
-            for unused_i, spc in enumerate(spc_group):
-                assert hasattr(spc, 'conid')
-                spc.conid = spc_id
-            spc_map[spc_idi] = spc_id
-            spc_id += 1
-
-        for spc_idi, spc_group in sorted(model.spcs.items()):
-            for unused_i, spc in enumerate(spc_group):
-                assert hasattr(spc, 'conid')
-                spc.conid = spc_id
-            spc_map[spc_idi] = spc_id
-            spc_id += 1
+        spc_id = _create_dict_mapper(model.spcadds, spc_map, 'conid', spc_id)
+        spc_id = _create_dict_mapper(model.spcs, spc_map, 'conid', spc_id)
     else:
         # TODO: why are we doing this?
         for spc_id in model.spcadds:
@@ -1025,19 +1020,8 @@ def _update_mpcs(model, starting_id_dict, mpc_id,
     """updates the mpcs"""
     if 'mpc_id' in starting_id_dict and mpc_id is not None:
         # mpc
-        for mpc_idi, mpc_group in sorted(model.mpcadds.items()):
-            for unused_i, mpc in enumerate(mpc_group):
-                assert hasattr(mpc, 'conid')
-                mpc.conid = mpc_id
-            mpc_map[mpc_idi] = mpc_id
-            mpc_id += 1
-
-        for mpc_idi, mpc_group in sorted(model.mpcs.items()):
-            for unused_i, mpc in enumerate(mpc_group):
-                assert hasattr(mpc, 'conid')
-                mpc.conid = mpc_id
-            mpc_map[mpc_idi] = mpc_id
-            mpc_id += 1
+        mpc_id = _create_dict_mapper(model.mpcadds, mpc_map, 'conid', mpc_id)
+        mpc_id = _create_dict_mapper(model.mpcs, mpc_map, 'conid', mpc_id)
     else:
         # TODO: why are we doing this?
         for mpc_id in model.mpcadds:
@@ -1050,14 +1034,11 @@ def _update_coords(model, starting_id_dict, cid,
                    cid_map):
     """updates the coords"""
     if 'cid' in starting_id_dict and cid is not None:
-        # coords
-        for cidi, coord in sorted(model.coords.items()):
-            if cidi == 0:
-                cid_map[0] = 0
-                continue
-            coord.cid = cid
-            cid_map[cidi] = cid
-            cid += 1
+        # coords; the basic coordinate system isn't renumbered
+        if 0 in model.coords:
+            cid_map[0] = 0
+        coords = {cidi: coord for cidi, coord in model.coords.items() if cidi != 0}
+        _create_dict_mapper(coords, cid_map, 'cid', cid)
 
 
 def _update_case_control(model, mapper):
@@ -1245,32 +1226,77 @@ def _update_case_control(model, mapper):
 def _update_case_key(key, elemental_quantities, seti2, eid_map, nid_map):
     """Updates a Case Control SET card.  A set may have an elemental result
     or a nodal result."""
-    values2 = []
     eids_missing = []
     nids_missing = []
     if key in elemental_quantities:
         # renumber eids
-        for eid in seti2:
-            if eid not in eid_map:
-                eids_missing.append(eid)
-                continue
-            eid_new = eid_map[eid]
-            values2.append(eid_new)
-        #print('updating element SET %r' % options)
+        values2, eids_missing = _map_ids(eid_map, seti2)
     else:
         # renumber nids
-        for nid in seti2:
-            if nid not in nid_map:
-                nids_missing.append(nid)
-                continue
-            nid_new = nid_map[nid]
-            values2.append(nid_new)
-        #print('updating node SET %r' % options)
+        values2, nids_missing = _map_ids(nid_map, seti2)
     return eids_missing, nids_missing, values2
 
-#def _create_dict_mapper(properties, properties_map, pid_name, pid):
-    #for pidi, prop in sorted(mydict.items()):
-        #setattr(prop, pid_name, pid)
-        #properties_map[pidi] = pid
-        #pid += 1
-    #return pid
+
+def _get_id_map(ids, id0: int) -> Dict[int, int]:
+    """maps the unique, sorted ids to id0, id0+1, ..."""
+    ids = np.unique(np.fromiter(ids, dtype='int64'))
+    ids_new = np.arange(id0, id0 + len(ids), dtype='int64')
+    return dict(zip(ids.tolist(), ids_new.tolist()))
+
+
+def _create_dict_mapper(cards: Dict[int, Any], id_map: Dict[int, int],
+                        id_name: str, id0: int) -> int:
+    """
+    Renumbers a dictionary of cards (or lists of cards) to id0, id0+1, ...
+    in the order of the old ids
+
+    Parameters
+    ----------
+    cards : Dict[int, card] / Dict[int, List[card]]
+        the cards (e.g., model.properties, model.spcs)
+    id_map : Dict[int, int]
+        the old -> new id map, which is updated
+    id_name : str
+        the id attribute (e.g., 'pid', 'conid', 'sid')
+    id0 : int
+        the first new id
+
+    Returns
+    -------
+    id0 : int
+        the next new id
+
+    """
+    id_map_cards = _get_id_map(cards.keys(), id0)
+    for idi, card in cards.items():
+        id_new = id_map_cards[idi]
+        for cardi in (card if isinstance(card, list) else [card]):
+            assert hasattr(cardi, id_name), cardi
+            setattr(cardi, id_name, id_new)
+    id_map.update(id_map_cards)
+    return id0 + len(id_map_cards)
+
+
+def _map_ids(id_map: Dict[int, int], ids: List[int]) -> Tuple[List[int], List[int]]:
+    """
+    Maps the ids of a SET with np.searchsorted
+
+    Returns
+    -------
+    ids_new : List[int]
+        the new ids of the ids in id_map
+    ids_missing : List[int]
+        the ids that aren't in id_map
+
+    """
+    ids = np.asarray(ids, dtype='int64')
+    ids_old = np.fromiter(id_map.keys(), dtype='int64', count=len(id_map))
+    ids_new = np.fromiter(id_map.values(), dtype='int64', count=len(id_map))
+    isort = np.argsort(ids_old)
+    ids_old = ids_old[isort]
+    ids_new = ids_new[isort]
+
+    index = np.searchsorted(ids_old, ids)
+    index[index == len(ids_old)] = 0
+    is_found = (ids_old[index] == ids) if len(ids_old) else np.zeros(len(ids), dtype='bool')
+    return ids_new[index[is_found]].tolist(), ids[~is_found].tolist()
@@ -5,8 +5,9 @@ defines:
 
 """
 from __future__ import annotations
-from collections import defaultdict
 from typing import Tuple, List, Optional, TYPE_CHECKING
+
+from pyNastran.bdf.bdf_interface.topology_index import TopologyIndex
 if TYPE_CHECKING:  # pragma: no cover
     from pyNastran.bdf.bdf import BDF
 
@@ -32,11 +33,11 @@ def free_edges(model: BDF, eids: Optional[List[int]]=None, maps=None) -> List[Tu
         list of node ids of each edges
 
     """
-    if maps is not None:
-        edge_to_eid_map = maps['edge_to_eid_map']
-    else:
-        edge_to_eid_map = _get_edge_to_eids_map(model, eids=eids)
+    if maps is None:
+        index = _get_topology_index(model, eids=eids)
+        return [tuple(edge) for edge in index.free_edges().tolist()]
 
+    edge_to_eid_map = maps['edge_to_eid_map']
     edges = []
     for edge, eids in edge_to_eid_map.items():
         if len(eids) == 1:
@@ -65,39 +66,23 @@ def non_paired_edges(model: BDF, eids: List[int]=None, maps=None) -> List[Tuple[
         the non-paired edges
 
     """
-    if maps is not None:
-        edge_to_eid_map = maps['edge_to_eid_map']
-    else:
-        edge_to_eid_map = _get_edge_to_eids_map(model, eids=eids)
+    if maps is None:
+        index = _get_topology_index(model, eids=eids)
+        return [tuple(edge) for edge in index.non_paired_edges().tolist()]
 
+    edge_to_eid_map = maps['edge_to_eid_map']
     edges = []
     for edge, eids in edge_to_eid_map.items():
         if len(eids) != 2:
             edges.append(edge)
     return edges
 
-def _get_edge_to_eids_map(model, eids=None):
-    """helper method"""
-    edge_to_eids = defaultdict(set)
-    shell_elements = ['CTRIA3', 'CTRIAX', 'CTRIA6', 'CTRIAX6',
-                      'CQUAD4', 'CQUAD', 'CQUAD8', 'CQUADR', 'CQUADX', 'CQUADX8',
-                      'CSHEAR']
+def _get_topology_index(model: BDF, eids: Optional[List[int]]=None) -> TopologyIndex:
+    """gets the cached topology index or one for a subset of elements"""
     if eids is None:
-        for eid, elem in model.elements.items():
-            if elem.type not in shell_elements:
-                continue
-            edges = elem.get_edge_ids()
-            for edge in edges:
-                edge_to_eids[edge].add(eid)
-    else:
-        if isinstance(eids, int):
-            eids = [eids]
-        for eid in eids:
-            elem = model.elements[eid]
-            if elem.type not in shell_elements:
-                continue
-            edges = elem.get_edge_ids()
-            for edge in edges:
-                edge_to_eids[edge].add(eid)
+        return model.get_topology_index()
+    return TopologyIndex(model, element_ids=eids)
 
-    return edge_to_eids
+def _get_edge_to_eids_map(model, eids=None):
+    """helper method"""
+    return _get_topology_index(model, eids=eids).get_edge_to_eids_map()
@@ -4,6 +4,8 @@ Defines:
       find the net force/moment on the model
   - sum_forces_moments_elements
       find the net force/moment on the model for a subset of elements
+  - sum_forces_moments_vectorized
+      find the net force/moment on the model for many load cases
 
 """
 from __future__ import annotations
@@ -20,6 +22,13 @@ if TYPE_CHECKING:  # pragma: no cover
     from pyNastran.bdf.bdf import BDF, Subcase
 
 
+# the number of face nodes of the shell elements
+PLOAD2_NFACE = {'CTRIA3': 3, 'CTRIAR': 3, 'CQUAD4': 4, 'CQUADR': 4, 'CSHEAR': 4}
+PLOAD4_SHELL_NFACE = {
+    'CTRIA3': 3, 'CTRIA6': 3, 'CTRIAR': 3,
+    'CQUAD4': 4, 'CQUAD8': 4, 'CQUAD': 4, 'CQUADR': 4, 'CSHEAR': 4,
+}
+
 def isnan(value):
     return value is None or np.isnan(value)
 
@@ -224,9 +233,8 @@ def _pload1_bar_beam(model, unused_loadcase_id, load, elem, scale, xyz, F, M, p)
     p2 = load.p2 * scale
 
     nodes = elem.node_ids
-    n1, n2 = xyz[nodes[0]], xyz[nodes[1]]
-    n1 += elem.wa
-    n2 += elem.wb
+    n1 = xyz[nodes[0]] + elem.wa
+    n2 = xyz[nodes[1]] + elem.wb
 
     bar_vector = n2 - n1
     L = norm(bar_vector)
@@ -607,6 +615,261 @@ def sum_forces_moments_elements(model: BDF, p0: int, loadcase_id: int,
     return F2, M2
 
 
+def sum_forces_moments_vectorized(model: BDF, p0: np.ndarray, loadcase_ids: List[int],
+                                  cid: int=0,
+                                  include_grav: bool=False,
+                                  xyz_cid0: Optional[Dict[int, NDArray3float]]=None,
+                                  ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sums applied forces & moments about a reference point p0 for many
+    load cases in one call.
+
+    This is a vectorized version of ``sum_forces_moments``.  The reduced
+    loads of all the load cases are flattened into arrays of nodal
+    forces/moments and loaded faces, so the areas, normals and centroids
+    of the PLOAD, PLOAD2 and shell PLOAD4 faces are calculated in one pass.
+    The mass and cg of the elements are calculated once for the GRAV cards.
+
+    The PLOAD1 and the solid/LINE PLOAD4 cards use the per card method
+    from ``sum_forces_moments``.
+
+    Parameters
+    ----------
+    model : BDF()
+        a BDF object
+    p0 : NUMPY.NDARRAY shape=(3,) or integer (node ID)
+        the reference point
+    loadcase_ids : List[int]
+        the LOAD=ID values to analyze
+    cid : int; default=0
+        the coordinate system for the summation
+    include_grav : bool; default=False
+        includes gravity in the summation
+    xyz_cid0 : None / Dict[int] = (3, ) ndarray
+        the nodes in the global coordinate system
+
+    Returns
+    -------
+    forces : (nloadcases, 3) float ndarray
+        the forces for each load case
+    moments : (nloadcases, 3) float ndarray
+        the moments for each load case
+
+    .. seealso:: sum_forces_moments
+
+    """
+    p = _get_load_summation_point(model, p0, cid=0)
+    nloadcases = len(loadcase_ids)
+    F = np.zeros((nloadcases, 3), dtype='float64')
+    M = np.zeros((nloadcases, 3), dtype='float64')
+
+    all_nids, xyz_array = _get_xyz_cid0_array(model, xyz_cid0)
+    xyz = None  # the node dictionary for the per card method
+
+    # FORCE/MOMENT: icase, nid, cid, xyz, mag
+    forces = ([], [], [], [], [])
+    moments = ([], [], [], [], [])
+    # PLOAD/PLOAD2/PLOAD4 by number of face nodes: icase, nids, pressure, load direction
+    faces = {3: ([], [], [], []), 4: ([], [], [], [])}
+    # GRAV: icase, gravity
+    gravs = ([], [])
+
+    unsupported_types = set()
+    for icase, loadcase_id in enumerate(loadcase_ids):
+        if not isinstance(loadcase_id, integer_types):
+            raise RuntimeError('loadcase_id must be an integer; loadcase_id=%r' % loadcase_id)
+        loads, scale_factors, unused_is_grav = model.get_reduced_loads(
+            loadcase_id, skip_scale_factor0=True)
+
+        for load, scale in zip(loads, scale_factors):
+            load_type = load.type
+            if load_type in ['FORCE', 'FORCE1', 'FORCE2', 'MOMENT', 'MOMENT1', 'MOMENT2']:
+                # the FORCE1/FORCE2/MOMENT1/MOMENT2 vectors are in the global frame
+                cidi = load.Cid() if load_type in ['FORCE', 'MOMENT'] else 0
+                nodal_loads = forces if load_type.startswith('FORCE') else moments
+                for values, value in zip(nodal_loads, [icase, load.node_id, cidi,
+                                                      load.xyz, load.mag * scale]):
+                    values.append(value)
+
+            elif load_type == 'PLOAD':
+                nodes = load.node_ids
+                nnodes = len(nodes)
+                if nnodes not in faces:
+                    msg = 'invalid number of nodes on PLOAD card; nodes=%s' % str(nodes)
+                    raise RuntimeError(msg)
+                _append_face(faces[nnodes], icase, nodes, load.pressure * scale)
+
+            elif load_type == 'PLOAD1':
+                if xyz is None:
+                    xyz = dict(zip(all_nids.tolist(), xyz_array))
+                _pload1_total(model, loadcase_id, load, scale, xyz, F[icase], M[icase], p)
+
+            elif load_type == 'PLOAD2':
+                pressure = load.pressure * scale
+                for eid in load.element_ids:
+                    elem = model.elements[eid]
+                    nface = PLOAD2_NFACE.get(elem.type)
+                    if nface is None:
+                        model.log.warning('case=%s etype=%r loadtype=%r not supported' % (
+                            loadcase_id, elem.type, load_type))
+                        continue
+                    _append_face(faces[nface], icase, elem.node_ids[:nface], pressure)
+
+            elif load_type == 'PLOAD4':
+                assert load.line_load_dir == 'NORM', 'line_load_dir = %s' % (load.line_load_dir)
+                load_dir = None
+                is_surf = load.surf_or_line == 'SURF'
+                if np.abs(load.nvector).max() != 0.0:
+                    # the vector in a non-global frame isn't supported
+                    is_surf = is_surf and load.Cid() in [0, None]
+                    load_dir = load.nvector / np.linalg.norm(load.nvector)
+                for elem in load.eids_ref:
+                    nface = PLOAD4_SHELL_NFACE.get(elem.type)
+                    if nface is not None and is_surf:
+                        pressure = _mean_pressure_on_pload4(load.pressures[:nface], load, elem)
+                        _append_face(faces[nface], icase, elem.node_ids[:nface],
+                                     pressure * scale, load_dir)
+                        continue
+                    if xyz is None:
+                        xyz = dict(zip(all_nids.tolist(), xyz_array))
+                    fi, mi = _pload4_helper(loadcase_id, load, scale, elem, xyz, p)
+                    F[icase] += fi
+                    M[icase] += mi
+
+            elif load_type == 'GRAV':
+                if include_grav:
+                    gravs[0].append(icase)
+                    gravs[1].append(load.GravityVector() * scale)
+            else:
+                # we collect them so we only get one print
+                unsupported_types.add((loadcase_id, load_type))
+
+    for loadcase_id, load_type in sorted(unsupported_types):
+        model.log.warning('case=%s loadtype=%r not supported' % (loadcase_id, load_type))
+
+    if forces[0]:
+        icase, inode, force = _get_nodal_loads_array(model, all_nids, *forces)
+        np.add.at(F, icase, force)
+        np.add.at(M, icase, np.cross(xyz_array[inode, :] - p, force))
+    if moments[0]:
+        icase, unused_inode, moment = _get_nodal_loads_array(model, all_nids, *moments)
+        np.add.at(M, icase, moment)
+
+    for nface, (icases, face_nids, pressures, load_dirs) in faces.items():
+        if not icases:
+            continue
+        icase = np.array(icases, dtype='int32')
+        inode = _get_node_index(all_nids, np.array(face_nids))
+        area, centroid, normal = _get_face_area_centroid_normal(xyz_array[inode, :])
+
+        # a PLOAD4 with an N1/N2/N3 vector doesn't act normal to the face
+        is_normal = np.array([load_dir is None for load_dir in load_dirs])
+        if not is_normal.all():
+            normal[~is_normal] = [load_dir for load_dir in load_dirs if load_dir is not None]
+        force = (np.array(pressures) * area)[:, np.newaxis] * normal
+        np.add.at(F, icase, force)
+        np.add.at(M, icase, np.cross(centroid - p, force))
+
+    if gravs[0] and model.elements:
+        # the gravity loads only depend on the mass and cg of the elements
+        from pyNastran.bdf.mesh_utils.mass_properties import mass_properties_vectorized
+        mass, cg, unused_inertia = mass_properties_vectorized(
+            model, element_ids=set(model.elements), sym_axis='no', scale=1.0)
+        icase = np.array(gravs[0], dtype='int32')
+        force = mass * np.array(gravs[1])
+        np.add.at(F, icase, force)
+        if mass != 0.0:
+            np.add.at(M, icase, np.cross(cg - p, force))
+
+    if cid == 0:
+        return F, M
+    cid0 = 0
+    for icase in range(nloadcases):
+        F[icase], M[icase] = transform_load(F[icase], M[icase], cid0, cid, model)
+    return F, M
+
+def _append_face(face_loads, icase: int, nodes: List[int], pressure: float,
+                 load_dir: Optional[np.ndarray]=None) -> None:
+    """helper method for ``sum_forces_moments_vectorized``"""
+    icases, face_nids, pressures, load_dirs = face_loads
+    icases.append(icase)
+    face_nids.append(nodes)
+    pressures.append(pressure)
+    load_dirs.append(load_dir)
+
+def _get_xyz_cid0_array(model: BDF,
+                        xyz_cid0: Optional[Dict[int, NDArray3float]]=None,
+                        ) -> Tuple[np.ndarray, np.ndarray]:
+    """gets the sorted node ids and their locations in the global frame"""
+    if xyz_cid0 is not None:
+        nids = np.array(sorted(xyz_cid0), dtype='int64')
+        xyz = np.array([xyz_cid0[nid] for nid in nids.tolist()], dtype='float64').reshape(-1, 3)
+        return nids, xyz
+    if not model.nodes:
+        return np.zeros(0, dtype='int64'), np.zeros((0, 3), dtype='float64')
+    nid_cp_cd, xyz = model.get_xyz_in_coord_array(cid=0, fdtype='float64', idtype='int64')[:2]
+    isort = np.argsort(nid_cp_cd[:, 0])
+    return nid_cp_cd[isort, 0], xyz[isort, :]
+
+def _get_node_index(all_nids: np.ndarray, nids: np.ndarray) -> np.ndarray:
+    """gets the index of the nodes in the sorted all_nids array"""
+    if len(all_nids) == 0:
+        raise KeyError('nids=%s are not defined' % np.unique(nids).tolist())
+    inode = np.searchsorted(all_nids, nids).clip(max=len(all_nids) - 1)
+    is_missing = all_nids[inode] != nids
+    if is_missing.any():
+        raise KeyError('nids=%s are not defined' % np.unique(nids[is_missing]).tolist())
+    return inode
+
+def _get_nodal_loads_array(model: BDF, all_nids: np.ndarray, icases: List[int],
+                           nids: List[int], cids: List[int], xyzs: List[np.ndarray],
+                           mags: List[float]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Stacks the FORCE/MOMENT cards and transforms their vectors to the global frame
+
+    Returns
+    -------
+    icase : (n, ) int ndarray
+        the index of the load case
+    inode : (n, ) int ndarray
+        the index of the node in all_nids
+    vector : (n, 3) float ndarray
+        the scaled force/moment in the global frame
+
+    """
+    icase = np.array(icases, dtype='int32')
+    inode = _get_node_index(all_nids, np.array(nids, dtype='int64'))
+    cid = np.array(cids, dtype='int64')
+    vector = np.array(xyzs, dtype='float64')
+
+    # like Coord.transform_vector_to_global, the vector is transformed as
+    # if it's a point and the origin is removed
+    is_local = cid != 0
+    if is_local.any():
+        engine = model.get_coord_engine()
+        cid_local = cid[is_local]
+        vector[is_local] = (
+            engine.transform_points(vector[is_local], cid_from=cid_local) -
+            engine.origin[engine.get_index(cid_local)])
+    vector *= np.array(mags, dtype='float64')[:, np.newaxis]
+    return icase, inode, vector
+
+def _get_face_area_centroid_normal(xyz: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Gets the area, centroid and normal of (n, 3, 3) triangle
+    or (n, 4, 3) quad faces
+    """
+    if xyz.shape[1] == 3:
+        axb = np.cross(xyz[:, 0, :] - xyz[:, 1, :], xyz[:, 0, :] - xyz[:, 2, :])
+    else:
+        axb = np.cross(xyz[:, 0, :] - xyz[:, 2, :], xyz[:, 1, :] - xyz[:, 3, :])
+    nunit = norm(axb, axis=1)
+    area = 0.5 * nunit
+    normal = axb / nunit[:, np.newaxis]
+    centroid = xyz.mean(axis=1)
+    return area, centroid, normal
+
+
 def _bar_eq_pload1(load, elem, xyz, Ldir,
                    n1, n2,
                    x1, x2,
@@ -635,7 +898,7 @@ def _bar_eq_pload1(load, elem, xyz, Ldir,
         elif load.Type == 'FZ' and x1 == x2:
             force_dir = array([0., 0., 1.])
         F += p1 * force_dir
-        M += cross(r - p, F)
+        M += cross(r - p, p1 * force_dir)
     elif load.Type in ['MX', 'MY', 'MZ']:
         if load.Type == 'MX' and x1 == x2:
             moment_dir = array([1., 0., 0.])
@@ -669,7 +932,7 @@ def _bar_eq_pload1(load, elem, xyz, Ldir,
             msg += 'force_dir = %s\n' % force_dir
             msg += 'load = \n%s' % str(load)
             raise FloatingPointError(msg)
-        M += cross(r - p, F)
+        M += cross(r - p, p1 * force_dir)
         del force_dir
 
     elif load.Type in ['MXE', 'MYE', 'MZE']:
@@ -1077,15 +1340,25 @@ def _Fg_vector_from_loads(model: BDF, loads, ndof_per_grid: int, ndof: int,
     skipped_load_types = set([])
     not_static_loads = []
     show_force_warning = True
+
+    # the FORCE/MOMENT loads in the CD frame of their node are added in one pass
+    force_nids = []
+    force_offsets = []
+    force_vectors = []
     for load in loads:
         loadtype = load.type
-        if load.type in ['FORCE', 'MOMENT']:
+        if load.type in ['FORCE', 'MOMENT', 'FORCE1', 'MOMENT1',
+                         'FORCE2', 'MOMENT2']:
             offset = 1 if load.type[0] == 'F' else 4
-            show_force_warning = _add_force(Fg, dof_map, model, load, offset, ndof_per_grid, cid=load.cid, show_warning=show_force_warning)
-        elif load.type in ['FORCE1', 'MOMENT1',
-                           'FORCE2', 'MOMENT2']:
-            offset = 1 if load.type[0] == 'F' else 4
-            show_force_warning = _add_force(Fg, dof_map, model, load, offset, ndof_per_grid, cid=0, show_warning=show_force_warning)
+            cid = load.cid if load.type in ['FORCE', 'MOMENT'] else 0
+            node_ref = load.node_ref
+            if node_ref.type == 'GRID' and node_ref.cd == cid:
+                force_nids.append(load.node)
+                force_offsets.append(offset)
+                force_vectors.append(load.mag * load.xyz)
+                continue
+            show_force_warning = _add_force(Fg, dof_map, model, load, offset, ndof_per_grid,
+                                            cid=cid, show_warning=show_force_warning)
 
         elif loadtype == 'SLOAD':
             for nid, mag in zip(load.nodes, load.mags):
@@ -1100,12 +1373,29 @@ def _Fg_vector_from_loads(model: BDF, loads, ndof_per_grid: int, ndof: int,
             continue
         else:
             skipped_load_types.add(load.type)
+
+    if force_nids:
+        assert ndof_per_grid == 6, f'GRID must have 6 DOF for structural analysis; ndof_per_grid={ndof_per_grid}'
+        irow = _get_grid_dof_index(model, np.array(force_nids), np.array(force_offsets))
+        np.add.at(Fg, irow[:, np.newaxis] + np.arange(3), force_vectors)
+
     if skipped_load_types:
         skipped_load_types = list(skipped_load_types)
         skipped_load_types.sort()
         model.log.warning(f'skipping {skipped_load_types} in Fg')
     return Fg
 
+def _get_grid_dof_index(model: BDF, nids: np.ndarray, dofs: np.ndarray) -> np.ndarray:
+    """
+    Gets the row in Fg of the (nid, dof) pairs, which is the vectorized
+    version of the dof_map from ``_get_dof_map``
+    """
+    # the GRIDs are numbered in the order of model.nodes with 6 DOF each
+    all_nids = np.array(list(model.nodes), dtype='int64')
+    isort = np.argsort(all_nids)
+    inode = isort[_get_node_index(all_nids[isort], nids)]
+    return 6 * inode + dofs - 1
+
 def _force_to_local(cd_ref, vector):
     #if cd_ref.type[-1] in ['C', 'S']:
     return cd_ref.transform_vector_to_local(vector)
@@ -4,6 +4,8 @@
 Defines:
   - mass_poperties
       get the mass & moment of inertia of the model
+  - mass_properties_vectorized
+      the array-based version of mass_properties_nsm
 
 """
 from __future__ import annotations
@@ -585,6 +587,336 @@ def mass_properties_nsm(model, element_ids=None, mass_ids=None, nsm_id=None,
     return mass, cg, inertia
 
 
+def mass_properties_vectorized(model, element_ids=None, mass_ids=None, nsm_id=None,
+                               reference_point=None,
+                               sym_axis=None, scale=None, inertia_reference='cg',
+                               debug=False):
+    """
+    Calculates mass properties in the global system about the
+    reference point.  Considers NSM, NSM1, NSML, NSML1, and WTMASS.
+
+    This is a vectorized version of ``mass_properties_nsm``.  The elements
+    are grouped by type, the property data is evaluated once per property
+    and the lengths/areas/volumes, centroids, mass and inertia are
+    calculated with arrays of the node locations.  The NSM distributions
+    are applied to the same arrays.
+
+    The CBEAM, CONM2, CONM1, CMASSx and the less common elements use the
+    per element method from ``mass_properties_nsm``.
+    ``mass_properties_breakdown`` is unchanged and doesn't use this.
+
+    Parameters
+    ----------
+    model : BDF()
+        a cross-referenced BDF object
+    element_ids : list[int]; (n, ) ndarray, optional
+        An array of element ids.
+    mass_ids : list[int]; (n, ) ndarray, optional
+        An array of mass ids.
+    nsm_id : int
+        the NSM id to consider
+    reference_point : ndarray/int, optional
+        type : ndarray
+            An array that defines the origin of the frame.
+            default = <0,0,0>.
+        type : int
+            the node id
+    sym_axis : str, optional
+        The axis to which the model is symmetric.
+        If AERO cards are used, this can be left blank.
+        allowed_values = 'no', x', 'y', 'z', 'xy', 'yz', 'xz', 'xyz'
+    scale : float, optional
+        The WTMASS scaling value.
+        default=None -> PARAM, WTMASS is used
+        float > 0.0
+    inertia_reference : str; default='cg'
+        'cg' : inertia is taken about the cg
+        'ref' : inertia is about the reference point
+    debug : bool; default=False
+        developer debug; may be removed in the future
+
+    Returns
+    -------
+    mass : float
+        The mass of the model; wtmass is considered
+    cg : (3,) float ndarray
+        The cg of the model
+    inertia : (6,) float ndarray
+        Moment of inertia array([Ixx, Iyy, Izz, Ixy, Ixz, Iyz]); wtmass is considered
+
+    .. seealso:: mass_properties_nsm
+
+    """
+    reference_point, is_cg = _update_reference_point(
+        model, reference_point, inertia_reference)
+    element_ids, unused_elements, mass_ids, unused_masses = _mass_properties_elements_init(
+        model, element_ids, mass_ids)
+
+    if model.nodes:
+        nid_cp_cd, xyz_cid0 = model.get_xyz_in_coord_array(
+            cid=0, fdtype='float64', idtype='int64')[:2]
+        all_nids = nid_cp_cd[:, 0]
+    else:
+        all_nids = np.zeros(0, dtype='int64')
+        xyz_cid0 = np.zeros((0, 3), dtype='float64')
+    xyz = None  # the node dictionary for the per element method
+
+    mass = 0.
+    cg = array([0., 0., 0.])
+    inertia = array([0., 0., 0., 0., 0., 0., ])
+
+    idtype = model._upcast_int_dtype(dtype='int32')
+    eids_list = list(model.elements.keys())
+    all_eids = np.array(eids_list, dtype=idtype)
+    all_eids.sort()
+
+    all_mass_ids = np.array(list(model.masses.keys()), dtype=idtype)
+    all_mass_ids.sort()
+    element_ids_array = np.array(list(element_ids), dtype=idtype)
+
+    etypes_skipped = set()
+    area_eids_pids = defaultdict(list)
+    areas = defaultdict(list)
+    nsm_centroids_area = defaultdict(list)
+
+    length_eids_pids = defaultdict(list)
+    nsm_centroids_length = defaultdict(list)
+    lengths = defaultdict(list)
+
+    for etype, eids in model._type_to_id_map.items():
+        if etype in NO_MASS or len(eids) == 0:
+            continue
+        if etype not in VECTORIZED_MASS_ETYPES:
+            if xyz is None:
+                xyz = dict(zip(all_nids.tolist(), xyz_cid0))
+            mass, cg, inertia = _get_mass_nsm(
+                model, element_ids, mass_ids,
+                all_eids, all_mass_ids, etypes_skipped,
+                etype, eids, xyz,
+                length_eids_pids, nsm_centroids_length, lengths,
+                area_eids_pids, nsm_centroids_area, areas,
+                mass, cg, inertia, reference_point)
+            continue
+
+        eids2 = get_sub_eids(all_eids, eids, etype)
+        elements = [model.elements[eid] for eid in eids2]
+        if etype in ['CROD', 'CONROD', 'CTUBE', 'CBAR']:
+            eids2, massi, centroid = _get_line_mass_vectorized(
+                etype, eids2, elements, all_nids, xyz_cid0,
+                length_eids_pids, lengths, nsm_centroids_length)
+        elif etype == 'CSHEAR':
+            eids2, massi, centroid = _get_cshear_mass_vectorized(
+                eids2, elements, all_nids, xyz_cid0,
+                area_eids_pids, areas, nsm_centroids_area)
+        elif etype in ['CTETRA', 'CPYRAM', 'CPENTA', 'CHEXA']:
+            massi, centroid = _get_solid_mass_vectorized(
+                etype, elements, all_nids, xyz_cid0)
+        else:
+            eids2, massi, centroid = _get_shell_mass_vectorized(
+                etype, eids2, elements, all_nids, xyz_cid0,
+                area_eids_pids, areas, nsm_centroids_area)
+
+        is_used = np.in1d(eids2, element_ids_array)
+        mass = _increment_inertia_array(
+            centroid[is_used, :], reference_point, massi[is_used],
+            mass, cg, inertia)
+
+    model_eids = np.array(eids_list, dtype=idtype)
+    model_pids = np.array(list(model.properties.keys()), dtype=idtype)
+    mass = _apply_nsm(model, nsm_id,
+                      model_eids, model_pids,
+                      area_eids_pids, areas, nsm_centroids_area,
+                      length_eids_pids, lengths, nsm_centroids_length,
+                      mass, cg, inertia, reference_point, debug=debug)
+    if mass:
+        cg /= mass
+    inertia = np.asarray(inertia, dtype='float64')
+
+    # only transform if we're calculating the inertia about the cg
+    if is_cg:
+        xyz_ref = reference_point
+        xyz_ref2 = cg
+        inertia = transform_inertia(mass, cg, xyz_ref, xyz_ref2, inertia)
+
+    mass, cg, inertia = _apply_mass_symmetry(model, sym_axis, scale, mass, cg, inertia)
+    return mass, cg, inertia
+
+#: the element types that ``mass_properties_vectorized`` calculates with arrays
+VECTORIZED_MASS_ETYPES = {
+    'CROD', 'CONROD', 'CTUBE', 'CBAR',
+    'CTRIA3', 'CTRIA6', 'CTRIAR', 'CQUAD4', 'CQUAD8', 'CQUADR', 'CSHEAR',
+    'CTETRA', 'CPYRAM', 'CPENTA', 'CHEXA',
+}
+
+def _increment_inertia_array(centroids: np.ndarray, reference_point: np.ndarray,
+                             masses: np.ndarray, mass: float,
+                             cg: np.ndarray,
+                             inertia: List[float]) -> float:
+    """vectorized version of ``_increment_inertia``"""
+    if len(masses) == 0:
+        return mass
+    x, y, z = (centroids - reference_point).T
+    x2 = x * x
+    y2 = y * y
+    z2 = z * z
+    inertia[0] += masses @ (y2 + z2)  # Ixx
+    inertia[1] += masses @ (x2 + z2)  # Iyy
+    inertia[2] += masses @ (x2 + y2)  # Izz
+    inertia[3] += masses @ (x * y)    # Ixy
+    inertia[4] += masses @ (x * z)    # Ixz
+    inertia[5] += masses @ (y * z)    # Iyz
+    mass += masses.sum()
+    cg += masses @ centroids
+    return mass
+
+def _get_corner_xyz(elements, nnodes: int,
+                    all_nids: np.ndarray, xyz_cid0: np.ndarray) -> List[np.ndarray]:
+    """gets the (nelements, 3) locations of the first nnodes nodes"""
+    nids = np.array([elem.node_ids[:nnodes] for elem in elements], dtype=all_nids.dtype)
+    inids = np.searchsorted(all_nids, nids).clip(max=len(all_nids) - 1)
+    is_missing = all_nids[inids] != nids
+    if is_missing.any():
+        raise KeyError('nids=%s do not exist' % np.unique(nids[is_missing]).tolist())
+    return [xyz_cid0[inid, :] for inid in inids.T]
+
+def _get_property_values(elements, pids: np.ndarray, func) -> np.ndarray:
+    """evaluates func(element) once per property and broadcasts it to the elements"""
+    unused_upids, ifirst, inverse = np.unique(pids, return_index=True, return_inverse=True)
+    values = np.array([func(elements[i]) for i in ifirst])
+    return values[inverse]
+
+def _get_line_mass_vectorized(etype, eids, elements, all_nids, xyz_cid0,
+                              length_eids_pids, lengths, nsm_centroids_length):
+    """helper method for ``mass_properties_vectorized``"""
+    xyz1, xyz2 = _get_corner_xyz(elements, 2, all_nids, xyz_cid0)
+    length = norm(xyz2 - xyz1, axis=1)
+    centroid = (xyz1 + xyz2) / 2.
+    if etype == 'CONROD':
+        ptype = 'CONROD'
+        pids = np.full(len(eids), -42, dtype=eids.dtype)  # faked number
+        mass_per_length = np.array([elem.MassPerLength() for elem in elements])
+    else:
+        ptype = {'CROD' : 'PROD', 'CTUBE' : 'PTUBE', 'CBAR' : 'PBAR'}[etype]
+        pids = np.array([elem.Pid() for elem in elements], dtype=eids.dtype)
+        if etype == 'CROD':
+            mass_per_length = _get_property_values(
+                elements, pids, lambda elem: elem.MassPerLength())
+        else:
+            mass_per_length = _get_property_values(
+                elements, pids, lambda elem: elem.pid_ref.MassPerLength())
+    _add_nsm_data(ptype, eids, pids, length, centroid,
+                  length_eids_pids, lengths, nsm_centroids_length)
+    return eids, mass_per_length * length, centroid
+
+def _get_shell_mass_vectorized(etype, eids, elements, all_nids, xyz_cid0,
+                               area_eids_pids, areas, nsm_centroids_area):
+    """helper method for ``mass_properties_vectorized``"""
+    if etype in ['CTRIA3', 'CTRIA6', 'CTRIAR']:
+        n1, n2, n3 = _get_corner_xyz(elements, 3, all_nids, xyz_cid0)
+        centroid = (n1 + n2 + n3) / 3.
+        area = 0.5 * norm(cross(n1 - n2, n1 - n3), axis=1)
+    else:
+        n1, n2, n3, n4 = _get_corner_xyz(elements, 4, all_nids, xyz_cid0)
+        centroid = (n1 + n2 + n3 + n4) / 4.
+        area = 0.5 * norm(cross(n3 - n1, n4 - n2), axis=1)
+
+    pids = np.array([elem.Pid() for elem in elements], dtype=eids.dtype)
+    ptypes = _get_property_values(elements, pids, lambda elem: elem.pid_ref.type)
+    is_pshell = ptypes == 'PSHELL'
+    is_pcomp = np.in1d(ptypes, ['PCOMP', 'PCOMPG'])
+    is_mass = is_pshell | is_pcomp
+    is_invalid = ~(is_mass | np.in1d(ptypes, ['PLPLANE', 'PPLANE']))
+    if is_invalid.any():
+        raise NotImplementedError(ptypes[is_invalid][0])
+
+    mass_per_area = np.zeros(len(eids), dtype='float64')
+    if is_pshell.any():
+        pshell_elements = [elem for elem, is_pshelli in zip(elements, is_pshell) if is_pshelli]
+        pids_pshell = pids[is_pshell]
+        thickness0, nsm, rho = _get_property_values(
+            pshell_elements, pids_pshell,
+            lambda elem: (elem.pid_ref.Thickness(), elem.pid_ref.nsm, elem.pid_ref.Rho())).T
+        tflag = np.array([elem.tflag for elem in pshell_elements])
+        if not np.in1d(tflag, [0, 1]).all():  # pragma: no cover
+            raise RuntimeError('tflag=%r' % np.unique(tflag).tolist())
+        tscales = np.array([elem.get_thickness_scale() for elem in pshell_elements],
+                           dtype='float64')
+        is_blank = np.isnan(tscales)
+        thickness0 = thickness0[:, np.newaxis]
+
+        # tflag=0 is absolute; tflag=1 is relative
+        tscales = np.where(tflag[:, np.newaxis] == 0, tscales, tscales * thickness0)
+        thickness = np.where(is_blank, thickness0, tscales).mean(axis=1)
+        assert (thickness > 0.).all(), 'thickness=%s' % thickness
+        mass_per_area[is_pshell] = nsm + rho * thickness
+    if is_pcomp.any():
+        pcomp_elements = [elem for elem, is_pcompi in zip(elements, is_pcomp) if is_pcompi]
+        mass_per_area[is_pcomp] = _get_property_values(
+            pcomp_elements, pids[is_pcomp], lambda elem: elem.pid_ref.get_mass_per_area())
+
+    eids = eids[is_mass]
+    area = area[is_mass]
+    centroid = centroid[is_mass, :]
+    _add_nsm_data('PSHELL', eids, pids[is_mass], area, centroid,
+                  area_eids_pids, areas, nsm_centroids_area)
+    return eids, mass_per_area[is_mass] * area, centroid
+
+def _get_cshear_mass_vectorized(eids, elements, all_nids, xyz_cid0,
+                                area_eids_pids, areas, nsm_centroids_area):
+    """helper method for ``mass_properties_vectorized``"""
+    n1, n2, n3, n4 = _get_corner_xyz(elements, 4, all_nids, xyz_cid0)
+    centroid = (n1 + n2 + n3 + n4) / 4.
+    area = 0.5 * norm(cross(n3 - n1, n4 - n2), axis=1)
+    pids = np.array([elem.Pid() for elem in elements], dtype=eids.dtype)
+    mass_per_area = _get_property_values(
+        elements, pids, lambda elem: elem.pid_ref.MassPerArea())
+    _add_nsm_data('PSHEAR', eids, pids, area, centroid,
+                  area_eids_pids, areas, nsm_centroids_area)
+    return eids, mass_per_area * area, centroid
+
+def _get_solid_mass_vectorized(etype, elements, all_nids, xyz_cid0):
+    """helper method for ``mass_properties_vectorized``"""
+    if etype == 'CTETRA':
+        n1, n2, n3, n4 = _get_corner_xyz(elements, 4, all_nids, xyz_cid0)
+        centroid = (n1 + n2 + n3 + n4) / 4.
+        volume = -np.einsum('ij,ij->i', n1 - n4, cross(n2 - n4, n3 - n4)) / 6.
+    elif etype == 'CPYRAM':
+        n1, n2, n3, n4, n5 = _get_corner_xyz(elements, 5, all_nids, xyz_cid0)
+        centroid1 = (n1 + n2 + n3 + n4) / 4.
+        area1 = 0.5 * norm(cross(n3 - n1, n4 - n2), axis=1)
+        centroid = (centroid1 + n5) / 2.
+        volume = area1 / 3. * norm(centroid1 - n5, axis=1)
+    elif etype == 'CPENTA':
+        n1, n2, n3, n4, n5, n6 = _get_corner_xyz(elements, 6, all_nids, xyz_cid0)
+        area1 = 0.5 * norm(cross(n3 - n1, n2 - n1), axis=1)
+        area2 = 0.5 * norm(cross(n6 - n4, n5 - n4), axis=1)
+        centroid1 = (n1 + n2 + n3) / 3.
+        centroid2 = (n4 + n5 + n6) / 3.
+        centroid = (centroid1 + centroid2) / 2.
+        volume = (area1 + area2) / 2. * norm(centroid1 - centroid2, axis=1)
+    else:
+        n1, n2, n3, n4, n5, n6, n7, n8 = _get_corner_xyz(elements, 8, all_nids, xyz_cid0)
+        centroid1 = (n1 + n2 + n3 + n4) / 4.
+        area1 = 0.5 * norm(cross(n3 - n1, n4 - n2), axis=1)
+        centroid2 = (n5 + n6 + n7 + n8) / 4.
+        area2 = 0.5 * norm(cross(n7 - n5, n8 - n6), axis=1)
+        centroid = (centroid1 + centroid2) / 2.
+        volume = (area1 + area2) / 2. * norm(centroid1 - centroid2, axis=1)
+
+    pids = np.array([elem.Pid() for elem in elements])
+    rho = _get_property_values(elements, pids, lambda elem: elem.Rho())
+    return rho * volume, centroid
+
+def _add_nsm_data(ptype, eids, pids, area_length, centroid,
+                  eids_pids_dict, area_length_dict, nsm_centroids_dict):
+    """stores the area/length data used by ``_apply_nsm``"""
+    if len(eids) == 0:
+        return
+    eids_pids_dict[ptype] += np.column_stack([eids, pids]).tolist()
+    area_length_dict[ptype] += area_length.tolist()
+    nsm_centroids_dict[ptype] += centroid.tolist()
+
+
 def get_sub_eids(all_eids, eids, etype):
     """supports limiting the element/mass ids"""
     eids = np.array(eids)
@@ -1399,15 +1731,13 @@ def _combine_prop_weighted_area_length_simple(model, eids, area, centroids,
         if debug:
             model.log.debug('dividing by %s=%s' % (word, area_sum))
 
-    for eid, areai, centroid in zip(eids, area, centroids):
-        #area_sum += areai
-        m = nsm_value * areai
-        if debug:  # pragma: no cover
+    masses = nsm_value * np.asarray(area)
+    if debug:  # pragma: no cover
+        for eid, areai, m in zip(eids, area, masses):
             model.log.debug('  eid=%s %si=%s nsm_value=%s mass=%s %s=%s' % (
                 eid, word, areai, nsm_value, m, word, areai))
-        #elem = model.elements[eid]
-        #assert np.allclose(m, elem.Mass()), elem.get_stats()
-        mass = _increment_inertia(centroid, reference_point, m, mass, cg, I)
+    mass = _increment_inertia_array(np.asarray(centroids), reference_point, masses,
+                                    mass, cg, I)
     if debug:  # pragma: no cover
         model.log.debug('mass = %s' % mass)
     return mass
@@ -1436,15 +1766,12 @@ def _combine_prop_weighted_area_length(
             model.log.debug("  nsm_centroidsi = %s" % nsm_centroidsi)
         centroids = nsm_centroidsi[ipid, :]
 
-        area2 = area / area_sum
-        for areai, centroid in zip(area2, centroids):
-            #print('  areai=%s area_sum=%s nsm_value=%s' % (areai*area_sum, area_sum, nsm_value))
-            m = nsm_value * areai
-            if debug:  # pragma: no cover
+        masses = nsm_value * area / area_sum
+        if debug:  # pragma: no cover
+            for areai, m in zip(area, masses):
                 model.log.debug('  %si=%s %s_sum=%s nsm_value=%s mass=%s' % (
-                    word, areai*area_sum, word, area_sum, nsm_value, m))
-            #assert np.allclose(m, elem.Mass()), elem.get_stats()
-            mass = _increment_inertia(centroid, reference_point, m, mass, cg, I)
+                    word, areai, word, area_sum, nsm_value, m))
+        mass = _increment_inertia_array(centroids, reference_point, masses, mass, cg, I)
     return mass
 
 def _apply_nsm(model, nsm_id,
@@ -1899,12 +2226,8 @@ def _nsm1_element(model, nsm, nsm_ids, all_eids_pids, area_length, nsm_centroids
         #area_sum_str = ''
         area_length_actual2 = area_length_actual
 
-    for eid, area_lengthi, centroid in zip(eids_actual, area_length_actual2, nsm_centroid):
-        massi = nsm_value * area_lengthi
-        #if debug:  # pragma: no cover
-            #print('  eid=%s %si=%s %snsm_value=%s mass=%s' % (
-                #eid, word, area_lengthi, area_sum_str, nsm_value, massi))
-        mass = _increment_inertia(centroid, reference_point, massi, mass, cg, I)
+    masses = nsm_value * area_length_actual2
+    mass = _increment_inertia_array(nsm_centroid, reference_point, masses, mass, cg, I)
     return mass
 
 def _get_sym_axis(model, sym_axis):
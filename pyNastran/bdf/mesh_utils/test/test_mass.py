@@ -4,7 +4,8 @@ import os
 import numpy as np
 import pyNastran
 from pyNastran.bdf.bdf import BDF
-from pyNastran.bdf.mesh_utils.mass_properties import mass_properties
+from pyNastran.bdf.mesh_utils.mass_properties import (
+    mass_properties, mass_properties_nsm, mass_properties_vectorized)
 from pyNastran.utils import object_methods
 
 PKG_PATH = pyNastran.__path__[0]
@@ -163,5 +164,79 @@ class TestMass(unittest.TestCase):
         assert np.allclose(mass, 0.005311658333), 'mass=%s' % mass
         assert np.allclose(mass2, 2.050833333), 'mass2=%s' % mass2
 
+    def test_mass_properties_vectorized(self):
+        """tests that mass_properties_vectorized matches mass_properties_nsm"""
+        model = BDF(debug=None)
+        nid = 1
+        for i in range(5):
+            for j in range(5):
+                for k in range(3):
+                    model.add_grid(nid, [i * 1.1, j * 0.9 + 0.1 * i, k * 1.3 + 0.05 * j])
+                    nid += 1
+
+        def n(i, j, k):
+            """gets the node id at (i, j, k)"""
+            return 1 + k + 3 * (j + 5 * i)
+
+        model.add_mat1(1, 3.0e7, None, 0.3, rho=0.1)
+        model.add_prod(1, 1, A=0.2, nsm=0.01)
+        model.add_ptube(2, 1, 0.5, t=0.1, nsm=0.02)
+        model.add_pbar(3, 1, A=0.3, nsm=0.03)
+        model.add_pshell(4, mid1=1, t=0.1, nsm=0.04)
+        model.add_pcomp(5, [1, 1], [0.1, 0.2], thetas=[0., 45.], nsm=0.05)
+        model.add_pshear(6, 1, 0.05, nsm=0.06)
+        model.add_psolid(7, 1)
+        model.add_pbeam(8, 1, [0.], ['C'], [0.4], [1.], [1.], [0.], [0.], nsm=[0.08])
+
+        model.add_crod(1, 1, [n(0, 0, 0), n(1, 0, 0)])
+        model.add_crod(2, 1, [n(1, 0, 0), n(2, 1, 1)])
+        model.add_conrod(3, 1, [n(2, 0, 0), n(3, 1, 0)], A=0.1, nsm=0.2)
+        model.add_cbar(5, 3, [n(0, 2, 0), n(1, 2, 1)], [0., 0., 1.], None)
+        model.add_cbar(6, 3, [n(2, 2, 0), n(3, 2, 1)], [0., 1., 0.], None)
+        model.add_cbeam(7, 8, [n(0, 3, 0), n(1, 3, 0)], [0., 0., 1.], None)
+        model.add_ctria3(8, 4, [n(0, 0, 2), n(1, 0, 2), n(1, 1, 2)])
+        model.add_cquad4(9, 4, [n(1, 0, 2), n(2, 0, 2), n(2, 1, 2), n(1, 1, 2)])
+        model.add_cquad4(10, 5, [n(2, 0, 2), n(3, 0, 2), n(3, 1, 2), n(2, 1, 2)])
+        model.add_ctria3(11, 5, [n(3, 0, 2), n(4, 0, 2), n(4, 1, 2)])
+        model.add_cshear(12, 6, [n(0, 4, 0), n(1, 4, 0), n(1, 4, 1), n(0, 4, 1)])
+        model.add_ctetra(13, 7, [n(3, 3, 0), n(4, 3, 0), n(4, 4, 0), n(4, 4, 1)])
+        model.add_cpyram(14, 7, [n(2, 3, 0), n(3, 3, 0), n(3, 4, 0), n(2, 4, 0), n(2, 3, 1)])
+        model.add_cpenta(15, 7, [n(1, 3, 1), n(2, 3, 1), n(2, 4, 1),
+                                 n(1, 3, 2), n(2, 3, 2), n(2, 4, 2)])
+        model.add_chexa(16, 7, [n(3, 3, 1), n(4, 3, 1), n(4, 4, 1), n(3, 4, 1),
+                                n(3, 3, 2), n(4, 3, 2), n(4, 4, 2), n(3, 4, 2)])
+        model.add_conm2(100, n(4, 4, 2), 2.5, X=[0.1, 0.2, 0.3], I=[1., 0., 2., 0., 0., 3.])
+
+        model.add_nsm(10, 'PSHELL', 4, 0.5)
+        model.add_nsm1(10, 'ELEMENT', 0.3, [1, 3])
+        model.add_nsml(11, 'PBAR', 3, 1.2)
+        model.add_nsml1(11, 'PSHELL', 0.7, [4, 5])
+        model.add_nsml1(12, 'ELEMENT', 0.9, [8, 9, 12])
+        model.add_nsmadd(13, [10, 11, 12])
+        model.cross_reference()
+
+        def check(**kwargs):
+            """compares the two methods"""
+            mass1, cg1, inertia1 = mass_properties_nsm(model, **kwargs)
+            mass2, cg2, inertia2 = mass_properties_vectorized(model, **kwargs)
+            msg = 'kwargs=%s' % kwargs
+            self.assertAlmostEqual(mass1, mass2, msg=msg)
+            assert np.allclose(cg1, cg2), '%s\ncg1=%s\ncg2=%s' % (msg, cg1, cg2)
+            assert np.allclose(inertia1, inertia2), '%s\ninertia1=%s\ninertia2=%s' % (
+                msg, inertia1, inertia2)
+
+        for nsm_id in [None, 10, 11, 12, 13]:
+            for reference_point in [None, np.array([1., 2., 3.])]:
+                check(nsm_id=nsm_id, reference_point=reference_point)
+                check(nsm_id=nsm_id, reference_point=reference_point,
+                      element_ids=[1, 3, 5, 7, 9, 11, 13, 15])
+        check(sym_axis='xz')
+        check(mass_ids=[])
+
+        # mass_properties_nsm doesn't support a CTUBE with an NSM
+        ctube = model.add_ctube(4, 2, [n(0, 1, 0), n(1, 2, 0)])
+        ctube.cross_reference(model)
+        check()
+
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
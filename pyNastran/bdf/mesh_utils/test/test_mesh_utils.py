@@ -10,7 +10,8 @@ from cpylog import SimpleLogger
 
 import pyNastran
 from pyNastran.bdf.bdf import BDF, read_bdf
-from pyNastran.bdf.mesh_utils.bdf_equivalence import bdf_equivalence_nodes
+from pyNastran.bdf.mesh_utils.bdf_equivalence import (
+    bdf_equivalence_nodes, get_equivalent_node_ids)
 from pyNastran.bdf.mesh_utils.export_mcids import export_mcids
 from pyNastran.bdf.mesh_utils.split_cbars_by_pin_flag import split_cbars_by_pin_flag
 from pyNastran.bdf.mesh_utils.split_elements import split_line_elements
@@ -21,7 +22,7 @@ from pyNastran.bdf.mesh_utils.mirror_mesh import (
 from pyNastran.bdf.mesh_utils.mass_properties import (
     mass_properties, mass_properties_nsm)  #mass_properties_breakdown
 from pyNastran.bdf.mesh_utils.make_half_model import make_half_model
-from pyNastran.bdf.mesh_utils.bdf_merge import bdf_merge
+from pyNastran.bdf.mesh_utils.bdf_merge import bdf_merge, bdf_merge_streaming
 from pyNastran.bdf.mesh_utils.utils import cmd_line
 from pyNastran.bdf.mesh_utils.find_closest_nodes import find_closest_nodes
 from pyNastran.bdf.mesh_utils.find_coplanar_elements import find_coplanar_triangles
@@ -285,6 +286,40 @@ class TestMeshUtils(unittest.TestCase):
         os.remove(bdf_filename_out2)
         os.remove(bdf_filename_out3)
 
+    def test_merge_streaming(self):
+        """merges multiple bdfs one model at a time"""
+        log = SimpleLogger(level='error')
+        bdf_filename1 = BWB_PATH / 'bwb_saero.bdf'
+        bdf_filename2 = os.path.join(MODEL_PATH, 'sol_101_elements', 'static_solid_shell_bar.bdf')
+        bdf_filename3 = os.path.join(MODEL_PATH, 'solid_bending', 'solid_bending.bdf')
+        bdf_filename_out = MODEL_PATH / 'bwb' / 'BWBsaero_streaming.out'
+        bdf_filenames = [bdf_filename1, bdf_filename2, bdf_filename3]
+        models = [read_bdf(bdf_filename, log=log) for bdf_filename in bdf_filenames]
+
+        for renumber in [True, False]:
+            mappers = bdf_merge_streaming(bdf_filenames, bdf_filename_out,
+                                          renumber=renumber, log=log)
+            model = read_bdf(bdf_filename_out, log=log)
+            assert len(mappers) == 3
+            assert len(model.nodes) == sum(len(modeli.nodes) for modeli in models)
+            assert len(model.elements) == sum(len(modeli.elements) for modeli in models)
+            if renumber:
+                assert sorted(model.nodes) == list(range(1, len(model.nodes) + 1))
+            else:
+                assert mappers[0]['nodes'][1101141] == 1101141
+
+            for modeli, mapper in zip(models, mappers):
+                nid_map = mapper['nodes']
+                for nid, node in modeli.nodes.items():
+                    xyz = model.nodes[nid_map[nid]].get_position()
+                    assert np.allclose(xyz, node.get_position()), (nid, xyz, node.get_position())
+        os.remove(bdf_filename_out)
+
+        argv = ['bdf', 'merge', str(bdf_filename2), bdf_filename3,
+                '-o', str(bdf_filename_out), '--streaming']
+        cmd_line(argv=argv, quiet=True)
+        os.remove(bdf_filename_out)
+
     def test_exit(self):
         """tests totally failing to run"""
         with self.assertRaises(SystemExit):
@@ -366,6 +401,13 @@ class TestMeshUtils(unittest.TestCase):
         argv = ['bdf', 'renumber', 'caero3.bdf', 'caero4.bdf', '--size', '8']
         cmd_line(argv=argv, quiet=True)
 
+        argv = ['bdf', 'renumber', 'caero3.bdf', 'caero4_rcm.bdf', '--size', '8', '--rcm']
+        cmd_line(argv=argv, quiet=True)
+
+        argv = ['bdf', 'renumber', 'caero3.bdf', 'caero4_rcm.bdf', '--superelement', '--rcm']
+        with self.assertRaises(SystemExit):
+            cmd_line(argv=argv, quiet=True)
+
         #bdf transform IN_BDF_FILENAME [-o OUT_CAERO_BDF_FILENAME] [--shift XYZ]
         argv = ['bdf', 'transform', 'caero4.bdf', '-o', 'caero5.bdf', '--shift', '0,0,20.']
         cmd_line(argv=argv, quiet=True)
@@ -385,6 +427,7 @@ class TestMeshUtils(unittest.TestCase):
         os.remove('caero3.bdf')
         os.remove('caero3_merged.bdf')
         os.remove('caero4.bdf')
+        os.remove('caero4_rcm.bdf')
         os.remove('caero5.bdf')
         os.remove('caero6.bdf')
         #os.remove('caero5.scaled.bdf')
@@ -1342,6 +1385,107 @@ class TestEquiv(unittest.TestCase):
         model2 = read_bdf(bdf_filename_out, debug=None)
         assert len(model2.nodes) == 3, model2.nodes
 
+    def test_eq_chunked(self):
+        """chains of close nodes are merged to the lowest node id"""
+        nids = np.array([1, 2, 3, 4, 5, 6])
+        nodes_xyz = np.array([
+            [0., 0., 0.],
+            [5., 0., 0.],
+            [0.06, 0., 0.],  # within tol of 1 and 6
+            [5., 0.01, 0.],
+            [9., 0., 0.],
+            [0.12, 0., 0.],
+        ])
+        expected = [1, 2, 1, 2, 5, 1]
+        for out_of_core in [False, True]:
+            for chunk_size in [1, 4, 100]:
+                nids_keep = get_equivalent_node_ids(
+                    nodes_xyz, nids, 0.1, chunk_size=chunk_size,
+                    out_of_core=out_of_core, neq_max=1)
+                assert np.array_equal(nids_keep, expected), nids_keep
+
+        node_set = [np.array([1, 3]), np.array([2, 4, 6])]
+        nids_keep = get_equivalent_node_ids(nodes_xyz, nids, 0.1, node_set=node_set)
+        assert np.array_equal(nids_keep, [1, 2, 1, 2, 5, 6]), nids_keep
+
+        node_groups = np.array([0, 0, 0, 1, 0, 0])
+        nids_keep = get_equivalent_node_ids(nodes_xyz, nids, 0.1, node_groups=node_groups)
+        assert np.array_equal(nids_keep, [1, 2, 1, 4, 5, 1]), nids_keep
+
+    def test_eq_chunked_model(self):
+        """tests bdf_equivalence_nodes(..., method='chunked')"""
+        log = SimpleLogger(level='error')
+        msg = (
+            'CEND\n'
+            'BEGIN BULK\n'
+            'GRID,1,,0.,0.,0.\n'
+            'GRID,2,,0.,0.,0.5\n'
+            'GRID,3,,0.,0.,0.51\n'
+            'GRID,10,,0.,0.,1.\n'
+            'GRID,11,,0.,0.,1.\n'
+            'CTRIA3,1,1,1,2,11\n'
+            'CTRIA3,3,1,2,3,11\n'
+            'CTRIA3,4,1,1,2,10\n'
+            'PSHELL,1,1,0.1\n'
+            'MAT1,1,3.0,, 0.3\n'
+            'ENDDATA'
+        )
+        bdf_filename = DIRNAME / 'nonunique_chunked.bdf'
+        bdf_filename_out = DIRNAME / 'unique_chunked.bdf'
+        with open(bdf_filename, 'w') as bdf_file:
+            bdf_file.write(msg)
+
+        tol = 0.2
+        for out_of_core in [False, True]:
+            bdf_equivalence_nodes(bdf_filename, bdf_filename_out, tol,
+                                  renumber_nodes=False, neq_max=4, xref=True,
+                                  node_set=None, crash_on_collapse=False,
+                                  log=log, debug=False, method='chunked',
+                                  chunk_size=2, out_of_core=out_of_core)
+            model = save_check_nodes(bdf_filename_out, log, nnodes=3, skip_cards=['CTRIA3'])
+            node_ids = list(sorted(model.nodes))
+            assert node_ids == [1, 2, 10], node_ids
+
+        # only collapse 2 and 3
+        bdf_equivalence_nodes(bdf_filename, bdf_filename_out, tol,
+                              renumber_nodes=False, xref=True,
+                              node_set=np.array([2, 3]), crash_on_collapse=False,
+                              log=log, debug=False, method='chunked')
+        model = save_check_nodes(bdf_filename_out, log, nnodes=4, skip_cards=['CTRIA3'])
+        node_ids = list(sorted(model.nodes))
+        assert node_ids == [1, 2, 10, 11], node_ids
+        os.remove(bdf_filename)
+
+        # a GRID with a different CD isn't merged
+        model = BDF(log=log)
+        model.add_grid(1, [0., 0., 0.])
+        model.add_grid(2, [0., 0., 0.])
+        model.add_grid(3, [0., 0., 0.], cd=1)
+        model.add_cord2r(1, [0., 0., 0.], [0., 0., 1.], [1., 0., 0.])
+        bdf_equivalence_nodes(model, bdf_filename_out, 0.1,
+                              renumber_nodes=False, xref=True, crash_on_collapse=False,
+                              log=log, debug=False, method='chunked')
+        model2 = save_check_nodes(bdf_filename_out, log, nnodes=2)
+        assert list(sorted(model2.nodes)) == [1, 3], model2.nodes
+
+        # multiple node sets
+        model = BDF(log=log)
+        model.add_grid(1, [0., 0., 0.])
+        model.add_grid(2, [0., 0., 0.])
+        model.add_grid(3, [0., 0., 0.])
+        model.add_grid(4, [1., 0., 0.])
+        model.add_grid(5, [1., 0., 0.])
+        node_set = [
+            [1, 2],
+            [3, 4, 5],
+        ]
+        bdf_equivalence_nodes(model, bdf_filename_out, 0.1,
+                              renumber_nodes=False, xref=True,
+                              node_set=node_set, crash_on_collapse=False,
+                              log=log, debug=False, method='chunked')
+        model2 = save_check_nodes(bdf_filename_out, log, nnodes=3)
+        assert list(sorted(model2.nodes)) == [1, 3, 4], model2.nodes
+
 def save_check_nodes(bdf_filename, log, nnodes, skip_cards=None):
     model = BDF(log=log, debug=False)
     model.disable_cards(skip_cards)
@@ -3,7 +3,9 @@ import os
 import unittest
 from cpylog import SimpleLogger
 from pyNastran.bdf.bdf import BDF, read_bdf
-from pyNastran.bdf.mesh_utils.bdf_renumber import bdf_renumber
+from pyNastran.bdf.mesh_utils.bdf_renumber import (
+    bdf_renumber, get_rcm_node_order, get_renumber_starting_ids_from_model,
+    _create_dict_mapper, _map_ids)
 
 import pyNastran
 PKG_PATH = pyNastran.__path__[0]
@@ -123,6 +125,112 @@ class TestRenumber(unittest.TestCase):
         read_bdf(bdf_filename_out2, log=log)
         read_bdf(bdf_filename_out3, log=log)
 
+    def test_renumber_rcm(self):
+        """renumbers a strip of CQUAD4s to reduce the bandwidth"""
+        log = SimpleLogger(level='error')
+        model = BDF(log=log)
+        nquads = 10
+        # the bottom row is 1-11 and the top row is 101-111
+        for i in range(nquads + 1):
+            model.add_grid(i + 1, [float(i), 0., 0.])
+            model.add_grid(i + 101, [float(i), 1., 0.])
+        for i in range(nquads):
+            model.add_cquad4(i + 1, 1, [i + 1, i + 2, i + 102, i + 101])
+        model.add_pshell(1, mid1=1, t=0.1)
+        model.add_mat1(1, 3.0e7, None, 0.3)
+        model.add_spoint([3, 4])
+        model.cross_reference()
+        assert _get_bandwidth(model) == 101
+
+        nids = get_rcm_node_order(model)
+        assert sorted(nids) == sorted(model.nodes)
+
+        model, mapper = bdf_renumber(model, None, node_ordering='rcm', log=log)
+        nid_map = mapper['nodes']
+        assert sorted(nid_map) == sorted(model.nodes)
+        assert sorted(nid_map.values()) == [1, 2] + list(range(5, 25))
+        # 3 + the skipped SPOINT ids
+        assert _get_bandwidth(model) <= 5
+        for nid_old in [1, 11, 101]:
+            nid_new = nid_map[nid_old]
+            assert model.nodes[nid_old].nid == nid_new
+        assert model.elements[1].node_ids == [nid_map[nid] for nid in [1, 2, 102, 101]]
+
+        # the RBE2 connects 1 and 11, so they're close in the new order
+        model = BDF(log=log)
+        for i in range(nquads + 1):
+            model.add_grid(i + 1, [float(i), 0., 0.])
+        for i in range(nquads):
+            model.add_conrod(i + 1, 1, [i + 1, i + 2], A=1.0)
+        model.add_grid(20, [5., 5., 0.])
+        model.add_grid(30, [5., 6., 0.])
+        model.add_rbe2(100, 20, '123456', [1, 11])
+        model.add_mat1(1, 3.0e7, None, 0.3)
+        model.cross_reference()
+        nids = get_rcm_node_order(model).tolist()
+        assert nids[-1] == 30, nids
+        inids = [nids.index(nid) for nid in [1, 11, 20]]
+        assert max(inids) - min(inids) <= 3, nids
+
+    def test_renumber_starting_ids(self):
+        """gets the next ids from a model with CAERO2/CAERO5 panels"""
+        log = SimpleLogger(level='error')
+        model = BDF(log=log)
+        model.add_grid(10, [0., 0., 0.])
+        model.add_grid(20, [1., 0., 0.])
+        model.add_conrod(5, 1, [10, 20], A=1.0)
+        model.add_mat1(1, 3.0e7, None, 0.3)
+        model.add_caero1(1000, 1, 0, [0., 0., 0.], 1., [0., 1., 0.], 1.,
+                         nspan=3, nchord=2)
+        model.add_caero2(2000, 2, 1, [0., 0., 0.], 1., nsb=4, nint=2)
+        model.add_caero5(3000, 5, [0., 0., 0.], 1., [0., 1., 0.], 1., nspan=7)
+
+        starting_id_dict = get_renumber_starting_ids_from_model(model)
+        assert starting_id_dict['nid'] == 21, starting_id_dict
+        assert starting_id_dict['eid'] == 6, starting_id_dict
+        assert starting_id_dict['mid'] == 2, starting_id_dict
+        assert starting_id_dict['caero_id'] == 3007, starting_id_dict
+
+        # the keys of a renumbered model are stale, so the mapper is used
+        mapper = {
+            'nodes' : {10 : 1, 20 : 2},
+            'elements' : {5 : 1},
+            'materials' : {1 : 1},
+        }
+        starting_id_dict = get_renumber_starting_ids_from_model(model, mapper)
+        assert starting_id_dict['nid'] == 3, starting_id_dict
+        assert starting_id_dict['eid'] == 2, starting_id_dict
+        assert starting_id_dict['pid'] == 1, starting_id_dict
+        assert starting_id_dict['mid'] == 2, starting_id_dict
+
+    def test_renumber_id_maps(self):
+        """tests the array-based id maps"""
+        log = SimpleLogger(level='error')
+        model = BDF(log=log)
+        model.add_pshell(30, mid1=1, t=0.1)
+        model.add_pshell(10, mid1=1, t=0.2)
+        model.add_spc1(7, '123', [1, 2])
+        model.add_spc1(7, '456', [3])
+        model.add_spc1(2, '123', [4])
+
+        properties_map = {}
+        pid = _create_dict_mapper(model.properties, properties_map, 'pid', 100)
+        assert pid == 102, pid
+        assert properties_map == {10 : 100, 30 : 101}, properties_map
+        assert model.properties[10].pid == 100
+        assert model.properties[30].pid == 101
+
+        spc_map = {}
+        spc_id = _create_dict_mapper(model.spcs, spc_map, 'conid', 1)
+        assert spc_id == 3, spc_id
+        assert spc_map == {2 : 1, 7 : 2}, spc_map
+        assert [spc.conid for spc in model.spcs[7]] == [2, 2]
+
+        ids_new, ids_missing = _map_ids({10 : 1, 30 : 2, 20 : 3}, [30, 5, 10, 40])
+        assert ids_new == [2, 1], ids_new
+        assert ids_missing == [5, 40], ids_missing
+        assert _map_ids({}, [1, 2]) == ([], [1, 2])
+
     #def test_renumber_06(self):
         #dirname = os.path.join(UNIT_PATH, 'obscure')
         #bdf_filenames = get_files_of_type(dirname, extension='.bdf')
@@ -135,6 +243,11 @@ class TestRenumber(unittest.TestCase):
             #check_renumber(bdf_filename, bdf_filename_renumber, bdf_filename_check)
 
 
+def _get_bandwidth(model):
+    """gets the maximum node id difference within an element"""
+    return max(max(elem.node_ids) - min(elem.node_ids) for elem in model.elements.values())
+
+
 def check_renumber(bdf_filename, bdf_filename_renumber, bdf_filename_check,
                    log=None):
     """renumbers the file, then reloads both it and the renumbered deck"""
@@ -5,9 +5,10 @@ from numpy import array, allclose, cross
 import numpy as np
 
 import pyNastran
-from pyNastran.bdf.bdf import BDF
+from pyNastran.bdf.bdf import BDF, read_bdf
 from pyNastran.bdf.bdf import GRID
-from pyNastran.bdf.mesh_utils.loads import sum_forces_moments, sum_forces_moments_elements
+from pyNastran.bdf.mesh_utils.loads import (
+    sum_forces_moments, sum_forces_moments_elements, sum_forces_moments_vectorized)
 model_path = os.path.join(pyNastran.__path__[0], '..', 'models')
 
 
@@ -477,6 +478,84 @@ class TestLoadSum(unittest.TestCase):
         self.assertTrue(allclose(F2_expected, F1), 'loadcase_id=%s F_expected=%s F1=%s' % (loadcase_id, F2_expected, F1))
         self.assertTrue(allclose(M2_expected, M1), 'loadcase_id=%s M_expected=%s M1=%s' % (loadcase_id, M2_expected, M1))
 
+    def test_loads_sum_pload1_randvar2(self):
+        """tests the PLOAD1 moment doesn't depend on the other loads in the case"""
+        bdf_filename = os.path.join(model_path, 'other', 'randvar2.bdf')
+        model = read_bdf(bdf_filename, log=None, debug=None)
+        p0 = array([0., 0., 0.])
+        xyz_cid0 = model.get_xyz_in_coord(cid=0)
+
+        # the PLOAD1 is applied at the end of CBAR 3401 (GRID 3402 + wb)
+        #   r = [1, 0, 0] + [1, 1, 1]
+        #   M = r x [1, 0, 0]
+        loads = model.loads[1]
+        model.loads[1] = [load for load in loads if load.type == 'PLOAD1']
+        F, M = sum_forces_moments(model, p0, 1, include_grav=False)
+        assert allclose(F, [1., 0., 0.]), F
+        assert allclose(M, [0., 1., -1.]), M
+
+        # the bar offsets used to be added to the GRIDs, which moved the
+        # FORCE1 on GRID 3402
+        model.loads[1] = loads
+        F, M = sum_forces_moments(model, p0, 1, include_grav=False)
+        assert allclose(F, [2057.00000004, 4.99973163, 2040.6190638]), F
+        assert allclose(M, [9948.28037088, -19931.2173438, -10198.96080509]), M
+        assert allclose(model.get_xyz_in_coord(cid=0), xyz_cid0)
+
+        forces, moments = sum_forces_moments_vectorized(model, p0, [1], include_grav=False)
+        assert allclose(forces[0], F), forces
+        assert allclose(moments[0], M), moments
+
+    def test_loads_sum_vectorized(self):
+        """tests sum_forces_moments_vectorized"""
+        model = BDF(log=None, debug=None)
+        model.add_grid(1, [0., 0., 0.])
+        model.add_grid(2, [1., 0., 0.])
+        model.add_grid(3, [1., 1., 0.])
+        model.add_grid(4, [0., 1., 0.])
+        model.add_grid(5, [2., 0., 0.])
+        model.add_grid(6, [2., 1., 0.])
+        model.add_grid(11, [0., 0., 1.])
+        model.add_grid(12, [1., 0., 1.])
+        model.add_grid(13, [1., 1., 1.])
+        model.add_grid(14, [0., 1., 1.])
+        model.add_cquad4(1, 100, [1, 2, 3, 4])
+        model.add_ctria3(2, 100, [2, 5, 6])
+        model.add_chexa(3, 200, [1, 2, 3, 4, 11, 12, 13, 14])
+        model.add_pshell(100, mid1=1000, t=0.1)
+        model.add_psolid(200, 1000)
+        model.add_mat1(1000, 3.0e7, None, 0.3, rho=0.2)
+        model.add_cord2c(1, [0., 0., 1.], [0., 0., 2.], [1., 1., 1.])
+
+        model.add_force(1, 3, 10., [1., 0., 0.])
+        model.add_force(1, 6, 10., [1., 45., 0.], cid=1)
+        model.add_moment(1, 4, 5., [0., 1., 1.])
+        model.add_pload(2, 2., [1, 2, 3, 4])
+        model.add_pload(2, 3., [2, 5, 6])
+        model.add_pload2(2, 4., [1, 2])
+        model.add_pload4(3, [1, 2], [1., 2., 3., 4.])
+        model.add_pload4(3, [1], [5., None, None, None], nvector=[1., 1., 0.])
+        model.add_pload4(3, [3], [6., None, None, None], g1=1, g34=3)
+        model.add_grav(4, 9.81, [0., 0., -1.])
+        model.add_load(10, 2., [1., -0.5, 3.], [1, 2, 3])
+        model.cross_reference()
+
+        p0 = array([1., 2., 3.])
+        loadcase_ids = [1, 2, 3, 4, 10]
+        for cid in [0, 1]:
+            forces, moments = sum_forces_moments_vectorized(
+                model, p0, loadcase_ids, cid=cid, include_grav=True)
+            assert forces.shape == (5, 3), forces.shape
+            for loadcase_id, force, moment in zip(loadcase_ids, forces, moments):
+                F1, M1 = sum_forces_moments(model, p0, loadcase_id, cid=cid, include_grav=True)
+                assert np.allclose(force, F1), 'case=%s F1=%s force=%s' % (loadcase_id, F1, force)
+                assert np.allclose(moment, M1), 'case=%s M1=%s moment=%s' % (loadcase_id, M1, moment)
+
+
+        # PLOAD: 2*1 + 3*0.5; PLOAD2: 4*(1 + 0.5)
+        forces, moments = sum_forces_moments_vectorized(model, p0, [2])
+        assert np.allclose(forces, [[0., 0., 9.5]]), forces
+
 
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
@@ -15,7 +15,7 @@ from typing import List
 from cpylog import SimpleLogger
 import pyNastran
 from pyNastran.bdf.mesh_utils.bdf_renumber import bdf_renumber, superelement_renumber
-from pyNastran.bdf.mesh_utils.bdf_merge import bdf_merge
+from pyNastran.bdf.mesh_utils.bdf_merge import bdf_merge, bdf_merge_streaming
 from pyNastran.bdf.mesh_utils.export_mcids import export_mcids
 from pyNastran.bdf.mesh_utils.pierce_shells import pierce_shell_model
 
@@ -243,8 +243,8 @@ def cmd_line_renumber(argv=None, quiet=False):
     from docopt import docopt
     msg = (
         "Usage:\n"
-        '  bdf renumber IN_BDF_FILENAME OUT_BDF_FILENAME [--superelement] [--size SIZE]\n'
-        '  bdf renumber IN_BDF_FILENAME                  [--superelement] [--size SIZE]\n'
+        '  bdf renumber IN_BDF_FILENAME OUT_BDF_FILENAME [--superelement | --rcm] [--size SIZE]\n'
+        '  bdf renumber IN_BDF_FILENAME                  [--superelement | --rcm] [--size SIZE]\n'
         '  bdf renumber -h | --help\n'
         '  bdf renumber -v | --version\n'
         '\n'
@@ -256,7 +256,9 @@ def cmd_line_renumber(argv=None, quiet=False):
 
         'Options:\n'
         '--superelement  calls superelement_renumber\n'
-        '--size SIZE     set the field size (default=16)\n\n'
+        '--size SIZE     set the field size (default=16)\n'
+        '--rcm           renumber the nodes to reduce the bandwidth (reverse Cuthill-McKee);\n'
+        '                not supported with --superelement\n\n'
 
         'Info:\n'
         '  -h, --help      show this help message and exit\n'
@@ -276,10 +278,11 @@ def cmd_line_renumber(argv=None, quiet=False):
     bdf_filename_out = data['OUT_BDF_FILENAME']
     if bdf_filename_out is None:
         bdf_filename_out = 'renumber.bdf'
+    node_ordering = 'rcm' if data['--rcm'] else 'id'
 
     size = 16
     if data['--size']:
-        size = int(data['SIZE'])
+        size = int(data['--size'])
 
     assert size in [8, 16], f'size={size} args={argv}'
     #cards_to_skip = [
@@ -296,7 +299,7 @@ def cmd_line_renumber(argv=None, quiet=False):
     else:
         bdf_renumber(bdf_filename, bdf_filename_out, size=size, is_double=False,
                      starting_id_dict=None, round_ids=False,
-                     cards_to_skip=cards_to_skip, log=log)
+                     cards_to_skip=cards_to_skip, log=log, node_ordering=node_ordering)
 
 
 def cmd_line_mirror(argv=None, quiet=False):
@@ -422,7 +425,7 @@ def cmd_line_merge(argv=None, quiet=False):
     import pyNastran
     msg = (
         "Usage:\n"
-        '  bdf merge (IN_BDF_FILENAMES)... [-o OUT_BDF_FILENAME]\n'
+        '  bdf merge (IN_BDF_FILENAMES)... [-o OUT_BDF_FILENAME] [--streaming]\n'
         '  bdf merge -h | --help\n'
         '  bdf merge -v | --version\n'
         '\n'
@@ -432,7 +435,8 @@ def cmd_line_merge(argv=None, quiet=False):
         '\n'
 
         'Options:\n'
-        '  -o OUT, --output  OUT_BDF_FILENAME  path to output BDF/DAT/NAS file\n\n'
+        '  -o OUT, --output  OUT_BDF_FILENAME  path to output BDF/DAT/NAS file\n'
+        '  --streaming       only load one model at a time\n\n'
 
         'Info:\n'
         '  -h, --help      show this help message and exit\n'
@@ -458,6 +462,11 @@ def cmd_line_merge(argv=None, quiet=False):
         #'AEFACT', 'CAERO1', 'CAERO2', 'SPLINE1', 'SPLINE2',
         #'AERO', 'AEROS', 'PAERO1', 'PAERO2', 'MKAERO1']
     cards_to_skip = []
+    if data['--streaming']:
+        bdf_merge_streaming(bdf_filenames, bdf_filename_out, renumber=True,
+                            encoding=None, size=size, is_double=False,
+                            cards_to_skip=cards_to_skip)
+        return
     bdf_merge(bdf_filenames, bdf_filename_out, renumber=True,
               encoding=None, size=size, is_double=False, cards_to_skip=cards_to_skip)
 
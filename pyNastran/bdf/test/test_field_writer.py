@@ -9,6 +9,7 @@ from pyNastran.bdf.field_writer_8 import (print_field_8, print_float_8,
                                           print_scientific_8)
 from pyNastran.bdf.field_writer_16 import print_field_16, print_card_16, print_float_16, print_scientific_16
 from pyNastran.bdf.field_writer_double import print_card_double
+from pyNastran.bdf.bdf_interface.fast_write import print_floats_8
 
 
 from pyNastran.bdf.bdf_interface.assign_type import interpret_value
@@ -385,6 +386,19 @@ class Testfield_writer_8(unittest.TestCase):
                 output = print_scientific_8(num)
                 self.assertEqual(len(output), 8, msg='output=%r len(output)=%i' % (output, len(output)))
 
+    def test_floats_8_vectorized(self):
+        """tests the vectorized print_float_8"""
+        nums = [np.logspace(istart, istart+1, num=1000, endpoint=True, base=10.0)
+                for istart in np.arange(-13, 13)]
+        nums = np.hstack(nums + [-num for num in nums] + [np.round(num, 3) for num in nums])
+        nums = np.hstack([nums, [0., -0., np.nan, 0.5, 100000.25, -10000.75,
+                                 0.99999995, -0.9999995, 999999.95, -99999.95]])
+        chars, is_valid = print_floats_8(nums)
+        assert is_valid.all()
+        outputs = chars.view('|S8').ravel()
+        for num, output in zip(nums, outputs):
+            self.assertEqual(output.decode('ascii'), print_float_8(num), msg='num=%r' % num)
+
     def test_scientific_8(self):
         expected_num = [
             ('      0.', 0.),
@@ -1,11 +1,17 @@
 import os
 import unittest
 from io import StringIO
+from contextlib import redirect_stdout
+
+import numpy as np
 
 from cpylog import SimpleLogger
 import pyNastran
 from pyNastran.bdf.bdf import BDF, read_bdf
 from pyNastran.bdf.bdf_interface.pybdf import BDFInputPy
+from pyNastran.bdf.bdf_interface.bdf_cache import BDFCache
+from pyNastran.bdf.bdf_interface.fast_write import write_cards_8
+from pyNastran.bdf.cards.elements.solid import CTETRA10, CHEXA20
 from pyNastran.bdf.bdf_interface.include_file import (
     split_filename_into_tokens, get_include_filename,
     PurePosixPath, PureWindowsPath,
@@ -513,6 +519,426 @@ class TestReadWrite(unittest.TestCase):
         model.read_bdf(bdf_filename)
         assert len(model.elements) == 0, len(model.elements)
 
+    def test_fast_parse(self):
+        """tests the vectorized GRID/CQUAD4/CTRIA3/CTETRA/CHEXA parser"""
+        log = SimpleLogger(level='warning', encoding='utf-8')
+        lines = [
+            'SOL 101',
+            'CEND',
+            'BEGIN BULK',
+            '$ comment',
+            'GRID           1       0      0.      0.      0.',
+            'GRID,2,,1.,0.,0.',
+            'GRID*                  3               0              1.              1.',
+            '*                     0.',
+            'GRID           4              0.      1.      0.       0     456',
+            'GRID           5              0.      0.    1.-5',
+            'GRID           6              1.      0.      1.',
+            'GRID           7              0.      1.      1.',
+            'GRID           8              1.      1.      1.',
+            'GRID,9,,0.5,0.5,0.',
+            'GRID,10,,0.5,0.,0.5',
+            'CQUAD4         1       1       1       2       3       4',
+            'CQUAD4         2               1       2       3       4     45.',
+            'CTRIA3,3,1,1,2,3',
+            'CTETRA        10       2       1       2       3       5',
+            'CTETRA        11       2       1       2       3       5       9      10',
+            'CHEXA         20       2       1       2       3       4       5       6',
+            '               8       7',
+            'CHEXA         21       2       1       2       3       4       5       6',
+            '               8       7       9',
+            'PSHELL         1       1     0.1',
+            'PSOLID         2       1',
+            'MAT1           1    3.+7             0.3',
+            'ENDDATA',
+        ]
+        bdf_filename = 'fast_parse.bdf'
+        with open(bdf_filename, 'w') as bdf_file:
+            bdf_file.write('\n'.join(lines))
+
+        model_slow = BDF(log=log, debug=False)
+        model_slow._fast_parse = False
+        model_slow.read_bdf(bdf_filename)
+
+        model = BDF(log=log, debug=False)
+        model.read_bdf(bdf_filename)
+        os.remove(bdf_filename)
+
+        assert model.card_count == model_slow.card_count, model.card_count
+        assert list(model.nodes) == list(model_slow.nodes), list(model.nodes)
+        assert list(model.elements) == list(model_slow.elements), list(model.elements)
+        for nid, node in model.nodes.items():
+            assert node.write_card() == model_slow.nodes[nid].write_card(), node
+        for eid, elem in model.elements.items():
+            assert elem.write_card() == model_slow.elements[eid].write_card(), elem
+        assert isinstance(model.elements[11], CTETRA10), model.elements[11]
+        assert isinstance(model.elements[21], CHEXA20), model.elements[21]
+
+    def test_read_nworkers(self):
+        """tests reading the INCLUDE files/cards in parallel"""
+        log = SimpleLogger(level='warning', encoding='utf-8')
+        main_lines = [
+            'SOL 101\n',
+            'CEND\n',
+            'BEGIN BULK\n',
+            "INCLUDE 'nworkers_1.inc'\n",
+            'PROD           1       1      1.\n',
+            'MAT1           1    3.+7             0.3\n',
+            'ENDDATA\n',
+        ]
+        include_lines = ["INCLUDE 'nworkers_2.inc'\n"]
+        include_lines2 = []
+        for i in range(1, 3001):
+            include_lines.append('GRID,%i,,%i.,0.,0.\n' % (i, i))
+            include_lines.append('CROD,%i,1,%i,%i\n' % (i, i, i + 1))
+            include_lines2.append('CONM2,%i,%i,,%i.\n' % (i, i, i))
+        include_lines2.append('GRID,3001,,3001.,0.,0.\n')
+
+        bdf_filenames = ['nworkers.bdf', 'nworkers_1.inc', 'nworkers_2.inc']
+        for bdf_filename, lines in zip(bdf_filenames,
+                                       [main_lines, include_lines, include_lines2]):
+            with open(bdf_filename, 'w') as bdf_file:
+                bdf_file.writelines(lines)
+
+        model_serial = read_bdf(bdf_filenames[0], xref=False, log=log)
+        model = read_bdf(bdf_filenames[0], xref=False, log=log, nworkers=2)
+        for bdf_filename in bdf_filenames:
+            os.remove(bdf_filename)
+
+        assert model.card_count == model_serial.card_count, model.card_count
+        assert list(model.nodes) == list(model_serial.nodes)
+        assert list(model.elements) == list(model_serial.elements)
+        assert list(model.masses) == list(model_serial.masses)
+        for eid, elem in model.elements.items():
+            assert elem.write_card() == model_serial.elements[eid].write_card(), elem
+        for eid, mass in model.masses.items():
+            assert mass.write_card() == model_serial.masses[eid].write_card(), mass
+
+    def test_read_cache_dir(self):
+        """tests the binary model cache"""
+        log = SimpleLogger(level='warning', encoding='utf-8')
+        cache_dir = 'bdf_cache'
+        bdf_filename = 'cache.bdf'
+        include_filename = 'cache.inc'
+        with open(bdf_filename, 'w') as bdf_file:
+            bdf_file.write(
+                'SOL 101\n'
+                'CEND\n'
+                'BEGIN BULK\n'
+                "INCLUDE 'cache.inc'\n"
+                '$ a comment\n'
+                'CQUAD4         1       1       1       2       3       4\n'
+                'PSHELL         1       1     0.1\n'
+                'MAT1           1    3.+7             0.3\n'
+                'SPC1,1,123456,1,2\n'
+                'FORCE,2,3,,1.0,0.,0.,1.\n'
+                'ENDDATA\n')
+        include_lines = [
+            'GRID           1              0.      0.      0.\n',
+            'GRID           2              1.      0.      0.\n',
+            'GRID           3              1.      1.      0.\n',
+            'GRID           4              0.      1.      0.\n',
+        ]
+        with open(include_filename, 'w') as include_file:
+            include_file.writelines(include_lines)
+
+        model_serial = read_bdf(bdf_filename, log=log)
+        model1 = read_bdf(bdf_filename, log=log, cache_dir=cache_dir)
+        cache_filenames = os.listdir(cache_dir)
+        assert len(cache_filenames) == 1, cache_filenames
+
+        model2 = read_bdf(bdf_filename, log=log, cache_dir=cache_dir)
+        for model in [model1, model2]:
+            assert model.card_count == model_serial.card_count, model.card_count
+            assert list(model.nodes) == list(model_serial.nodes)
+            for nid, node in model.nodes.items():
+                assert node.write_card() == model_serial.nodes[nid].write_card(), node
+            assert model.elements[1].write_card() == model_serial.elements[1].write_card()
+            assert model.elements[1].comment == '$ a comment\n', model.elements[1].comment
+            assert model.spcs[1][0].write_card() == model_serial.spcs[1][0].write_card()
+            assert model.loads[2][0].write_card() == model_serial.loads[2][0].write_card()
+            assert model.elements[1].nodes_ref[0] is model.nodes[1]
+        assert str(model2.case_control_deck) == str(model_serial.case_control_deck)
+
+        # changing an include file invalidates the snapshot
+        include_lines[0] = 'GRID           1              0.      0.      5.\n'
+        with open(include_filename, 'w') as include_file:
+            include_file.writelines(include_lines)
+        stat = os.stat(include_filename)
+        os.utime(include_filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        model3 = read_bdf(bdf_filename, log=log, cache_dir=cache_dir)
+        assert model3.nodes[1].xyz[2] == 5.0, model3.nodes[1].xyz
+
+        # the other options use a different snapshot
+        model4 = read_bdf(bdf_filename, log=log, cache_dir=cache_dir, mode='nx')
+        assert model4.nodes[1].xyz[2] == 5.0, model4.nodes[1].xyz
+        cache_filenames = os.listdir(cache_dir)
+        assert len(cache_filenames) == 2, cache_filenames
+
+        # the least recently used snapshots are removed
+        cache = BDFCache(cache_dir, bdf_filename, {'mode' : 'nx'}, log, max_nbytes=0)
+        cache.evict()
+        assert len(os.listdir(cache_dir)) == 0, os.listdir(cache_dir)
+
+        os.rmdir(cache_dir)
+        os.remove(bdf_filename)
+        os.remove(include_filename)
+
+    def test_refresh(self):
+        """tests re-reading the changed include files"""
+        log = SimpleLogger(level='warning', encoding='utf-8')
+        bdf_filename = 'refresh.bdf'
+        grid_filename = 'refresh_grids.inc'
+        prop_filename = 'refresh_props.inc'
+        with open(bdf_filename, 'w') as bdf_file:
+            bdf_file.write(
+                'SOL 101\n'
+                'CEND\n'
+                'BEGIN BULK\n'
+                "INCLUDE 'refresh_grids.inc'\n"
+                "INCLUDE 'refresh_props.inc'\n"
+                'CQUAD4         1       1       1       2       3       4\n'
+                'CQUAD4         2       2       1       2       3       4\n'
+                'SPC1,1,123456,1,2\n'
+                'ENDDATA\n')
+        with open(grid_filename, 'w') as grid_file:
+            grid_file.write(
+                'GRID           1              0.      0.      0.\n'
+                'GRID           2              1.      0.      0.\n'
+                'GRID           3              1.      1.      0.\n'
+                'GRID           4              0.      1.      0.\n')
+        prop_lines = [
+            'PSHELL         1       1     0.1\n',
+            'PSHELL         2       1     0.2\n',
+            'MAT1           1    3.+7             0.3\n',
+            'FORCE,2,3,,1.0,0.,0.,1.\n',
+        ]
+        with open(prop_filename, 'w') as prop_file:
+            prop_file.writelines(prop_lines)
+
+        def update(filename, lines):
+            with open(filename, 'w') as file_obj:
+                file_obj.writelines(lines)
+            stat = os.stat(filename)
+            os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        model = read_bdf(bdf_filename, log=log)
+        assert model._file_cards == {}
+        with self.assertRaises(RuntimeError):
+            model.refresh()
+
+        model = read_bdf(bdf_filename, log=log, track_includes=True)
+        assert model.refresh() == []
+
+        # the same cards
+        update(prop_filename, prop_lines)
+        assert model.refresh() == []
+
+        # only the cards in the include file are replaced
+        grid = model.nodes[1]
+        prop_lines[0] = 'PSHELL         1       1     0.3\n'
+        prop_lines[3] = 'FORCE,2,3,,2.0,0.,0.,1.\n'
+        prop_lines.append('PSHELL         3       1     0.4\n')
+        update(prop_filename, prop_lines)
+        filenames = model.refresh()
+        assert len(filenames) == 1 and filenames[0].endswith(prop_filename), filenames
+        assert model.nodes[1] is grid
+        assert model.properties[1].t == 0.3, model.properties[1]
+        assert model.properties[3].t == 0.4, model.properties[3]
+        assert model.card_count['PSHELL'] == 3, model.card_count
+        assert model.loads[2][0].mag == 2.0, model.loads[2]
+        assert len(model.loads[2]) == 1, model.loads[2]
+        assert model.elements[1].pid_ref is model.properties[1]
+        assert model.elements[2].pid_ref is model.properties[2]
+        assert model.properties[1].mid_ref is model.materials[1]
+
+        model2 = read_bdf(bdf_filename, log=log)
+        assert model.card_count == model2.card_count, model.card_count
+
+        # the main file is fully re-read
+        with open(bdf_filename, 'a') as bdf_file:
+            bdf_file.write('$ a comment\n')
+        stat = os.stat(bdf_filename)
+        os.utime(bdf_filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        filenames = model.refresh()
+        assert len(filenames) == 1 and filenames[0].endswith(bdf_filename), filenames
+        assert model.nodes[1] is not grid
+        assert model.card_count == model2.card_count, model.card_count
+        os.remove(bdf_filename)
+        os.remove(grid_filename)
+        os.remove(prop_filename)
+
+    def test_refresh_cache_dir(self):
+        """tests re-reading the changed include files of a cached model"""
+        log = SimpleLogger(level='warning', encoding='utf-8')
+        cache_dir = 'refresh_cache'
+        bdf_filename = 'refresh_cache.bdf'
+        prop_filename = 'refresh_cache.inc'
+        with open(bdf_filename, 'w') as bdf_file:
+            bdf_file.write(
+                'SOL 101\n'
+                'CEND\n'
+                'BEGIN BULK\n'
+                "INCLUDE 'refresh_cache.inc'\n"
+                'GRID           1              0.      0.      0.\n'
+                'GRID           2              1.      0.      0.\n'
+                'GRID           3              1.      1.      0.\n'
+                'CTRIA3         1       1       1       2       3\n'
+                'ENDDATA\n')
+        prop_lines = [
+            'PSHELL         1       1     0.1\n',
+            'MAT1           1    3.+7             0.3\n',
+        ]
+        with open(prop_filename, 'w') as prop_file:
+            prop_file.writelines(prop_lines)
+
+        model1 = read_bdf(bdf_filename, log=log, cache_dir=cache_dir, track_includes=True)
+        model2 = read_bdf(bdf_filename, log=log, cache_dir=cache_dir, track_includes=True)
+        assert len(os.listdir(cache_dir)) == 1, os.listdir(cache_dir)
+        assert model2._file_stamps == model1._file_stamps
+        assert model2._file_cards == model1._file_cards
+        assert model2.refresh() == []
+
+        # only the include file is re-read
+        grid = model2.nodes[1]
+        prop_lines[0] = 'PSHELL         1       1     0.3\n'
+        with open(prop_filename, 'w') as prop_file:
+            prop_file.writelines(prop_lines)
+        stat = os.stat(prop_filename)
+        os.utime(prop_filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        filenames = model2.refresh()
+        assert len(filenames) == 1 and filenames[0].endswith(prop_filename), filenames
+        assert model2.nodes[1] is grid
+        assert model2.properties[1].t == 0.3, model2.properties[1]
+        assert model2.elements[1].pid_ref is model2.properties[1]
+
+        # the snapshot without track_includes is a different one
+        model3 = read_bdf(bdf_filename, log=log, cache_dir=cache_dir)
+        assert model3._file_cards == {}
+        assert model3.properties[1].t == 0.3, model3.properties[1]
+        assert len(os.listdir(cache_dir)) == 2, os.listdir(cache_dir)
+
+        for cache_filename in os.listdir(cache_dir):
+            os.remove(os.path.join(cache_dir, cache_filename))
+        os.rmdir(cache_dir)
+        os.remove(bdf_filename)
+        os.remove(prop_filename)
+
+    def test_write_cards_8(self):
+        """tests the vectorized small field writer matches write_card"""
+        model = BDF(debug=None)
+        xyz = np.linspace(-1000., 1000., num=600).reshape(200, 3) ** 3 / 1.e5
+        for nid in range(1, 201):
+            model.add_grid(nid, xyz[nid - 1], cp=nid % 3)
+        model.add_grid(201, [1.e-9, -1.e10, np.nan], cd=1, comment='grid 201')
+        model.add_grid(202, [0.5, -0.25, 1.e-9], ps='123', comment='grid 202')
+
+        for eid in range(1, 101):
+            nids = [eid, eid + 1, eid + 2, eid + 3]
+            if eid % 2:
+                model.add_cquad4(eid, 1, nids, theta_mcid=eid % 4, zoffset=0.1 * (eid % 3))
+            else:
+                model.add_ctria3(eid, 1, nids[:3], T1=1.0, T2=1.5, T3=None,
+                                 comment='ctria3' if eid % 10 == 0 else '')
+        model.add_ctetra(101, 2, [1, 2, 3, 4])
+        model.add_ctetra(102, 2, [1, 2, 3, 4, 5, None, 7, None, 9, 10])
+        model.add_chexa(103, 2, [1, 2, 3, 4, 5, 6, 7, 8])
+        model.add_chexa(104, 2, list(range(1, 13)) + [None] * 4 + list(range(17, 21)))
+        model.add_cbar(105, 3, [1, 2], [0., 0., 1.], None, pb=123456, wb=[0., 0.1, 0.])
+        model.add_cbar(106, 3, [1, 2], None, 3, offt='GOO')
+        model.add_crod(107, 4, [1, 2])
+        model.add_conm2(108, 1, 1.5, X=[0., 1., 0.], I=[1., 0., 2., 0., 0., 3.])
+        model.add_rbe2(109, 1, '123', list(range(2, 30)))
+        model.add_rbe2(110, 1, '123456', [2, 3], alpha=1.e-5)
+
+        cards = [card for (unused_id, card) in sorted(model.nodes.items())]
+        cards += [card for (unused_id, card) in sorted(model.elements.items())]
+        cards += [card for (unused_id, card) in sorted(model.masses.items())]
+        cards += [card for (unused_id, card) in sorted(model.rigid_elements.items())]
+        bdf_file = StringIO()
+        write_cards_8(bdf_file, cards)
+        expected = ''.join(card.write_card(8) for card in cards)
+        self.assertEqual(bdf_file.getvalue(), expected)
+
+        # the card that can't be written is reported
+        model.masses[108].X = None
+        for eid in range(1000, 1200):
+            model.add_conm2(eid, 1, 1.5)
+        stdout = StringIO()
+        with self.assertRaises(TypeError), redirect_stdout(stdout):
+            model.write_bdf(StringIO(), size=8)
+        self.assertIn('failed printing masses...type=CONM2 eid=108', stdout.getvalue())
+
+    def test_write_split_includes(self):
+        """tests writing the sections to include files"""
+        model = BDF(debug=None)
+        model.add_grid(1, [0., 0., 0.])
+        model.add_grid(2, [1., 0., 0.])
+        model.add_grid(3, [1., 1., 0.])
+        model.add_grid(4, [0., 1., 0.])
+        model.add_cquad4(1, 1, [1, 2, 3, 4])
+        model.add_conm2(2, 3, 1.0)
+        pshell = model.add_pshell(1, mid1=1, t=0.1)
+        model.add_mat1(1, 3.0e7, None, 0.3)
+        model.add_force(2, 3, 1.0, [0., 0., 1.])
+        model.add_spc1(1, '123456', [1, 4])
+        model.add_param('POST', -1)
+        bdf_filename = 'split.bdf'
+        model.write_bdf(bdf_filename, split_includes=True, nworkers=2)
+
+        sections = ['nodes', 'elements', 'properties', 'materials', 'loads', 'constraints']
+        filenames = ['split_%s.inc' % section for section in sections]
+        for filename in filenames:
+            assert os.path.exists(filename), filename
+        model2 = read_bdf(bdf_filename, punch=True, debug=None)
+        for name in ['params', 'nodes', 'elements', 'masses', 'properties', 'materials',
+                     'loads', 'spcs']:
+            assert len(getattr(model2, name)) == len(getattr(model, name)), name
+
+        # only the properties are rewritten
+        old_ns = os.stat(filenames[0]).st_mtime_ns - 10**9
+        for filename in filenames:
+            os.utime(filename, ns=(old_ns, old_ns))
+        pshell.t = 0.2
+        model.write_bdf(bdf_filename, split_includes=True)
+        for section, filename in zip(sections, filenames):
+            is_changed = os.stat(filename).st_mtime_ns != old_ns
+            assert is_changed == (section == 'properties'), (section, is_changed)
+        model2 = read_bdf(bdf_filename, punch=True, debug=None)
+        assert model2.properties[1].t == 0.2, model2.properties[1]
+
+        # an empty section isn't INCLUDEd
+        model.spcs = {}
+        model.write_bdf(bdf_filename, split_includes=True)
+        assert filenames[-1] not in model._split_include_hashes
+        model2 = read_bdf(bdf_filename, punch=True, debug=None)
+        assert len(model2.spcs) == 0, model2.spcs
+
+        # the comments added by reading the include files aren't written,
+        # so a read/write loop doesn't change the include files
+        with open(filenames[0], 'r') as include_file:
+            nodes_msg = include_file.read()
+        for unused_i in range(2):
+            for filename in filenames[:-1]:
+                os.utime(filename, ns=(old_ns, old_ns))
+            model2.write_bdf(bdf_filename, split_includes=True)
+            for filename in filenames[:-1]:
+                assert os.stat(filename).st_mtime_ns == old_ns, filename
+            model2 = read_bdf(bdf_filename, punch=True, debug=None)
+        with open(filenames[0], 'r') as include_file:
+            assert include_file.read() == nodes_msg
+
+        # superelements are written to a single file
+        os.remove(bdf_filename)
+        for filename in filenames:
+            os.remove(filename)
+        model.superelement_models[1] = BDF(debug=None)
+        model.superelement_models[1].add_grid(10, [0., 0., 1.])
+        model.write_bdf(bdf_filename, split_includes=True)
+        for filename in filenames:
+            assert not os.path.exists(filename), filename
+        os.remove(bdf_filename)
+
     def test_solid_shell_bar_buckling(self):
         bdf_filename = os.path.join(ROOT_PATH, '..', 'models',
                                     'sol_101_elements', 'buckling_solid_shell_bar.bdf')
@@ -1,4 +1,6 @@
-from typing import List
+import re
+from functools import lru_cache
+from typing import List, Tuple, Optional, Union
 import numpy as np
 from pyNastran.utils import object_attributes
 
@@ -119,6 +121,271 @@ def write_floats_8p1e(vals: List[float]) -> List[str]:
             vals2.append('%8.1E' % val)
     return vals2
 
+#: the fields of the float columns that are written as Nastran 13.6 floats
+#: and the way 0.0 is written (the null bytes are removed)
+_FLOAT_13E_ZEROS = {
+    '%-13s': b' 0.0' + b' ' * 9,
+    '%13s': b' ' * 9 + b' 0.0',
+    '%s': b' 0.0' + b'\x00' * 9,
+    '%-s': b' 0.0' + b'\x00' * 9,
+}
+_FIELD_REGEX = re.compile(r'%[-+ #0]*\d*(?:\.\d+)?[a-zA-Z%]')
+_INT_FIELD_REGEX = re.compile(r'%(-?)(\d*)[id]$')
+
+#: smaller blocks are formatted one line at a time
+NROWS_VECTORIZE = 250
+
+def write_f06_lines(line_fmts: Union[str, List[str]], columns: List[np.ndarray],
+                    ifmt: Optional[np.ndarray]=None) -> str:
+    """
+    Writes a block of f06 lines.  This is the vectorized version of
+    calling ``write_floats_13e`` and formatting the lines one at a time.
+
+    The lines are assembled as an (nrows, nchars) character array.  The
+    '%-13s', '%13s' and '%s' fields of the float columns are written as
+    Nastran 13.6 floats (e.g., 0.0 is written as ' 0.0'), which are
+    calculated from the mantissa/exponent of the values.  The other fields
+    use the standard string formatting.
+
+    Parameters
+    ----------
+    line_fmts : str / List[str]
+        the format of a line (e.g., '%14i %6s     %-13s  %s\\n');
+        all the line formats have one field per column
+    columns : List[(nrows, ) ndarray]
+        the values for each field of the line
+    ifmt : (nrows, ) int ndarray; default=None
+        the index of the line format for each row;
+        None : use line_fmts for all the rows
+
+    Returns
+    -------
+    lines : str
+        the formatted lines
+
+    """
+    if isinstance(line_fmts, str):
+        line_fmts = [line_fmts]
+    if ifmt is None:
+        assert len(line_fmts) == 1, 'ifmt is required for multiple line formats'
+    columns = [np.asarray(column) for column in columns]
+    for line_fmt in line_fmts:
+        nfields = len(_parse_line_format(line_fmt)[1])
+        if nfields != len(columns):
+            raise ValueError('line_fmt=%r has %i fields, but there are %i columns' % (
+                line_fmt, nfields, len(columns)))
+
+    nrows = len(columns[0])
+    if nrows == 0:
+        return ''
+    if nrows < NROWS_VECTORIZE:
+        return _write_f06_lines_loop(line_fmts, columns, ifmt)
+
+    if ifmt is None:
+        chars = _get_line_chars(line_fmts[0], columns)
+    else:
+        blocks = []
+        for i, line_fmt in enumerate(line_fmts):
+            irows = np.where(ifmt == i)[0]
+            if len(irows):
+                blocks.append((irows, _get_line_chars(
+                    line_fmt, [column[irows] for column in columns])))
+        nchars = max(block.shape[1] for unused_irows, block in blocks)
+        chars = np.zeros((nrows, nchars), dtype='uint8')
+        for irows, block in blocks:
+            chars[irows, :block.shape[1]] = block
+    return chars.tobytes().replace(b'\x00', b'').decode('latin1')
+
+def _write_f06_lines_loop(line_fmts: List[str], columns: List[np.ndarray],
+                          ifmt: Optional[np.ndarray]) -> str:
+    """formats the lines one at a time"""
+    is_float = [column.dtype.kind == 'f' for column in columns]
+    is_13e_fields = []
+    for line_fmt in line_fmts:
+        fields = _parse_line_format(line_fmt)[1]
+        is_13e_fields.append([is_floati and field[-1] == 's'
+                              for is_floati, field in zip(is_float, fields)])
+
+    lines = []
+    ifmts = [0] * len(columns[0]) if ifmt is None else ifmt.tolist()
+    for ifmti, row in zip(ifmts, zip(*[column.tolist() for column in columns])):
+        values = [write_float_13e(value) if is_13e else value
+                  for value, is_13e in zip(row, is_13e_fields[ifmti])]
+        lines.append(line_fmts[ifmti] % tuple(values))
+    return ''.join(lines)
+
+@lru_cache(maxsize=None)
+def _parse_line_format(line_fmt: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Splits a line format into the constant text and the fields,
+    where there is one more literal than field
+    """
+    literals = []
+    fields = []
+    literal = ''
+    i0 = 0
+    for match in _FIELD_REGEX.finditer(line_fmt):
+        literal += line_fmt[i0:match.start()]
+        i0 = match.end()
+        field = match.group()
+        if field == '%%':
+            literal += '%'
+            continue
+        literals.append(literal)
+        fields.append(field)
+        literal = ''
+    literals.append(literal + line_fmt[i0:])
+    return tuple(literals), tuple(fields)
+
+def _get_line_chars(line_fmt: str, columns: List[np.ndarray]) -> np.ndarray:
+    """gets the (nrows, nchars) characters of the lines"""
+    nrows = len(columns[0])
+    literals, fields = _parse_line_format(line_fmt)
+
+    # the 13.6 floats are calculated together
+    field_chars = [None] * len(fields)
+    ifields_13e = [ifield for ifield, (field, column) in enumerate(zip(fields, columns))
+                   if column.dtype.kind == 'f' and field in _FLOAT_13E_ZEROS]
+    if ifields_13e:
+        values = np.column_stack([columns[ifield] for ifield in ifields_13e])
+        chars_13e = _get_float_13e_chars(values)
+        if chars_13e is not None:
+            is_zero = values == 0.
+            for i, ifield in enumerate(ifields_13e):
+                chars = chars_13e[:, i, :]
+                chars[is_zero[:, i], :] = np.frombuffer(
+                    _FLOAT_13E_ZEROS[fields[ifield]], dtype='uint8')
+                field_chars[ifield] = chars
+
+    pieces = []
+    for literal, field, column, chars in zip(literals, fields, columns, field_chars):
+        if literal:
+            pieces.append(_get_literal_chars(literal, nrows))
+        pieces.append(_get_field_chars(field, column) if chars is None else chars)
+    if literals[-1]:
+        pieces.append(_get_literal_chars(literals[-1], nrows))
+    return np.hstack(pieces)
+
+def _get_literal_chars(literal: str, nrows: int) -> np.ndarray:
+    """gets the (nrows, nchars) characters of the constant text"""
+    chars = np.frombuffer(literal.encode('latin1'), dtype='uint8')
+    return np.broadcast_to(chars, (nrows, len(chars)))
+
+def _get_field_chars(field: str, column: np.ndarray) -> np.ndarray:
+    """gets the (nrows, nchars) characters of a field, which are padded with null bytes"""
+    kind = column.dtype.kind
+    if kind == 'f':
+        if field[-1] == 's':
+            strings = [field % write_float_13e(value) for value in column.tolist()]
+        else:
+            strings = [field % value for value in column.tolist()]
+        return _strings_to_chars(strings)
+
+    if kind in 'iu':
+        match = _INT_FIELD_REGEX.match(field)
+        if match:
+            is_left, width = match.groups()
+            return _get_int_chars(column, int(width) if width else 0, bool(is_left))
+
+    # the ids/names only need to be formatted once
+    unique_values, inverse = np.unique(column, return_inverse=True)
+    chars = _strings_to_chars([field % value for value in unique_values.tolist()])
+    return chars[inverse, :]
+
+def _strings_to_chars(strings: List[str]) -> np.ndarray:
+    """gets the (nrows, nchars) characters, which are padded with null bytes"""
+    return np.array(strings, dtype='S').view('uint8').reshape(len(strings), -1)
+
+def _get_int_chars(values: np.ndarray, width: int, is_left: bool) -> np.ndarray:
+    """
+    Gets the (nrows, nchars) characters of the '%i' formatted values
+    (e.g., '%8i', '%-8i'), which are padded with null bytes
+    """
+    values = values.astype('int64', copy=False)
+    nrows = len(values)
+    is_negative = values < 0
+    abs_values = np.abs(values)
+    ndigits = np.ones(nrows, dtype='int64')
+    power = 10
+    max_value = abs_values.max()
+    while power <= max_value:
+        ndigits += abs_values >= power
+        power *= 10
+    nchars_number = ndigits + is_negative
+    nchars_field = np.maximum(nchars_number, width)
+
+    irows = np.arange(nrows)
+    chars = np.zeros((nrows, nchars_field.max()), dtype='uint8')
+    if is_left:
+        ilast = nchars_number - 1
+        for i in range(width):
+            chars[nchars_number <= i, i] = ord(' ')
+    else:
+        ilast = nchars_field - 1
+        for i in range(width):
+            chars[nchars_field - nchars_number > i, i] = ord(' ')
+    for idigit in range(ndigits.max()):
+        is_digit = ndigits > idigit
+        chars[irows[is_digit], ilast[is_digit] - idigit] = (
+            ord('0') + (abs_values[is_digit] // 10 ** idigit) % 10)
+    chars[irows[is_negative], ilast[is_negative] - ndigits[is_negative]] = ord('-')
+    return chars
+
+def _get_float_13e_chars(values: np.ndarray) -> Optional[np.ndarray]:
+    """
+    Gets the (..., 13) characters of the '%13.6E' formatted values.
+
+    The 7 digits are calculated with floats, so the values that are close
+    to being halfway between two 7 digit numbers and the nan/inf values
+    use the standard string formatting.  The 0.0 values are not set.
+
+    Returns None for 3 digit exponents.
+    """
+    shape = values.shape
+    values = values.astype('float64', copy=False).ravel()
+    is_zero = values == 0.
+    is_number = np.isfinite(values) & ~is_zero
+    abs_values = np.where(is_number, np.abs(values), 1.)
+    exponent = np.floor(np.log10(abs_values)).astype('int64')
+    if np.abs(exponent).max() >= 99:
+        return None
+    mantissa = abs_values * 10. ** (6 - exponent)
+    is_halfway = _is_halfway(mantissa)
+
+    # the log10 estimate of the exponent may be off by one
+    is_small = mantissa < 999999.5
+    is_big = mantissa >= 9999999.5
+    if is_small.any() or is_big.any():
+        exponent[is_small] -= 1
+        exponent[is_big] += 1
+        mantissa = abs_values * 10. ** (6 - exponent)
+        is_halfway |= _is_halfway(mantissa)
+
+    digits = np.rint(mantissa).astype('int64')
+
+    chars = np.empty((len(values), 13), dtype='uint8')
+    chars[:, 0] = np.where(values < 0., ord('-'), ord(' '))
+    chars[:, 1] = ord('0') + digits // 1000000
+    chars[:, 2] = ord('.')
+    for i in range(6):
+        chars[:, 3 + i] = ord('0') + (digits // 10 ** (5 - i)) % 10
+    chars[:, 9] = ord('E')
+    chars[:, 10] = np.where(exponent < 0, ord('-'), ord('+'))
+    abs_exponent = np.abs(exponent)
+    chars[:, 11] = ord('0') + abs_exponent // 10
+    chars[:, 12] = ord('0') + abs_exponent % 10
+
+    for i in np.where((is_halfway & is_number) | ~(is_number | is_zero))[0]:
+        value_str = '%13.6E' % values[i]
+        if len(value_str) != 13:
+            return None
+        chars[i, :] = np.frombuffer(value_str.encode('latin1'), dtype='uint8')
+    return chars.reshape(shape + (13, ))
+
+def _is_halfway(mantissa: np.ndarray) -> np.ndarray:
+    """are the values close to being halfway between two integers"""
+    return np.abs(mantissa - np.floor(mantissa) - 0.5) < 1e-6
+
 def _eigenvalue_header(obj, header, itime: int, ntimes: int, dt):
     if obj.nonlinear_factor not in (None, np.nan):
         name = obj.data_code['name']
@@ -1,8 +1,9 @@
 import unittest
+import numpy as np
 from pyNastran.f06.f06_formatting import (
     write_floats_8p4f, write_floats_8p1e,
-    write_floats_10e, write_floats_12e,
-    write_imag_floats_13e)
+    write_floats_10e, write_floats_12e, write_floats_13e,
+    write_imag_floats_13e, write_f06_lines)
 from pyNastran.f06.f06_writer import (
     make_end, sorted_bulk_data_header, make_f06_header, make_stamp)
 
@@ -165,6 +166,46 @@ class TestF06Formatting(unittest.TestCase):
                          msg='\nimag %s+%sj:\nactual  =%r len(actual)=%i\nexpected=%r len(expected)=%i' % (
             val.real, val.imag, actual_imag, len(actual_imag), actual_imag, len(expected_imag)))
 
+    def test_write_f06_lines(self):
+        """testing write_f06_lines against write_floats_13e"""
+        nrows = 1000
+        nids = np.arange(1, nrows + 1, dtype='int32')
+        nids[-1] = -42
+        gridtypes = np.array(['G', 'S'] * (nrows // 2))
+        values = np.random.uniform(-1e5, 1e5, size=(nrows, 3)).astype('float32')
+        values[::3, 0] = 0.
+        values[1, 1] = -0.
+        values[2, :] = [np.nan, np.inf, 123456.75]
+        values[3, :] = [9.9999995, 999999.5, 1e-7]
+        values[4, :] = [1.e-37, 1.e37, 0.5]
+
+        line_fmts = [
+            '%14i %6s     %-13s  %13s  %s\n',
+            '%14i %6s     %s%.0s%.0s\n',
+        ]
+        ifmt = (gridtypes == 'S').astype('int32')
+        expected = []
+        for nid, gridtype, row, ifmti in zip(nids, gridtypes, values, ifmt):
+            line_fmt = line_fmts[ifmti]
+            expected.append(line_fmt % tuple([nid, gridtype] + write_floats_13e(row)))
+        expected = ''.join(expected)
+
+        columns = [nids, gridtypes] + [values[:, i] for i in range(3)]
+        actual = write_f06_lines(line_fmts, columns, ifmt=ifmt)
+        self.assertEqual(actual, expected)
+        self.assertEqual(write_f06_lines(line_fmts, [column[:10] for column in columns],
+                                         ifmt=ifmt[:10]),
+                         expected[:expected.index('\n%14i' % 11) + 1])
+
+        # 3 digit exponents
+        values = np.array([1.e-120, 2.5, 1.e120])
+        actual = write_f06_lines('%-13s|%13s\n', [values, values])
+        expected = ''.join(['%-13s|%13s\n' % (value, value)
+                            for value in write_floats_13e(values)])
+        self.assertEqual(actual, expected)
+        with self.assertRaises(ValueError):
+            write_f06_lines('%-13s|%13s\n', [values])
+
     def test_make_end(self):
         """miscellaneous F06 tester"""
         make_end(end_flag=True, options=None)
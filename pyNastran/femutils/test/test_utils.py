@@ -13,7 +13,8 @@ from numpy.testing import assert_equal, assert_array_equal
 import pyNastran
 from pyNastran.femutils.io import loadtxt_nice, savetxt_nice
 from pyNastran.femutils.matrix3d import dot_n33_n33, transpose3d, triple_n33_n33, triple_n33_33
-from pyNastran.femutils.utils import augmented_identity, perpendicular_vector, perpendicular_vector2d
+from pyNastran.femutils.utils import (
+    augmented_identity, perpendicular_vector, perpendicular_vector2d, concatenate_ranges)
 from pyNastran.femutils.coord_transforms import cylindrical_rotation_matrix
 
 from pyNastran.femutils.test.utils import is_array_close
@@ -222,6 +223,14 @@ class TestNumpyUtils(unittest.TestCase):
         msg = 'expected:\n%s\nactual:\n%s' % (expected_array, actual_array)
         assert np.array_equal(expected_array, actual_array), msg
 
+    def test_concatenate_ranges(self):
+        """tests concatenate_ranges"""
+        starts = np.array([5, 0, 10, 3])
+        counts = np.array([2, 3, 0, 1])
+        expected = np.hstack([np.arange(start, start + count)
+                              for start, count in zip(starts, counts)])
+        assert_array_equal(concatenate_ranges(starts, counts), expected)
+
 class TestFemIO(unittest.TestCase):
     """tests functions in femutils.io"""
 
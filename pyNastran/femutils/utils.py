@@ -6,6 +6,7 @@ This includes:
  - row_col_pairs, optional_index, optional_inverse = unique_rows(
        return_index=False, return_inverse=False):
  - augmented_identity(A)
+ - indices = concatenate_ranges(starts, counts)
 
 """
 import numpy as np
@@ -95,6 +96,14 @@ def is_monotonic(int_array):
     """is the array monotonic?"""
     return np.all(int_array[1:] >= int_array[:-1])
 
+def concatenate_ranges(starts, counts):
+    """
+    Vectorized version of:
+    np.hstack([np.arange(start, start + count) for start, count in zip(starts, counts)])
+    """
+    ends = np.cumsum(counts)
+    return np.arange(ends[-1]) + np.repeat(starts - ends + counts, counts)
+
 def unique_rows(A, return_index=False, return_inverse=False):
     """
     Similar to MATLAB's unique(A, 'rows'), this returns B, I, J
@@ -107,7 +107,10 @@ class FortranFormat:
         if self.read_mode == 2:
             self.ntotal = 0
 
-            data, ndata = op2_reader._read_record_ndata()
+            if op2_reader.mmap is not None:
+                data, ndata = op2_reader._read_record_ndata_mmap()
+            else:
+                data, ndata = op2_reader._read_record_ndata()
             n = table4_parser(data, ndata)
             assert isinstance(n, integer_types), self.table_name
 
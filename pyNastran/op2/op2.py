@@ -5,7 +5,17 @@ Defines the main OP2 class.  Defines:
  - read_op2(op2_filename=None, combine=True, subcases=None,
             exclude_results=None, include_results=None,
             log=None, debug=True, debug_file=None, build_dataframe=False,
-            skip_undefined_matrices=True, mode='msc', encoding=None)
+            skip_undefined_matrices=True, mode='msc', encoding=None,
+            use_index=False, use_mmap=False, nworkers=1)
+
+ - iter_op2_results(op2_filename, ntimes=100, combine=True, subcases=None,
+                    exclude_results=None, include_results=None,
+                    log=None, debug=True, skip_undefined_matrices=True,
+                    mode=None, encoding=None, use_index=False)
+ - read_op2_many(op2_filenames, combine_runs='stack', subcases=None,
+                 exclude_results=None, include_results=None,
+                 log=None, debug=True, skip_undefined_matrices=True,
+                 mode=None, encoding=None, nworkers=1)
 
  - OP2(debug=True, log=None, debug_file=None, mode='msc')
    - build_dataframe()
@@ -13,9 +23,12 @@ Defines the main OP2 class.  Defines:
    - create_objects_from_matrices()
    - object_attributes(mode='public', keys_to_skip=None, filter_properties=False)
    - object_methods(mode='public', keys_to_skip=None)
+   - open_lazy(op2_filename, combine=True, skip_undefined_matrices=False,
+               encoding=None, use_index=False)
    - print_subcase_key()
    - read_op2(op2_filename=None, combine=True, build_dataframe=False,
-              skip_undefined_matrices=False, encoding=None)
+              skip_undefined_matrices=False, encoding=None, use_index=False,
+              use_mmap=False, nworkers=1)
    - set_mode(mode)
    - transform_displacements_to_global(i_transform, coords, xyz_cid0=None, debug=False)
    - transform_gpforce_to_global(nids_all, nids_transform, i_transform, coords, xyz_cid0=None)
@@ -25,7 +38,7 @@ from __future__ import annotations
 import sys
 from collections import defaultdict
 from pickle import load, dump, dumps
-from typing import List, Dict, Tuple, Optional, Any, TYPE_CHECKING
+from typing import List, Dict, Tuple, Optional, Iterator, Any, TYPE_CHECKING
 
 import numpy as np
 
@@ -42,8 +55,16 @@ from pyNastran.op2.errors import (SortCodeError, DeviceCodeError,
 from pyNastran.op2.writer.op2_writer import OP2Writer
 #from pyNastran.op2.op2_interface.op2_f06_common import Op2F06Attributes
 from pyNastran.op2.op2_interface.op2_scalar import OP2_Scalar
+from pyNastran.op2.op2_interface.op2_lazy import (
+    LazyScan, LazyResult, make_lazy, unmake_lazy, get_lazy_item)
+from pyNastran.op2.op2_interface.op2_index import OP2Index, LAYOUT_MODEL_ATTRS
+from pyNastran.op2.op2_interface.op2_parallel import (
+    read_results_parallel, read_runs, _get_filters, _get_header, _set_header,
+    _reset_nan_nonlinear_factor)
+from pyNastran.op2.op2_interface import op2_combine
 from pyNastran.op2.op2_interface.transforms import (
     transform_displacement_to_global, transform_gpforce_to_globali)
+from pyNastran.bdf.bdf_interface.coord_engine import CoordTransformEngine
 from pyNastran.utils import check_path
 if TYPE_CHECKING:  # pragma: no cover
     from h5py import File as H5File
@@ -525,7 +546,11 @@ class OP2(OP2_Scalar, OP2Writer):
                  combine: bool=True,
                  build_dataframe: Optional[bool]=False,
                  skip_undefined_matrices: bool=False,
-                 encoding: Optional[str]=None) -> None:
+                 encoding: Optional[str]=None,
+                 use_index: bool=False,
+                 use_mmap: bool=False,
+                 nworkers: int=1,
+                 combine_superelements: bool=False) -> None:
         """
         Starts the OP2 file reading
 
@@ -547,6 +572,23 @@ class OP2(OP2_Scalar, OP2Writer):
              True : prevents matrix reading crashes
         encoding : str
             the unicode encoding (default=None; system default)
+        use_index : bool; default=False
+            writes a table-of-contents sidecar (model.op2.toc) on the
+            first read, which stores the record offsets and the sized
+            result objects.  Later reads build the result objects from
+            it, so the array sizing pass (read_mode=1) is skipped and
+            only the records are read.  The sidecar is rebuilt if the
+            OP2's size or mtime changes.
+        use_mmap : bool; default=False
+            memory maps the OP2, so the results records are sliced from
+            the mapping instead of being read/copied into bytes
+        nworkers : int; default=1
+            the number of processes used to decode the results tables;
+            the OP2 is scanned once (see ``open_lazy``) and the results
+            are split across the workers, which seek to their records
+        combine_superelements : bool; default=False
+            merges the results of the superelements of a subcase into
+            one object (requires combine=True; see ``combine_results``)
 
         """
         if op2_filename:
@@ -557,6 +599,15 @@ class OP2(OP2_Scalar, OP2Writer):
             if ipython_info():
                 build_dataframe = True
 
+        if nworkers > 1 or use_index:
+            self._read_op2_lazy(op2_filename, nworkers, combine=combine,
+                                build_dataframe=build_dataframe,
+                                skip_undefined_matrices=skip_undefined_matrices,
+                                encoding=encoding, use_index=use_index,
+                                use_mmap=use_mmap,
+                                combine_superelements=combine_superelements)
+            return
+
         if encoding is None:
             encoding = sys.getdefaultencoding()
         self.encoding = encoding
@@ -572,11 +623,13 @@ class OP2(OP2_Scalar, OP2Writer):
         load_as_h5 = False
         if hasattr(self, 'load_as_h5'):
             load_as_h5 = self.load_as_h5
+        self.op2_reader.use_mmap = use_mmap
 
         try:
             # get GUI object names, build objects, but don't read data
             table_names = OP2_Scalar.read_op2(self, op2_filename=op2_filename,
-                                              load_as_h5=load_as_h5, mode=mode)
+                                              load_as_h5=load_as_h5, mode=mode,
+                                              use_index=use_index)
             self.table_names = table_names
 
             # TODO: stuff to figure out objects
@@ -596,10 +649,380 @@ class OP2(OP2_Scalar, OP2Writer):
         if build_dataframe:
             self.build_dataframe()
         self.create_objects_from_matrices()
-        self.combine_results(combine=combine)
+        self.combine_results(combine=combine, combine_superelements=combine_superelements)
         self.log.debug('finished reading op2')
         str(self.op2_results)
 
+    def _read_op2_lazy(self, op2_filename: str, nworkers: int,
+                       combine: bool=True,
+                       build_dataframe: bool=False,
+                       skip_undefined_matrices: bool=False,
+                       encoding: Optional[str]=None,
+                       use_index: bool=False,
+                       use_mmap: bool=False,
+                       combine_superelements: bool=False) -> None:
+        """
+        reads the OP2 with the lazy scan (see ``open_lazy``) and decodes
+        the results tables with ``nworkers`` processes
+        """
+        self._scan_lazy(op2_filename, skip_undefined_matrices=skip_undefined_matrices,
+                        encoding=encoding, use_index=use_index, use_mmap=use_mmap)
+        if nworkers > 1:
+            read_results_parallel(self, nworkers)
+        else:
+            self._load_lazy_results()
+        if build_dataframe:
+            self.build_dataframe()
+        self.create_objects_from_matrices()
+        self.combine_results(combine=combine, combine_superelements=combine_superelements)
+        self.log.debug('finished reading op2')
+        str(self.op2_results)
+
+    def open_lazy(self, op2_filename: str,
+                  combine: bool=True,
+                  skip_undefined_matrices: bool=False,
+                  encoding: Optional[str]=None,
+                  use_index: bool=False) -> None:
+        """
+        Opens the OP2, but only reads the result data when it's first used.
+
+        The array sizing pass is run, so the result objects exist, but they
+        are turned into a ``LazyResult`` (a subclass of their real class).
+        Accessing the data (e.g., ``model.cquad4_stress[1].data``) reads the
+        table 4 records for that result only.
+
+        Parameters
+        ----------
+        op2_filename : str
+            the op2_filename
+        combine : bool; default=True
+            True : objects are isubcase based
+            False : objects are (isubcase, subtitle) based;
+                    will be used for superelements regardless of the option
+        skip_undefined_matrices : bool; default=False
+             True : prevents matrix reading crashes
+        encoding : str
+            the unicode encoding (default=None; system default)
+        use_index : bool; default=False
+            uses/creates the table-of-contents sidecar (model.op2.toc);
+            the scan is skipped if it's valid
+
+        """
+        check_path(op2_filename, name='op2_filename')
+        self._scan_lazy(op2_filename, skip_undefined_matrices=skip_undefined_matrices,
+                        encoding=encoding, use_index=use_index)
+        self.create_objects_from_matrices()
+        self.combine_results(combine=combine)
+        self.log.debug('finished scanning op2')
+
+    def _scan_lazy(self, op2_filename: Optional[str],
+                   skip_undefined_matrices: bool=False,
+                   encoding: Optional[str]=None,
+                   use_index: bool=False,
+                   use_mmap: bool=False) -> None:
+        """
+        Runs the array sizing pass and turns the result objects into a
+        LazyResult (see ``open_lazy``).  The results are not combined.
+        With ``use_index``, the result objects are stored in the
+        table-of-contents sidecar, so the sizing pass is skipped next time.
+        """
+        if encoding is None:
+            encoding = sys.getdefaultencoding()
+        self.encoding = encoding
+        self.op2_reader.use_mmap = use_mmap
+
+        self.skip_undefined_matrices = skip_undefined_matrices
+        self.is_vectorized = True
+        if use_index:
+            op2_filename = self._validate_op2_filename(op2_filename)
+            op2_index = OP2Index(op2_filename, self.log)
+            if (op2_index.load() and op2_index.layout is not None and
+                    op2_index.layout['filters'] == _get_filters(self)):
+                self._read_index_layout(op2_index)
+                return
+
+        self.log.debug('-------- scanning op2 with read_mode=1 (array sizing) --------')
+        self.read_mode = 1
+        self._close_op2 = False
+
+        lazy_scan = LazyScan()
+        self.op2_reader.lazy_scan = lazy_scan
+        try:
+            table_names = OP2_Scalar.read_op2(self, op2_filename=op2_filename,
+                                              mode=self.mode, use_index=use_index)
+            self.table_names = table_names
+
+            # the record lengths found by the scan are reused to size
+            # the records of a lazy result (e.g., a block of time steps)
+            self.op2_reader.op2_index.is_loaded = True
+
+            # tables that can't be lazily loaded (e.g., geometry, eigenvalues)
+            self.read_mode = 2
+            self.log.debug('-------- reading non-lazy tables with read_mode=2 --------')
+
+            # the optimization count is incremented by the R1TABRG/DESCYC
+            # tables, which are read eagerly
+            self._count = 0
+            for table_name, n in lazy_scan.get_eager_tables():
+                self.op2_reader._goto(n)
+                self.table_name = table_name
+                self._read_table(table_name)
+        except FileNotFoundError:
+            raise
+        except Exception:
+            OP2_Scalar.close_op2(self, force=True)
+            raise
+        self.op2_reader.close_mmap()
+        self.f.close()
+        self.f = None
+        self.op2_reader.lazy_scan = None
+
+        self._create_lazy_results(lazy_scan)
+        self._finalize()
+        if use_index:
+            op2_index = self.op2_reader.op2_index
+            op2_index.layout = self._get_index_layout(lazy_scan)
+            op2_index.write()
+
+    def _get_index_layout(self, lazy_scan: LazyScan) -> Dict[str, Any]:
+        """
+        Gets the sized result objects of the lazy scan, which are stored
+        in the table-of-contents sidecar (see ``_read_index_layout``)
+        """
+        codes = {}
+        results = []
+        for result_name in self.get_table_types():
+            result = self.get_result(result_name)
+            if not isinstance(result, dict):
+                continue
+            codes[result_name] = list(result)
+            for obj in result.values():
+                if isinstance(obj, LazyResult):
+                    results.append(get_lazy_item(obj))
+
+        layout = {
+            'filters' : _get_filters(self),
+            'header' : _get_header(self),
+            'tables' : lazy_scan.tables,
+            'model' : {name: getattr(self, name) for name in LAYOUT_MODEL_ATTRS},
+            'codes' : codes,
+            'results' : results,
+        }
+        return layout
+
+    def _read_index_layout(self, op2_index: OP2Index) -> None:
+        """
+        Creates the LazyResults from the layout stored in the
+        table-of-contents sidecar, so the array sizing pass isn't run.
+        Only the tables that can't be lazily loaded are read.
+        """
+        layout = op2_index.layout
+        self.log.debug('-------- reading the layout of the op2 index --------')
+        self._read_lazy_header(op2_index.op2_filename, encoding=self.encoding,
+                               use_mmap=self.op2_reader.use_mmap)
+        _set_header(self, layout['header'])
+        self.op2_reader.op2_index = op2_index
+
+        tables = layout['tables']
+        self.table_names = [table_name for table_name, unused_n, unused_is_lazy in tables]
+        self.table_count = defaultdict(int)
+        self._open_lazy_records()
+        try:
+            # the tables that weren't lazily loaded are sized and then read
+            for read_mode in [1, 2]:
+                self.read_mode = read_mode
+                self._count = 0
+                for table_name, n, is_lazy in tables:
+                    if read_mode == 1:
+                        self.table_count[table_name] += 1
+                    if is_lazy:
+                        continue
+                    self.op2_reader._goto(n)
+                    self.table_name = table_name
+                    self._read_table(table_name)
+        finally:
+            self.op2_reader.close_mmap()
+            self.f.close()
+            self.f = None
+
+        for name, value in layout['model'].items():
+            setattr(self, name, value)
+        for result_name, code, obj_class, obj_state, records in layout['results']:
+            obj = obj_class.__new__(obj_class)
+            obj.__dict__.update(obj_state)
+            _reset_nan_nonlinear_factor(obj)
+            self.get_result(result_name)[code] = make_lazy(
+                obj, self, result_name, code, records)
+
+        # the results are put back in the order of the scan
+        for result_name, codes in layout['codes'].items():
+            result = self.get_result(result_name)
+            objs = dict(result)
+            result.clear()
+            for code in codes:
+                if code in objs:
+                    result[code] = objs.pop(code)
+            result.update(objs)
+        self._finalize()
+
+    def _load_lazy_results(self) -> None:
+        """reads the records of the LazyResults of a model opened with ``_scan_lazy``"""
+        self.read_mode = 2
+        self._open_lazy_records()
+        try:
+            for result_name in self.get_table_types():
+                result = self.get_result(result_name)
+                if not isinstance(result, dict):
+                    continue
+                for obj in list(result.values()):
+                    if not isinstance(obj, LazyResult):
+                        continue
+                    unused_result_name, code, records = unmake_lazy(obj)
+                    self.op2_reader.read_lazy_records(records, count=_get_count(code))
+                    if hasattr(obj, 'finalize'):
+                        obj.finalize()
+        finally:
+            self._close_lazy_records()
+
+    def _read_lazy_header(self, op2_filename: str,
+                          encoding: Optional[str]=None,
+                          use_mmap: bool=False) -> None:
+        """
+        Reads the OP2 header (endian, record size, Nastran version), which
+        is all that's needed to read the records of a result created with
+        ``make_lazy``; the tables aren't scanned
+        """
+        if encoding is None:
+            encoding = sys.getdefaultencoding()
+        self.encoding = encoding
+        self.is_vectorized = True
+        self.op2_filename = op2_filename
+        self.read_mode = 1
+        self._create_binary_debug()
+        self._setup_op2()
+        try:
+            self.op2_reader.read_nastran_version(self.mode)
+        finally:
+            self.f.close()
+            self.f = None
+            self.del_structs()
+        self.op2_reader.use_mmap = use_mmap
+
+    def _open_lazy_records(self) -> None:
+        """opens the OP2 to read the records of a LazyResult"""
+        self._set_structs(self.op2_reader.size)
+        self.f = open(self.op2_filename, 'rb')
+        if self.op2_reader.use_mmap:
+            self.op2_reader.open_mmap()
+
+    def _close_lazy_records(self) -> None:
+        """closes the OP2 after reading the records of a LazyResult"""
+        self.op2_reader.close_mmap()
+        self.f.close()
+        self.f = None
+        self.del_structs()
+
+    def _create_lazy_results(self, lazy_scan: LazyScan) -> None:
+        """turns the result objects that haven't been filled into a LazyResult"""
+        result_types = self.get_table_types()
+        for result_type in result_types:
+            result = self.get_result(result_type)
+            if not isinstance(result, dict):
+                continue
+            for code, obj in list(result.items()):
+                if lazy_scan.is_lazy(obj):
+                    make_lazy(obj, self, result_type, code, lazy_scan.get_records(obj))
+
+    def _load_lazy_result(self, obj: LazyResult) -> None:
+        """
+        reads the table 4 records for a result opened with ``open_lazy``
+        and swaps it back to its real class
+        """
+        result_name, code, records = unmake_lazy(obj)
+        result = self.get_result(result_name)
+
+        # the key may have been changed by combine_results, so we put
+        # the object back under the key the table 4 reader expects
+        keys = [key for key, value in result.items() if value is obj]
+        key = keys[0] if keys else code
+        if key in result:
+            del result[key]
+        result[code] = obj
+
+        self.log.debug(f'loading {result_name}[{key!r}]')
+        self.read_mode = 2
+        self._open_lazy_records()
+        try:
+            self.op2_reader.read_lazy_records(records, count=_get_count(code))
+        except Exception:
+            del result[code]
+            result[key] = make_lazy(obj, self, result_name, code, records)
+            raise
+        finally:
+            self._close_lazy_records()
+
+        del result[code]
+        result[key] = obj
+        if hasattr(obj, 'finalize'):
+            obj.finalize()
+
+    def _iter_lazy_results(self, ntimes: int) -> Iterator[Tuple[str, Any, Any]]:
+        """
+        Yields the results of a model opened with ``_scan_lazy``.  SORT1
+        results are read in chunks of ``ntimes`` time steps.  SORT2
+        results have 1 record per node/element, so they're read in
+        chunks of ``ntimes`` nodes/elements with all the time steps.
+        Each chunk is a new result object, so it's freed once the caller
+        drops it.
+        """
+        results_to_skip = ['params', 'gpdt', 'bgpdt', 'eqexin', 'psds', 'monitor1', 'monitor3']
+        for result_name in self.get_table_types():
+            if result_name in results_to_skip or result_name.startswith('responses.'):
+                continue
+            result = self.get_result(result_name)
+            if not isinstance(result, dict):
+                continue
+            for key, obj in list(result.items()):
+                if not isinstance(obj, LazyResult):
+                    yield result_name, key, obj
+                    continue
+
+                del result[key]
+                unused_result_name, code, records = unmake_lazy(obj)
+                nrecords = len(records)
+                nchunk = nrecords
+                if not obj.is_sort1:
+                    # 1 record per node/element
+                    nchunk = max(ntimes, 1)
+                elif obj.ntimes and nrecords % obj.ntimes == 0:
+                    # the same number of records per time step
+                    nchunk = max(ntimes, 1) * (nrecords // obj.ntimes)
+                for irecord in range(0, nrecords, nchunk):
+                    obj_chunk = self._read_lazy_chunk(
+                        result_name, code, records[irecord:irecord+nchunk])
+                    yield result_name, key, obj_chunk
+                    del obj_chunk
+
+    def _read_lazy_chunk(self, result_name: str, code: Any,
+                         records: List[Tuple[bytes, bytes, int, int]]) -> Any:
+        """
+        Creates a result object from a subset of its records.  The
+        records are sized (read_mode=1) and then read (read_mode=2).
+        """
+        result = self.get_result(result_name)
+        self._open_lazy_records()
+        try:
+            for read_mode in [1, 2]:
+                self.read_mode = read_mode
+                self.op2_reader.read_lazy_records(records, count=_get_count(code))
+        finally:
+            self._close_lazy_records()
+
+        obj = result.pop(code)
+        if hasattr(obj, 'finalize'):
+            obj.finalize()
+        return obj
+
     def create_objects_from_matrices(self) -> None:
         """
         creates the following objects:
@@ -640,6 +1063,8 @@ class OP2(OP2_Scalar, OP2Writer):
                 raise
 
             for obj in values:
+                if isinstance(obj, LazyResult):
+                    continue
                 if hasattr(obj, 'finalize'):
                     obj.finalize()
                 elif hasattr(obj, 'tCode') and not obj.is_sort1:
@@ -725,7 +1150,9 @@ class OP2(OP2_Scalar, OP2Writer):
                     self.log.error(f'build_dataframe is broken for {class_name}')
                     raise
 
-    def load_hdf5_filename(self, hdf5_filename: str, combine: bool=True) -> None:
+    def load_hdf5_filename(self, hdf5_filename: str, combine: bool=True,
+                           subcases=None, results=None, times=None, ids=None,
+                           load_as_h5: bool=False) -> None:
         """
         Loads an h5 file into an OP2 object
 
@@ -735,6 +1162,18 @@ class OP2(OP2_Scalar, OP2Writer):
             the path to the an hdf5 file
         combine : bool; default=True
             runs the combine routine
+        subcases : List[int]; default=None -> all
+            the subcase ids to load
+        results : List[str]; default=None -> all
+            the results to load (e.g., ['displacements', 'cquad4_stress'])
+        times : List[float]; default=None -> all
+            the times/modes/frequencies/load steps to load
+        ids : List[int]; default=None -> all
+            the node/element ids to load
+        load_as_h5 : bool; default=False
+            the result data arrays are left on disk as h5py Datasets,
+            so opening a large file is fast and uses little memory;
+            the file is left open (see ``self.h5_file``)
 
         """
         check_path(hdf5_filename, 'hdf5_filename')
@@ -744,11 +1183,21 @@ class OP2(OP2_Scalar, OP2Writer):
 
         self.log.info(f'hdf5_op2_filename = {hdf5_filename!r}')
         debug = False
-        with h5py.File(hdf5_filename, 'r') as h5_file:
-            load_op2_from_hdf5_file(self, h5_file, self.log, debug=debug)
+        if load_as_h5:
+            h5_file = h5py.File(hdf5_filename, 'r')
+            self.h5_file = h5_file
+            load_op2_from_hdf5_file(self, h5_file, self.log, debug=debug,
+                                    subcases=subcases, results=results, times=times, ids=ids,
+                                    load_as_h5=load_as_h5)
+        else:
+            with h5py.File(hdf5_filename, 'r') as h5_file:
+                load_op2_from_hdf5_file(self, h5_file, self.log, debug=debug,
+                                        subcases=subcases, results=results, times=times, ids=ids)
         self.combine_results(combine=combine)
 
-    def load_hdf5_file(self, h5_file: H5File, combine: bool=True) -> None:
+    def load_hdf5_file(self, h5_file: H5File, combine: bool=True,
+                       subcases=None, results=None, times=None, ids=None,
+                       load_as_h5: bool=False) -> None:
         """
         Loads an h5 file object into an OP2 object
 
@@ -758,27 +1207,49 @@ class OP2(OP2_Scalar, OP2Writer):
             an h5py file object
         combine : bool; default=True
             runs the combine routine
+        subcases / results / times / ids / load_as_h5 : default=None/False
+            see ``load_hdf5_filename``; for load_as_h5, h5_file must
+            stay open while the results are used
 
         """
         from pyNastran.op2.op2_interface.hdf5_interface import load_op2_from_hdf5_file
         #self.op2_filename = hdf5_filename
         #self.log.info('hdf5_op2_filename = %r' % hdf5_filename)
         debug = False
-        load_op2_from_hdf5_file(self, h5_file, self.log, debug=debug)
+        load_op2_from_hdf5_file(self, h5_file, self.log, debug=debug,
+                                subcases=subcases, results=results, times=times, ids=ids,
+                                load_as_h5=load_as_h5)
         self.combine_results(combine=combine)
 
-    def export_hdf5_filename(self, hdf5_filename: str) -> None:
+    def export_hdf5_filename(self, hdf5_filename: str, compression: Optional[str]=None,
+                             compression_opts: Optional[int]=None,
+                             shuffle: bool=False) -> None:
         """
         Converts the OP2 objects into hdf5 object
 
+        Parameters
+        ----------
+        hdf5_filename : str
+            the path to the an hdf5 file
+        compression : str; default=None
+            the HDF5 filter of the results (e.g., 'gzip', 'lzf')
+        compression_opts : int; default=None
+            the compression level (e.g., 0-9 for 'gzip')
+        shuffle : bool; default=False
+            apply the byte shuffle filter, which improves the compression
+
         TODO: doesn't support:
           - BucklingEigenvalues
 
         """
         from pyNastran.op2.op2_interface.hdf5_interface import export_op2_to_hdf5_filename
-        export_op2_to_hdf5_filename(hdf5_filename, self)
+        export_op2_to_hdf5_filename(hdf5_filename, self, compression=compression,
+                                    compression_opts=compression_opts, shuffle=shuffle)
 
-    def export_hdf5_file(self, hdf5_file: H5File, exporter=None) -> None:
+    def export_hdf5_file(self, hdf5_file: H5File, exporter=None,
+                         compression: Optional[str]=None,
+                         compression_opts: Optional[int]=None,
+                         shuffle: bool=False) -> None:
         """
         Converts the OP2 objects into hdf5 object
 
@@ -788,6 +1259,8 @@ class OP2(OP2_Scalar, OP2Writer):
             an h5py object
         exporter : HDF5Exporter; default=None
             unused
+        compression / compression_opts / shuffle : default=None/None/False
+            see ``export_hdf5_filename``
 
         TODO: doesn't support:
           - BucklingEigenvalues
@@ -795,9 +1268,11 @@ class OP2(OP2_Scalar, OP2Writer):
         """
         ## type (file, Any) -> None
         from pyNastran.op2.op2_interface.hdf5_interface import export_op2_to_hdf5_file
-        export_op2_to_hdf5_file(hdf5_file, self)
+        export_op2_to_hdf5_file(hdf5_file, self, compression=compression,
+                                compression_opts=compression_opts, shuffle=shuffle)
 
-    def combine_results(self, combine: str=True) -> None:
+    def combine_results(self, combine: str=True,
+                        combine_superelements: bool=False) -> None:
         """
         we want the data to be in the same format and grouped by subcase, so
         we take
@@ -823,10 +1298,19 @@ class OP2(OP2_Scalar, OP2Writer):
                2 : result4,
            }
 
+        If combine_superelements=True, the superelements are merged with a
+        single sort of the node/element ids (see
+        ``op2_combine.combine_superelements``).  Results that don't line up
+        (e.g., different times or different data for the boundary nodes)
+        keep the superelement keys.
+
         """
         self.combine = combine
         result_types = self.get_table_types()
         results_to_skip = ['bgpdt', 'gpdt', 'eqexin', 'grid_point_weight', 'psds', 'monitor1', 'monitor3']
+        if combine and combine_superelements:
+            # merge the superelements, so they're a single key
+            op2_combine.combine_superelements(self, result_types, results_to_skip)
 
         # set subcase_key
         for result_type in result_types:
@@ -1191,6 +1675,7 @@ class OP2(OP2_Scalar, OP2Writer):
             self.applied_loads,
             self.load_vectors,
         ]
+        engine = CoordTransformEngine(coords, getattr(self, 'nodes', None))
         for disp_like_dict in disp_like_dicts:
             if not disp_like_dict:
                 continue
@@ -1200,7 +1685,7 @@ class OP2(OP2_Scalar, OP2Writer):
                     continue
                 self.log.debug(f'transforming {result.table_name}')
                 transform_displacement_to_global(subcase, result, icd_transform, coords, xyz_cid0,
-                                                 self.log, debug=debug)
+                                                 self.log, debug=debug, engine=engine)
 
     def transform_gpforce_to_global(self, nids_all, nids_transform, icd_transform, coords,
                                     xyz_cid0=None):
@@ -1258,7 +1743,11 @@ def read_op2(op2_filename: Optional[str]=None,
              build_dataframe: Optional[bool]=False,
              skip_undefined_matrices: bool=True,
              mode: Optional[str]=None,
-             encoding: Optional[str]=None) -> OP2:
+             encoding: Optional[str]=None,
+             use_index: bool=False,
+             use_mmap: bool=False,
+             nworkers: int=1,
+             combine_superelements: bool=False) -> OP2:
     """
     Creates the OP2 object without calling the OP2 class.
 
@@ -1296,6 +1785,18 @@ def read_op2(op2_filename: Optional[str]=None,
         {nx, msc, autodesk, optistruct, nasa95}
     encoding : str
         the unicode encoding (default=None; system default)
+    use_index : bool; default=False
+        uses/creates the table-of-contents sidecar (model.op2.toc)
+        to jump over the data records in the array sizing pass
+        (the sizing pass is still run)
+    use_mmap : bool; default=False
+        memory maps the OP2 to reduce copying of the results records
+    nworkers : int; default=1
+        the number of processes used to decode the results tables
+    combine_superelements : bool; default=False
+        merges the results of the superelements of a subcase into one
+        object (requires combine=True); the superelements that can't be
+        merged keep their (isubcase, subtitle) based keys
 
     Returns
     -------
@@ -1319,7 +1820,9 @@ def read_op2(op2_filename: Optional[str]=None,
             validate=True, xref=True,
             build_dataframe=build_dataframe,
             skip_undefined_matrices=skip_undefined_matrices,
-            mode=mode, log=log, debug=debug, encoding=encoding)
+            mode=mode, log=log, debug=debug, encoding=encoding,
+            use_index=use_index, use_mmap=use_mmap, nworkers=nworkers,
+            combine_superelements=combine_superelements)
     else:
         model = OP2(log=log, debug=debug, mode=mode)
         model.set_subcases(subcases)
@@ -1328,7 +1831,8 @@ def read_op2(op2_filename: Optional[str]=None,
 
         model.read_op2(op2_filename=op2_filename, build_dataframe=build_dataframe,
                        skip_undefined_matrices=skip_undefined_matrices, combine=combine,
-                       encoding=encoding)
+                       encoding=encoding, use_index=use_index, use_mmap=use_mmap,
+                       nworkers=nworkers, combine_superelements=combine_superelements)
 
     ## TODO: this will go away when OP2 is refactored
     ## TODO: many methods will be missing, but it's a start...
@@ -1342,6 +1846,138 @@ def read_op2(op2_filename: Optional[str]=None,
     return model
 
 
+def read_op2_many(op2_filenames: List[str],
+                  combine_runs: str='stack',
+                  subcases: Optional[List[int]]=None,
+                  exclude_results: Optional[List[str]]=None,
+                  include_results: Optional[List[str]]=None,
+                  log: Any=None,
+                  debug: Optional[bool]=True,
+                  skip_undefined_matrices: bool=True,
+                  mode: Optional[str]=None,
+                  encoding: Optional[str]=None,
+                  nworkers: int=1) -> OP2:
+    """
+    Reads the results of many OP2s of the same model (e.g., one OP2 per
+    load case deck) into a single OP2 object.
+
+    Parameters
+    ----------
+    op2_filenames : List[str]
+        the OP2s (one per run)
+    combine_runs : str; default='stack'
+        'stack' : results with the same key, shape and ids in every run
+                  are stacked along a new run axis:
+                  ``obj.run_data`` is (nruns, ntimes, nentities, ncols) and
+                  ``obj.data`` is ``obj.run_data[0]``; other results are
+                  from the first run
+        'subcase' : the subcases of the runs are renumbered (1, 2, 3, ...)
+                    in the order of the runs;
+                    ``model.run_subcases[isubcase] = (irun, isubcase_run)``
+    subcases : List[int, ...] / int; default=None->all subcases
+        list of [subcase1_ID,subcase2_ID]
+    exclude_results / include_results : List[str] / str; default=None
+        a list of result types to exclude/include
+        one of these must be None
+    log / debug / skip_undefined_matrices / mode / encoding
+        see ``read_op2``
+    nworkers : int; default=1
+        the number of processes; each one reads an entire OP2
+
+    Returns
+    -------
+    model : OP2()
+        an OP2 object with the results of the runs;
+        ``model.op2_filenames`` are the runs
+
+    .. code-block:: python
+
+       model = read_op2_many(op2_filenames, include_results=['displacements'],
+                             nworkers=4)
+       # the max translation of each node over all the runs
+       disp = model.displacements[1]
+       max_translation = np.linalg.norm(disp.run_data[:, :, :, :3], axis=3).max(axis=(0, 1))
+
+    """
+    for op2_filename in op2_filenames:
+        check_path(op2_filename, name='op2_filename')
+    model = OP2(log=log, debug=debug, mode=mode)
+    model.set_subcases(subcases)
+    model.include_exclude_results(exclude_results=exclude_results,
+                                  include_results=include_results)
+    read_runs(model, op2_filenames, nworkers=nworkers, combine_runs=combine_runs,
+              mode=mode, encoding=encoding,
+              skip_undefined_matrices=skip_undefined_matrices)
+    return model
+
+
+def iter_op2_results(op2_filename: str,
+                     ntimes: int=100,
+                     combine: bool=True,
+                     subcases: Optional[List[int]]=None,
+                     exclude_results: Optional[List[str]]=None,
+                     include_results: Optional[List[str]]=None,
+                     log: Any=None,
+                     debug: Optional[bool]=True,
+                     skip_undefined_matrices: bool=True,
+                     mode: Optional[str]=None,
+                     encoding: Optional[str]=None,
+                     use_index: bool=False) -> Iterator[Tuple[str, Any, Any]]:
+    """
+    Reads the OP2 results one block at a time, so results that don't
+    fit in memory (e.g., a long transient) can be post-processed.
+
+    Parameters
+    ----------
+    op2_filename : str
+        the op2_filename
+    ntimes : int; default=100
+        the maximum number of time steps/frequencies/modes per block;
+        SORT2 results are returned in blocks of ntimes nodes/elements
+        with all the time steps; results with a different number of
+        nodes/elements per time step (e.g., grid_point_forces) are sized
+        to the block
+    combine : bool; default=True
+        True : the subcase_key is the isubcase
+        False : the subcase_key is (isubcase, analysis_code, sort_method, ...)
+    subcases : List[int, ...] / int; default=None->all subcases
+        list of [subcase1_ID,subcase2_ID]
+    exclude_results / include_results : List[str] / str; default=None
+        a list of result types to exclude/include
+        one of these must be None
+    log / debug / skip_undefined_matrices / mode / encoding / use_index
+        see ``read_op2``
+
+    Yields
+    ------
+    result_name : str
+        the result type (e.g., 'displacements', 'stress.cquad4_stress')
+    subcase_key : int / tuple
+        the key the result would have in ``read_op2``
+    obj : result object
+        the result (e.g., RealDisplacementArray) for the block of
+        time steps; a new object is created for each block
+
+    .. code-block:: python
+
+       max_disp = 0.
+       for result_name, subcase_key, obj in iter_op2_results(
+               'transient.op2', ntimes=50, include_results=['displacements']):
+           max_disp = max(max_disp, np.abs(obj.data).max())
+
+    """
+    check_path(op2_filename, name='op2_filename')
+    model = OP2(log=log, debug=debug, mode=mode)
+    model.set_subcases(subcases)
+    model.include_exclude_results(exclude_results=exclude_results,
+                                  include_results=include_results)
+    model._scan_lazy(op2_filename, skip_undefined_matrices=skip_undefined_matrices,
+                     encoding=encoding, use_index=use_index)
+    model.combine_results(combine=combine)
+    for result_name, subcase_key, obj in model._iter_lazy_results(ntimes):
+        yield result_name, subcase_key, obj
+
+
 def _create_hdf5_info(h5_file: H5File, op2_model: OP2) -> None:
     """exports the h5 info group"""
     load_as_h5 = False
@@ -1351,3 +1987,10 @@ def _create_hdf5_info(h5_file: H5File, op2_model: OP2) -> None:
         return
     from pyNastran.op2.op2_interface.hdf5_interface import create_info_group
     create_info_group(h5_file, op2_model)
+
+
+def _get_count(code: Any) -> int:
+    """gets the optimization count from a result key"""
+    if isinstance(code, tuple) and len(code) == 7:
+        return code[3]
+    return 0
@@ -47,7 +47,11 @@ def read_op2_geom(op2_filename: Optional[Union[str, PurePath]]=None,
                   build_dataframe: bool=False, skip_undefined_matrices: bool=True,
                   mode: str='msc', log: SimpleLogger=None, debug: bool=True,
                   debug_file: Optional[str]=None,
-                  encoding: Optional[str]=None):
+                  encoding: Optional[str]=None,
+                  use_index: bool=False,
+                  use_mmap: bool=False,
+                  nworkers: int=1,
+                  combine_superelements: bool=False):
     """
     Creates the OP2 object without calling the OP2 class.
 
@@ -81,6 +85,17 @@ def read_op2_geom(op2_filename: Optional[Union[str, PurePath]]=None,
         sets the filename that will be written to
     encoding : str
         the unicode encoding (default=None; system default)
+    use_index : bool; default=False
+        uses/creates the table-of-contents sidecar (model.op2.toc)
+        to jump over the data records in the array sizing pass
+        (the sizing pass is still run)
+    use_mmap : bool; default=False
+        memory maps the OP2 to reduce copying of the results records
+    nworkers : int; default=1
+        the number of processes used to decode the results tables
+    combine_superelements : bool; default=False
+        merges the results of the superelements of a subcase into one
+        object (requires combine=True)
 
     Returns
     -------
@@ -100,7 +115,8 @@ def read_op2_geom(op2_filename: Optional[Union[str, PurePath]]=None,
 
     model.read_op2(op2_filename=op2_filename, build_dataframe=build_dataframe,
                    skip_undefined_matrices=skip_undefined_matrices, combine=combine,
-                   encoding=encoding)
+                   encoding=encoding, use_index=use_index, use_mmap=use_mmap,
+                   nworkers=nworkers, combine_superelements=combine_superelements)
     if validate:
         model.validate()
     if xref:
@@ -313,12 +329,17 @@ class OP2Geom(BDF, OP2GeomCommon):
     def read_op2(self, op2_filename: Optional[Union[str, PurePath]]=None, combine: bool=True,
                  build_dataframe: Optional[bool]=False,
                  skip_undefined_matrices: bool=False,
-                 encoding: Optional[str]=None):
+                 encoding: Optional[str]=None,
+                 use_index: bool=False,
+                 use_mmap: bool=False,
+                 nworkers: int=1,
+                 combine_superelements: bool=False):
         """see ``OP2.read_op2``"""
         OP2.read_op2(self, op2_filename=op2_filename, combine=combine,
                      build_dataframe=build_dataframe,
                      skip_undefined_matrices=skip_undefined_matrices,
-                     encoding=encoding)
+                     encoding=encoding, use_index=use_index, use_mmap=use_mmap,
+                     nworkers=nworkers, combine_superelements=combine_superelements)
         if len(self.nodes) == 0:
             self.gpdt_to_nodes()
 
@@ -4,10 +4,11 @@ defines:
  model = load_op2_from_h5(h5_filename, log=None)
  export_op2_to_hdf5(hdf5_filename, op2_model)
 
- model = load_op2_from_hdf5(hdf5_filename, combine=True, log=None)
+ model = load_op2_from_hdf5(hdf5_filename, combine=True, log=None,
+                            subcases=None, results=None, times=None, ids=None)
  model = load_op2_from_hdf5_file(model, h5_file, log, debug=False)
- export_op2_to_hdf5_file(hdf5_filename, op2_model)
- export_op2_to_hdf5_file(hdf5_file, op2_model)
+ export_op2_to_hdf5_file(hdf5_filename, op2_model, compression=None)
+ export_op2_to_hdf5_file(hdf5_file, op2_model, compression=None)
 
 """
 from typing import List, Union, Optional, Any
@@ -17,6 +18,8 @@ import h5py
 from cpylog import SimpleLogger
 import pyNastran
 from pyNastran.op2.op2 import OP2
+from pyNastran.op2.op2_interface.op2_combine import (
+    ENTITY_ID_KEYS, ENTITY_KEYS, ELEMENT_KEYS, update_entity_counts)
 
 from pyNastran.op2.result_objects.grid_point_weight import GridPointWeight
 from pyNastran.op2.tables.lama_eigenvalues.lama_objects import RealEigenvalues, ComplexEigenvalues, BucklingEigenvalues
@@ -1087,7 +1090,8 @@ def _load_eigenvalue(h5_result, encoding: str,
     return obj
 
 def _load_table(result_name, h5_result, objs, encoding: str,
-                log: SimpleLogger, debug: bool=False):# real_obj, complex_obj
+                log: SimpleLogger, debug: bool=False,
+                times=None, ids=None, load_as_h5: bool=False):# real_obj, complex_obj
     """loads a RealEigenvectorArray/ComplexEigenvectorArray"""
     is_real = _cast(h5_result.get('is_real'))
     #is_complex = _cast(h5_result.get('is_complex'))
@@ -1149,14 +1153,118 @@ def _load_table(result_name, h5_result, objs, encoding: str,
     if obj.class_name != class_name:
         msg = 'class_name=%r selected; should be %r' % (obj.class_name, class_name)
         raise RuntimeError(msg)
+    itimes, ientities = _get_hdf5_slices(h5_result, result_name, str_data_names,
+                                         times, ids, log)
     _apply_hdf5_attributes_to_object(obj, h5_result, result_name, data_code, str_data_names,
-                                     encoding, debug=debug)
+                                     encoding, debug=debug,
+                                     itimes=itimes, ientities=ientities, ids=ids,
+                                     load_as_h5=load_as_h5)
     return obj
 
+def _get_hdf5_slices(h5_result, result_name: str, str_data_names: List[str],
+                     times, ids, log: SimpleLogger):
+    """
+    Gets the indices of a partial read of a result
+
+    Parameters
+    ----------
+    times : List[float]; default=None
+        the times/modes/frequencies/load steps to load (the first data name)
+    ids : List[int]; default=None
+        the node/element ids to load
+
+    Returns
+    -------
+    itimes : (ntimes, ) int ndarray
+        the indices of the times; None for all the times
+    ientities : (nentities, ) int ndarray
+        the indices of the nodes/elements (the rows of the data);
+        None for all the rows
+
+    """
+    itimes = None
+    ientities = None
+    h5_data = h5_result.get('data')
+    if h5_data is None or len(h5_data.shape) < 2:
+        return itimes, ientities
+    ntimes, nentities = h5_data.shape[:2]
+
+    if times is not None:
+        h5_times = h5_result.get(str_data_names[0]) if str_data_names else None
+        if h5_times is None or h5_times.shape != (ntimes, ) or h5_times.dtype.kind not in 'iuf':
+            log.warning(f'times cannot be selected for {result_name}; loading all the times')
+        else:
+            all_times = np.asarray(h5_times[()], dtype='float64')
+            times = np.asarray(times, dtype='float64').ravel()
+            is_time = np.isclose(all_times[:, np.newaxis], times[np.newaxis, :],
+                                 rtol=1e-5, atol=0.).any(axis=1)
+            itimes = np.where(is_time)[0]
+
+    if ids is not None:
+        for key in ENTITY_ID_KEYS:
+            h5_ids = h5_result.get(key)
+            if h5_ids is None or len(h5_ids.shape) == 0 or h5_ids.shape[0] != nentities:
+                continue
+            if h5_ids.dtype.kind not in 'iu':
+                continue
+            all_ids = h5_ids[()]
+            if all_ids.ndim == 2:
+                all_ids = all_ids[:, 0]
+            ientities = np.where(np.isin(all_ids, ids))[0]
+            break
+        else:
+            log.warning(f'ids cannot be selected for {result_name}; loading all the ids')
+    return itimes, ientities
+
+def _read_h5_data(h5_data, itimes, ientities) -> np.ndarray:
+    """
+    Reads the (time, entity) hyperslab of a data array, so only the chunks
+    of the selected times/entities are read.
+    """
+    if itimes is None and ientities is None:
+        return h5_data[()]
+
+    shape = list(h5_data.shape)
+    if itimes is not None:
+        shape[0] = len(itimes)
+    if ientities is not None:
+        shape[1] = len(ientities)
+    if 0 in shape:
+        return np.zeros(shape, dtype=h5_data.dtype)
+
+    if ientities is None:
+        return h5_data[_index_to_slice(itimes)]
+
+    # h5py supports one list of indices, so the times are read as a
+    # bounding slice and filtered
+    if itimes is None:
+        return h5_data[:, _index_to_slice(ientities)]
+    data = h5_data[itimes[0]:itimes[-1] + 1, _index_to_slice(ientities)]
+    return data[itimes - itimes[0]]
+
+def _index_to_slice(index: np.ndarray):
+    """converts a sorted index array to a slice if it's contiguous"""
+    if index[-1] - index[0] + 1 == len(index):
+        return slice(index[0], index[-1] + 1)
+    return index
+
 
 def _apply_hdf5_attributes_to_object(obj, h5_result, result_name, data_code, str_data_names,
-                                     encoding: str, debug: bool=False):
-    """helper method for ``_load_table``"""
+                                     encoding: str, debug: bool=False,
+                                     itimes=None, ientities=None, ids=None,
+                                     load_as_h5: bool=False):
+    """
+    helper method for ``_load_table``
+
+    itimes/ientities are the indices of the times/nodes/elements of a
+    partial read (see ``_get_hdf5_slices``)
+
+    load_as_h5 : bool; default=False
+        the data is left on disk as an h5py Dataset, so only the
+        slices that are used are read; partial reads are in memory
+    """
+    is_partial = itimes is not None or ientities is not None
+    nentities = h5_result.get('data').shape[1] if is_partial else None
     keys_to_skip = [
         'class_name', 'headers', 'is_real', 'is_complex',
         'is_sort1', 'is_sort2', 'table_name_str',
@@ -1168,7 +1276,7 @@ def _apply_hdf5_attributes_to_object(obj, h5_result, result_name, data_code, str
     #if result_name == 'eigenvectors':
         #debug = True
     for key in h5_result.keys():
-        if key not in filtered_attrs:
+        if key not in filtered_attrs and key not in str_data_names and not _is_index_key(obj, key):
             continue
         elif result_name == 'grid_point_forces' and key in ['element_name']:
             pass
@@ -1176,10 +1284,20 @@ def _apply_hdf5_attributes_to_object(obj, h5_result, result_name, data_code, str
             if debug:  # pragma: no cover
                 print('  *****key={key!r}')
             datai = _cast_str(h5_result.get(key), encoding)
+            if itimes is not None and isinstance(datai, list):
+                datai = [datai[itime] for itime in itimes]
             setattr(obj, key, datai)
-            setattr(obj, '_times', datai)
+            if key == str_data_names[0]:
+                setattr(obj, '_times', datai)
         elif key not in data_code:
-            datai = _cast(h5_result.get(key))
+            if key == 'data' and is_partial:
+                datai = _read_h5_data(h5_result.get(key), itimes, ientities)
+            elif key == 'data' and load_as_h5 and _is_lazy_data(h5_result.get(key)):
+                datai = h5_result.get(key)
+            else:
+                datai = _cast(h5_result.get(key))
+                if ientities is not None:
+                    datai = _slice_entity_array(key, datai, nentities, ientities, ids)
             if debug:  # pragma: no cover
                 print('  **key=%r' % key)
                 if key not in ['data']:
@@ -1195,8 +1313,34 @@ def _apply_hdf5_attributes_to_object(obj, h5_result, result_name, data_code, str
                 print(f'key={key!r} datai={datai!r}')
                 raise
             assert not isinstance(datai, bytes), f'key={key!r} data={datai}'
+
+    if is_partial:
+        update_entity_counts(obj)
     return obj
 
+def _is_lazy_data(h5_data) -> bool:
+    """the (ntimes, nentities, ncols) data may be left on disk"""
+    return isinstance(h5_data, h5py.Dataset) and len(h5_data.shape) == 3
+
+def _is_index_key(obj, key: str) -> bool:
+    """
+    The node/element index arrays are created when the object is built,
+    so they're not attributes of the new object.
+    """
+    if key not in ENTITY_ID_KEYS and key not in ELEMENT_KEYS:
+        return False
+    return not isinstance(getattr(type(obj), key, None), property)
+
+def _slice_entity_array(key: str, datai, nentities: int, ientities: np.ndarray, ids):
+    """gets the rows of the selected nodes/elements of a partial read"""
+    if not isinstance(datai, np.ndarray) or datai.ndim == 0:
+        return datai
+    if key in ENTITY_KEYS and datai.shape[0] == nentities:
+        return datai[ientities]
+    if key in ELEMENT_KEYS and datai.ndim == 2:
+        return datai[np.isin(datai[:, 0], ids)]
+    return datai
+
 def _get_obj_class(objs, class_name, result_name, unused_is_real,
                    log: SimpleLogger) -> Any:
     #if 1:
@@ -1239,23 +1383,50 @@ def _get_obj_class(objs, class_name, result_name, unused_is_real,
             #obj_class = complex_obj
     return obj_class
 
-def export_op2_to_hdf5_filename(hdf5_filename: str, op2_model: OP2) -> None:
-    """exports an OP2 object to an HDF5 file"""
+def export_op2_to_hdf5_filename(hdf5_filename: str, op2_model: OP2,
+                                compression: Optional[str]=None,
+                                compression_opts: Optional[int]=None,
+                                shuffle: bool=False) -> None:
+    """
+    exports an OP2 object to an HDF5 file
+
+    Parameters
+    ----------
+    hdf5_filename : str
+        the path to the hdf5 file
+    op2_model : OP2
+        the model to export
+    compression : str; default=None
+        the HDF5 filter of the results (e.g., 'gzip', 'lzf')
+    compression_opts : int; default=None
+        the compression level (e.g., 0-9 for 'gzip')
+    shuffle : bool; default=False
+        apply the byte shuffle filter, which improves the compression
+
+    The results data is chunked by (time, entity), so it may be partially
+    read by ``load_op2_from_hdf5``.
+
+    """
     #no_sort2_classes = ['RealEigenvalues', 'ComplexEigenvalues', 'BucklingEigenvalues']
     try:
         with h5py.File(hdf5_filename, 'w') as hdf5_file:
             op2_model.log.info(f'starting export_op2_to_hdf5_file of {hdf5_filename!r}')
-            export_op2_to_hdf5_file(hdf5_file, op2_model)
+            export_op2_to_hdf5_file(hdf5_file, op2_model, compression=compression,
+                                    compression_opts=compression_opts, shuffle=shuffle)
     except OSError:
         op2_model.log.error(f'failed to export {hdf5_filename!r}')
         raise
 
-def export_op2_to_hdf5_file(hdf5_file, op2_model: OP2) -> None:
+def export_op2_to_hdf5_file(hdf5_file, op2_model: OP2,
+                            compression: Optional[str]=None,
+                            compression_opts: Optional[int]=None,
+                            shuffle: bool=False) -> None:
     """exports an OP2 object to an HDF5 file object"""
     assert not isinstance(hdf5_file, str), hdf5_file
     create_info_group(hdf5_file, op2_model)
     export_matrices(hdf5_file, op2_model)
-    _export_subcases(hdf5_file, op2_model)
+    _export_subcases(hdf5_file, op2_model, compression=compression,
+                     compression_opts=compression_opts, shuffle=shuffle)
 
 def create_info_group(hdf5_file, op2_model: OP2) -> None:
     """creates the info HDF5 group"""
@@ -1280,7 +1451,8 @@ def export_matrices(hdf5_file, op2_model: OP2) -> None:
                 raise NotImplementedError(msg)
                 #continue
 
-def _export_subcases(hdf5_file, op2_model):
+def _export_subcases(hdf5_file, op2_model, compression=None,
+                     compression_opts=None, shuffle=False):
     """exports the subcases to HDF5"""
     subcase_groups = {}
     result_types = op2_model.get_table_types()
@@ -1318,28 +1490,81 @@ def _export_subcases(hdf5_file, op2_model):
             #result_name = result_type + ':' + class_name
             result_name = result_type
             result_group = subcase_group.create_group(result_name)
-            obj.export_to_hdf5(result_group, op2_model.log)
-
-def load_op2_from_hdf5(hdf5_filename, combine=True, log=None):
-    return load_op2_from_hdf5_filename(hdf5_filename, combine=combine, log=log)
+            obj.export_to_hdf5(result_group, op2_model.log, compression=compression,
+                               compression_opts=compression_opts, shuffle=shuffle)
+
+def load_op2_from_hdf5(hdf5_filename, combine=True, log=None,
+                       subcases=None, results=None, times=None, ids=None,
+                       load_as_h5=False):
+    """
+    loads an hdf5 file into an OP2 object
+
+    Parameters
+    ----------
+    hdf5_filename : str
+        the path to the hdf5 file
+    combine : bool; default=True
+        runs the combine routine
+    log : SimpleLogger; default=None
+        the logger
+    subcases : List[int]; default=None -> all
+        the subcase ids to load
+    results : List[str]; default=None -> all
+        the results to load (e.g., ['displacements', 'cquad4_stress'])
+    times : List[float]; default=None -> all
+        the times/modes/frequencies/load steps to load
+    ids : List[int]; default=None -> all
+        the node/element ids to load
+    load_as_h5 : bool; default=False
+        the result data arrays are h5py Datasets instead of numpy arrays,
+        so the results are read from disk when they're sliced; the file
+        is left open (see ``model.h5_file``) until the model is deleted
+
+    Only the (time, entity) hyperslabs of the data that are selected by
+    ``times`` and ``ids`` are read, so a time history of one element may
+    be read without loading the full results.
+
+    """
+    return load_op2_from_hdf5_filename(
+        hdf5_filename, combine=combine, log=log,
+        subcases=subcases, results=results, times=times, ids=ids,
+        load_as_h5=load_as_h5)
 
 def load_op2_from_hdf5_filename(hdf5_filename: str, combine: bool=True,
-                                log: Optional[SimpleLogger]=None):
+                                log: Optional[SimpleLogger]=None,
+                                subcases=None, results=None, times=None, ids=None,
+                                load_as_h5: bool=False):
     """loads an hdf5 file into an OP2 object"""
     check_path(hdf5_filename, 'hdf5_filename')
     model = OP2(log=log)
     model.op2_filename = hdf5_filename
+    log = model.log
 
     log.info(f'hdf5_op2_filename = {hdf5_filename!r}')
     debug = False
-    with h5py.File(hdf5_filename, 'r') as h5_file:
-        load_op2_from_hdf5_file(model, h5_file, log, debug=debug)
+    if load_as_h5:
+        h5_file = h5py.File(hdf5_filename, 'r')
+        model.h5_file = h5_file
+        load_op2_from_hdf5_file(model, h5_file, log, debug=debug,
+                                subcases=subcases, results=results, times=times, ids=ids,
+                                load_as_h5=load_as_h5)
+    else:
+        with h5py.File(hdf5_filename, 'r') as h5_file:
+            load_op2_from_hdf5_file(model, h5_file, log, debug=debug,
+                                    subcases=subcases, results=results, times=times, ids=ids)
     model.combine_results(combine=combine)
     return model
 
 def load_op2_from_hdf5_file(model: OP2, h5_file,
-                            log: SimpleLogger, debug=False):
-    """loads an h5 file object into an OP2 object"""
+                            log: SimpleLogger, debug=False,
+                            subcases=None, results=None, times=None, ids=None,
+                            load_as_h5: bool=False):
+    """
+    loads an h5 file object into an OP2 object
+
+    See ``load_op2_from_hdf5`` for the subcases/results/times/ids filters.
+    For ``load_as_h5``, h5_file must stay open while the results are used.
+    """
     encoding = 'latin1'
     for key in h5_file.keys():
         if key.startswith('Subcase'):
@@ -1347,6 +1572,8 @@ def load_op2_from_hdf5_file(model: OP2, h5_file,
             #log.debug('subcase:')
             for result_name in h5_subcase.keys():
                 assert isinstance(result_name, str), f'result_name={result_name}; type={type(result_name)}'
+                if results is not None and result_name not in results:
+                    continue
 
                 if result_name in ['eigenvalues', 'eigenvalues_fluid']:
                     #log.warning('    skipping %r...' % result_name)
@@ -1371,8 +1598,11 @@ def load_op2_from_hdf5_file(model: OP2, h5_file,
                     if objs is None:
                         log.warning(f'  skipping {result_name}...')
                         continue
+                    if subcases is not None and _cast(h5_result.get('isubcase')) not in subcases:
+                        continue
                     obj = _load_table(result_name, h5_result, objs,
-                                      encoding, log=log, debug=debug)
+                                      encoding, log=log, debug=debug,
+                                      times=times, ids=ids, load_as_h5=load_as_h5)
                     if obj is None:
                         continue
 
@@ -0,0 +1,294 @@
+"""
+Defines the superelement merging used by ``OP2.combine_results``:
+  - combine_superelements(model, result_types, results_to_skip)
+  - combine_objects(objs, log)
+  - update_entity_counts(obj)
+
+The results of each superelement are stored under a separate key:
+
+.. code-block:: python
+
+   # isubcase, analysis_code, sort_method, count, ogs, superelement_adaptivity_index, pval_step
+   (1, 1, 1, 0, 0, 'SUPERELEMENT 0', '')
+   (1, 1, 1, 0, 0, 'SUPERELEMENT 10', '')
+
+The partial objects that share a key are merged into one object under
+the key without the superelement, (1, 1, 1, 0, 0, '', ''), which is then
+renamed to the isubcase as usual.  The node/element ids of the partial
+objects are sorted with a single argsort and the data is copied into one
+preallocated array.  The data of each part is freed once it's copied, so
+the peak memory is close to one copy of the result.  Boundary nodes that
+are in multiple superelements are kept once if their data is the same;
+otherwise, the result isn't merged.
+
+"""
+from __future__ import annotations
+from typing import List, Dict, Tuple, Optional, Any, TYPE_CHECKING
+
+import numpy as np
+if TYPE_CHECKING:  # pragma: no cover
+    from cpylog import SimpleLogger
+    from pyNastran.op2.op2 import OP2
+
+#: the node/element id arrays; the first one that is found is sorted on
+ENTITY_ID_KEYS = [
+    'node_gridtype', 'node_element', 'element_node', 'element_layer_node',
+    'element_layer', 'element', 'node', 'node_ids', 'eids',
+]
+#: the arrays that are aligned with the rows (the 2nd axis) of the data
+ENTITY_KEYS = ENTITY_ID_KEYS + [
+    'gridtype_str', 'fiber_curvature', 'xxb', 'sd', 'location', 'angle',
+    'element_names', 'element_type', 'element_data_type', 'failure_theory',
+]
+#: the arrays with one row per element (the first column is the element id)
+ELEMENT_KEYS = ['element_cid']
+
+
+def combine_superelements(model: OP2, result_types: List[str],
+                          results_to_skip: List[str]) -> None:
+    """merges the superelement results that share a subcase key"""
+    log = model.log
+    for result_type in result_types:
+        if result_type in results_to_skip or result_type.startswith('responses.'):
+            continue
+        result = model.get_result(result_type)
+        if not isinstance(result, dict) or len(result) < 2:
+            continue
+
+        for key, keys in _get_superelement_groups(result).items():
+            if key in result:
+                continue
+            obj = combine_objects([result[keyi] for keyi in keys], log)
+            if obj is None:
+                log.debug(f'{result_type} for {keys} cannot be combined')
+                continue
+            for keyi in keys:
+                del result[keyi]
+            result[key] = obj
+
+
+def _get_superelement_groups(result: Dict[Any, Any]) -> Dict[Tuple, List[Tuple]]:
+    """
+    Gets the keys that only differ by the superelement
+
+    Returns
+    -------
+    groups : Dict[key, List[key]]
+        key : the key without the superelement
+        value : the superelement keys
+    """
+    groups = {}  # type: Dict[Tuple, List[Tuple]]
+    for key in result:
+        if not isinstance(key, tuple) or len(key) != 7:
+            continue
+        superelement_adaptivity_index = key[5]
+        if not (isinstance(superelement_adaptivity_index, str) and
+                superelement_adaptivity_index.startswith('SUPERELEMENT')):
+            continue
+        key0 = key[:5] + ('', ) + key[6:]
+        groups.setdefault(key0, []).append(key)
+    return {key0: keys for key0, keys in groups.items() if len(keys) > 1}
+
+
+def combine_objects(objs: List[Any], log: SimpleLogger) -> Optional[Any]:
+    """
+    Merges result objects with the same times and columns, but different
+    nodes/elements.
+
+    Parameters
+    ----------
+    objs : List[result]
+        the results to merge; the first object is updated
+    log : SimpleLogger
+        the logger
+
+    Returns
+    -------
+    obj : result / None
+        the merged result or None if the results can't be merged
+
+    """
+    names = _get_entity_names(objs)
+    if names is None:
+        return None
+    id_name = names[0]
+    obj0 = objs[0]
+
+    nrows = np.array([obj.data.shape[1] for obj in objs])
+    offsets = np.hstack([0, np.cumsum(nrows)])
+    ids = np.concatenate([getattr(obj, id_name) for obj in objs])
+
+    # the rows of a later object with the ids of an earlier object
+    # (e.g., boundary nodes)
+    idup, iprev = _get_duplicate_rows(ids, nrows)
+    if len(idup):
+        datas = [obj.data for obj in objs]
+        if not np.array_equal(_get_rows(datas, offsets, idup),
+                              _get_rows(datas, offsets, iprev)):
+            log.debug(f'{obj0.class_name}: the duplicate {id_name} rows are different')
+            return None
+        del datas
+
+    keep = np.ones(len(ids), dtype='bool')
+    keep[idup] = False
+    ikeep = np.where(keep)[0]
+    ids1 = ids[:, 0] if ids.ndim == 2 else ids
+    isort = ikeep[np.argsort(ids1[ikeep], kind='stable')]
+    nout = len(isort)
+
+    # the row of the combined data for each of the rows
+    irow = np.full(len(ids), -1, dtype='int64')
+    irow[isort] = np.arange(nout)
+
+    # the data of each part is freed once it's copied, so the peak
+    # memory is the combined data plus one part
+    ntimes, unused_nrows0, ncols = obj0.data.shape
+    data = np.empty((ntimes, nout, ncols), dtype=obj0.data.dtype)
+    for i, obj in enumerate(objs):
+        irowi = irow[offsets[i]:offsets[i+1]]
+        is_kept = irowi >= 0
+        if is_kept.all():
+            data[:, irowi, :] = obj.data
+        else:
+            data[:, irowi[is_kept], :] = obj.data[:, is_kept, :]
+        obj.data = None
+
+    for name in names:
+        setattr(obj0, name, np.concatenate([getattr(obj, name) for obj in objs])[isort])
+    for name in ELEMENT_KEYS:
+        arrays = [getattr(obj, name, None) for obj in objs]
+        if all(isinstance(array, np.ndarray) and array.ndim == 2 for array in arrays):
+            array = np.vstack(arrays)
+            unused_eids, ieid = np.unique(array[:, 0], return_index=True)
+            setattr(obj0, name, array[ieid])
+    obj0.data = data
+
+    obj0.superelement_adaptivity_index = ''
+    if 'superelement_adaptivity_index' in obj0.data_code:
+        obj0.data_code['superelement_adaptivity_index'] = ''
+    update_entity_counts(obj0)
+    return obj0
+
+
+def _get_entity_names(objs: List[Any]) -> Optional[List[str]]:
+    """
+    Gets the names of the arrays that are aligned with the data rows;
+    the first name is the id array.  None is returned if the objects
+    can't be merged.
+    """
+    obj0 = objs[0]
+    data0 = getattr(obj0, 'data', None)
+    if not isinstance(data0, np.ndarray) or data0.ndim != 3:
+        return None
+    ntimes, unused_nrows, ncols = data0.shape
+    times0 = getattr(obj0, '_times', None)
+    for obj in objs:
+        data = getattr(obj, 'data', None)
+        if (obj.class_name != obj0.class_name or
+                not isinstance(data, np.ndarray) or data.ndim != 3 or
+                data.shape[0] != ntimes or data.shape[2] != ncols or
+                data.dtype != data0.dtype):
+            return None
+        times = getattr(obj, '_times', None)
+        if times0 is not None and not _is_equal_times(times0, times):
+            return None
+        # the length of the table changes with time (e.g., grid point forces)
+        if len(set(getattr(obj, '_ntotals', []))) > 1:
+            return None
+
+    names = []
+    for name in ENTITY_KEYS:
+        arrays = [obj.__dict__.get(name) for obj in objs]
+        is_entity = [isinstance(array, np.ndarray) and array.ndim > 0 and
+                     len(array) == obj.data.shape[1]
+                     for obj, array in zip(objs, arrays)]
+        if all(is_entity):
+            names.append(name)
+        elif any(is_entity):
+            return None
+    if not names or names[0] not in ENTITY_ID_KEYS:
+        return None
+    return names
+
+
+def _is_equal_times(times0: Any, times: Any) -> bool:
+    """are the times the same; static results have a time of nan"""
+    if times is None:
+        return False
+    times0 = np.asarray(times0)
+    times = np.asarray(times)
+    if times0.dtype.kind == 'f' and times.dtype.kind == 'f':
+        # np.array_equal(..., equal_nan=True) requires numpy>=1.19
+        if times0.shape != times.shape:
+            return False
+        isnan = np.isnan(times0)
+        return (np.array_equal(isnan, np.isnan(times)) and
+                np.array_equal(times0[~isnan], times[~isnan]))
+    return np.array_equal(times0, times)
+
+
+def _get_duplicate_rows(ids: np.ndarray, nrows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Finds the rows that have the ids of a row in an earlier object
+
+    Parameters
+    ----------
+    ids : (n, ) or (n, m) int ndarray
+        the ids of the stacked objects
+    nrows : (nobjs, ) int ndarray
+        the number of rows in each object
+
+    Returns
+    -------
+    idup : (ndup, ) int ndarray
+        the duplicate rows
+    iprev : (ndup, ) int ndarray
+        the rows they duplicate
+
+    """
+    if ids.ndim == 2:
+        unused_uids, ikey = np.unique(ids, axis=0, return_inverse=True)
+    else:
+        unused_uids, ikey = np.unique(ids, return_inverse=True)
+    ikey = ikey.ravel()
+    iobj = np.repeat(np.arange(len(nrows)), nrows)
+
+    # sort by id, then by object
+    iorder = np.lexsort((iobj, ikey))
+    is_dup = ((ikey[iorder[1:]] == ikey[iorder[:-1]]) &
+              (iobj[iorder[1:]] != iobj[iorder[:-1]]))
+    return iorder[1:][is_dup], iorder[:-1][is_dup]
+
+
+def _get_rows(datas: List[np.ndarray], offsets: np.ndarray, irows: np.ndarray) -> np.ndarray:
+    """gets the rows of the stacked data without stacking it"""
+    ntimes, unused_nrows, ncols = datas[0].shape
+    rows = np.empty((ntimes, len(irows), ncols), dtype=datas[0].dtype)
+    for i, data in enumerate(datas):
+        is_obj = (offsets[i] <= irows) & (irows < offsets[i+1])
+        rows[:, is_obj, :] = data[:, irows[is_obj] - offsets[i], :]
+    return rows
+
+
+def update_entity_counts(obj: Any) -> None:
+    """updates the number of times/nodes/elements after the data changes"""
+    ntimes, ntotal = obj.data.shape[:2]
+    if hasattr(obj, 'ntimes'):
+        if getattr(obj, 'itime', None) == obj.ntimes:
+            obj.itime = ntimes
+        obj.ntimes = ntimes
+    if hasattr(obj, 'ntotal'):
+        if getattr(obj, 'itotal', None) == obj.ntotal:
+            obj.itotal = ntotal
+        obj.ntotal = ntotal
+    if hasattr(obj, 'nelements'):
+        for key in ['element_node', 'element_layer', 'element']:
+            eids = getattr(obj, key, None)
+            if isinstance(eids, np.ndarray) and eids.ndim and len(eids) == ntotal:
+                if eids.ndim == 2:
+                    eids = eids[:, 0]
+                nelements = len(np.unique(eids))
+                if getattr(obj, 'ielement', None) == obj.nelements:
+                    obj.ielement = nelements
+                obj.nelements = nelements
+                break
@@ -0,0 +1,203 @@
+"""
+Defines the OP2 table-of-contents (TOC) sidecar file:
+  - OP2Index(op2_filename, log)
+    - load()
+    - write()
+    - add_table(table_name, n)
+    - add_subtable(table_name, isubtable, n, record_len, data_code)
+    - add_record(n0, ndata, n1)
+    - get_record(n0)
+  - get_index_filename(op2_filename)
+
+The first time an OP2 is read with ``use_index=True``, the record
+layout is stored in ``model.op2.toc``.  Later reads seek straight over
+the records instead of walking every Fortran block marker to find the
+record length.  The sidecar is rebuilt if the OP2's size or mtime changes.
+
+The layout of the lazy scan (see ``OP2.open_lazy``) is stored as well:
+the sized result objects (e.g., ntimes/ntotal) and their table 3/4
+records, the tables and the few model attributes the table 3 headers
+set.  On later reads, the result objects are built from the layout, so
+the array sizing pass (read_mode=1) is skipped; only the tables that
+can't be lazily loaded (e.g., geometry, eigenvalues) are read.  The
+layout is only used if the result/subcase filters are unchanged.
+
+"""
+from __future__ import annotations
+import os
+import pickle
+from typing import List, Dict, Tuple, Optional, Any
+
+INDEX_VERSION = 2
+
+#: the model attributes set by the table 3 headers during the
+#: array sizing pass, which are stored in the layout
+LAYOUT_MODEL_ATTRS = ['title', 'isubcase_name_map', 'result_names']
+
+
+def get_index_filename(op2_filename: str) -> str:
+    """gets the sidecar filename for an OP2 (e.g., model.op2 -> model.op2.toc)"""
+    return op2_filename + '.toc'
+
+
+def _get_op2_stamp(op2_filename: str) -> Tuple[int, int]:
+    """gets the (size, mtime_ns) of the OP2, which are used to invalidate the index"""
+    stat = os.stat(op2_filename)
+    return stat.st_size, stat.st_mtime_ns
+
+
+class OP2Index:
+    """
+    Stores the table-of-contents for an OP2
+
+    tables : List[Dict[str, Any]]
+        the tables in the order they were read
+        [{'table_name' : 'OUGV1', 'offset' : 1234, 'subtables' : [...]}, ...]
+    records : Dict[int, Tuple[int, int]]
+        maps the starting file position of a record to the
+        record length (summed over all blocks) and the ending position
+        {n0 : (ndata, n1)}
+    layout : Dict[str, Any]; default=None
+        the sized result objects of the lazy scan (see ``OP2._scan_lazy``)
+        {'filters' : ..., 'header' : ..., 'tables' : ..., 'model' : ...,
+         'codes' : ..., 'results' : ...}
+
+    """
+    def __init__(self, op2_filename: str, log: Any) -> None:
+        self.op2_filename = op2_filename
+        self.index_filename = get_index_filename(op2_filename)
+        self.log = log
+
+        #: is the index complete (loaded from a valid sidecar file or
+        #: filled by a finished scan); tables aren't added to it
+        self.is_loaded = False
+        self.tables = []  # type: List[Dict[str, Any]]
+        self.records = {}  # type: Dict[int, Tuple[int, int]]
+        self.layout = None  # type: Optional[Dict[str, Any]]
+
+    def load(self) -> bool:
+        """
+        Loads the sidecar file if it's valid for the current OP2.
+
+        Returns
+        -------
+        is_loaded : bool
+            False if the sidecar doesn't exist, is out of date, or
+            can't be read; the index will be rebuilt
+
+        """
+        self.is_loaded = False
+        self.tables = []
+        self.records = {}
+        self.layout = None
+        if not os.path.exists(self.index_filename):
+            return False
+
+        try:
+            with open(self.index_filename, 'rb') as index_file:
+                data = pickle.load(index_file)
+        except (OSError, ValueError, EOFError, AttributeError, ImportError,
+                pickle.UnpicklingError):
+            self.log.warning(f'cannot read {self.index_filename!r}; rebuilding the index')
+            return False
+
+        size, mtime_ns = _get_op2_stamp(self.op2_filename)
+        if (not isinstance(data, dict) or
+                data.get('version') != INDEX_VERSION or
+                data.get('size') != size or
+                data.get('mtime_ns') != mtime_ns):
+            self.log.info(f'{self.index_filename!r} is out of date; rebuilding the index')
+            return False
+
+        self.tables = data['tables']
+        self.records = {n0: (ndata, n1) for n0, ndata, n1 in zip(*data['records'])}
+        self.layout = data['layout']
+        self.is_loaded = True
+        self.log.debug(f'loaded {self.index_filename!r}; ntables={len(self.tables)} '
+                       f'nrecords={len(self.records)}')
+        return True
+
+    def write(self) -> None:
+        """writes the sidecar file"""
+        size, mtime_ns = _get_op2_stamp(self.op2_filename)
+        n0s = sorted(self.records)
+        ndatas = [self.records[n0][0] for n0 in n0s]
+        n1s = [self.records[n0][1] for n0 in n0s]
+        data = {
+            'version' : INDEX_VERSION,
+            'op2_filename' : os.path.basename(self.op2_filename),
+            'size' : size,
+            'mtime_ns' : mtime_ns,
+            'tables' : self.tables,
+            'records' : [n0s, ndatas, n1s],
+            'layout' : self.layout,
+        }
+        try:
+            with open(self.index_filename, 'wb') as index_file:
+                pickle.dump(data, index_file, protocol=pickle.HIGHEST_PROTOCOL)
+        except (OSError, pickle.PicklingError):
+            self.log.warning(f'cannot write {self.index_filename!r}')
+            return
+        self.log.debug(f'wrote {self.index_filename!r}')
+
+    def add_table(self, table_name: bytes, n: int) -> None:
+        """adds a table to the TOC"""
+        if self.is_loaded:
+            return
+        self.tables.append({
+            'table_name' : table_name.decode('latin1').strip(),
+            'offset' : n,
+            'subtables' : [],
+        })
+
+    def add_subtable(self, table_name: bytes, isubtable: int, n: int,
+                     record_len: int, data_code: Optional[Dict[str, Any]]=None) -> None:
+        """
+        Adds a table 3/table 4 record to the TOC
+
+        Parameters
+        ----------
+        table_name : bytes
+            the current table
+        isubtable : int
+            the subtable counter (-3, -4, ...)
+        n : int
+            the file position of the record
+        record_len : int
+            the length of the record
+        data_code : dict; default=None
+            the table 3 data, which is used to store the
+            subcase/element_type/num_wide; None for table 4
+
+        """
+        if self.is_loaded or not self.tables:
+            return
+        table = self.tables[-1]
+        assert table['table_name'] == table_name.decode('latin1').strip(), (table['table_name'], table_name)
+        subtable = {
+            'isubtable' : isubtable,
+            'offset' : n,
+            'record_len' : record_len,
+        }
+        if data_code is not None:
+            for key in ['isubcase', 'element_type', 'num_wide']:
+                if key in data_code:
+                    subtable[key] = int(data_code[key])
+        table['subtables'].append(subtable)
+
+    def add_record(self, n0: int, ndata: int, n1: int) -> None:
+        """adds a record's length and end position"""
+        self.records[n0] = (ndata, n1)
+
+    def get_record(self, n0: int) -> Optional[Tuple[int, int]]:
+        """gets the (ndata, n1) for a record starting at position n0"""
+        return self.records.get(n0)
+
+    def get_table_names(self) -> List[str]:
+        """gets the table names in the order they're found in the OP2"""
+        return [table['table_name'] for table in self.tables]
+
+    def __repr__(self) -> str:
+        return (f'OP2Index(op2_filename={self.op2_filename!r}, ntables={len(self.tables)}, '
+                f'nrecords={len(self.records)}, is_layout={self.layout is not None}, '
+                f'is_loaded={self.is_loaded})')
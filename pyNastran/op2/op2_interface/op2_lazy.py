@@ -0,0 +1,237 @@
+"""
+Defines the on-demand result loading used by ``OP2.open_lazy``:
+  - LazyScan()
+    - add_table(table_name, n, is_results_table)
+    - add_table4(table_name, subtable_name, obj, n3, n4)
+    - get_eager_tables()
+    - get_records(obj)
+  - LazyResult()
+    - load()
+  - make_lazy(obj, model, result_name, code, records)
+  - unmake_lazy(obj)
+  - get_lazy_item(obj)
+
+``open_lazy`` runs the array sizing pass (read_mode=1), which only reads
+the table 3 headers.  While doing that, ``LazyScan`` tracks which table
+3/4 record pairs feed which result object.  The objects are then
+turned into a ``LazyResult`` (in place) and the table 4 records are only
+read (through ``OP2Reader._read_subtable_3_4``) when the data is first used.
+
+"""
+from __future__ import annotations
+from collections import defaultdict
+from typing import List, Dict, Tuple, Any, TYPE_CHECKING
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.op2.op2 import OP2
+
+
+class LazyScan:
+    """
+    Tracks the records used to fill the result objects
+
+    tables : List[List[bytes, int, bool]]
+        [table_name, offset, is_lazy]
+    records : Dict[int, List[Tuple[bytes, bytes, int, int]]]
+        id(obj) -> [(table_name, subtable_name, n3, n4), ...]
+        n3/n4 are the file positions of the table 3/table 4 records
+
+    """
+    def __init__(self) -> None:
+        self.tables = []  # type: List[List[Any]]
+        self.records = defaultdict(list)  # type: Dict[int, List[Tuple[bytes, bytes, int, int]]]
+        self.objs = {}  # type: Dict[int, Any]
+        self.eager_objs = set()
+
+    def add_table(self, table_name: bytes, n: int, is_results_table: bool) -> None:
+        """
+        Adds a table
+
+        Parameters
+        ----------
+        table_name : bytes
+            the table name
+        n : int
+            the file position of the table
+        is_results_table : bool
+            results tables may be loaded lazily; all other tables
+            (e.g., geometry, matrices, eigenvalues) are read eagerly
+
+        """
+        self.tables.append([table_name, n, is_results_table])
+
+    def add_table4(self, table_name: bytes, subtable_name: bytes, obj: Any,
+                   n3: int, n4: int) -> None:
+        """
+        Links a table 3/table 4 record pair to the object it fills.
+        If the object isn't a vectorized result, the table is read eagerly.
+        """
+        if not self.tables or not self.tables[-1][2]:
+            if obj is not None:
+                self.eager_objs.add(id(obj))
+            return
+
+        if obj is None or not (hasattr(obj, 'ntimes') and hasattr(obj, '_reset_indices')):
+            self._set_eager()
+            return
+        self.objs[id(obj)] = obj
+        self.records[id(obj)].append((table_name, subtable_name, n3, n4))
+
+    def _set_eager(self) -> None:
+        """flags the current table as being read eagerly"""
+        table = self.tables[-1]
+        table[2] = False
+        table_name, n0 = table[:2]
+        for obj_id, records in self.records.items():
+            if any(record[0] == table_name and record[2] >= n0 for record in records):
+                self.eager_objs.add(obj_id)
+
+    def get_eager_tables(self) -> List[Tuple[bytes, int]]:
+        """gets the (table_name, offset) for tables that aren't lazily loaded"""
+        return [(table_name, n) for table_name, n, is_lazy in self.tables
+                if not is_lazy]
+
+    def is_lazy(self, obj: Any) -> bool:
+        """can the object be lazily loaded"""
+        obj_id = id(obj)
+        return (obj_id in self.records and obj_id not in self.eager_objs and
+                self.objs[obj_id] is obj)
+
+    def get_records(self, obj: Any) -> List[Tuple[bytes, bytes, int, int]]:
+        """gets the table 3/4 records for an object"""
+        return self.records[id(obj)]
+
+
+#: the lazy subclass of each result class
+_LAZY_CLASSES = {}  # type: Dict[type, type]
+
+#: the attributes set on a result object by ``make_lazy``
+LAZY_ATTRS = ['_lazy_model', '_lazy_result_name', '_lazy_code', '_lazy_records']
+
+
+class LazyResult:
+    """
+    A mixin for a result object (e.g., RealPlateStressArray), whose
+    table 4 records have not been read yet.
+
+    ``make_lazy`` swaps the class of the result object to a subclass of
+    (LazyResult, RealPlateStressArray), so ``isinstance`` and the
+    dunder methods (e.g., ``len``, ``==``) work as usual.  Metadata
+    (e.g., ntimes, isubcase, table_name) is available without loading.
+    Accessing the data (e.g., ``data``, ``element_node``) or calling a
+    method loads the records and swaps the object back to its real class.
+
+    """
+    def __getattribute__(self, name: str) -> Any:
+        if name.startswith(('__', '_lazy')) or name in ['_real_class', 'load']:
+            return object.__getattribute__(self, name)
+        try:
+            value = object.__getattribute__(self, name)
+        except AttributeError:
+            value = None
+        if value is None or callable(value):
+            object.__getattribute__(self, 'load')()
+            return getattr(self, name)
+        return value
+
+    def load(self) -> Any:
+        """reads the records, restores the real class and returns the result object"""
+        model = object.__getattribute__(self, '_lazy_model')
+        model._load_lazy_result(self)
+        return self
+
+    def __repr__(self) -> str:
+        real_class = object.__getattribute__(self, '_real_class')
+        return (f'LazyResult({real_class.__name__}, result_name={self._lazy_result_name!r}, '
+                f'code={self._lazy_code})')
+
+
+def make_lazy(obj: Any, model: OP2, result_name: str, code: Any,
+              records: List[Tuple[bytes, bytes, int, int]]) -> Any:
+    """
+    Turns a result object into a LazyResult (in place)
+
+    Parameters
+    ----------
+    obj : result
+        the result object from the array sizing pass
+    model : OP2
+        the model that reads the records
+    result_name : str
+        the result name (e.g., 'displacements')
+    code : varies
+        the key of the result during the array sizing pass
+    records : List[(table_name, subtable_name, n3, n4)]
+        the table 3/4 records that fill the object
+
+    Returns
+    -------
+    obj : result
+        the same object
+
+    """
+    real_class = obj.__class__
+    lazy_class = _LAZY_CLASSES.get(real_class)
+    if lazy_class is None:
+        lazy_class = type(real_class)(
+            real_class.__name__, (LazyResult, real_class),
+            {'__module__' : real_class.__module__,
+             '__qualname__' : real_class.__qualname__,
+             '_real_class' : real_class})
+        _LAZY_CLASSES[real_class] = lazy_class
+
+    obj._lazy_model = model
+    obj._lazy_result_name = result_name
+    obj._lazy_code = code
+    obj._lazy_records = records
+    obj.__class__ = lazy_class
+    return obj
+
+
+def unmake_lazy(obj: Any) -> Tuple[str, Any, List[Tuple[bytes, bytes, int, int]]]:
+    """
+    Swaps a LazyResult back to its real class without reading the records
+
+    Returns
+    -------
+    result_name : str
+        the result name (e.g., 'displacements')
+    code : varies
+        the key of the result during the array sizing pass
+    records : List[(table_name, subtable_name, n3, n4)]
+        the table 3/4 records that fill the object
+
+    """
+    obj.__class__ = obj._real_class
+    result_name = obj._lazy_result_name
+    code = obj._lazy_code
+    records = obj._lazy_records
+    for name in LAZY_ATTRS:
+        del obj.__dict__[name]
+    return result_name, code, records
+
+
+def get_lazy_item(obj: Any) -> Tuple[str, Any, type, Dict[str, Any],
+                                     List[Tuple[bytes, bytes, int, int]]]:
+    """
+    Gets the sized result object of a LazyResult without reading the
+    records, so it can be pickled (e.g., sent to a worker)
+
+    Returns
+    -------
+    result_name : str
+        the result name (e.g., 'displacements')
+    code : varies
+        the key of the result during the array sizing pass
+    obj_class : type
+        the real class of the result
+    obj_state : Dict[str, Any]
+        the ``__dict__`` of the result without the lazy attributes
+    records : List[(table_name, subtable_name, n3, n4)]
+        the table 3/4 records that fill the object
+
+    """
+    # __dict__ is used, so the result isn't loaded
+    obj_state = {name: value for name, value in obj.__dict__.items()
+                 if name not in LAZY_ATTRS}
+    return (obj._lazy_result_name, obj._lazy_code, obj._real_class,
+            obj_state, obj._lazy_records)
@@ -0,0 +1,537 @@
+"""
+Defines the parallel result decoding used by ``read_op2(..., nworkers=N)``
+and ``read_op2_many(..., nworkers=N)``:
+  - read_results_parallel(model, nworkers)
+  - read_runs(model, op2_filenames, nworkers=1, combine_runs='stack', ...)
+  - split_keys(keys_weights, nworkers)
+
+The parent runs the lazy scan (see ``OP2.open_lazy``), which finds the
+table 3/4 records for each result object.  The results are split across
+``nworkers`` processes by size.  Each worker gets the sized result objects
+and their record offsets, so it only reads the OP2 header before seeking
+to the records.  The decoded results are returned and large arrays are
+passed back through shared memory (Python 3.8+) instead of being pickled.
+If the parent fails, the blocks that weren't loaded are unlinked.
+
+For many OP2s (one per run), each worker reads an entire OP2.  The runs
+complete in any order.  For combine_runs='stack', the parent stacks the
+data of each run as it arrives; for combine_runs='subcase', the runs are
+buffered and added in order, so the subcases are numbered by run.
+
+"""
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor, Future, as_completed
+from typing import List, Dict, Set, Tuple, Optional, Callable, Any, TYPE_CHECKING
+
+import numpy as np
+try:
+    from multiprocessing import shared_memory, resource_tracker
+    IS_SHARED_MEMORY = True
+except ImportError:  # pragma: no cover
+    # Python 3.7
+    IS_SHARED_MEMORY = False
+
+from pyNastran.op2.op2_interface.op2_lazy import LazyResult, make_lazy, get_lazy_item
+from pyNastran.op2.op2_interface.op2_combine import _is_equal_times
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.op2.op2 import OP2
+
+#: arrays smaller than this (in bytes) are pickled
+MIN_SHARED_NBYTES = 1024 * 1024
+
+
+class SharedArray:
+    """a reference to an array stored in a shared memory block"""
+    def __init__(self, name: str, shape: Tuple[int, ...], dtype: str) -> None:
+        self.name = name
+        self.shape = shape
+        self.dtype = dtype
+
+
+def split_keys(keys_weights: List[Tuple[Any, int]],
+               nworkers: int) -> List[List[Any]]:
+    """
+    Splits the results, so each worker has a similar amount of data.
+    The largest results are assigned first to the least loaded worker.
+
+    Parameters
+    ----------
+    keys_weights : List[(key, weight)]
+        the results and their size
+    nworkers : int
+        the number of workers
+
+    Returns
+    -------
+    groups : List[List[key]]
+        the keys for each worker; empty groups are removed
+
+    """
+    groups = [[] for i in range(nworkers)]  # type: List[List[Any]]
+    loads = np.zeros(nworkers, dtype='int64')
+    for key, weight in sorted(keys_weights, key=lambda key_weight: -key_weight[1]):
+        i = loads.argmin()
+        groups[i].append(key)
+        loads[i] += weight
+    return [group for group in groups if group]
+
+
+def read_results_parallel(model: OP2, nworkers: int) -> None:
+    """
+    Decodes the LazyResults in a model that was scanned with
+    ``OP2._scan_lazy`` and replaces them with the result objects.
+
+    Parameters
+    ----------
+    model : OP2
+        the scanned model
+    nworkers : int
+        the number of processes
+
+    """
+    keys_weights = []
+    items = {}  # type: Dict[Tuple[str, Any], Tuple[str, Any, type, Dict[str, Any], List[Any]]]
+    for result_name in model.get_table_types():
+        result = model.get_result(result_name)
+        if not isinstance(result, dict):
+            continue
+        for key, obj in result.items():
+            if not isinstance(obj, LazyResult):
+                continue
+            # __dict__ is used, so the result isn't loaded
+            state = obj.__dict__
+            weight = max(state.get('ntimes', 1), 1) * max(state.get('ntotal', 1), 1)
+            keys_weights.append(((result_name, key), weight))
+
+            # the sized object and its records are sent, so the worker
+            # doesn't have to scan the OP2
+            items[(result_name, key)] = get_lazy_item(obj)
+    if not keys_weights:
+        return
+
+    groups = split_keys(keys_weights, nworkers)
+    model.log.debug(f'decoding {len(keys_weights)} results with {len(groups)} workers')
+    filters, saved_results = _get_filters(model)
+    args = (model.op2_filename, model._nastran_format, model.encoding,
+            model.skip_undefined_matrices, model.op2_reader.use_mmap,
+            filters, saved_results)
+
+    def add_results(igroup: int, unused_header: Dict[str, Any],
+                    objs: List[Tuple[str, Any, Any]]) -> None:
+        for (result_name, key), (unused_result_name, unused_code, obj) in zip(groups[igroup], objs):
+            model.get_result(result_name)[key] = obj
+
+    with ProcessPoolExecutor(max_workers=len(groups)) as executor:
+        futures = [executor.submit(_read_results, *args, [items[key] for key in keys])
+                   for keys in groups]
+        _load_futures(futures, add_results)
+
+
+def _load_futures(futures: List[Future],
+                  add_objs: Callable[[int, Dict[str, Any], List[Tuple[str, Any, Any]]], None],
+                  ) -> None:
+    """
+    Loads the shared arrays of the worker results (header, objs) as
+    they complete and passes them to ``add_objs(ifuture, header, objs)``.
+    If a worker or the parent fails, the shared memory blocks of the
+    results that weren't loaded are unlinked (the workers unregister
+    them from the resource_tracker, so nothing else would).
+    """
+    ifutures = {future: ifuture for ifuture, future in enumerate(futures)}
+    pending = set(futures)
+    try:
+        for future in as_completed(ifutures):
+            header, objs = future.result()
+            for unused_result_name, unused_code, obj in objs:
+                if hasattr(obj, '__dict__'):
+                    _load_shared_arrays(obj)
+                    _reset_nan_nonlinear_factor(obj)
+            pending.remove(future)
+            add_objs(ifutures[future], header, objs)
+    finally:
+        for future in pending:
+            if future.cancel():
+                continue
+            try:
+                unused_header, objs = future.result()
+            except Exception:
+                continue
+            for unused_result_name, unused_code, obj in objs:
+                if hasattr(obj, '__dict__'):
+                    _unlink_shared_arrays(obj)
+
+
+def read_runs(model: OP2, op2_filenames: List[str], nworkers: int=1,
+              combine_runs: str='stack', mode: Optional[str]=None,
+              encoding: Optional[str]=None,
+              skip_undefined_matrices: bool=True) -> None:
+    """
+    Reads the results of many OP2s (runs) into a model
+
+    Parameters
+    ----------
+    model : OP2
+        the model to fill; the subcase/result filters are used
+    op2_filenames : List[str]
+        the OP2s (one per run)
+    nworkers : int; default=1
+        the number of processes; each one reads an entire OP2
+    combine_runs : str; default='stack'
+        'stack' : the results of the first run are kept; if a result
+                  has the same shape and ids in every run, the data of
+                  the runs is stacked into ``obj.run_data`` with shape
+                  (nruns, ntimes, nentities, ncols) and
+                  ``obj.data = obj.run_data[0]``
+        'subcase' : the results of all the runs are kept; the subcases
+                    are renumbered (1, 2, 3, ...) in the order of the
+                    runs (see ``model.run_subcases``)
+        The Nastran format and date of the model come from the first run.
+    mode / encoding / skip_undefined_matrices
+        see ``read_op2``
+
+    """
+    assert combine_runs in ['stack', 'subcase'], combine_runs
+    model.op2_filenames = op2_filenames
+    model.run_subcases = {}  # type: Dict[int, Tuple[int, int]]
+    filters, saved_results = _get_filters(model)
+    args = (mode, encoding, skip_undefined_matrices, filters, saved_results)
+
+    nruns = len(op2_filenames)
+    stacked = {}  # type: Dict[Tuple[str, Any], Any]
+    iruns_stacked = {}  # type: Dict[Tuple[str, Any], Set[int]]
+    add_objs = _get_add_run(model, nruns, combine_runs, stacked, iruns_stacked)
+
+    def add_run(irun: int, header: Dict[str, Any], objs: List[Tuple[str, Any, Any]]) -> None:
+        if irun == 0:
+            _set_header(model, header)
+        add_objs(irun, objs)
+
+    if nworkers > 1 and nruns > 1:
+        with ProcessPoolExecutor(max_workers=min(nworkers, nruns)) as executor:
+            futures = [executor.submit(_read_run, op2_filename, *args, True)
+                       for op2_filename in op2_filenames]
+            _load_futures(futures, add_run)
+    else:
+        for irun, op2_filename in enumerate(op2_filenames):
+            header, objs = _read_run(op2_filename, *args, False)
+            add_run(irun, header, objs)
+
+    if combine_runs == 'stack':
+        _finish_stack(model, nruns, stacked, iruns_stacked)
+
+
+def _get_add_run(model: OP2, nruns: int, combine_runs: str,
+                 stacked: Dict[Tuple[str, Any], Any],
+                 iruns_stacked: Dict[Tuple[str, Any], Set[int]],
+                 ) -> Callable[[int, List[Tuple[str, Any, Any]]], None]:
+    """
+    Gets the function that adds the results of a run to the model.
+    The runs may be added in any order.
+    """
+    if combine_runs == 'stack':
+        def add_run(irun: int, objs: List[Tuple[str, Any, Any]]) -> None:
+            _stack_run(model, irun, nruns, objs, stacked, iruns_stacked)
+        return add_run
+
+    # the subcases are renumbered in the order of the runs
+    buffered_runs = {}  # type: Dict[int, List[Tuple[str, Any, Any]]]
+    irun_next = 0
+    def add_run(irun: int, objs: List[Tuple[str, Any, Any]]) -> None:
+        nonlocal irun_next
+        buffered_runs[irun] = objs
+        while irun_next in buffered_runs:
+            _add_subcase_run(model, irun_next, buffered_runs.pop(irun_next))
+            irun_next += 1
+    return add_run
+
+
+def _add_subcase_run(model: OP2, irun: int,
+                     objs: List[Tuple[str, Any, Any]]) -> None:
+    """adds the results of a run to the model with renumbered subcases"""
+    isubcases = sorted({obj.isubcase for unused_result_name, code, obj in objs
+                        if _is_subcase_code(code, obj)})
+    isubcase_map = {}
+    for isubcase in isubcases:
+        isubcase_new = len(model.run_subcases) + 1
+        isubcase_map[isubcase] = isubcase_new
+        model.run_subcases[isubcase_new] = (irun, isubcase)
+
+    for result_name, code, obj in objs:
+        result = model.get_result(result_name)
+        if not _is_subcase_code(code, obj):
+            result.setdefault(code, obj)
+            continue
+        isubcase_new = isubcase_map[obj.isubcase]
+        obj.isubcase = isubcase_new
+        if isinstance(code, tuple):
+            code = (isubcase_new, ) + code[1:]
+        else:
+            code = isubcase_new
+        result[code] = obj
+
+
+def _stack_run(model: OP2, irun: int, nruns: int,
+               objs: List[Tuple[str, Any, Any]],
+               stacked: Dict[Tuple[str, Any], Any],
+               iruns_stacked: Dict[Tuple[str, Any], Set[int]]) -> None:
+    """
+    Stacks the data of a run.  The objects of the first run are stored
+    in the model.  The object of the first run to arrive holds run_data
+    until run 0 arrives, then run_data is moved to the run 0 object.
+    """
+    log = model.log
+    for result_name, code, obj in objs:
+        key = (result_name, code)
+        if irun == 0:
+            model.get_result(result_name)[code] = obj
+        data = getattr(obj, 'data', None)
+        if not isinstance(data, np.ndarray) or data.ndim != 3:
+            continue
+        if key not in stacked:
+            obj.run_data = np.zeros((nruns, ) + data.shape, dtype=data.dtype)
+            stacked[key] = obj
+            iruns_stacked[key] = set()
+
+        obj0 = stacked[key]
+        if obj0 is None:
+            continue
+        if obj0 is not obj and not _is_same_layout(obj0, obj):
+            log.warning(f'{result_name}[{code}] is different in run {irun}; '
+                        'the runs are not stacked')
+            _unstack(stacked, key)
+            continue
+        obj0.run_data[irun] = data
+        iruns_stacked[key].add(irun)
+        if irun == 0:
+            if obj0 is not obj:
+                obj.run_data = obj0.run_data
+                del obj0.run_data
+                stacked[key] = obj
+            obj.data = obj.run_data[0]
+
+
+def _finish_stack(model: OP2, nruns: int,
+                  stacked: Dict[Tuple[str, Any], Any],
+                  iruns_stacked: Dict[Tuple[str, Any], Set[int]]) -> None:
+    """unstacks the results that aren't in every run"""
+    log = model.log
+    for key, obj in stacked.items():
+        if obj is None:
+            continue
+        result_name, code = key
+        iruns = iruns_stacked[key]
+        if 0 not in iruns:
+            log.warning(f'{result_name}[{code}] is not in the first run; skipping')
+            del obj.run_data
+        elif len(iruns) < nruns:
+            iruns_missing = sorted(set(range(nruns)) - iruns)
+            log.warning(f'{result_name}[{code}] is missing from runs {iruns_missing}; '
+                        'the runs are not stacked')
+            _unstack(stacked, key)
+
+
+def _unstack(stacked: Dict[Tuple[str, Any], Any], key: Tuple[str, Any]) -> None:
+    """keeps the result of the first run"""
+    obj = stacked[key]
+    if obj.data.base is obj.run_data:
+        obj.data = obj.data.copy()
+    del obj.run_data
+    stacked[key] = None
+
+
+def _is_subcase_code(code: Any, obj: Any) -> bool:
+    """is the result stored by subcase (vs. title/name)"""
+    if not hasattr(obj, 'isubcase'):
+        return False
+    if isinstance(code, tuple):
+        return len(code) > 0 and code[0] == obj.isubcase
+    return isinstance(code, (int, np.integer)) and code == obj.isubcase
+
+
+def _is_same_layout(obj0: Any, obj: Any) -> bool:
+    """can the data of two runs be stacked"""
+    if obj0.class_name != obj.class_name:
+        return False
+    data = getattr(obj, 'data', None)
+    if not isinstance(data, np.ndarray) or data.shape != obj0.run_data.shape[1:]:
+        return False
+    times0 = getattr(obj0, '_times', None)
+    if times0 is not None and not _is_equal_times(times0, getattr(obj, '_times', None)):
+        return False
+    for name in ['node_gridtype', 'element_node', 'element_layer', 'element']:
+        ids0 = getattr(obj0, name, None)
+        if isinstance(ids0, np.ndarray):
+            return np.array_equal(ids0, getattr(obj, name, None))
+    return True
+
+
+def _get_header(model: OP2) -> Dict[str, Any]:
+    """the Nastran format/version and date of an OP2, so the combined model can be written"""
+    header = {
+        'nastran_format' : model._nastran_format,
+        'date' : model.date,
+        'post' : model.post,
+    }
+    return header
+
+
+def _set_header(model: OP2, header: Dict[str, Any]) -> None:
+    """sets the Nastran format/version and date from ``_get_header``"""
+    nastran_format = header['nastran_format']
+    if nastran_format in ['msc', 'nx', 'autodesk', 'nasa95', 'optistruct']:
+        model.set_mode(nastran_format)
+    else:
+        model._nastran_format = nastran_format
+    model.date = header['date']
+    model.post = header['post']
+
+
+def _get_filters(model: OP2) -> Tuple[Dict[str, Any], Set[str]]:
+    """the subcase/result filters, so the workers create the same objects"""
+    filters = {
+        'is_all_subcases' : model.is_all_subcases,
+        'valid_subcases' : model.valid_subcases,
+    }
+    saved_results = set(model._results.saved)
+    return filters, saved_results
+
+
+def _read_run(op2_filename: str, mode: Optional[str], encoding: Optional[str],
+              skip_undefined_matrices: bool,
+              filters: Dict[str, Any], saved_results: Set[str],
+              is_shared: bool) -> Tuple[Dict[str, Any], List[Tuple[str, Any, Any]]]:
+    """
+    Reads the results of an OP2 (in a worker if is_shared=True).
+    Returns the header (see ``_get_header``) and the results.
+    """
+    from pyNastran.op2.op2 import OP2
+    model = OP2(debug=None, mode=mode)
+    for name, value in filters.items():
+        setattr(model, name, value)
+    model._results.saved = saved_results
+    model.read_op2(op2_filename, combine=True, build_dataframe=False,
+                   skip_undefined_matrices=skip_undefined_matrices,
+                   encoding=encoding)
+
+    objs = []
+    for result_name in model.get_table_types():
+        result = model.get_result(result_name)
+        if not isinstance(result, dict):
+            continue
+        for code, obj in result.items():
+            if is_shared and hasattr(obj, '__dict__'):
+                _save_shared_arrays(obj)
+            objs.append((result_name, code, obj))
+    return _get_header(model), objs
+
+
+def _read_results(op2_filename: str, mode: str, encoding: str,
+                  skip_undefined_matrices: bool, use_mmap: bool,
+                  filters: Dict[str, Any], saved_results: Set[str],
+                  items: List[Tuple[str, Any, type, Dict[str, Any], List[Any]]],
+                  ) -> Tuple[Dict[str, Any], List[Tuple[str, Any, Any]]]:
+    """
+    Decodes a group of results in a worker.  The sized objects and
+    their records come from the parent's scan, so only the OP2 header
+    is read before seeking to the records.  Returns the header (see
+    ``_get_header``) and the results.
+    """
+    from pyNastran.op2.op2 import OP2
+    model = OP2(debug=None, mode=mode)
+    for name, value in filters.items():
+        setattr(model, name, value)
+    model._results.saved = saved_results
+    model.skip_undefined_matrices = skip_undefined_matrices
+    model._read_lazy_header(op2_filename, encoding=encoding, use_mmap=use_mmap)
+
+    objs = []
+    for result_name, code, obj_class, obj_state, records in items:
+        obj = obj_class.__new__(obj_class)
+        obj.__dict__.update(obj_state)
+        _reset_nan_nonlinear_factor(obj)
+        model.get_result(result_name)[code] = make_lazy(
+            obj, model, result_name, code, records)
+        obj.load()
+        objs.append((result_name, code, obj))
+
+    try:
+        for unused_result_name, unused_code, obj in objs:
+            _save_shared_arrays(obj)
+    except Exception:
+        for unused_result_name, unused_code, obj in objs:
+            _unlink_shared_arrays(obj)
+        raise
+    return _get_header(model), objs
+
+
+def _save_shared_arrays(obj: Any) -> None:
+    """
+    Moves the large arrays of a result object into shared memory.  The
+    blocks are unregistered from the resource_tracker, so they outlive
+    the worker; the parent unlinks them (see ``_load_futures``).
+    """
+    if not IS_SHARED_MEMORY:
+        return
+    for name, value in list(obj.__dict__.items()):
+        if not isinstance(value, np.ndarray) or value.nbytes < MIN_SHARED_NBYTES:
+            continue
+        if value.dtype.hasobject:
+            continue
+        shm = shared_memory.SharedMemory(create=True, size=value.nbytes)
+        try:
+            array = np.ndarray(value.shape, dtype=value.dtype, buffer=shm.buf)
+            array[...] = value
+            del array
+        except Exception:
+            shm.close()
+            shm.unlink()
+            raise
+        setattr(obj, name, SharedArray(shm.name, value.shape, value.dtype.str))
+        shm.close()
+
+        # the parent unlinks the block once it's copied
+        resource_tracker.unregister(shm._name, 'shared_memory')
+
+
+def _load_shared_arrays(obj: Any) -> None:
+    """copies the shared memory arrays back into the result object"""
+    for name, value in list(obj.__dict__.items()):
+        if not isinstance(value, SharedArray):
+            continue
+        shm = shared_memory.SharedMemory(name=value.name)
+        try:
+            array = np.ndarray(value.shape, dtype=value.dtype, buffer=shm.buf).copy()
+        finally:
+            shm.close()
+            shm.unlink()
+        setattr(obj, name, array)
+
+
+def _reset_nan_nonlinear_factor(obj: Any) -> None:
+    """
+    A NaN nonlinear_factor (a static result) is a new float once it's
+    pickled, so it fails the ``nonlinear_factor not in (None, np.nan)``
+    checks, which rely on it being ``np.nan``.
+    """
+    nonlinear_factor = obj.__dict__.get('nonlinear_factor')
+    if isinstance(nonlinear_factor, float) and np.isnan(nonlinear_factor):
+        obj.nonlinear_factor = np.nan
+    data_code = obj.__dict__.get('data_code')
+    if isinstance(data_code, dict):
+        nonlinear_factor = data_code.get('nonlinear_factor')
+        if isinstance(nonlinear_factor, float) and np.isnan(nonlinear_factor):
+            data_code['nonlinear_factor'] = np.nan
+
+
+def _unlink_shared_arrays(obj: Any) -> None:
+    """unlinks the shared memory blocks of a result object that won't be loaded"""
+    for name, value in list(obj.__dict__.items()):
+        if not isinstance(value, SharedArray):
+            continue
+        try:
+            shm = shared_memory.SharedMemory(name=value.name)
+        except FileNotFoundError:
+            continue
+        shm.close()
+        shm.unlink()
+        setattr(obj, name, None)
@@ -44,10 +44,11 @@ Defines various tables that don't fit in other sections:
 from __future__ import annotations
 import os
 import sys
+import mmap
 from copy import deepcopy
 from itertools import count
 from struct import unpack, Struct # , error as struct_error
-from typing import Tuple, Optional, Callable, TYPE_CHECKING
+from typing import List, Tuple, Optional, Callable, TYPE_CHECKING
 
 import numpy as np
 import scipy  # type: ignore
@@ -123,6 +124,20 @@ class OP2Reader:
         self.h5_file = None
         self.size = 4
 
+        #: the table-of-contents that lets us jump over records
+        #: (see ``OP2Index``); None if not using an index
+        self.op2_index = None
+
+        #: tracks the records for each result object (see ``OP2.open_lazy``)
+        self.lazy_scan = None
+
+        #: should the results records be read from a memory map
+        self.use_mmap = False
+        #: the memory map of the OP2 (and a memoryview of it)
+        self.mmap = None
+        self.mmap_view = None
+        self._n_table3 = None
+
         # Hack to dump the IBULK/CASECC decks in reverse order
         # It's in reverse because that's how Nastran writes it.
         #
@@ -4956,6 +4971,89 @@ class OP2Reader:
             record = b''.join(records)
         return record, nrecord
 
+    def open_mmap(self) -> None:
+        """memory maps the OP2, so records can be sliced without copying"""
+        self.mmap = mmap.mmap(self.op2.f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.mmap_view = memoryview(self.mmap)
+
+    def close_mmap(self) -> None:
+        """closes the memory map"""
+        if self.mmap is None:
+            return
+        try:
+            self.mmap_view.release()
+            self.mmap.close()
+        except BufferError:
+            # an array still references the mapping (e.g., np.frombuffer),
+            # so it will be closed when the array is garbage collected
+            self.log.debug('cannot close the memory map; arrays reference it')
+        self.mmap = None
+        self.mmap_view = None
+
+    def _read_record_ndata_mmap(self) -> Tuple[memoryview, int]:
+        """
+        Reads a record and the length of the record from the memory map.
+
+        A single block record is a memoryview into the mapping, so no data
+        is copied.  A multi-block record is copied once into a
+        preallocated buffer instead of being joined from a list of bytes.
+
+        Returns
+        -------
+        record : memoryview
+            the data in binary
+        nrecord : int
+            len(record)
+
+        """
+        if self.mmap is None or self.is_debug_file:
+            return self._read_record_ndata()
+
+        op2 = self.op2
+        size = self.size
+        mm = self.mmap
+        view = self.mmap_view
+        nmm = len(mm)
+        unpack_ndata = op2.struct_i.unpack_from
+        unpack_marker = op2.struct_i.unpack_from if size == 4 else op2.struct_q.unpack_from
+
+        # [size, marker0, size]
+        n = op2.n
+        marker0, = unpack_marker(mm, n + 4)
+        n += 8 + size
+
+        # [ndata, data, ndata]
+        ndata, = unpack_ndata(mm, n)
+        if marker0 * size != ndata:
+            # let the file based reader handle the error
+            return self._read_record_ndata()
+        blocks = [(n + 4, ndata)]
+        n += 8 + ndata
+        nrecord = ndata
+
+        # continuation blocks have a positive marker
+        while n + 8 + size <= nmm:
+            marker1, = unpack_marker(mm, n + 4)
+            if marker1 <= 0:
+                break
+            n += 8 + size
+            ndata, = unpack_ndata(mm, n)
+            blocks.append((n + 4, ndata))
+            n += 8 + ndata
+            nrecord += ndata
+        self._goto(n)
+
+        if len(blocks) == 1:
+            i0, ndata = blocks[0]
+            return view[i0:i0+ndata], nrecord
+
+        record = bytearray(nrecord)
+        i = 0
+        for i0, ndata in blocks:
+            record[i:i+ndata] = view[i0:i0+ndata]
+            i += ndata
+        return memoryview(record), nrecord
+
     def _read_record_ndata8(self, debug=True, macro_rewind=False) -> Tuple[bytes, int]:
         """reads a record and the length of the record for size=8"""
         op2 = self.op2
@@ -5469,6 +5567,26 @@ class OP2Reader:
             markers = self.get_nmarkers(1, rewind=True)
         self.read_markers([0])
 
+    def _skip_indexed_record(self) -> Optional[int]:
+        """
+        Jumps over a record using the table-of-contents
+
+        Returns
+        -------
+        nrecord : int / None
+            int : the length of the record that was skipped
+            None : the record isn't in the index (or there is no index)
+
+        """
+        if self.op2_index is None or self.is_debug_file:
+            return None
+        record = self.op2_index.get_record(self.op2.n)
+        if record is None:
+            return None
+        nrecord, n1 = record
+        self._goto(n1)
+        return nrecord
+
     def _skip_record(self):
         """
         the skip version of ``_read_record``
@@ -5479,6 +5597,8 @@ class OP2Reader:
             a record of None indicates a skipped block
 
         """
+        if self._skip_indexed_record() is not None:
+            return None
         unused_markers0 = self.get_nmarkers(1, rewind=False)
         record = self._skip_block()
 
@@ -5498,6 +5618,10 @@ class OP2Reader:
     def _skip_record_ndata4(self, debug=True, macro_rewind=False):
         """the skip version of ``_read_record_ndata``"""
         op2 = self.op2
+        nrecord = self._skip_indexed_record()
+        if nrecord is not None:
+            return None, nrecord
+        n0 = op2.n
         marker0 = self.get_marker1_4(rewind=False, macro_rewind=macro_rewind)
         if self.is_debug_file and debug:
             self.binary_debug.write('read_record - marker = [4, %i, 4]; macro_rewind=%s\n' % (
@@ -5541,11 +5665,17 @@ class OP2Reader:
                 marker1 = self.get_marker1_4(rewind=True)
                 if self.is_debug_file and debug:
                     self.binary_debug.write(f'read_record - marker1 = [4, {marker1}, 4]\n')
+        if self.op2_index is not None:
+            self.op2_index.add_record(n0, nrecord, op2.n)
         return record, nrecord
 
     def _skip_record_ndata8(self, debug=True, macro_rewind=False):
         """the skip version of ``_read_record_ndata``"""
         op2 = self.op2
+        nrecord = self._skip_indexed_record()
+        if nrecord is not None:
+            return None, nrecord
+        n0 = op2.n
         marker0 = self.get_marker1_8(rewind=False, macro_rewind=macro_rewind)
         if self.is_debug_file and debug:
             self.binary_debug.write('read_record - marker = [8, %i, 8]; macro_rewind=%s\n' % (
@@ -5573,6 +5703,8 @@ class OP2Reader:
                 marker1 = self.get_marker1_8(rewind=True)
                 if self.is_debug_file and debug:
                     self.binary_debug.write(f'read_record - marker1 = [8, {marker1}, 8]\n')
+        if self.op2_index is not None:
+            self.op2_index.add_record(n0, nrecord, op2.n)
         return record, nrecord
 
     def _get_record_length(self):
@@ -5592,6 +5724,10 @@ class OP2Reader:
             self.binary_debug.write('_get_record_length\n')
         len_record = 0
         n0 = op2.n
+        if self.op2_index is not None and not self.is_debug_file:
+            record = self.op2_index.get_record(n0)
+            if record is not None:
+                return record[0]
         markers0 = self.get_nmarkers(1, rewind=False)
         if self.is_debug_file:
             self.binary_debug.write('  markers0=%s\n' % markers0)
@@ -5612,6 +5748,8 @@ class OP2Reader:
             unused_record = self._skip_block()
             len_record += op2.n - n - 8  # -8 is for the block
             markers1 = self.get_nmarkers(1, rewind=True)
+        if self.op2_index is not None:
+            self.op2_index.add_record(n0, len_record, op2.n)
         self._goto(n0)
         return len_record
 
@@ -5994,6 +6132,7 @@ class OP2Reader:
         if self.binary_debug:
             self.binary_debug.write('-' * 60 + '\n')
         # this is the length of the current record inside table3/table4
+        n0 = op2.n
         record_len = self._get_record_length()
         if self.is_debug_file:
             self.binary_debug.write(f'record_length = {record_len:d}\n')
@@ -6015,6 +6154,7 @@ class OP2Reader:
                 'size' : self.size,
             }
             op2.obj = None
+            self._n_table3 = n0
             data, ndata = self._read_record_ndata()
             if not passer:
                 try:
@@ -6034,6 +6174,8 @@ class OP2Reader:
                         if IS_TESTING:
                             self._run_checks(table4_parser)
 
+                        if self.lazy_scan is not None and self.read_mode == 1:
+                            self.lazy_scan.add_table4(table_name, op2.subtable_name, None, n0, n0)
                         if self.read_mode == 1:
                             #op2_reader._goto(n)
                             #n = op2_reader._skip_record()
@@ -6049,7 +6191,12 @@ class OP2Reader:
                     raise RuntimeError(op2.code_information())
                 #if hasattr(op2, 'isubcase'):
                     #print("code = ", op2._get_code())
+            if self.op2_index is not None and self.read_mode == 1:
+                self.op2_index.add_subtable(table_name, op2.isubtable, n0, record_len,
+                                            op2.data_code)
         else:
+            if self.op2_index is not None and self.read_mode == 1:
+                self.op2_index.add_subtable(table_name, op2.isubtable, n0, record_len)
             if table_name in GEOM_TABLES:
                 if passer:
                     data = self._skip_record()
@@ -6064,14 +6211,54 @@ class OP2Reader:
                     # num_wide is the result size and is usually found in
                     # table3, but some B-list tables don't have it
                     unused_n = op2._read_subtable_results(table4_parser, record_len)
+                    if self.lazy_scan is not None and self.read_mode == 1:
+                        self.lazy_scan.add_table4(table_name, op2.subtable_name, op2.obj,
+                                                  self._n_table3, n0)
                 else:
                     data, ndata = self._read_record_ndata()
                     unused_n = table4_parser(data, ndata)
                     if IS_TESTING:
                         self._run_checks(table4_parser)
+                    if self.lazy_scan is not None and self.read_mode == 1:
+                        self.lazy_scan.add_table4(table_name, op2.subtable_name, None,
+                                                  self._n_table3, n0)
                 #del n
         return None
 
+    def read_lazy_records(self, records: List[Tuple[bytes, bytes, int, int]],
+                          count: int=0) -> None:
+        """
+        Reads the table 3/table 4 record pairs for a lazily loaded result
+
+        Parameters
+        ----------
+        records : List[(table_name, subtable_name, n3, n4)]
+            table_name / subtable_name : bytes
+                the table name and the name from the table header
+            n3 / n4 : int
+                the file position of the table 3/table 4 records
+        count : int; default=0
+            the optimization count of the result (the 4th value of the key),
+            which comes from the tables before the records
+
+        """
+        op2 = self.op2
+        op2._count = count
+        table_mapper = op2._get_table_mapper()
+        for table_name, subtable_name, n3, n4 in records:
+            op2.table_name = table_name
+            op2.subtable_name = subtable_name
+            op2._table4_count = 0
+            op2.is_table_1 = True
+            op2._data_factor = 1
+            table3_parser, table4_parser = table_mapper[table_name]
+
+            self._goto(n3)
+            self._read_subtable_3_4(table3_parser, table4_parser, False)
+            self._goto(n4)
+            self._read_subtable_3_4(table3_parser, table4_parser, False)
+        op2._finish()
+
     def _run_checks(self, table4_parser):
         """helper method"""
         if table4_parser != self.op2._table_passer:
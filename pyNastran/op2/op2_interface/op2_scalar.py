@@ -63,6 +63,7 @@ from pyNastran import is_release, __version__
 from pyNastran.f06.errors import FatalError
 from pyNastran.op2.errors import EmptyRecordError
 from pyNastran.op2.op2_interface.op2_reader import OP2Reader, reshape_bytes_block
+from pyNastran.op2.op2_interface.op2_index import OP2Index
 from pyNastran.bdf.cards.params import PARAM
 
 #============================
@@ -1709,7 +1710,8 @@ class OP2_Scalar(OP2Common, FortranFormat):
                  combine: bool=False,
                  load_as_h5: bool=False,
                  h5_file=None,
-                 mode: Optional[str]=None) -> None:
+                 mode: Optional[str]=None,
+                 use_index: bool=False) -> None:
         """
         Starts the OP2 file reading
 
@@ -1728,6 +1730,9 @@ class OP2_Scalar(OP2Common, FortranFormat):
         h5_file : h5File; default=None
             None : ???
             h5File : ???
+        use_index : bool; default=False
+            uses/creates the table-of-contents sidecar (model.op2.toc),
+            so records may be jumped over instead of walked
 
         +--------------+-----------------------+
         | op2_filename | Description           |
@@ -1766,6 +1771,15 @@ class OP2_Scalar(OP2Common, FortranFormat):
                 if os.path.getsize(op2_filename) == 0:
                     raise IOError(f'op2_filename={op2_filename!r} is empty.')
                 raise IOError(f'op2_filename={op2_filename!r} is not a binary OP2.')
+            op2_index = None
+            if use_index:
+                op2_index = OP2Index(op2_filename, self.log)
+                op2_index.load()
+            elif self.op2_reader.lazy_scan is not None:
+                # the record lengths are kept in memory, so the records of
+                # a lazy result can be sized without walking their markers
+                op2_index = OP2Index(op2_filename, self.log)
+            self.op2_reader.op2_index = op2_index
 
         self._create_binary_debug()
         self._setup_op2()
@@ -1804,6 +1818,11 @@ class OP2_Scalar(OP2Common, FortranFormat):
             self.show(500, types='ifs', endian=None, force=False)
             self._finish()
 
+        op2_index = self.op2_reader.op2_index
+        if (use_index and self.read_mode == 1 and op2_index is not None and
+                not op2_index.is_loaded and self.op2_reader.lazy_scan is None):
+            # the lazy scan writes the index once the layout is known
+            op2_index.write()
         self.close_op2(force=False)
         #self.remove_unpickable_data()
         return table_names
@@ -1816,6 +1835,7 @@ class OP2_Scalar(OP2Common, FortranFormat):
             self.binary_debug.close()
 
         if self._close_op2 or force:
+            self.op2_reader.close_mmap()
             if self.f is not None:
                 # can happen if:
                 #  - is ascii file
@@ -1879,6 +1899,8 @@ class OP2_Scalar(OP2Common, FortranFormat):
             #: the OP2 file object
             op2_filename = self.op2_filename
             self.f = open(op2_filename, 'rb')
+            if self.op2_reader.use_mmap:
+                self.op2_reader.open_mmap()
             #: the endian in bytes
             self._endian = None
             #: the endian in unicode
@@ -1951,60 +1973,84 @@ class OP2_Scalar(OP2Common, FortranFormat):
                 self.log.debug(f'  table_name={table_name!r}')
 
             self.table_name = table_name
-            #if 0:
-                #op2_reader._skip_table(table_name)
-            #else:
-            #print(table_name, table_name in op2_reader.mapped_tables)
-            if table_name in self.generalized_tables:
-                t0 = self.f.tell()
-                self.generalized_tables[table_name](self)
-                assert self.f.tell() != t0, 'the position was unchanged...'
-            elif table_name in op2_reader.mapped_tables:
-                t0 = self.f.tell()
-                op2_reader.mapped_tables[table_name]()
-                assert self.f.tell() != t0, 'the position was unchanged...'
-            elif table_name in GEOM_TABLES:
-                op2_reader.read_geom_table()  # DIT (agard)
-            elif table_name in MATRIX_TABLES:
-                op2_reader.read_matrix(table_name)
-            elif table_name in RESULT_TABLES:
-                op2_reader.read_results_table()
-            elif self.skip_undefined_matrices:
-                op2_reader.read_matrix(table_name)
-            elif table_name.strip() in self.additional_matrices:
-                op2_reader.read_matrix(table_name)
-            else:
-                #self.show(1000, types='ifsq')
-                msg = (
-                    f'Invalid Table = {table_name!r}\n\n'
-                    'If you have matrices that you want to read, see:\n'
-                    '  model.set_additional_matrices_to_read(matrices)\n'
-                    '  matrices = {\n'
-                    "      b'BHH' : True,\n"
-                    "      b'KHH' : False,\n"
-                    '  }  # you want to read some matrices, but not others\n'
-                    "  matrices = [b'BHH', b'KHH']  # assumes True\n\n"
-
-                    'If you the table is a geom/result table, see:\n'
-                    '  model.set_additional_result_tables_to_read(methods_dict)\n'
-                    "  methods_dict = {\n"
-                    "      b'OUGV1' : [method3, method4],\n"
-                    "      b'GEOM4SX' : [method3, method4],\n"
-                    "      b'OES1X1' : False,\n"
-                    '  }\n\n'
-
-                    'If you want to take control of the OP2 reader (mainly useful '
-                    'for obscure tables), see:\n'
-                    "  methods_dict = {\n"
-                    "      b'OUGV1' : [method],\n"
-                    '  }\n'
-                    '  model.set_additional_generalized_tables_to_read(methods_dict)\n'
-                )
-                raise NotImplementedError(msg)
+            if op2_reader.op2_index is not None and self.read_mode == 1:
+                op2_reader.op2_index.add_table(table_name, self.f.tell())
+            if op2_reader.lazy_scan is not None and self.read_mode == 1:
+                # matches the order of _read_table (e.g., DSCM2 is read as a matrix)
+                is_results_table = (
+                    table_name in RESULT_TABLES and
+                    table_name not in self.generalized_tables and
+                    table_name not in op2_reader.mapped_tables and
+                    table_name not in GEOM_TABLES and
+                    table_name not in MATRIX_TABLES)
+                op2_reader.lazy_scan.add_table(table_name, self.f.tell(), is_results_table)
+            self._read_table(table_name)
 
             table_name = op2_reader._read_table_name(last_table_name=table_name,
                                                      rewind=True, stop_on_failure=False)
 
+    def _read_table(self, table_name: bytes) -> None:
+        """
+        Reads a single geometry/result/matrix table
+
+        Parameters
+        ----------
+        table_name : bytes str
+            the table's name
+
+        """
+        op2_reader = self.op2_reader
+        #if 0:
+            #op2_reader._skip_table(table_name)
+        #else:
+        #print(table_name, table_name in op2_reader.mapped_tables)
+        if table_name in self.generalized_tables:
+            t0 = self.f.tell()
+            self.generalized_tables[table_name](self)
+            assert self.f.tell() != t0, 'the position was unchanged...'
+        elif table_name in op2_reader.mapped_tables:
+            t0 = self.f.tell()
+            op2_reader.mapped_tables[table_name]()
+            assert self.f.tell() != t0, 'the position was unchanged...'
+        elif table_name in GEOM_TABLES:
+            op2_reader.read_geom_table()  # DIT (agard)
+        elif table_name in MATRIX_TABLES:
+            op2_reader.read_matrix(table_name)
+        elif table_name in RESULT_TABLES:
+            op2_reader.read_results_table()
+        elif self.skip_undefined_matrices:
+            op2_reader.read_matrix(table_name)
+        elif table_name.strip() in self.additional_matrices:
+            op2_reader.read_matrix(table_name)
+        else:
+            #self.show(1000, types='ifsq')
+            msg = (
+                f'Invalid Table = {table_name!r}\n\n'
+                'If you have matrices that you want to read, see:\n'
+                '  model.set_additional_matrices_to_read(matrices)\n'
+                '  matrices = {\n'
+                "      b'BHH' : True,\n"
+                "      b'KHH' : False,\n"
+                '  }  # you want to read some matrices, but not others\n'
+                "  matrices = [b'BHH', b'KHH']  # assumes True\n\n"
+
+                'If you the table is a geom/result table, see:\n'
+                '  model.set_additional_result_tables_to_read(methods_dict)\n'
+                "  methods_dict = {\n"
+                "      b'OUGV1' : [method3, method4],\n"
+                "      b'GEOM4SX' : [method3, method4],\n"
+                "      b'OES1X1' : False,\n"
+                '  }\n\n'
+
+                'If you want to take control of the OP2 reader (mainly useful '
+                'for obscure tables), see:\n'
+                "  methods_dict = {\n"
+                "      b'OUGV1' : [method],\n"
+                '  }\n'
+                '  model.set_additional_generalized_tables_to_read(methods_dict)\n'
+            )
+            raise NotImplementedError(msg)
+
     def set_additional_generalized_tables_to_read(self, tables):
         """
         Adds methods to call a generalized table.
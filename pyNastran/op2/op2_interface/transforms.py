@@ -1,7 +1,7 @@
 """
 Defines:
  - transform_displacement_to_global(subcase, result, icd_transform, coords, xyz_cid0,
-                                    log, debug=False)
+                                    log, debug=False, engine=None)
  - transform_gpforce_to_globali(subcase, result,
                                  nids_all, nids_transform,
                                  i_transform, coords, xyz_cid0, log)
@@ -10,188 +10,39 @@ Defines:
 import sys
 import numpy as np
 
-from pyNastran.femutils.coord_transforms import cylindrical_rotation_matrix
-from pyNastran.femutils.matrix3d import (
-    dot_n33_33,
-    #dot_n33_n33,
-    #dot_33_n33,
-    dot_n33_n3)
+from pyNastran.bdf.bdf_interface.coord_engine import CoordTransformEngine
 
 
 def transform_displacement_to_global(subcase, result, icd_transform, coords, xyz_cid0,
-                                     log, debug=False):
+                                     log, debug=False, engine=None):
     """
     Performs an inplace operation to transform the DISPLACMENT, VELOCITY,
     ACCELERATION result into the global (cid=0) frame
 
+    Parameters
+    ----------
+    engine : CoordTransformEngine; default=None
+        the resolved coordinate systems; created from coords if None
+
     """
-    #print('result.name = ', result.class_name)
+    if engine is None:
+        engine = CoordTransformEngine(coords)
     data = result.data
-    nnodesi = data.shape[1]
     for cid, inode in icd_transform.items():
         if cid in [-1, 0]:
             continue
-        coord = coords[cid]
-        coord_type = coord.type
-        cid_transform = coord.beta()
-
-        # a global coordinate system has 1.0 along the main diagonal
-        is_global_cid = False
-        if np.array_equal([1., 1., 1.], np.diagonal(cid_transform)):
-            is_global_cid = True
-
-        if not is_global_cid and debug:
-            log.debug('coord\n%s' % coord)
-            log.debug(cid_transform)
+        if debug:
+            log.debug('coord\n%s' % coords[cid])
             log.debug('inode = [%s]' % ', '.join([str(val).rstrip('L') for val in inode.tolist()]))
             log.debug('data.shape = %s' % str(data.shape))
-            log.debug('len(inode) = %s' % len(inode))
-            assert np.array_equal(inode, np.unique(inode))
-
-        if coord_type in ['CORD2R', 'CORD1R']:
-            if is_global_cid:
-                #self.log.debug('is_global_cid')
-                continue
-            #self.log.debug('rectangular')
-
-
-            # isat_tran.op2
-            #  - nspoint = 4
-            #  - ngrid = 5379
-            #
-            #  - ntotal = 5383
-            #  data.shape = (101, 8, 6)
-            try:
-                translation = data[:, inode, :3]
-                rotation = data[:, inode, 3:]
-            except IndexError:
-                log.warning('shape of inode is incorrect')
-                translation = np.full(inode.shape, np.nan, dtype=data.dtype)
-                rotation = np.full(inode.shape, np.nan, dtype=data.dtype)
-                print(data.shape, inode.shape, nnodesi)
-                print(inode[:nnodesi].shape)
-                continue
-                translation = data[:, inode[:nnodesi], :3]
-                rotation = data[:, inode[:nnodesi], 3:]
-            data[:, inode, :3] = translation @ cid_transform
-            data[:, inode, 3:] = rotation @ cid_transform
-
-        elif coord_type in ['CORD2C', 'CORD1C']:
-            #self.log.debug('cylindrical')
-            if xyz_cid0 is None:
-                msg = 'xyz_cid0 is required for cylindrical coordinate transforms'
-                raise RuntimeError(msg)
-            _transform_cylindrical_displacement(inode, data, coord, xyz_cid0, cid_transform,
-                                                is_global_cid)
-
-        elif coord_type in ['CORD2S', 'CORD1S']:
-            #print('spherical')
-            if xyz_cid0 is None:
-                msg = ('xyz_cid is required for spherical '
-                       'coordinate transforms')
-                raise RuntimeError(msg)
-            _transform_spherical_displacement(inode, data, coord, xyz_cid0, cid_transform,
-                                              is_global_cid)
-        else:
-            raise RuntimeError(coord)
-
-
-def _transform_cylindrical_displacement(inode, data, coord, xyz_cid0, cid_transform, is_global_cid):
-    """helper method for transform_displacement_to_global"""
-    xyzi = xyz_cid0[inode, :]
-    rtz_cid = coord.xyz_to_coord_array(xyzi)
-
-    #print('rtz_cid:')
-    #print(rtz_cid)
-    thetad = rtz_cid[:, 1]
-    thetar = np.radians(thetad)
-    #print('thetad[cid=%s] = %s' % (coord.cid, thetad))
-    #print('thetar = ', thetar)
-    #self.log.debug('thetad = %s' % list(thetad))
-
-    #np.set_printoptions(precision=None, threshold=None, edgeitems=None, linewidth=None, suppress=True,
-                        #nanstr=None, infstr=None, formatter=None, sign=None, floatmode=None)
-    xforms = cylindrical_rotation_matrix(thetar, dtype='float64')
-    #print('xforms.shape = %s' % str(xforms.shape))
-
-    for itime in range(data.shape[0]):
-        translation = data[itime, inode, :3]
-        rotation = data[itime, inode, 3:]
-        #theta_max1 = translation[:, 1].max()
-        #theta_max2 = rotation[:, 1].max()
-        #print('theta_max = ', max(theta_max1, theta_max2))
-
-        if is_global_cid:
-            translation2 = dot_n33_n3(xforms, translation)
-            rotation2 = dot_n33_n3(xforms, rotation)
-        else:
-            #print('cid_transform[cid=%s]:\n%s' % (coord.cid, cid_transform))
-            #print('xforms:\n%s' % (xforms))
-            #xforms2 = dot_33_n33(xforms, cid_transform)  # wrong shape
-            #xforms2a = dot_33_n33(cid_transform, xforms)
-            #xforms2b = dot_n33_33(xforms, cid_transform)
-            #xforms2b = xforms
-            # triple products
-            #xforms2c = dot_33_n33(cid_transform.T, dot_n33_33(xforms, cid_transform))
-            #xforms2d = dot_33_n33(cid_transform, dot_n33_33(xforms, cid_transform.T))
-
-            #print('xform A:\n%s'  % xforms2a)
-            #print('xform B:\n%s'  % xforms2b)
-            #translation2 = dot_n33_n3(xforms2a, translation)
-            #xforms2 = xforms2b
-            if 1:
-                xforms2b = dot_n33_33(xforms, cid_transform)
-                translation2 = dot_n33_n3(xforms2b, translation)
-                rotation2 = dot_n33_n3(xforms2b, rotation)
-            elif 0:  ## pragma: no cover
-                xforms2b = dot_n33_33(xforms, cid_transform)
-                translation2a = dot_n33_n3(xforms2b, translation)
-                rotation2a = dot_n33_n3(xforms2b, rotation)
-                print('translation2a.shape =', translation2a.shape)
-                assert translation.shape == translation2a.shape
-
-                translation2 = translation2a @ cid_transform
-                rotation2 = rotation2a @ cid_transform
-
-            elif 0:  ## pragma: no cover
-                # bad shape
-                translation2a = dot_n33_n3(xforms, translation)
-                rotation2a = dot_n33_n3(xforms, rotation)
-                print('translation2a.shape =', translation2a.shape)
-                assert translation.shape == translation2a.shape
-
-                translation2 = cid_transform @ translation2a @ cid_transform
-                rotation2 = cid_transform @ rotation2a @ cid_transform
-            else:  ## pragma: no cover
-                raise NotImplementedError('pick an option...')
-        #print('translation.shape', translation.shape)
-        #print('translation2.shape', translation2.shape)
-        data[itime, inode, :3] = translation2
-        data[itime, inode, 3:] = rotation2
+        try:
+            datai = data[:, inode, :]
+        except IndexError:
+            log.warning('shape of inode is incorrect')
+            continue
+        xyz_cid0i = None if xyz_cid0 is None else xyz_cid0[inode, :]
+        data[:, inode, :] = engine.transform_vectors(datai, cid, 0, xyz_cid0=xyz_cid0i)
 
-def _transform_spherical_displacement(inode, data, coord, xyz_cid0, cid_transform, is_global_cid):
-    """helper method for transform_displacement_to_global"""
-    xyzi = xyz_cid0[inode, :]
-    #_transform_spherical_displacement_func
-    #rtp_cid = coord.xyz_to_coord_array(xyzi)
-    #theta = rtp_cid[:, 1]
-    #phi = rtp_cid[:, 2]
-    for itime in range(data.shape[0]):
-        translation = data[itime, inode, :3]
-        rotation = data[itime, inode, 3:]
-        #if 0:
-            #translation[:, 1] += theta
-            #translation[:, 2] += phi
-            #rotation[:, 1] += theta
-            #rotation[:, 2] += phi
-        translation = coord.coord_to_xyz_array(translation)
-        rotation = coord.coord_to_xyz_array(rotation)
-        if is_global_cid:
-            data[itime, inode, :3] = translation
-            data[itime, inode, 3:] = rotation
-            return
-        data[itime, inode, :3] = translation @ cid_transform
-        data[itime, inode, 3:] = rotation @ cid_transform
 
 def transform_gpforce_to_globali(subcase, result,
                                  nids_all, nids_transform,
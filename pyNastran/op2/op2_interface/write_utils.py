@@ -109,9 +109,66 @@ def view_dtype(array_obj, dtype):
         return array_obj.view(dtype)
     return array_obj.astype(dtype)
 
-def export_to_hdf5(self, group, log):
-    """exports the object to HDF5 format"""
+#: the target size of an HDF5 chunk of the results data
+HDF5_CHUNK_NBYTES = 256 * 1024
+
+def get_hdf5_data_chunks(shape, itemsize: int,
+                         chunk_nbytes: int=HDF5_CHUNK_NBYTES):
+    """
+    Gets the chunk shape of an HDF5 results data array, which is aligned
+    to the (time, entity) axes, so a time history of a few nodes/elements
+    or a single time step may be read without reading the full array.
+
+    Parameters
+    ----------
+    shape : (ntimes, nentities, ...) tuple
+        the shape of the data array
+    itemsize : int
+        the number of bytes per value
+    chunk_nbytes : int; default=HDF5_CHUNK_NBYTES
+        the target size of a chunk
+
+    Returns
+    -------
+    chunks : (ntimes_chunk, nentities_chunk, ...) tuple
+        the chunk shape
+
+    """
+    ntimes, nentities = shape[:2]
+    nbytes_row = itemsize * int(np.prod(shape[2:], dtype='int64'))
+    nrows = max(1, chunk_nbytes // max(1, nbytes_row))
+    ntimes_chunk = min(ntimes, max(1, int(np.sqrt(nrows))))
+    nentities_chunk = min(nentities, max(1, nrows // ntimes_chunk))
+    return (max(1, ntimes_chunk), max(1, nentities_chunk)) + tuple(shape[2:])
+
+def export_to_hdf5(self, group, log, compression=None, compression_opts=None,
+                   shuffle: bool=False):
+    """
+    exports the object to HDF5 format
+
+    Parameters
+    ----------
+    group : h5py.Group
+        the group to write to
+    log : SimpleLogger
+        the logger
+    compression : str; default=None
+        the HDF5 filter (e.g., 'gzip', 'lzf')
+    compression_opts : int; default=None
+        the compression level (e.g., 0-9 for 'gzip')
+    shuffle : bool; default=False
+        apply the byte shuffle filter, which improves the compression
+
+    The results data is chunked by (time, entity).
+
+    """
     #headers = self.get_headers()
+    filters = {}
+    if compression is not None:
+        filters['compression'] = compression
+        filters['compression_opts'] = compression_opts
+    if shuffle:
+        filters['shuffle'] = True
 
     # for some reason we can't just not write the properties...
     names = self.object_attributes(filter_properties=False)
@@ -167,8 +224,16 @@ def export_to_hdf5(self, group, log):
         #if hasattr(value, 'export_to_hdf5'):
             #msg = 'sub-object export_to_hdf5 not supported\nkey=%s value=%s' % (key, value)
             #raise NotImplementedError(msg)
+        kwargs = {}
+        if isinstance(value, np.ndarray) and value.ndim and value.size and value.dtype.kind != 'O':
+            if name == 'data' and value.ndim >= 2:
+                kwargs['chunks'] = get_hdf5_data_chunks(value.shape, value.dtype.itemsize)
+                kwargs.update(filters)
+            elif filters:
+                kwargs['chunks'] = True
+                kwargs.update(filters)
         try:
-            group.create_dataset(name, data=value)
+            group.create_dataset(name, data=value, **kwargs)
         except TypeError:
             print('name = %r; type=%s' % (name, type(value)))
             print(value)
@@ -102,9 +102,11 @@ class GridPointWeight:
         self.approach_code = approach_code
         self.table_code = table_code
 
-    def export_to_hdf5(self, group, log) -> None:
+    def export_to_hdf5(self, group, log, compression=None,
+                       compression_opts=None, shuffle: bool=False) -> None:
         """exports the object to HDF5 format"""
-        export_to_hdf5(self, group, log)
+        export_to_hdf5(self, group, log, compression=compression,
+                       compression_opts=compression_opts, shuffle=shuffle)
 
     def object_attributes(self, mode='public', keys_to_skip=None,
                           filter_properties=False):
@@ -105,9 +105,11 @@ class BaseScalarObject(Op2Codes):
         """creates a pandas dataframe"""
         print('build_dataframe is not implemented in %s' % self.__class__.__name__)
 
-    def export_to_hdf5(self, group, log: SimpleLogger) -> None:
+    def export_to_hdf5(self, group, log: SimpleLogger, compression=None,
+                       compression_opts=None, shuffle: bool=False) -> None:
         """exports the object to HDF5 format"""
-        export_to_hdf5(self, group, log)
+        export_to_hdf5(self, group, log, compression=compression,
+                       compression_opts=compression_opts, shuffle=shuffle)
 
     def write_f06(self, f06_file, header=None, page_stamp='PAGE %s',
                   page_num=1, is_mag_phase=False, is_sort1=True) -> int:
@@ -728,8 +730,9 @@ class BaseElement(ScalarObject):
         for eid in element:
             for header in headers:
                 eid_item.append([eid, header])
+        # data may be an h5py Dataset (load_as_h5), which is read here
         ntimes, nelements = data.shape[:2]
-        A = data.reshape(ntimes, nelements*len(headers)).T
+        A = np.asarray(data).reshape(ntimes, nelements*len(headers)).T
 
         names = ['ElementID', 'Item']
         index = pd.MultiIndex.from_tuples(eid_item, names=names)
@@ -771,7 +774,7 @@ class BaseElement(ScalarObject):
         ntimes, nelements = data.shape[:2]
         nheaders = len(headers)
         try:
-            A = data.reshape(ntimes, nelements*nheaders).T
+            A = np.asarray(data).reshape(ntimes, nelements*nheaders).T
         except ValueError:  # pragma: no cover
             ntotal = ntimes * nelements * nheaders
             print(f'data.shape={data.shape}; ntimes={ntimes} nelements={nelements} nheaders={nheaders}; ntotal={ntotal}')
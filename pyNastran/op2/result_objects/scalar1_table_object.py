@@ -262,7 +262,7 @@ class ScalarTableArray(ScalarObject):  # displacement style table
             names = ['NodeID', 'Type', 'Item']
             index = pd.MultiIndex.from_arrays(node_gridtype_item, names=names)
 
-            A = self.data.reshape(ntimes, nnodes*nheaders).T
+            A = np.asarray(self.data).reshape(ntimes, nnodes*nheaders).T
             data_frame = pd.DataFrame(A, columns=columns, index=index)
 
         else:
@@ -31,13 +31,17 @@ import numpy as np
 #from numpy import float32
 
 from pyNastran.op2.result_objects.op2_objects import ScalarObject
-from pyNastran.f06.f06_formatting import write_floats_13e, write_imag_floats_13e, write_float_12e
+from pyNastran.f06.f06_formatting import (
+    write_imag_floats_13e, write_float_12e, write_f06_lines)
 from pyNastran.op2.errors import SixtyFourBitError
 from pyNastran.op2.op2_interface.write_utils import set_table3_field, view_dtype, view_idtype_as_fdtype
 
 float_types = (float, np.float32)
 integer_types = (int, np.int32)
 
+#: the number of f06 lines that are formatted at once when writing SORT2
+NROWS_F06_BLOCK = 10000
+
 SORT2_TABLE_NAME_MAP = {
     # sort2_name : sort1_name
     'OUGATO2' : 'OUGATO1',
@@ -512,7 +516,7 @@ class TableArray(ScalarObject):  # displacement style table
 
                 names = ['NodeID', 'Type', 'Item']
                 index = pd.MultiIndex.from_tuples(node_gridtype_item, names=names)
-                A = self.data.reshape(ntimes, nnodes*6).T
+                A = np.asarray(self.data).reshape(ntimes, nnodes*6).T
                 try:
                     data_frame = pd.DataFrame(A, columns=columns, index=index)
                 except ValueError:  # pragma: no cover
@@ -886,6 +890,15 @@ class TableArray(ScalarObject):  # displacement style table
         #pack(ftable3[:j], *table3[:j])
         op2_file.write(pack(fmt, *data))
 
+    def _get_xyplot_data(self, inids, i: int):
+        """
+        Gets data[:, inids, i].  Only the requested nodes are read, so an
+        h5py Dataset (load_as_h5), which requires sorted unique indices,
+        is read in sorted order and the nodes are put back in order.
+        """
+        inids_sorted, inverse = np.unique(inids, return_inverse=True)
+        return self.data[:, inids_sorted, i][:, inverse]
+
 
 class RealTableArray(TableArray):
     """
@@ -1159,85 +1172,74 @@ class RealTableArray(TableArray):
         f06_file.write(''.join(header + words))
 
         node = self.node_gridtype[:, 0]
-        gridtype = self.node_gridtype[:, 1]
-        t1 = self.data[0, :, 0]
-        t2 = self.data[0, :, 1]
-        t3 = self.data[0, :, 2]
-        r1 = self.data[0, :, 3]
-        r2 = self.data[0, :, 4]
-        r3 = self.data[0, :, 5]
-        for node_id, gridtypei, t1i, t2i, t3i, r1i, r2i, r3i in zip(node, gridtype, t1, t2, t3, r1, r2, r3):
-            sgridtype = self.recast_gridtype_as_string(gridtypei)
-            vals = [t1i, t2i, t3i, r1i, r2i, r3i]
-            vals2 = write_floats_13e(vals)
-            (dx, dy, dz, rx, ry, rz) = vals2
-            f06_file.write('%14i %6s     %-13s  %-13s  %-13s  %-13s  %-13s  %s\n' % (
-                node_id, sgridtype, dx, dy, dz, rx, ry, rz))
+        sgridtype = self._get_f06_gridtypes()[0]
+        f06_file.write(write_f06_lines(
+            '%14i %6s     %-13s  %-13s  %-13s  %-13s  %-13s  %s\n',
+            [node, sgridtype] + [self.data[0, :, i] for i in range(6)]))
         f06_file.write(page_stamp % page_num)
         return page_num
 
+    def _get_f06_gridtypes(self):
+        """
+        Gets the gridtype strings and the index of the f06 line format
+        (0=G/H/L, 1=S/M/E) of the nodes
+        """
+        gridtypes, inverse = np.unique(self.node_gridtype[:, 1], return_inverse=True)
+        sgridtypes = [self.recast_gridtype_as_string(gridtype) for gridtype in gridtypes.tolist()]
+        is_scalar = [sgridtype in ['S', 'M', 'E'] for sgridtype in sgridtypes]
+        return np.array(sgridtypes)[inverse], np.array(is_scalar, dtype='int32')[inverse]
+
     def _write_sort1_as_sort2(self, f06_file, page_num, page_stamp, header, words):
         nodes = self.node_gridtype[:, 0]
-        gridtypes = self.node_gridtype[:, 1]
+        sgridtypes, ifmt = self._get_f06_gridtypes()
         times = self._times
-
-        for inode, (node_id, gridtypei) in enumerate(zip(nodes, gridtypes)):
-            t1 = self.data[:, inode, 0].ravel()
-            t2 = self.data[:, inode, 1].ravel()
-            t3 = self.data[:, inode, 2].ravel()
-            r1 = self.data[:, inode, 3].ravel()
-            r2 = self.data[:, inode, 4].ravel()
-            r3 = self.data[:, inode, 5].ravel()
-
-            header[1] = ' POINT-ID = %10i\n' % node_id
-            f06_file.write(''.join(header + words))
-            for dt, t1i, t2i, t3i, r1i, r2i, r3i in zip(times, t1, t2, t3, r1, r2, r3):
-                sgridtype = self.recast_gridtype_as_string(gridtypei)
-                vals = [t1i, t2i, t3i, r1i, r2i, r3i]
-                vals2 = write_floats_13e(vals)
-                (dx, dy, dz, rx, ry, rz) = vals2
-                if sgridtype in ['G', 'H', 'L']:
-                    f06_file.write('%14s %6s     %-13s  %-13s  %-13s  %-13s  %-13s  %s\n' % (
-                        write_float_12e(dt), sgridtype, dx, dy, dz, rx, ry, rz))
-                elif sgridtype in ['S', 'M', 'E']:
-                    f06_file.write('%14s %6s     %s\n' % (node_id, sgridtype, dx))
-                else:  # pragma: no cover
-                    raise NotImplementedError(sgridtype)
-            f06_file.write(page_stamp % page_num)
-            page_num += 1
+        ntimes = len(times)
+        nnodes = len(nodes)
+
+        # the lines of a block of nodes are formatted at once, which limits
+        # the size of the formatted block to ~NROWS_F06_BLOCK lines
+        # (inode, itime) -> irow
+        sdts = np.array([write_float_12e(dt) for dt in times])
+        nnodes_per_block = max(1, NROWS_F06_BLOCK // ntimes)
+        for inode0 in range(0, nnodes, nnodes_per_block):
+            inode1 = min(inode0 + nnodes_per_block, nnodes)
+            nodesi = nodes[inode0:inode1]
+            nnodesi = len(nodesi)
+            data = np.asarray(self.data[:, inode0:inode1, :]).transpose(1, 0, 2).reshape(
+                nnodesi * ntimes, 6)
+            lines = write_f06_lines(
+                ['%14s%.0s %6s     %-13s  %-13s  %-13s  %-13s  %-13s  %s\n',
+                 '%.0s%14s %6s     %s%.0s%.0s%.0s%.0s%.0s\n'],
+                [np.tile(sdts, nnodesi), np.repeat(nodesi, ntimes),
+                 np.repeat(sgridtypes[inode0:inode1], ntimes)] +
+                [data[:, i] for i in range(6)],
+                ifmt=np.repeat(ifmt[inode0:inode1], ntimes)).splitlines(keepends=True)
+
+            for inode, node_id in enumerate(nodesi):
+                header[1] = ' POINT-ID = %10i\n' % node_id
+                f06_file.write(''.join(header + words))
+                f06_file.write(''.join(lines[inode * ntimes:(inode + 1) * ntimes]))
+                f06_file.write(page_stamp % page_num)
+                page_num += 1
         return page_num
 
     def _write_sort1_as_sort1(self, f06_file, page_num, page_stamp, header, words):
         nodes = self.node_gridtype[:, 0]
-        gridtypes = self.node_gridtype[:, 1]
-        unused_times = self._times
-
+        sgridtypes, ifmt = self._get_f06_gridtypes()
+        line_fmts = [
+            '%14i %6s     %-13s  %-13s  %-13s  %-13s  %-13s  %s\n',
+            '%14i %6s     %s%.0s%.0s%.0s%.0s%.0s\n',
+        ]
         for itime in range(self.ntimes):
             dt = self._times[itime]
-            t1 = self.data[itime, :, 0]
-            t2 = self.data[itime, :, 1]
-            t3 = self.data[itime, :, 2]
-            r1 = self.data[itime, :, 3]
-            r2 = self.data[itime, :, 4]
-            r3 = self.data[itime, :, 5]
-
             if isinstance(dt, float_types):
                 header[1] = ' %s = %10.4E\n' % (self.data_code['name'], dt)
             else:
                 header[1] = ' %s = %10i\n' % (self.data_code['name'], dt)
             f06_file.write(''.join(header + words))
-            for node_id, gridtypei, t1i, t2i, t3i, r1i, r2i, r3i in zip(nodes, gridtypes, t1, t2, t3, r1, r2, r3):
-                sgridtype = self.recast_gridtype_as_string(gridtypei)
-                vals = [t1i, t2i, t3i, r1i, r2i, r3i]
-                vals2 = write_floats_13e(vals)
-                (dx, dy, dz, rx, ry, rz) = vals2
-                if sgridtype in ['G', 'H', 'L']:
-                    f06_file.write('%14i %6s     %-13s  %-13s  %-13s  %-13s  %-13s  %s\n' % (
-                        node_id, sgridtype, dx, dy, dz, rx, ry, rz))
-                elif sgridtype in ['S', 'M', 'E']:
-                    f06_file.write('%14i %6s     %s\n' % (node_id, sgridtype, dx))
-                else:  # pragma: no cover
-                    raise NotImplementedError(f'node_id={node_id} sgridtype={sgridtype} vals={vals2}')
+            f06_file.write(write_f06_lines(
+                line_fmts, [nodes, sgridtypes] + [self.data[itime, :, i] for i in range(6)],
+                ifmt=ifmt))
             f06_file.write(page_stamp % page_num)
             page_num += 1
         return page_num
@@ -1300,7 +1302,7 @@ class RealTableArray(TableArray):
         nids = self.node_gridtype[:, 0]
         inids = np.searchsorted(nids, node_ids)
         assert all(nids[inids] == node_ids), 'nids=%s expected=%s; all=%s'  % (nids[inids], node_ids, nids)
-        return self.data[:, inids, i]
+        return self._get_xyplot_data(inids, i)
 
 
 class ComplexTableArray(TableArray):
@@ -1362,18 +1364,19 @@ class ComplexTableArray(TableArray):
         nids = self.node_gridtype[:, 0]
         inids = np.searchsorted(nids, node_ids)
         assert all(nids[inids] == node_ids), 'nids=%s expected=%s; all=%s'  % (nids[inids], node_ids, nids)
+        data = self._get_xyplot_data(inids, i)
         if j == 1:
             # real
-            return self.data[:, inids, i].real
+            return data.real
         elif j == 2:
             # imag
-            return self.data[:, inids, i].imag
+            return data.imag
         elif j == 3:
             # mag
-            return np.abs(self.data[:, inids, i])
+            return np.abs(data)
         elif j == 4:
             # phase
-            return np.angle(self.data[:, inids, i])
+            return np.angle(data)
         else:
             raise RuntimeError()
 
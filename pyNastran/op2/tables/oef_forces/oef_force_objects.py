@@ -13,7 +13,7 @@ from pyNastran.op2.result_objects.op2_objects import BaseElement, get_times_dtyp
 from pyNastran.f06.f06_formatting import (
     write_floats_13e, write_floats_12e,
     write_float_13e, # write_float_12e,
-    _eigenvalue_header,
+    _eigenvalue_header, write_f06_lines,
 )
 from pyNastran.op2.op2_interface.write_utils import set_table3_field
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import update_stress_force_time_word
@@ -2431,25 +2431,21 @@ class RealPlateForceArray(RealForceObject):  # 33-CQUAD4, 74-CTRIA3
                 # 74, 83 CTRIA3
                 # 227 CTRIAR linear
                 # 228 CQUADR linear
-                for eid, mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi in zip(eids, mx, my, mxy, bmx, bmy, bmxy, tx, ty):
-                    [mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi] = write_floats_13e(
-                        [mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi])
-                    # ctria3
-                    #          8      -7.954568E+01  2.560061E+03 -4.476376E+01    1.925648E+00  1.914048E+00  3.593237E-01    8.491534E+00  5.596094E-01  #
-                    f06_file.write('   %8i %18s %13s %13s   %13s %13s %13s   %13s %s\n' % (
-                        eid, mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi))
+                # ctria3
+                #          8      -7.954568E+01  2.560061E+03 -4.476376E+01    1.925648E+00  1.914048E+00  3.593237E-01    8.491534E+00  5.596094E-01  #
+                f06_file.write(write_f06_lines(
+                    '   %8i %18s %13s %13s   %13s %13s %13s   %13s %s\n',
+                    [eids, mx, my, mxy, bmx, bmy, bmxy, tx, ty]))
 
             elif self.element_type == 33:
-                for eid, mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi in zip(eids, mx, my, mxy, bmx, bmy, bmxy, tx, ty):
-                    [mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi] = write_floats_13e(
-                        [mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi])
-                    # cquad4
-                    #0         6    CEN/4  1.072685E+01  2.504399E+03 -2.455727E+01 -5.017930E+00 -2.081427E+01 -5.902618E-01 -9.126162E+00  4.194400E+01#
-                    #Fmt = '% 8i   ' + '%27.20E   ' * 8 + '\n'
-                    #f06_file.write(Fmt % (eid, mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi))
-                    #
-                    f06_file.write('0 %8i %8s %13s %13s %13s %13s %13s %13s %13s %s\n' % (
-                        eid, cen_word, mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi))
+                # cquad4
+                #0         6    CEN/4  1.072685E+01  2.504399E+03 -2.455727E+01 -5.017930E+00 -2.081427E+01 -5.902618E-01 -9.126162E+00  4.194400E+01#
+                #Fmt = '% 8i   ' + '%27.20E   ' * 8 + '\n'
+                #f06_file.write(Fmt % (eid, mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi))
+                #
+                f06_file.write(write_f06_lines(
+                    '0 %%8i %8s %%13s %%13s %%13s %%13s %%13s %%13s %%13s %%s\n' % cen_word,
+                    [eids, mx, my, mxy, bmx, bmy, bmxy, tx, ty]))
             else:
                 raise NotImplementedError(f'element_name={self.element_name} element_type={self.element_type}')
             f06_file.write(page_stamp % page_num)
@@ -2826,9 +2822,17 @@ class RealPlateBilinearForceArray(RealForceObject):  # 144-CQUAD4
             raise NotImplementedError(self.element_type)
 
         # TODO: this shouldn't be neccessary
-        cyc = cyci * (len(eids) // nnodes_per_eid)
+        cyc = np.array(cyci * (len(eids) // nnodes_per_eid), dtype='int32')
         assert len(eids) % nnodes_per_eid == 0
 
+        # the first row of an element is the center
+        ifmt = (cyc != 0).astype('int32')
+        data_fmt = ' %-13s %-13s %-13s %-13s %-13s %-13s %-13s %s\n'
+        line_fmts = [
+            '0  %%8i    %s%%.0s' % cen_word + data_fmt,
+            '            %.0s%8i' + data_fmt,
+        ]
+
         for itime in range(ntimes):
             dt = self._times[itime]  # TODO: rename this...
             header = _eigenvalue_header(self, header, itime, ntimes, dt)
@@ -2845,19 +2849,10 @@ class RealPlateBilinearForceArray(RealForceObject):  # 144-CQUAD4
             tx = self.data[itime, :, 6]
             ty = self.data[itime, :, 7]
 
-            for i, eid, nid, mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi in zip(cyc, eids, nids, mx, my, mxy, bmx, bmy, bmxy, tx, ty):
-                [mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi] = write_floats_13e(
-                    [mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi])
-                # ctria3
-                #          8      -7.954568E+01  2.560061E+03 -4.476376E+01    1.925648E+00  1.914048E+00  3.593237E-01    8.491534E+00  5.596094E-01  #
-                if i == 0:
-                    f06_file.write(
-                        '0  %8i    %s %-13s %-13s %-13s %-13s %-13s %-13s %-13s %s\n' % (
-                            eid, cen_word, mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi))
-                else:
-                    f06_file.write(
-                        '            %8i %-13s %-13s %-13s %-13s %-13s %-13s %-13s %s\n' % (
-                            nid, mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi))
+            # ctria3
+            #          8      -7.954568E+01  2.560061E+03 -4.476376E+01    1.925648E+00  1.914048E+00  3.593237E-01    8.491534E+00  5.596094E-01  #
+            f06_file.write(write_f06_lines(line_fmts, [
+                eids, nids, mx, my, mxy, bmx, bmy, bmxy, tx, ty], ifmt=ifmt))
             # else:
                 # raise NotImplementedError(self.element_type)
             f06_file.write(page_stamp % page_num)
@@ -1,6 +1,5 @@
 # coding: utf-8
 #pylint disable=C0103
-from itertools import count
 import warnings
 from typing import Tuple, List
 import numpy as np
@@ -10,7 +9,7 @@ from pyNastran.op2.op2_interface.write_utils import to_column_bytes, view_dtype,
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import (
     StressObject, StrainObject, OES_Object)
 from pyNastran.op2.result_objects.op2_objects import get_times_dtype
-from pyNastran.f06.f06_formatting import write_floats_13e, _eigenvalue_header
+from pyNastran.f06.f06_formatting import write_f06_lines, _eigenvalue_header
 from pyNastran.op2.errors import SixtyFourBitError
 
 
@@ -492,35 +491,34 @@ class RealPlateArray(OES_Object):
 
             is_linear = self.element_type in {33, 74, 227, 228, 83}
             is_bilinear = self.element_type in {64, 70, 75, 82, 144}
-            for (i, eid, nid, fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi) in zip(
-                 count(), eids, nids, fiber_dist, oxx, oyy, txy, angle, major_principal, minor_principal, ovm):
-                [fdi, oxxi, oyyi, txyi, major, minor, ovmi] = write_floats_13e(
-                    [fdi, oxxi, oyyi, txyi, major, minor, ovmi])
-                ilayer = i % 2
-                # tria3
-                if is_linear:  # CQUAD4, CTRIA3, CTRIAR linear, CQUADR linear
-                    if ilayer == 0:
-                        f06_file.write('0  %6i   %-13s     %-13s  %-13s  %-13s   %8.4f   %-13s   %-13s  %s\n' % (
-                            eid, fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi))
-                    else:
-                        f06_file.write('   %6s   %-13s     %-13s  %-13s  %-13s   %8.4f   %-13s   %-13s  %s\n' % (
-                            '', fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi))
-
-                elif is_bilinear:  # CQUAD8, CTRIAR, CTRIA6, CQUADR, CQUAD4
-                    # bilinear
-                    if nid == 0 and ilayer == 0:  # CEN
-                        f06_file.write('0  %8i %8s  %-13s  %-13s %-13s %-13s   %8.4f  %-13s %-13s %s\n' % (
-                            eid, cen_word, fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi))
-                    elif ilayer == 0:
-                        f06_file.write('   %8s %8i  %-13s  %-13s %-13s %-13s   %8.4f  %-13s %-13s %s\n' % (
-                            '', nid, fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi))
-                    elif ilayer == 1:
-                        f06_file.write('   %8s %8s  %-13s  %-13s %-13s %-13s   %8.4f  %-13s %-13s %s\n\n' % (
-                            '', '', fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi))
-                else:  # pragma: no cover
-                    msg = 'element_name=%s self.element_type=%s' % (
-                        self.element_name, self.element_type)
-                    raise NotImplementedError(msg)
+            ilayer = np.arange(len(eids)) % 2
+            data_fmt = '%-13s     %-13s  %-13s  %-13s   %8.4f   %-13s   %-13s  %s\n'
+            if is_linear:  # CQUAD4, CTRIA3, CTRIAR linear, CQUADR linear
+                line_fmts = [
+                    '0  %6i   ' + data_fmt,
+                    '   %.0s         ' + data_fmt,
+                ]
+                ifmt = ilayer
+                columns = [eids]
+
+            elif is_bilinear:  # CQUAD8, CTRIAR, CTRIA6, CQUADR, CQUAD4
+                # bilinear
+                data_fmt = '%-13s  %-13s %-13s %-13s   %8.4f  %-13s %-13s %s\n'
+                line_fmts = [
+                    '0  %%8i %8s%%.0s  ' % cen_word + data_fmt,  # CEN
+                    '   %.0s         %8i  ' + data_fmt,
+                    '%.0s%.0s' + ' ' * 22 + data_fmt + '\n',
+                ]
+                ifmt = np.where(ilayer == 1, 2, np.where(nids == 0, 0, 1))
+                columns = [eids, nids]
+            else:  # pragma: no cover
+                msg = 'element_name=%s self.element_type=%s' % (
+                    self.element_name, self.element_type)
+                raise NotImplementedError(msg)
+
+            f06_file.write(write_f06_lines(line_fmts, columns + [
+                fiber_dist, oxx, oyy, txy, angle, major_principal, minor_principal, ovm],
+                ifmt=ifmt))
 
             f06_file.write(page_stamp % page_num)
             page_num += 1
@@ -6,7 +6,7 @@ from pyNastran.op2.result_objects.op2_objects import get_times_dtype
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import (
     StressObject, StrainObject, OES_Object, oes_data_code)
 from pyNastran.op2.op2_interface.write_utils import view_dtype, view_idtype_as_fdtype
-from pyNastran.f06.f06_formatting import write_floats_13e, _eigenvalue_header #, get_key0
+from pyNastran.f06.f06_formatting import write_floats_13e, write_f06_lines, _eigenvalue_header #, get_key0
 
 ELEMENT_NAME_TO_ELEMENT_TYPE = {
     'CROD' : 1,
@@ -286,17 +286,17 @@ class RealRodArray(OES_Object):
             torsion = self.data[itime, :, 2]
             SMt = self.data[itime, :, 3]
 
-            out = []
-            for eid, axiali, SMai, torsioni, SMti in zip(eids, axial, SMa, torsion, SMt):
-                [axiali, torsioni, SMai, SMti] = write_floats_13e([axiali, torsioni, SMai, SMti])
-                out.append([eid, axiali, SMai, torsioni, SMti])
-
-            for i in range(0, nwrite, 2):
-                f06_file.write(
-                    '      %8i %-13s  %-13s %-13s  %-13s %-8i   %-13s  %-13s %-13s  %-s\n' % (
-                        tuple(out[i] + out[i + 1])))
+            # two elements per line
+            columns = [eids, axial, SMa, torsion, SMt]
+            f06_file.write(write_f06_lines(
+                '      %8i %-13s  %-13s %-13s  %-13s %-8i   %-13s  %-13s %-13s  %-s\n',
+                [column[0:nwrite:2] for column in columns] +
+                [column[1:nwrite:2] for column in columns]))
             if is_odd:
-                f06_file.write('      %8i %-13s  %-13s %-13s  %13s\n' % (tuple(out[-1])))
+                [axiali, torsioni, SMai, SMti] = write_floats_13e(
+                    [axial[-1], torsion[-1], SMa[-1], SMt[-1]])
+                f06_file.write('      %8i %-13s  %-13s %-13s  %13s\n' % (
+                    eids[-1], axiali, SMai, torsioni, SMti))
             f06_file.write(page_stamp % page_num)
             page_num += 1
         return page_num - 1
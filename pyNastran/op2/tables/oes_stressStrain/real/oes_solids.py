@@ -1,15 +1,14 @@
 # pylint: disable=C0301,C0103,R0913,R0914,R0904,C0111,R0201,R0902
 import warnings
-from itertools import count
 from struct import pack
 from typing import Tuple, List, Any
 
 import numpy as np
-from numpy import zeros, where, searchsorted
+from numpy import zeros, searchsorted
 from numpy.linalg import eigh  # type: ignore
 
 from pyNastran.utils.numpy_utils import float_types
-from pyNastran.f06.f06_formatting import write_floats_13e, _eigenvalue_header
+from pyNastran.f06.f06_formatting import write_f06_lines, _eigenvalue_header
 from pyNastran.op2.result_objects.op2_objects import get_times_dtype
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import StressObject, StrainObject, OES_Object
 from pyNastran.op2.op2_interface.write_utils import to_column_bytes
@@ -480,6 +479,18 @@ class RealSolidArray(OES_Object):
         else:
             v = np.zeros((ntimes, nnodes, 3, 3), dtype=fdtype)
 
+        # the coordinate system of each element
+        isort = np.argsort(eids3, kind='stable')
+        cids = cids3[isort[np.searchsorted(eids3[isort], eids2)]]
+
+        block_fmt = (
+            '0              %8s  X  %-13s  XY  %-13s   A  %-13s  LX%5.2f%5.2f%5.2f  %-13s   %s\n'
+            '                         Y  %-13s  YZ  %-13s   B  %-13s  LY%5.2f%5.2f%5.2f\n'
+            '                         Z  %-13s  ZX  %-13s   C  %-13s  LZ%5.2f%5.2f%5.2f\n')
+        line_fmts = [
+            '0  %%8s    %%8iGRID CS  %i GP\n' % nnodes + block_fmt.replace('%8s', '  CENTER%.0s', 1),
+            '%.0s%.0s' + block_fmt,
+        ]
         for itime in range(ntimes):
             dt = self._times[itime]
             header = _eigenvalue_header(self, header, itime, ntimes, dt)
@@ -499,37 +510,23 @@ class RealSolidArray(OES_Object):
             vi = v[itime, :, :, :]
             pi = p[itime, :]
 
+            # o1-max
+            # o2-mid
+            # o3-min
+            is_valid = (o1 >= o2) & (o2 >= o3)
+            if not is_valid.all():
+                i = np.where(~is_valid)[0][0]
+                raise AssertionError('o1 >= o2 >= o3; eid=%s o1=%e o2=%e o3=%e' % (
+                    eids2[i], o1[i], o2[i], o3[i]))
+
+            # the first row of an element is the center
             cnnodes = nnodes + 1
-            for i, deid, node_id, doxx, doyy, dozz, dtxy, dtyz, dtxz, do1, do2, do3, dp, dv, dovm in zip(
-                    count(), eids2, nodes, oxx, oyy, ozz, txy, tyz, txz, o1, o2, o3, pi, vi, ovm):
-
-                # o1-max
-                # o2-mid
-                # o3-min
-                assert do1 >= do2 >= do3, 'o1 >= o2 >= o3; eid=%s o1=%e o2=%e o3=%e' % (deid, do1, do2, do3)
-                [oxxi, oyyi, ozzi, txyi, tyzi, txzi, o1i, o2i, o3i, pii, ovmi] = write_floats_13e(
-                    [doxx, doyy, dozz, dtxy, dtyz, dtxz, do1, do2, do3, dp, dovm])
-
-                if i % cnnodes == 0:
-                    j = where(eids3 == deid)[0][0]
-                    cid = cids3[j]
-                    f06_file.write('0  %8s    %8iGRID CS  %i GP\n' % (deid, cid, nnodes))
-                    f06_file.write(
-                        '0              %8s  X  %-13s  XY  %-13s   A  %-13s  LX%5.2f%5.2f%5.2f  %-13s   %s\n'
-                        '               %8s  Y  %-13s  YZ  %-13s   B  %-13s  LY%5.2f%5.2f%5.2f\n'
-                        '               %8s  Z  %-13s  ZX  %-13s   C  %-13s  LZ%5.2f%5.2f%5.2f\n'
-                        % ('CENTER', oxxi, txyi, o1i, dv[0, 1], dv[0, 2], dv[0, 0], pii, ovmi,
-                           '', oyyi, tyzi, o2i, dv[1, 1], dv[1, 2], dv[1, 0],
-                           '', ozzi, txzi, o3i, dv[2, 1], dv[2, 2], dv[2, 0]))
-                else:
-                    f06_file.write(
-                        '0              %8s  X  %-13s  XY  %-13s   A  %-13s  LX%5.2f%5.2f%5.2f  %-13s   %s\n'
-                        '               %8s  Y  %-13s  YZ  %-13s   B  %-13s  LY%5.2f%5.2f%5.2f\n'
-                        '               %8s  Z  %-13s  ZX  %-13s   C  %-13s  LZ%5.2f%5.2f%5.2f\n'
-                        % (node_id, oxxi, txyi, o1i, dv[0, 1], dv[0, 2], dv[0, 0], pii, ovmi,
-                           '', oyyi, tyzi, o2i, dv[1, 1], dv[1, 2], dv[1, 0],
-                           '', ozzi, txzi, o3i, dv[2, 1], dv[2, 2], dv[2, 0]))
-                i += 1
+            ifmt = (np.arange(len(eids2)) % cnnodes != 0).astype('int32')
+            f06_file.write(write_f06_lines(line_fmts, [
+                eids2, cids, nodes,
+                oxx, txy, o1, vi[:, 0, 1], vi[:, 0, 2], vi[:, 0, 0], pi, ovm,
+                oyy, tyz, o2, vi[:, 1, 1], vi[:, 1, 2], vi[:, 1, 0],
+                ozz, txz, o3, vi[:, 2, 1], vi[:, 2, 2], vi[:, 2, 0]], ifmt=ifmt))
             f06_file.write(page_stamp % page_num)
             page_num += 1
         return page_num - 1
@@ -807,9 +804,10 @@ def calculate_principal_eigenvectors5(ntimes: int, nelements: int, nnodes: int,
 
     TODO: scale by 2 for strain
     """
-    a_matrix = np.empty((ntimes, nelements, nnodes, 3, 3), dtype=dtype)
+    a_matrix = np.zeros((ntimes, nelements, nnodes, 3, 3), dtype=dtype)
 
-    # we're only filling the lower part of the A matrix
+    # we're only filling the lower part of the A matrix, but
+    # eigh casts the upper part too, so it can't be garbage
     a_matrix[:, :, :, 0, 0] = oxx
     a_matrix[:, :, :, 1, 1] = oyy
     a_matrix[:, :, :, 2, 2] = ozz
@@ -844,9 +842,10 @@ def calculate_principal_eigenvectors4(ntimes: int, nnodes: int,
     eigenvectors : (ntimes, nnodes, 3, 3)
         the eigenvectors
     """
-    a_matrix = np.empty((ntimes, nnodes, 3, 3), dtype=dtype)
+    a_matrix = np.zeros((ntimes, nnodes, 3, 3), dtype=dtype)
 
-    # we're only filling the lower part of the A matrix
+    # we're only filling the lower part of the A matrix, but
+    # eigh casts the upper part too, so it can't be garbage
     try:
         a_matrix[:, :, 0, 0] = oxx
         a_matrix[:, :, 1, 1] = oyy
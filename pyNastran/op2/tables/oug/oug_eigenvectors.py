@@ -1,3 +1,5 @@
+import numpy as np
+
 from pyNastran.op2.result_objects.table_object import RealTableArray, ComplexTableArray
 from pyNastran.f06.f06_formatting import write_floats_13e
 
@@ -48,7 +50,7 @@ class RealEigenvectorArray(RealTableArray):
         """
         nmodes, nnodes = self.data.shape[:2]
         ndof = nnodes * 6
-        phi_transpose = self.data.reshape(nmodes, ndof)
+        phi_transpose = np.asarray(self.data).reshape(nmodes, ndof)
         return phi_transpose.T
 
     @classmethod
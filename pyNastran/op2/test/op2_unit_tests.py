@@ -1,6 +1,9 @@
 """various OP2 tests"""
 import os
+import pickle
 import unittest
+from unittest import mock
+from io import StringIO
 from pathlib import Path
 
 import numpy as np
@@ -26,8 +29,15 @@ except ImportError:  # pragma: no cover
 
 import pyNastran
 from pyNastran.bdf.bdf import BDF, read_bdf, CORD2R
-from pyNastran.op2.op2 import OP2, read_op2, FatalError, FortranMarkerError
+from pyNastran.op2.op2 import (
+    OP2, read_op2, read_op2_many, iter_op2_results, FatalError, FortranMarkerError)
 from pyNastran.op2.op2_interface.op2_common import get_scode_word
+from pyNastran.op2.op2_interface.op2_scalar import OP2_Scalar
+from pyNastran.op2.op2_interface.op2_index import OP2Index, get_index_filename
+from pyNastran.op2.op2_interface.op2_lazy import LazyResult
+from pyNastran.op2.op2_interface.op2_parallel import (
+    split_keys, IS_SHARED_MEMORY, SharedArray, _save_shared_arrays, _load_futures,
+    _get_filters, _read_run, _get_add_run, _finish_stack)
 from pyNastran.op2.op2_geom import OP2Geom, read_op2_geom
 from pyNastran.op2.test.test_op2 import run_op2, main as test_op2
 
@@ -42,6 +52,11 @@ from pyNastran.op2.vector_utils import filter1d, abs_max_min_global, abs_max_min
 from pyNastran.op2.tables.oug.oug_displacements import RealDisplacementArray
 from pyNastran.femutils.test.utils import is_array_close
 from pyNastran.op2.result_objects.grid_point_weight import make_grid_point_weight
+from pyNastran.op2.result_objects import table_object
+from pyNastran.op2.op2_interface.op2_combine import _is_equal_times
+from pyNastran.op2.tables.oes_stressStrain.real.oes_solids import (
+    calculate_principal_eigenvectors4, calculate_principal_eigenvectors5)
+from pyNastran.op2.op2_interface.write_utils import get_hdf5_data_chunks, HDF5_CHUNK_NBYTES
 from pyNastran.op2.tables.geom.geom4 import _read_spcadd_mpcadd
 
 PKG_PATH = Path(pyNastran.__path__[0])
@@ -68,6 +83,30 @@ class TestOP2Unit(Tester):
             superelement_adaptivity_index='')
         str(weight)
 
+    def test_principal_eigenvectors_garbage(self):
+        """the unfilled upper triangle of the solid A matrix isn't garbage"""
+        oxx = np.array([[1., 2.]], dtype='float32')
+        zero = np.zeros(oxx.shape, dtype='float32')
+        shear = np.full(oxx.shape, 0.5, dtype='float32')
+
+        def empty_snan(shape, dtype=float):
+            """np.empty with signaling NaNs, which raise when eigh casts them"""
+            return np.full(shape, 0x7fa00000, dtype='uint32').view('float32').astype(dtype)
+
+        with mock.patch('numpy.empty', empty_snan), np.errstate(invalid='raise'):
+            eigenvalues, eigenvectors = calculate_principal_eigenvectors4(
+                1, 2, oxx, 2 * oxx, 3 * oxx, shear, zero, zero, 'float32')
+            eigenvalues5, eigenvectors5 = calculate_principal_eigenvectors5(
+                1, 1, 2, oxx[:, np.newaxis, :], 2 * oxx[:, np.newaxis, :], 3 * oxx[:, np.newaxis, :],
+                shear[:, np.newaxis, :], zero[:, np.newaxis, :], zero[:, np.newaxis, :], 'float32')
+
+        # [[1, 0.5, 0], [0.5, 2, 0], [0, 0, 3]]
+        x = np.sqrt(0.5)
+        assert np.allclose(eigenvalues[0, 0], [1.5 - x, 1.5 + x, 3.]), eigenvalues
+        assert np.allclose(eigenvalues5[0, 0], eigenvalues[0]), eigenvalues5
+        assert np.isfinite(eigenvectors).all()
+        assert np.isfinite(eigenvectors5).all()
+
 class TestOP2(Tester):
     """various OP2 tests"""
     #def _spike(self):
@@ -295,6 +334,356 @@ class TestOP2(Tester):
         os.remove(f06_filename)
         os.remove('temp.debug')
 
+    def test_op2_index(self):
+        """tests the table-of-contents sidecar file"""
+        log = get_logger(level='warning')
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'static_solid_shell_bar.op2')
+        index_filename = get_index_filename(op2_filename)
+        if os.path.exists(index_filename):
+            os.remove(index_filename)
+
+        op2 = read_op2(op2_filename, debug=False, log=log)
+        op2_index1 = read_op2(op2_filename, debug=False, log=log, use_index=True)
+        assert os.path.exists(index_filename), index_filename
+
+        # the result objects come from the index, so the sizing pass isn't run
+        with mock.patch.object(OP2_Scalar, 'read_op2', side_effect=AssertionError('scanned')):
+            op2_index2 = read_op2(op2_filename, debug=False, log=log, use_index=True)
+        op2.assert_op2_equal(op2_index1)
+        op2.assert_op2_equal(op2_index2)
+        assert op2_index2.table_names == op2.table_names
+        assert op2_index2.isubcase_name_map == op2.isubcase_name_map
+        assert op2_index2.get_op2_stats() == op2.get_op2_stats()
+
+        op2_index = OP2Index(op2_filename, log)
+        assert op2_index.load()
+        assert 'OUGV1' in op2_index.get_table_names()
+        assert len(op2_index.layout['results']) > 0
+
+        # the layout depends on the results that are read
+        op2_disp = read_op2(op2_filename, debug=False, log=log,
+                            include_results='displacements', use_index=True)
+        assert len(op2_disp.displacements) == 1
+        assert len(op2_disp.cquad4_stress) == 0
+        op2_disp = read_op2(op2_filename, debug=False, log=log,
+                            include_results='displacements', use_index=True)
+        assert len(op2_disp.displacements) == 1
+        assert len(op2_disp.cquad4_stress) == 0
+
+        # a stale index is rebuilt
+        with open(index_filename, 'rb') as index_file:
+            data = pickle.load(index_file)
+        data['size'] += 1
+        with open(index_filename, 'wb') as index_file:
+            pickle.dump(data, index_file)
+        assert not op2_index.load()
+        op2_index3 = read_op2(op2_filename, debug=False, log=log, use_index=True)
+        op2.assert_op2_equal(op2_index3)
+        assert op2_index.load()
+        os.remove(index_filename)
+
+    def test_op2_lazy(self):
+        """tests reading the result data on demand"""
+        log = get_logger(level='warning')
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'static_solid_shell_bar.op2')
+        op2 = read_op2(op2_filename, debug=False, log=log)
+        op2_lazy = OP2(debug=False, log=log)
+        op2_lazy.open_lazy(op2_filename)
+
+        stress = op2_lazy.cquad4_stress[1]
+        assert isinstance(stress, LazyResult), stress
+        assert stress.ntimes == 1, stress.ntimes
+        assert isinstance(stress, LazyResult), stress
+        assert stress.class_name == 'RealPlateStressArray', stress.class_name
+
+        stress_expected = op2.cquad4_stress[1]
+        assert np.array_equal(stress.data, stress_expected.data)
+        assert np.array_equal(stress.element_node, stress_expected.element_node)
+        assert not isinstance(stress, LazyResult), stress
+        assert type(stress) is type(stress_expected)
+        assert op2_lazy.cquad4_stress[1] is stress
+
+        # only the loaded result is read; the real class is used for
+        # isinstance and the dunder methods
+        disp = op2_lazy.displacements[1]
+        assert isinstance(disp, LazyResult), disp
+        assert isinstance(disp, RealDisplacementArray), disp
+        assert disp == op2.displacements[1]
+        assert not isinstance(disp, LazyResult), disp
+        assert np.array_equal(disp.data, op2.displacements[1].data)
+        str(disp.get_stats())
+
+        # a method loads the data
+        op2_lazy = OP2(debug=False, log=log)
+        op2_lazy.open_lazy(op2_filename)
+        disp = op2_lazy.displacements[1]
+        str(disp.get_stats())
+        assert not isinstance(disp, LazyResult), disp
+
+        # the optimization count in the key comes from the design cycle tables
+        op2_filename = os.path.join(MODEL_PATH, 'sol200', 'model_200.op2')
+        op2 = read_op2(op2_filename, debug=False, log=log)
+        op2_lazy = OP2(debug=False, log=log)
+        op2_lazy.open_lazy(op2_filename)
+        op2.assert_op2_equal(op2_lazy)
+
+    def test_op2_mmap(self):
+        """tests reading the results records from a memory map"""
+        log = get_logger(level='warning')
+        for op2_filename in ['static_solid_shell_bar.op2', 'transient_solid_shell_bar.op2']:
+            op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', op2_filename)
+            op2 = read_op2(op2_filename, debug=False, log=log)
+            op2_mmap = read_op2(op2_filename, debug=False, log=log, use_mmap=True)
+            op2.assert_op2_equal(op2_mmap)
+            assert np.array_equal(op2.displacements[1].data, op2_mmap.displacements[1].data)
+            assert np.array_equal(op2.cquad4_stress[1].data, op2_mmap.cquad4_stress[1].data)
+
+    def test_op2_nworkers(self):
+        """tests decoding the results tables with a process pool"""
+        log = get_logger(level='warning')
+        assert split_keys([('a', 1), ('b', 5), ('c', 3), ('d', 2)], 2) == [['b', 'a'], ['c', 'd']]
+        assert split_keys([('a', 1)], 4) == [['a']]
+
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'transient_solid_shell_bar.op2')
+        op2 = read_op2(op2_filename, debug=False, log=log)
+        op2_parallel = read_op2(op2_filename, debug=False, log=log, nworkers=2)
+        op2.assert_op2_equal(op2_parallel)
+        assert not isinstance(op2_parallel.displacements[1], LazyResult)
+        assert np.array_equal(op2.displacements[1].data, op2_parallel.displacements[1].data)
+        assert np.array_equal(op2.cquad4_stress[1].data, op2_parallel.cquad4_stress[1].data)
+
+        op2_parallel_mmap = read_op2(op2_filename, debug=False, log=log, nworkers=2,
+                                     use_mmap=True)
+        op2.assert_op2_equal(op2_parallel_mmap)
+
+        # the static results have a NaN nonlinear_factor
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'static_solid_shell_bar.op2')
+        f06_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'static_solid_shell_bar.nworkers.f06')
+        op2_parallel = read_op2(op2_filename, debug=False, log=log, nworkers=2)
+        assert op2_parallel.displacements[1].nonlinear_factor is np.nan
+        op2_parallel.build_dataframe()
+        op2_parallel.write_f06(f06_filename)
+        os.remove(f06_filename)
+
+    @unittest.skipIf(not IS_SHARED_MEMORY, 'no shared_memory')
+    def test_op2_nworkers_shared_memory_cleanup(self):
+        """the shared memory blocks are unlinked if the parent fails"""
+        from concurrent.futures import Future
+        from multiprocessing import shared_memory
+
+        class Result:
+            pass
+
+        futures = []
+        names = []
+        for i in range(2):
+            obj = Result()
+            obj.data = np.full((1, 100_000, 6), i, dtype='float32')
+            _save_shared_arrays(obj)
+            assert isinstance(obj.data, SharedArray)
+            names.append(obj.data.name)
+            future = Future()
+            future.set_result(({}, [('displacements', i + 1, obj)]))
+            futures.append(future)
+
+        def add_objs(unused_ifuture, unused_header, unused_objs):
+            raise RuntimeError('parent failed')
+
+        with self.assertRaises(RuntimeError):
+            _load_futures(futures, add_objs)
+        for name in names:
+            with self.assertRaises(FileNotFoundError):
+                shared_memory.SharedMemory(name=name)
+
+    def test_iter_op2_results(self):
+        """tests reading the results in blocks of time steps"""
+        log = get_logger(level='warning')
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'transient_solid_shell_bar.op2')
+        op2 = read_op2(op2_filename, debug=False, log=log)
+        ntimes = op2.displacements[1].data.shape[0]
+
+        blocks = []
+        for result_name, subcase_key, obj in iter_op2_results(
+                op2_filename, ntimes=3, include_results=['displacements', 'stress'],
+                debug=False, log=log):
+            assert not isinstance(obj, LazyResult)
+            if result_name == 'displacements':
+                assert subcase_key == 1, subcase_key
+                assert obj.data.shape[0] <= 3, obj.data.shape
+                blocks.append(obj.data)
+            else:
+                assert result_name.endswith('_stress'), result_name
+        assert len(blocks) == (ntimes + 2) // 3, len(blocks)
+        assert np.array_equal(np.vstack(blocks), op2.displacements[1].data)
+
+    def test_iter_op2_results_sort2(self):
+        """tests reading the SORT2 results in blocks of nodes"""
+        log = get_logger(level='warning')
+        op2_filename = os.path.join(MODEL_PATH, 'elements', 'time_thermal_elements_sort2_nx.op2')
+        op2 = read_op2(op2_filename, debug=False, log=log, combine=False)
+        # key = (isubcase, analysis_code, sort_method, ...)
+        temperatures = {key: obj for key, obj in op2.temperatures.items()
+                        if key[2] == 2}
+        assert len(temperatures) == 1, temperatures
+        key, temperature = list(temperatures.items())[0]
+        nnodes = temperature.data.shape[1]
+
+        blocks = []
+        for result_name, subcase_key, obj in iter_op2_results(
+                op2_filename, ntimes=4, combine=False, debug=False, log=log):
+            if result_name != 'temperatures' or subcase_key != key:
+                continue
+            assert obj.data.shape[0] == temperature.data.shape[0], obj.data.shape
+            assert obj.data.shape[1] <= 4, obj.data.shape
+            blocks.append(obj)
+        assert len(blocks) == (nnodes + 3) // 4, len(blocks)
+        assert np.array_equal(np.hstack([obj.data for obj in blocks]), temperature.data)
+        assert np.array_equal(np.vstack([obj.node_gridtype for obj in blocks]),
+                              temperature.node_gridtype)
+
+    def test_read_op2_many(self):
+        """tests reading and combining the results of many OP2s"""
+        log = get_logger(level='warning')
+        folder = os.path.join(MODEL_PATH, 'sol_101_elements')
+        static_filename = os.path.join(folder, 'static_solid_shell_bar.op2')
+        mode_filename = os.path.join(folder, 'mode_solid_shell_bar.op2')
+        op2 = read_op2(static_filename, debug=False, log=log)
+        disp = op2.displacements[1]
+        stress = op2.cquad4_stress[1]
+
+        op2_filenames = [static_filename, static_filename]
+        for nworkers in [1, 2]:
+            model = read_op2_many(op2_filenames, include_results=['displacements', 'stress'],
+                                  debug=False, log=log, nworkers=nworkers)
+            assert model.op2_filenames == op2_filenames
+            assert model._nastran_format == op2._nastran_format, model._nastran_format
+            assert model.date == op2.date, model.date
+            disp2 = model.displacements[1]
+            stress2 = model.cquad4_stress[1]
+            assert disp2.run_data.shape == (2, ) + disp.data.shape
+            assert np.array_equal(disp2.run_data[1], disp.data)
+            assert np.array_equal(disp2.data, disp.data)
+            assert np.array_equal(stress2.run_data[0], stress.data)
+            assert len(model.op2_results.force.cquad4_force) == 0
+
+        # the eigenvectors aren't in the first run and the displacements
+        # aren't in the second run, so they aren't stacked
+        model = read_op2_many([static_filename, mode_filename], debug=False, log=log)
+        assert not hasattr(model.displacements[1], 'run_data')
+        assert np.array_equal(model.displacements[1].data, disp.data)
+        assert len(model.eigenvectors) == 0
+
+        model = read_op2_many([static_filename, mode_filename, static_filename],
+                              combine_runs='subcase', debug=False, log=log, nworkers=2)
+        assert model.run_subcases == {1: (0, 1), 2: (1, 1), 3: (2, 1)}
+        assert list(model.displacements) == [1, 3]
+        assert list(model.eigenvectors) == [2]
+        assert model.displacements[3].isubcase == 3
+        assert np.array_equal(model.displacements[3].data, disp.data)
+
+    def test_read_op2_many_write(self):
+        """the model of many OP2s can be written"""
+        log = get_logger(level='warning')
+        folder = os.path.join(MODEL_PATH, 'sol_101_elements')
+        static_filename = os.path.join(folder, 'static_solid_shell_bar.op2')
+        op2_filename_out = os.path.join(folder, 'static_solid_shell_bar.many.op2')
+        hdf5_filename = os.path.join(folder, 'static_solid_shell_bar.many.h5')
+        f06_filename = os.path.join(folder, 'static_solid_shell_bar.many.f06')
+
+        op2_filenames = [static_filename, static_filename]
+        for combine_runs in ['stack', 'subcase']:
+            for nworkers in [1, 2]:
+                model = read_op2_many(op2_filenames, combine_runs=combine_runs,
+                                      debug=False, log=log, nworkers=nworkers)
+                model.write_op2(op2_filename_out)
+                model.write_f06(f06_filename)
+                if IS_H5PY:
+                    model.export_hdf5_filename(hdf5_filename)
+                    os.remove(hdf5_filename)
+                model2 = read_op2(op2_filename_out, debug=False, log=log)
+                assert np.array_equal(model2.displacements[1].data, model.displacements[1].data)
+        os.remove(op2_filename_out)
+        os.remove(f06_filename)
+
+    def test_read_op2_many_times(self):
+        """the results of runs with different times aren't stacked"""
+        log = get_logger(level='warning')
+        folder = os.path.join(MODEL_PATH, 'sol_101_elements')
+        transient_filename = os.path.join(folder, 'transient_solid_shell_bar.op2')
+        model = OP2(debug=False, log=log)
+        filters, saved_results = _get_filters(model)
+        runs = [_read_run(transient_filename, None, None, True, filters, saved_results, False)[1]
+                for irun in range(2)]
+        disp1 = [obj for result_name, code, obj in runs[1]
+                 if result_name == 'displacements'][0]
+        disp1._times = disp1._times + 1.
+
+        stacked = {}
+        iruns_stacked = {}
+        add_run = _get_add_run(model, 2, 'stack', stacked, iruns_stacked)
+        add_run(0, runs[0])
+        add_run(1, runs[1])
+        _finish_stack(model, 2, stacked, iruns_stacked)
+        assert not hasattr(model.displacements[1], 'run_data')
+        assert hasattr(model.cquad4_stress[1], 'run_data')
+
+    def test_read_op2_many_out_of_order(self):
+        """the runs are combined when they complete out of order"""
+        log = get_logger(level='warning')
+        folder = os.path.join(MODEL_PATH, 'sol_101_elements')
+        static_filename = os.path.join(folder, 'static_solid_shell_bar.op2')
+        mode_filename = os.path.join(folder, 'mode_solid_shell_bar.op2')
+
+        def read_run(model, op2_filename):
+            filters, saved_results = _get_filters(model)
+            unused_header, objs = _read_run(op2_filename, None, None, True,
+                                            filters, saved_results, False)
+            return objs
+
+        def get_obj(objs, result_name, code):
+            return [obj for result_namei, codei, obj in objs
+                    if result_namei == result_name and codei == code][0]
+
+        # stack: run 1 completes first
+        model = OP2(debug=False, log=log)
+        runs = [read_run(model, static_filename) for irun in range(2)]
+        disp0 = get_obj(runs[0], 'displacements', 1)
+        disp1 = get_obj(runs[1], 'displacements', 1)
+        disp1.data *= 2.
+        data0 = disp0.data.copy()
+
+        stacked = {}
+        iruns_stacked = {}
+        add_run = _get_add_run(model, 2, 'stack', stacked, iruns_stacked)
+        add_run(1, runs[1])
+        assert len(model.displacements) == 0
+        add_run(0, runs[0])
+        _finish_stack(model, 2, stacked, iruns_stacked)
+
+        disp = model.displacements[1]
+        assert disp is disp0
+        assert not hasattr(disp1, 'run_data')
+        assert disp.run_data.shape == (2, ) + data0.shape
+        assert np.array_equal(disp.data, data0)
+        assert np.array_equal(disp.run_data[1], 2. * data0)
+        assert np.shares_memory(disp.data, disp.run_data)
+
+        # subcase: the subcases are numbered by run
+        model = OP2(debug=False, log=log)
+        model.run_subcases = {}
+        runs = [read_run(model, static_filename), read_run(model, mode_filename),
+                read_run(model, static_filename)]
+        disp2 = get_obj(runs[2], 'displacements', 1)
+        add_run = _get_add_run(model, 3, 'subcase', {}, {})
+        add_run(2, runs[2])
+        add_run(1, runs[1])
+        assert model.run_subcases == {}
+        add_run(0, runs[0])
+        assert model.run_subcases == {1: (0, 1), 2: (1, 1), 3: (2, 1)}
+        assert list(model.eigenvectors) == [2]
+        assert model.displacements[3] is disp2
+        assert disp2.isubcase == 3
+
     def test_beam_modes(self):
         """tests the eigenvalue table reading"""
         log = get_logger(level='warning')
@@ -1120,6 +1509,56 @@ class TestOP2(Tester):
                 stop_on_failure=True, dev=False,
                 build_pandas=False, log=log)
 
+    def test_op2_combine_superelements(self):
+        """tests merging the superelement results of a subcase"""
+        log = get_logger(level='warning')
+        op2_filename = os.path.join(MODEL_PATH, 'other', 'ehbus69.op2')
+        op2 = read_op2(op2_filename, combine=False, debug=False, log=log)
+        op2_combine = read_op2(op2_filename, combine=True, combine_superelements=True,
+                               debug=False, log=log)
+
+        # the superelements aren't merged by default
+        key = (10, 10, 1, 0, 0, '', '')
+        op2_default = read_op2(op2_filename, combine=True, debug=False, log=log)
+        assert key not in op2_default.displacements
+        assert (10, 10, 1, 0, 0, 'SUPERELEMENT 1', '') in op2_default.displacements
+
+        # the boundary nodes are in both superelements
+        disp0 = op2.displacements[(10, 10, 1, 0, 0, 'SUPERELEMENT 0', '')]
+        disp1 = op2.displacements[(10, 10, 1, 0, 0, 'SUPERELEMENT 1', '')]
+        disp = op2_combine.displacements[key]
+        nids0 = disp0.node_gridtype[:, 0]
+        nids1 = disp1.node_gridtype[:, 0]
+        nids = np.unique(np.hstack([nids0, nids1]))
+        assert len(nids) < len(nids0) + len(nids1)
+        assert np.array_equal(disp.node_gridtype[:, 0], nids)
+        assert disp.ntotal == len(nids)
+        assert disp.superelement_adaptivity_index == ''
+        inid = np.searchsorted(nids, nids1)
+        assert np.array_equal(disp.data[:, inid, :], disp1.data)
+
+        # the element ids are sorted and the corner nodes stay with their element
+        strain0 = op2.op2_results.strain.ctetra_strain[(10, 10, 1, 0, 0, 'SUPERELEMENT 0', '')]
+        strain1 = op2.op2_results.strain.ctetra_strain[(10, 10, 1, 0, 0, 'SUPERELEMENT 1', '')]
+        strain = op2_combine.op2_results.strain.ctetra_strain[key]
+        element_node = np.vstack([strain0.element_node, strain1.element_node])
+        isort = np.argsort(element_node[:, 0], kind='stable')
+        assert np.array_equal(strain.element_node, element_node[isort, :])
+        assert np.array_equal(strain.data, np.hstack([strain0.data, strain1.data])[:, isort, :])
+        assert strain.nelements == strain0.nelements + strain1.nelements
+        assert len(strain.element_cid) == strain.nelements
+
+        # the boundary nodes have different spc forces, so they're not merged
+        assert key not in op2_combine.spc_forces
+        assert (10, 10, 1, 0, 0, 'SUPERELEMENT 1', '') in op2_combine.spc_forces
+
+        # static results have a time of nan
+        assert _is_equal_times(np.array([np.nan]), np.array([np.nan]))
+        assert _is_equal_times(np.array([1., np.nan]), [1., np.nan])
+        assert not _is_equal_times(np.array([1., np.nan]), [2., np.nan])
+        assert not _is_equal_times(np.array([np.nan]), [np.nan, np.nan])
+        assert _is_equal_times(np.array([1, 2]), [1, 2])
+
     def test_bdf_op2_other_20(self):
         """checks gpst17.bdf, which tests GridPointStressesVolumeDirectArray"""
         log = get_logger(level='error')
@@ -1845,6 +2284,121 @@ class TestOP2(Tester):
             op2b.load_hdf5_filename(hdf5_filename, combine=True)
             op2b.print_subcase_key()
 
+    def test_op2_hdf5_data_chunks(self):
+        """tests the chunks of a large results array are ~HDF5_CHUNK_NBYTES"""
+        shapes_itemsizes = [
+            ((100, 1_000_000, 6), 4),  # real displacement
+            ((1, 1_000_000, 6), 4),    # static
+            ((10_000, 50_000, 6), 8),  # complex displacement
+            ((500, 200_000, 9), 4),    # real solid stress
+        ]
+        for shape, itemsize in shapes_itemsizes:
+            chunks = get_hdf5_data_chunks(shape, itemsize)
+            assert len(chunks) == len(shape), chunks
+            assert chunks[2:] == shape[2:], chunks
+            assert all(1 <= nchunk <= n for nchunk, n in zip(chunks, shape)), (shape, chunks)
+            nbytes = itemsize * int(np.prod(chunks))
+            assert 0.5 * HDF5_CHUNK_NBYTES <= nbytes <= HDF5_CHUNK_NBYTES, (shape, chunks, nbytes)
+
+        # a small array is a single chunk
+        assert get_hdf5_data_chunks((2, 3, 6), 4) == (2, 3, 6)
+
+    @unittest.skipIf(not IS_H5PY, 'h5py is required')
+    def test_op2_hdf5_partial(self):
+        """tests a compressed hdf5 file and reading part of the results"""
+        log = get_logger(level='warning')
+        folder = os.path.join(MODEL_PATH, 'sol_101_elements')
+        op2_filename = os.path.join(folder, 'mode_solid_shell_bar.op2')
+        hdf5_filename = os.path.join(folder, 'mode_solid_shell_bar.test_op2_hdf5_partial.h5')
+        op2 = read_op2(op2_filename, build_dataframe=False, debug=False, log=log)
+        op2.export_hdf5_filename(hdf5_filename, compression='gzip', shuffle=True)
+
+        with h5py.File(hdf5_filename, 'r') as h5_file:
+            for subcase_name in h5_file.keys():
+                if subcase_name.startswith('Subcase'):
+                    h5_data = h5_file[subcase_name]['eigenvectors']['data']
+                    assert h5_data.compression == 'gzip'
+                    assert h5_data.chunks == h5_data.shape
+
+        op2b = OP2(debug=False, log=log)
+        op2b.load_hdf5_filename(hdf5_filename, combine=True)
+        for key, eigenvectors in op2.eigenvectors.items():
+            assert np.array_equal(op2b.eigenvectors[key].data, eigenvectors.data)
+
+        # the 2nd/3rd modes of nodes/elements 2, 5, 6
+        isubcase = 1
+        ids = [2, 5, 6]
+        op2c = OP2(debug=False, log=log)
+        op2c.load_hdf5_filename(hdf5_filename, combine=True, subcases=[isubcase],
+                                results=['eigenvectors', 'stress.ctetra_stress'],
+                                times=[2, 3], ids=ids)
+        assert len(op2c.eigenvectors) == 1
+        assert len(op2c.op2_results.stress.ctetra_stress) == 1
+        assert len(op2c.cquad4_stress) == 0
+
+        eigenvectors = op2.eigenvectors[isubcase]
+        eigenvectors2 = op2c.eigenvectors[isubcase]
+        inid = np.searchsorted(eigenvectors.node_gridtype[:, 0], ids)
+        assert np.array_equal(eigenvectors2.modes, [2, 3])
+        assert np.array_equal(eigenvectors2.node_gridtype, eigenvectors.node_gridtype[inid, :])
+        assert np.array_equal(eigenvectors2.data, eigenvectors.data[1:, inid, :])
+        assert eigenvectors2.ntimes == 2
+
+        stress = op2.op2_results.stress.ctetra_stress[isubcase]
+        stress2 = op2c.op2_results.stress.ctetra_stress[isubcase]
+        ieid = np.where(stress.element_node[:, 0] == 5)[0]
+        assert np.array_equal(stress2.element_node, stress.element_node[ieid, :])
+        assert np.array_equal(stress2.element_cid[:, 0], [5])
+        assert np.array_equal(stress2.data, stress.data[1:, ieid, :])
+        assert stress2.nelements == 1
+        os.remove(hdf5_filename)
+
+    @unittest.skipIf(not IS_H5PY, 'h5py is required')
+    def test_op2_hdf5_load_as_h5(self):
+        """tests an hdf5 file with the results data left on disk"""
+        log = get_logger(level='warning')
+        folder = os.path.join(MODEL_PATH, 'sol_101_elements')
+        op2_filename = os.path.join(folder, 'mode_solid_shell_bar.op2')
+        hdf5_filename = os.path.join(folder, 'mode_solid_shell_bar.test_op2_hdf5_load_as_h5.h5')
+        op2 = read_op2(op2_filename, build_dataframe=False, debug=False, log=log)
+        op2.export_hdf5_filename(hdf5_filename)
+
+        # the in-memory and on-disk results of the hdf5 file are compared
+        op2a = OP2(debug=False, log=log)
+        op2a.load_hdf5_filename(hdf5_filename, combine=True)
+        op2b = OP2(debug=False, log=log)
+        op2b.load_hdf5_filename(hdf5_filename, combine=True, load_as_h5=True)
+        isubcase = 1
+        eigenvectors = op2a.eigenvectors[isubcase]
+        eigenvectors2 = op2b.eigenvectors[isubcase]
+        stress = op2a.op2_results.stress.ctetra_stress[isubcase]
+        stress2 = op2b.op2_results.stress.ctetra_stress[isubcase]
+        assert isinstance(eigenvectors2.data, h5py.Dataset)
+        assert isinstance(stress2.data, h5py.Dataset)
+
+        assert np.array_equal(eigenvectors2.data[1, :, 2], eigenvectors.data[1, :, 2])
+        assert np.array_equal(eigenvectors2.extract_xyplot([5, 2, 5], 3),
+                              eigenvectors.extract_xyplot([5, 2, 5], 3))
+        assert np.array_equal(eigenvectors2.extract_xyplot([5, 2], 3),
+                              eigenvectors.data[:, [4, 1], 2])
+        assert eigenvectors2.get_stats() == eigenvectors.get_stats()
+        assert stress2.get_stats(short=True) == stress.get_stats(short=True)
+
+        stress.build_dataframe()
+        stress2.build_dataframe()
+        assert stress2.data_frame.equals(stress.data_frame)
+
+        for result, result2 in [(eigenvectors, eigenvectors2), (stress, stress2)]:
+            f06_file = StringIO()
+            f06_file2 = StringIO()
+            result.write_f06(f06_file, header=['', '', ''], page_stamp='PAGE %s', page_num=1)
+            result2.write_f06(f06_file2, header=['', '', ''], page_stamp='PAGE %s', page_num=1)
+            assert f06_file2.getvalue() == f06_file.getvalue()
+
+        op2b.h5_file.close()
+        op2b.h5_file = None
+        os.remove(hdf5_filename)
+
     def test_op2_solid_shell_bar_01_geom(self):
         """tests reading op2 geometry"""
         log = get_logger(level='warning')
@@ -1973,6 +2527,30 @@ class TestOP2(Tester):
         op2.write_f06(f06_filename)
         os.remove(f06_filename)
 
+    def test_op2_transient_solid_shell_bar_sort2_f06(self):
+        """the SORT2 f06 is the same when it's written in blocks of nodes"""
+        log = get_logger(level='warning')
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'transient_solid_shell_bar.op2')
+        op2 = read_op2(op2_filename, debug=False, log=log)
+        disp = op2.displacements[1]
+        assert disp.data.shape == (42, 25, 6), disp.data.shape
+
+        nrows_f06_block = table_object.NROWS_F06_BLOCK
+        f06_lines = []
+        try:
+            # all the nodes; 2 nodes per block (the last block has 1 node)
+            for nrows in [nrows_f06_block, 100]:
+                table_object.NROWS_F06_BLOCK = nrows
+                f06_file = StringIO()
+                page_num = disp.write_f06(f06_file, header=['', '', ''], page_stamp='PAGE %i\n',
+                                          page_num=1, is_sort1=False)
+                assert page_num == 25, page_num
+                f06_lines.append(f06_file.getvalue())
+        finally:
+            table_object.NROWS_F06_BLOCK = nrows_f06_block
+        assert f06_lines[0] == f06_lines[1]
+        assert f06_lines[0].count(' POINT-ID = ') == 25
+
     def test_op2_frequency_solid_shell_bar_01_geom(self):
         """frequency test"""
         log = get_logger(level='warning')
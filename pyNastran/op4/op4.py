@@ -9,11 +9,12 @@ from scipy.sparse import coo_matrix  # type: ignore
 from cpylog import get_logger2
 
 from pyNastran.utils import is_binary_file as file_is_binary
+from pyNastran.femutils.utils import concatenate_ranges
 from pyNastran.utils.mathematics import print_matrix #, print_annotated_matrix
 
 
 def read_op4(op4_filename=None, matrix_names=None, precision='default',
-             debug=False, log=None):
+             debug=False, log=None, lazy=False):
     """
     Reads a NASTRAN OUTPUT4 file, and stores the
     matrices as the output arguments.  The number of
@@ -45,6 +46,11 @@ def read_op4(op4_filename=None, matrix_names=None, precision='default',
        >>> matrices = op4.read_op4()
        >>>
 
+       # find the matrices, but only read A (binary only)
+       >>> matrices = op4.read_op4(op4_filename, lazy=True)
+       >>> (formA, A_lazy) = matrices['A']
+       >>> A = A_lazy.load()
+
     Parameters
     ----------
     op4_filename : str / None
@@ -54,6 +60,9 @@ def read_op4(op4_filename=None, matrix_names=None, precision='default',
     precision : str; {'default', 'single', 'double'}
         specifies if the matrices are in single or double precsion
         which means the format will be whatever the file is in
+    lazy : bool; default=False
+        only find the matrices (binary files); the matrices are
+        LazyMatrix objects that are read by calling ``load()``
 
     Returns
     -------
@@ -92,7 +101,48 @@ def read_op4(op4_filename=None, matrix_names=None, precision='default',
 
     """
     op4 = OP4(log=log, debug=debug)
-    return op4.read_op4(op4_filename, matrix_names, precision)
+    return op4.read_op4(op4_filename, matrix_names, precision, lazy=lazy)
+
+
+class LazyMatrix:
+    """
+    A matrix in a binary OP4 file that isn't read until ``load`` is called
+
+    The file offset of the matrix is found by ``read_op4(..., lazy=True)``
+    by skipping over the column records, so a single matrix can be read
+    from a large OP4 without decoding the other matrices.
+    """
+    def __init__(self, op4_filename, name, form, matrix_type, nrows, ncols,
+                 offset, endian, log=None, debug=False):
+        self.op4_filename = op4_filename
+        self.name = name
+        self.form = form
+        self.matrix_type = matrix_type
+        self.nrows = nrows
+        self.ncols = ncols
+        self.offset = offset
+        self._endian = endian
+        self.log = log
+        self.debug = debug
+
+    @property
+    def shape(self):
+        """the shape of the matrix"""
+        return (self.nrows, self.ncols)
+
+    def load(self):
+        """reads the matrix"""
+        op4_obj = OP4(log=self.log, debug=self.debug)
+        op4_obj._endian = self._endian
+        with open(self.op4_filename, mode='rb') as op4:
+            op4.seek(self.offset)
+            op4_obj.n = self.offset
+            matrix = op4_obj._read_matrix_binary(op4, 'default', None)[2]
+        return matrix
+
+    def __repr__(self):
+        return 'LazyMatrix(name=%r, form=%s, matrix_type=%s, shape=%s)' % (
+            self.name, self.form, self.matrix_type, self.shape)
 
 
 class OP4:
@@ -111,7 +161,8 @@ class OP4:
         self._new = False
         self.large = None
 
-    def read_op4(self, op4_filename=None, matrix_names=None, precision='default'):
+    def read_op4(self, op4_filename=None, matrix_names=None, precision='default',
+                 lazy=False):
         """See ``read_op4``"""
         if precision not in ('default', 'single', 'double'):
             msg = "precision=%r and must be 'single', 'double', or 'default'" % precision
@@ -134,7 +185,10 @@ class OP4:
         #assert isinstance(matrix_names, list), 'type(matrix_names)=%s' % type(matrix_names)
 
         if file_is_binary(op4_filename):
-            return self.read_op4_binary(op4_filename, matrix_names, precision)
+            return self.read_op4_binary(op4_filename, matrix_names, precision, lazy=lazy)
+        if lazy:
+            raise NotImplementedError('lazy=True is only supported for binary OP4 files; '
+                                      'op4_filename=%r' % op4_filename)
         return self.read_op4_ascii(op4_filename, matrix_names, precision)
 
 #--------------------------------------------------------------------------
@@ -664,16 +718,15 @@ class OP4:
         return (irow, idummy - 1)
 
 #--------------------------------------------------------------------------
-    def read_op4_binary(self, op4_filename, matrix_names=None, precision='default'):
+    def read_op4_binary(self, op4_filename, matrix_names=None, precision='default',
+                        lazy=False):
         """matrix_names must be a list or None, but basically the same"""
         with open(op4_filename, mode='rb') as op4:
             self.n = 0
             self._endian = self._determine_endian(op4)
 
             matrices = {}
-            name = 'dummyName'
-            while name is not None:
-                #print "i =", i
+            while True:
                 # checks for the end of the file
                 assert self.n == op4.tell(), 'n=%s tell=%s' % (self.n, op4.tell())
                 n = self.n
@@ -681,36 +734,60 @@ class OP4:
                 op4.seek(n)
                 if len(data1) == 0:
                     break
-                #self.show(f, 60)
 
-                (name, form, matrix) = self._read_matrix_binary(op4, precision, matrix_names)
-                #print(print_matrix(matrix))
-                if name is not None:
-                    if matrix_names is None or name in matrix_names:  # save the matrix
-                        name = name.decode('ascii')
+                header = self._read_matrix_header_binary(op4)
+                name = header[0].decode('ascii')
+                form, matrix_type, nrows, ncols = header[1:5]
+                is_saved = matrix_names is None or name in matrix_names
+                if lazy or not is_saved:
+                    # skip over the column records
+                    self.n = self._scan_matrix_binary(op4, ncols)[0]
+                    op4.seek(self.n)
+                    if is_saved:
+                        matrix = LazyMatrix(op4_filename, name, form, matrix_type, nrows, ncols,
+                                            n, self._endian, log=self.log, debug=self.debug)
                         _save_matrix(matrices, name, form, matrix)
+                    continue
 
-                #print("not op4.closed = ",not op4.closed,form,name)
-                # if not op4.closed or form is not None:
-                #     data = op4.read(4)
-                #     self.n += 4
-                #     if len(data) == 0:
-                #         break
-                #     (record_length,) = unpack(self._endian + 'i', data)
-                ##     print("record_length = %s" % record_length)
-                #     if record_length == 24:
-                #         self.n -= 4
-                #         op4.seek(self.n)
-                #     else:
-                #         data = op4.read(4)
-                #         if len(data) == 0:
-                #             break
-                #         (record_length2,) = unpack(self._endian + 'i', data)
-                #         assert record_length2 == 24
-                #         op4.seek(self.n)
-                #
+                matrix = self._read_matrix_data_binary(op4, header)
+                _save_matrix(matrices, name, form, matrix)
         return matrices
 
+    def _scan_matrix_binary(self, op4, ncols):
+        """
+        Steps over the column records of a matrix using the record
+        lengths without reading the values
+
+        Returns
+        -------
+        n_end : int
+            the file position after the matrix
+        nwords : int
+            the number of words in the column records, which is an
+            upper bound on the number of values
+
+        """
+        n0 = self.n
+        n = n0
+        nwords_total = 0
+        struct_5i = Struct(self._endian + '5i')
+        while True:
+            # [end of the previous record, record_length, icol, irow, nwords]
+            op4.seek(n)
+            data = op4.read(20)
+            if len(data) != 20:
+                raise EOFError('end of the file was found while reading a matrix; '
+                               'filename=%r' % op4.name)
+            unused_record_end, record_length, icol, unused_irow, nwords = struct_5i.unpack(data)
+            n += 8 + record_length
+            if icol == ncols + 1:
+                # the end of the last record
+                n += 4
+                break
+            nwords_total += nwords
+        op4.seek(n0)
+        return n, nwords_total
+
     def read_start_marker(self, op4):
         if self.debug:
             self.log.info('--------------------------------------')
@@ -735,6 +812,21 @@ class OP4:
 
     def _read_matrix_binary(self, op4, precision, matrix_names):
         """Reads a binary matrix"""
+        header = self._read_matrix_header_binary(op4)
+        name, form = header[:2]
+        A = self._read_matrix_data_binary(op4, header)
+        return (name, form, A)
+
+    def _read_matrix_header_binary(self, op4):
+        """
+        Reads the header record of a binary matrix
+
+        Returns
+        -------
+        header : (name, form, matrix_type, nrows, ncols, is_big_mat)
+            name is bytes
+
+        """
         #self.show(f, 60)
         if self.debug:
             self.log.info("*************************")
@@ -784,6 +876,11 @@ class OP4:
 
         if self.debug:
             self.log.info('is_big_matrix = %s' % is_big_mat)
+        return (name, form, Type, nrows, ncols, is_big_mat)
+
+    def _read_matrix_data_binary(self, op4, header):
+        """Reads the column records of a binary matrix"""
+        unused_name, unused_form, Type, nrows, ncols, is_big_mat = header
 
         # jump forward to get irow (needed for check on is_sparse),
         # then jump back
@@ -826,7 +923,7 @@ class OP4:
         #f.read(4); self.n+=4
 
         assert self.n == op4.tell(), 'n=%s op4.tell=%s' % (self.n, op4.tell())
-        return (name, form, A)
+        return A
 
     def _get_matrix_info(self, matrix_type, debug=True):
         if matrix_type == 1:
@@ -898,113 +995,100 @@ class OP4:
         return A
 
     def _read_real_sparse_binary(self, op4, nrows, ncols, matrix_type, is_big_mat):
+        """Reads a sparse real binary matrix"""
         if self.debug:
             self.log.info('_read_real_sparse_binary')
-        out = self._get_matrix_info(matrix_type, debug=False)
-        (nwords_per_value, nbytes_per_value, data_format, dtype) = out
-        rows = []
-        cols = []
-        entries = []
+        return self._read_sparse_binary(op4, nrows, ncols, matrix_type, is_big_mat)
 
-        data = ''
-        icol = -1  # dummy value so the loop starts
-        while icol < ncols + 1:  # if isDense
-            #if record_length==0:
+    def _read_sparse_binary(self, op4, nrows, ncols, matrix_type, is_big_mat):
+        """
+        Reads a sparse real/complex binary matrix
+
+        Each column record is a series of strings (a row header and
+        the values in consecutive rows).  The record is read once and
+        a cursor is stepped over the strings, so the row ids and values
+        are copied into arrays that are allocated up front from the
+        record lengths.
+        """
+        out = self._get_matrix_info(matrix_type, debug=False)
+        (nwords_per_value, nbytes_per_value, unused_data_format, dtype) = out
+        value_dtype = np.dtype(dtype).newbyteorder(self._endian)
+        struct_irow = Struct(self._endian + ('2i' if is_big_mat else 'i'))
+        nbytes_irow = struct_irow.size
+
+        unused_n_end, nwords_max = self._scan_matrix_binary(op4, ncols)
+        nvalues_max = nwords_max // nwords_per_value
+        rows = np.zeros(nvalues_max, dtype='int32')
+        cols = np.zeros(nvalues_max, dtype='int32')
+        entries = np.zeros(nvalues_max, dtype=dtype)
+        nvalues_total = 0
+
+        while True:
             assert self.n == op4.tell(), 'n=%s tell=%s' % (self.n, op4.tell())
             (icol, irow, nwords) = self.get_markers_sparse(op4, is_big_mat)
-            L = nwords
-
             if icol == ncols + 1:
                 if self.debug:
                     self.log.info('breaking on icol=%s ncol+1=%s' % (icol, ncols + 1))
                 break
 
             if is_big_mat:
-                irow, L = self._get_irow_big_binary(op4, data[:8])
-                data = data[8:]
+                irow, L = self._get_irow_big_binary(op4, b'')
             else:
-                irow, L = self._get_irow_small_binary(op4, data[:4])
-                data = data[4:]
+                irow, L = self._get_irow_small_binary(op4, b'')
 
             if L == -1:
                 if self.debug:
                     self.log.info('breaking on L=-1')
                 break
 
-            if self.debug:
-                self.log.info("  next icol")
-                self.log.info("    n=%s icol=%s irow=%s nwords=%s" % (
-                    self.n, icol, irow, nwords))
-                self._show(op4, 100, types='qd')
-                self.log.info('**************************************************')
-
-            #if nwords == 0 and is_big_mat:
-                #self.n -= 4
-                #op4.seek(self.n)
-                #break
-
             record_length = 4 * nwords
-            data = op4.read(record_length)
+            data = memoryview(op4.read(record_length))
             self.n += record_length
             if self.debug:
-                self.log.info("  data_format=%s record_length=%s n_next=%s" % (
-                    data_format, record_length, self.n))
-            #if icol == ncols + 1:
-                #break
-
-            i = 0
-            while len(data) > 0:
-                if i > 0:
-                    if is_big_mat:
-                        (irow, L) = self._get_irow_big_binary(op4, data[0:8])
-                        data = data[8:]
-                    else:
-                        (irow, L) = self._get_irow_small_binary(op4, data[0:4])
-                        data = data[4:]
-                    assert irow > 0
-                nvalues = L // nwords_per_value
-                str_values = self._endian + '%i%s' % (nvalues, data_format)
-
-                if self.debug:
-                    self.log.info('irow=%s L=%s nwords_per_value=%s nvalues=%s '
-                                  'nbytes_per_value=%s' % (irow, L, nwords_per_value,
-                                                           nvalues, nbytes_per_value))
-                    self.log.info('str_values = %r' % str_values)
-
-                value_list = unpack(str_values, data[0:nvalues * nbytes_per_value])
-                assert self.n == op4.tell(), 'n=%s tell=%s' % (self.n, op4.tell())
-
-                #irow -= 1
-                #icol -= 1
-                if self.debug:
-                    self.log.info('rows = %s' % list(i+irow-1 for i in range(nvalues)))
-                    self.log.info('cols = %s ' % ([icol-1] * nvalues))
-                    self.log.info('value_list = %s' % str(value_list))
-
-                rows.extend([i+irow-1 for i in range(nvalues)])
-                irow += nvalues
-                cols.extend([icol-1] * nvalues)
-                entries.extend(value_list)
-
-                record_length -= nvalues * nbytes_per_value
-                data = data[nvalues * nbytes_per_value:]
-                if self.debug:
-                    self.log.info("  record_length=%s nbytes_per_value=%s len(data)=%s" % (
-                        record_length, nbytes_per_value, len(data)))
-                    ##print(A)
-                    #print("********")  # ,data
-                    #print(self.print_block(data))
-                i += 1
-            #print "-------------------------------"
-
-        #if rows == []:  # NULL matrix
-            #raise NotImplementedError()
-
-        A = coo_matrix((entries, (rows, cols)), shape=(nrows, ncols),
-                       dtype=dtype)
+                self.log.info("  icol=%s irow=%s nwords=%s record_length=%s" % (
+                    icol, irow, nwords, record_length))
+
+            # find the strings: (row, number of values, byte offset of the values)
+            irows = [irow]
+            nvalues = [L // nwords_per_value]
+            offsets = [0]
+            i = nvalues[0] * nbytes_per_value
+            while i < record_length:
+                if is_big_mat:
+                    idummy, irow = struct_irow.unpack_from(data, i)
+                    L = idummy - 1
+                else:
+                    IS, = struct_irow.unpack_from(data, i)
+                    L = IS // 65536 - 1
+                    irow = IS - 65536 * (L + 1)
+                assert irow > 0, irow
+                i += nbytes_irow
+                irows.append(irow)
+                nvalues.append(L // nwords_per_value)
+                offsets.append(i)
+                i += nvalues[-1] * nbytes_per_value
+
+            nvalues_record = sum(nvalues)
+            j = nvalues_total + nvalues_record
+            cols[nvalues_total:j] = icol - 1
+            if len(irows) == 1:
+                rows[nvalues_total:j] = np.arange(irows[0] - 1, irows[0] - 1 + nvalues_record)
+                entries[nvalues_total:j] = np.frombuffer(
+                    data, dtype=value_dtype, count=nvalues_record)
+            else:
+                rows[nvalues_total:j] = concatenate_ranges(
+                    np.array(irows) - 1, np.array(nvalues))
+                # gather the value words in between the row headers
+                words = np.frombuffer(data, dtype=self._endian + 'i4')
+                iwords = concatenate_ranges(
+                    np.array(offsets) // 4, np.array(nvalues) * nwords_per_value)
+                entries[nvalues_total:j] = words[iwords].view(value_dtype)
+            nvalues_total = j
+
+        A = coo_matrix((entries[:nvalues_total], (rows[:nvalues_total], cols[:nvalues_total])),
+                       shape=(nrows, ncols), dtype=dtype)
         op4.read(4)
         self.n += 4
-
         return A
 
     def _show(self, op4, n, types='ifs', endian=None):
@@ -1233,112 +1317,7 @@ class OP4:
         """Reads a sparse complex binary matrix"""
         if self.debug:
             self.log.info('_read_complex_sparse_binary')
-        out = self._get_matrix_info(matrix_type, debug=False)
-        (nwords_per_value, nbytes_per_value, data_format, dtype) = out
-        rows = []
-        cols = []
-        entries = []
-        record_length = 0
-        data = ''
-        icol = -1  # dummy value so the loop starts
-        while icol < ncols + 1:  # if isDense
-            #if record_length == 0:
-            assert self.n == op4.tell(), 'n=%s tell=%s' % (self.n, op4.tell())
-            (icol, irow, nwords) = self.get_markers_sparse(op4, is_big_mat)
-            if self.debug:
-                self.log.info("n=%s icol=%s irow=%s nwords=%s" % (
-                    self.n, icol, irow, nwords))
-                self.log.info("-----------")
-
-            L = nwords
-            if icol == ncols + 1:
-                break
-
-            if is_big_mat:
-                (irow, L) = self._get_irow_big_binary(op4, data[:8])
-                data = data[8:]
-            else:
-                (irow, L) = self._get_irow_small_binary(op4, data[:4])
-                data = data[4:]
-
-            if L == -1:
-                if self.debug:
-                    self.log.info('breaking on L=-1')
-                break
-
-            if self.debug:
-                self.log.info("n=%s icol=%s irow=%s nwords=%s" % (
-                    self.n, icol, irow, nwords))
-                self._show(op4, 100, types='qf')
-                self.log.info('\n\n')
-
-            #if nwords == 0 and is_big_mat:
-                #self.n -= 4
-                #op4.seek(self.n)
-                #break
-
-            record_length = 4 * nwords
-            data = op4.read(record_length)
-            self.n += record_length
-            if self.debug:
-                self.log.info("data_format=%s record_length=%s n_next=%s" % (
-                    data_format, record_length, self.n))
-            if icol == ncols + 1:
-                continue
-
-            nvalues = nwords // nwords_per_value
-            while record_length >= nbytes_per_value:
-                if self.debug:
-                    self.log.info("inner while...")
-                    self.log.info("nwords  = %s" % nwords)
-                    self.log.info("nvalues = %s" % nvalues)
-                    self.log.info("nwords_per_value = %s" % nwords_per_value)
-
-                #if nvalues == 0:
-                    #assert icol == ncols + 1
-                    #break
-
-                # we have 2x values for complex
-                str_values = self._endian + '%i%s' % (nvalues * 2, data_format)
-                if self.debug:
-                    self.log.info("  str_values = %s" % str_values)
-                    self.log.info("  nvalues*nbytes_per_value=%s len(data)=%s" % (
-                        nvalues * nbytes_per_value, len(data)))
-                value_list = unpack(str_values, data[0:nvalues * nbytes_per_value])
-                assert self.n == op4.tell(), 'n=%s tell=%s' % (self.n, op4.tell())
-                #self.show(op4, 4)
-                #print(self.print_block(data))
-                if self.debug:
-                    self.log.info("  value_list = %s" % str(value_list))
-
-                #irow -= 1
-                #icol -= 1
-                irow -= 1
-                icol -= 1
-
-                cols += [icol] * nvalues
-                rows += [i + irow for i in range(nvalues)]
-                for i, value in enumerate(value_list):
-                    if i % 2 == 0:
-                        real_value = value
-                    else:
-                        if self.debug:
-                            self.log.info("  A[%s,%s] = %s" % (
-                                irow, icol, complex(real_value, value)))
-                        #A[irow, icol] = complex(real_value, value)
-                        entries.append(complex(real_value, value))
-                        irow += 1
-
-                record_length -= nvalues * nbytes_per_value
-                data = data[nvalues * nbytes_per_value:]
-                #print("record_length=%s nbytes_per_value=%s" % (record_length, nbytes_per_value))
-                #print(print_matrix(A))
-                #print("********", data)
-
-        A = coo_matrix((entries, (rows, cols)), shape=(nrows, ncols), dtype=dtype)
-        op4.read(4)
-        self.n += 4
-        return A
+        return self._read_sparse_binary(op4, nrows, ncols, matrix_type, is_big_mat)
 
     def get_markers_sparse(self, op4, is_big_mat):
         if is_big_mat:
@@ -308,6 +308,37 @@ class TestOP4(unittest.TestCase):
         #for line in Kgg:
             #print(line)
 
+    def test_op4_lazy(self):
+        """tests lazy=True and matrix_names for the binary reader"""
+        fnames = [
+            'mat_b_dn.op4',
+            'mat_b_s1.op4',
+            'mat_b_s2.op4',
+            'testplate_kgg.op4',
+        ]
+        for fname in fnames:
+            op4_filename = os.path.join(OP4_PATH, fname)
+            matrices = read_op4(op4_filename)
+            matrices_lazy = read_op4(op4_filename, lazy=True)
+            assert list(matrices_lazy) == list(matrices)
+            for name, (form, matrix) in matrices.items():
+                form_lazy, matrix_lazy = matrices_lazy[name]
+                assert form_lazy == form, name
+                assert matrix_lazy.shape == matrix.shape, name
+                matrix2 = matrix_lazy.load()
+                assert type(matrix2) == type(matrix), name
+                if isinstance(matrix, ndarray):
+                    assert array_equal(matrix2, matrix), name
+                else:
+                    assert array_equal(matrix2.toarray(), matrix.toarray()), name
+
+                matrices2 = read_op4(op4_filename, matrix_names=name)
+                assert list(matrices2) == [name], list(matrices2)
+
+        op4_filename = os.path.join(OP4_PATH, 'mat_t_dn.op4')
+        with self.assertRaises(NotImplementedError):
+            read_op4(op4_filename, lazy=True)
+
 def get_matrices():
     """creates dummy matrices"""
     strings = np.array([